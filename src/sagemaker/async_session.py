@@ -0,0 +1,282 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""This module contains an asyncio facade over the SageMaker ``Session``."""
+from __future__ import absolute_import
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import botocore.exceptions
+
+from sagemaker.session import _check_endpoint_status, _check_job_status
+from sagemaker.utilities import polling
+
+logger = logging.getLogger(__name__)
+
+# The number of threads running the blocking calls of an ``AsyncSession`` by default.
+DEFAULT_MAX_WORKERS = 16
+
+
+class AsyncSession(object):
+    """Awaitable versions of the core APIs of a SageMaker ``Session``.
+
+    The blocking calls run on a bounded thread pool. The waiters sleep on the event loop and
+    only use a thread while they describe their resource, so thousands of waits can share
+    one event loop and a few threads. Unlike the ``Session`` waiters, they print nothing.
+
+    Example:
+        >>> async with AsyncSession(sagemaker_session) as aio:
+        ...     descriptions = await asyncio.gather(*[aio.wait_for_job(j) for j in job_names])
+
+    A session also exposes one through ``Session.aio``.
+    """
+
+    def __init__(self, sagemaker_session=None, max_workers=None):
+        """Initialize an ``AsyncSession``.
+
+        Args:
+            sagemaker_session (sagemaker.session.Session): The session whose APIs are wrapped
+                (default: None). If not specified, one is created using the default AWS
+                configuration chain.
+            max_workers (int): The maximum number of blocking calls running at the same time
+                (default: None). If not specified, ``DEFAULT_MAX_WORKERS`` is used.
+        """
+        if sagemaker_session is None:
+            from sagemaker.session import Session
+
+            sagemaker_session = Session()
+        self.sagemaker_session = sagemaker_session
+        self.max_workers = max_workers or DEFAULT_MAX_WORKERS
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        """Return the state of the session, without its thread pool."""
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state of the session, the thread pool is created again when needed."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    async def __aenter__(self):
+        """Return the session itself."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Shut the thread pool down."""
+        self.close()
+
+    def close(self):
+        """Shut the thread pool down, after the running calls complete."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    async def run(self, fn, *args, **kwargs):
+        """Run a blocking function on the thread pool and return its result.
+
+        Args:
+            fn (callable): The function to run, for example a ``Session`` method.
+            *args: The positional arguments of ``fn``.
+            **kwargs: The keyword arguments of ``fn``.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="sagemaker-aio"
+                )
+            executor = self._executor
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(fn, *args, **kwargs))
+
+    async def train(self, **kwargs):
+        """Create a training job, see ``Session.train`` for the arguments."""
+        return await self.run(self.sagemaker_session.train, **kwargs)
+
+    async def process(self, **kwargs):
+        """Create a processing job, see ``Session.process`` for the arguments."""
+        return await self.run(self.sagemaker_session.process, **kwargs)
+
+    async def transform(self, **kwargs):
+        """Create a transform job, see ``Session.transform`` for the arguments."""
+        return await self.run(self.sagemaker_session.transform, **kwargs)
+
+    async def create_model(self, *args, **kwargs):
+        """Create a model, see ``Session.create_model`` for the arguments."""
+        return await self.run(self.sagemaker_session.create_model, *args, **kwargs)
+
+    async def create_endpoint_config(self, *args, **kwargs):
+        """Create an endpoint configuration, see ``Session.create_endpoint_config``."""
+        return await self.run(self.sagemaker_session.create_endpoint_config, *args, **kwargs)
+
+    async def create_endpoint(self, endpoint_name, config_name, tags=None, wait=True, poll=30):
+        """Create an endpoint, and optionally wait for it to be in service.
+
+        Args:
+            endpoint_name (str): The name of the endpoint.
+            config_name (str): The name of the endpoint configuration to deploy.
+            tags (list[dict[str, str]]): The tags of the endpoint (default: None).
+            wait (bool): Whether to wait for the endpoint to be in service (default: True).
+            poll (int or sagemaker.utilities.polling.PollingStrategy): The polling interval
+                in seconds, or the strategy deciding it (default: 30).
+
+        Returns:
+            str: The name of the endpoint.
+        """
+        await self.run(
+            self.sagemaker_session.create_endpoint, endpoint_name, config_name, tags, wait=False
+        )
+        if wait:
+            await self.wait_for_endpoint(endpoint_name, poll=poll)
+        return endpoint_name
+
+    async def update_endpoint(self, endpoint_name, endpoint_config_name, wait=True, poll=30):
+        """Update an endpoint, and optionally wait for the deployment to complete.
+
+        Args:
+            endpoint_name (str): The name of the endpoint.
+            endpoint_config_name (str): The name of the endpoint configuration to deploy.
+            wait (bool): Whether to wait for the endpoint to be in service (default: True).
+            poll (int or sagemaker.utilities.polling.PollingStrategy): The polling interval
+                in seconds, or the strategy deciding it (default: 30).
+
+        Returns:
+            str: The name of the endpoint.
+        """
+        await self.run(
+            self.sagemaker_session.update_endpoint,
+            endpoint_name,
+            endpoint_config_name,
+            wait=False,
+        )
+        if wait:
+            await self.wait_for_endpoint(endpoint_name, poll=poll)
+        return endpoint_name
+
+    async def describe_training_job(self, job_name):
+        """Return the description of a training job."""
+        return await self.run(self.sagemaker_session.describe_training_job, job_name)
+
+    async def describe_processing_job(self, job_name):
+        """Return the description of a processing job."""
+        return await self.run(self.sagemaker_session.describe_processing_job, job_name)
+
+    async def describe_transform_job(self, job_name):
+        """Return the description of a transform job."""
+        return await self.run(self.sagemaker_session.describe_transform_job, job_name)
+
+    async def describe_endpoint(self, endpoint_name):
+        """Return the description of an endpoint."""
+        return await self.run(self.sagemaker_session.describe_endpoint, endpoint_name)
+
+    async def wait_for_job(self, job, poll=5):
+        """Wait for a training job to complete, see ``Session.wait_for_job``."""
+        desc = await self._wait_until(
+            lambda: self.sagemaker_session.sagemaker_client.describe_training_job(
+                TrainingJobName=job
+            ),
+            "TrainingJobStatus",
+            ("InProgress", "Created"),
+            poll,
+        )
+        _check_job_status(job, desc, "TrainingJobStatus")
+        return desc
+
+    async def wait_for_processing_job(self, job, poll=5):
+        """Wait for a processing job to complete, see ``Session.wait_for_processing_job``."""
+        desc = await self._wait_until(
+            lambda: self.sagemaker_session.sagemaker_client.describe_processing_job(
+                ProcessingJobName=job
+            ),
+            "ProcessingJobStatus",
+            ("InProgress", "Stopping", "Starting"),
+            poll,
+        )
+        _check_job_status(job, desc, "ProcessingJobStatus")
+        return desc
+
+    async def wait_for_transform_job(self, job, poll=5):
+        """Wait for a transform job to complete, see ``Session.wait_for_transform_job``."""
+        desc = await self._wait_until(
+            lambda: self.sagemaker_session.sagemaker_client.describe_transform_job(
+                TransformJobName=job
+            ),
+            "TransformJobStatus",
+            ("InProgress", "Stopping"),
+            poll,
+        )
+        _check_job_status(job, desc, "TransformJobStatus")
+        return desc
+
+    async def wait_for_endpoint(self, endpoint, poll=30):
+        """Wait for an endpoint deployment to complete, see ``Session.wait_for_endpoint``."""
+        desc = await self._wait_until(
+            lambda: self.sagemaker_session.sagemaker_client.describe_endpoint(
+                EndpointName=endpoint
+            ),
+            "EndpointStatus",
+            ("Creating", "Updating"),
+            poll,
+        )
+        _check_endpoint_status(endpoint, desc)
+        return desc
+
+    async def upload_data(self, *args, **kwargs):
+        """Upload local files to S3, see ``Session.upload_data`` for the arguments."""
+        return await self.run(self.sagemaker_session.upload_data, *args, **kwargs)
+
+    async def upload_string_as_file_body(self, *args, **kwargs):
+        """Upload a string to S3, see ``Session.upload_string_as_file_body``."""
+        return await self.run(self.sagemaker_session.upload_string_as_file_body, *args, **kwargs)
+
+    async def download_data(self, *args, **kwargs):
+        """Download S3 objects to local files, see ``Session.download_data``."""
+        return await self.run(self.sagemaker_session.download_data, *args, **kwargs)
+
+    async def read_s3_file(self, bucket, key_prefix):
+        """Read an S3 object, see ``Session.read_s3_file``."""
+        return await self.run(self.sagemaker_session.read_s3_file, bucket, key_prefix)
+
+    async def _wait_until(self, describe, status_key, in_progress_statuses, poll):
+        """Describe a resource until its status is not in progress, and return its description.
+
+        Like the ``Session`` waiters, throttling errors are retried after backing off, and
+        AccessDeniedException is retried for 5 minutes to wait for tag propagation.
+        """
+        poller = polling.Poller(self.sagemaker_session._polling(poll))
+        while True:
+            await asyncio.sleep(poller.next_delay())
+            try:
+                desc = await self.run(describe)
+            except botocore.exceptions.ClientError as err:
+                if poller.throttled(err):
+                    continue
+                if (
+                    err.response["Error"]["Code"] == "AccessDeniedException"
+                    and poller.elapsed <= 300
+                ):
+                    logger.warning(
+                        "Received AccessDeniedException, continuing to wait for tag propagation."
+                    )
+                    continue
+                raise
+            if desc[status_key] not in in_progress_statuses:
+                return desc
@@ -21,19 +21,22 @@ list feature groups APIs can be used to manage feature groups.
 
 from __future__ import absolute_import, annotations
 
+import collections
 import copy
 import logging
 import math
 import os
 import tempfile
+import threading
 from concurrent.futures import as_completed
-from concurrent.futures import ThreadPoolExecutor
-from typing import Optional, Sequence, List, Dict, Any, Union, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Sequence, List, Dict, Any, Union, Iterable, Iterator, Tuple
 from urllib.parse import urlparse
 
 from multiprocessing.pool import AsyncResult
 import signal
 import attr
+import numpy as np
 import pandas as pd
 from pandas import DataFrame, Series
 from pandas.api.types import is_list_like
@@ -53,6 +56,15 @@ from sagemaker.feature_store.feature_definition import (
     FeatureTypeEnum,
     ListCollectionType,
 )
+from sagemaker.feature_store.ingestion import (
+    AdaptiveConcurrency,
+    IngestionJournal,
+    IngestionStats,
+    _SharedDataFrame,
+    _iter_data_frames,
+    _prefetch,
+    ingest_adaptively,
+)
 from sagemaker.feature_store.inputs import (
     OnlineStoreConfig,
     OnlineStoreSecurityConfig,
@@ -74,6 +86,14 @@ from sagemaker.utils import resolve_value_from_config, format_tags, Tags
 
 logger = logging.getLogger(__name__)
 
+# Feature store runtime clients shared by the ingestion threads of a process.
+_FS_RUNTIME_CLIENTS = collections.OrderedDict()
+_FS_RUNTIME_CLIENTS_LOCK = threading.Lock()
+_MAX_CACHED_FS_RUNTIME_CLIENTS = 8
+
+# The number of DataFrame rows converted to records at once during ingestion.
+_RECORD_ENCODING_CHUNK_SIZE = 10000
+
 
 @attr.s
 class AthenaQuery:
@@ -197,6 +217,15 @@ class IngestionManagerPandas:
             ``max_workers`` threads.
         profile_name (str): the profile credential should be used for ``PutRecord``
             (default: None).
+        adaptive_concurrency (AdaptiveConcurrency): if specified, the rows are ingested by
+            the current process with an adaptive number of requests in flight, instead of
+            ``max_processes`` processes of ``max_workers`` threads (default: None).
+        shared_memory (bool): whether the processes read their rows from a memory-mapped
+            copy of the DataFrame, instead of receiving a pickled partition of it
+            (default: False).
+        journal (IngestionJournal): if specified, the rows are ingested by the current
+            process, the rows the journal records as ingested are skipped, and the progress
+            of the ingestion is recorded in it (default: None).
     """
 
     feature_group_name: str = attr.ib()
@@ -206,9 +235,15 @@ class IngestionManagerPandas:
     max_workers: int = attr.ib(default=1)
     max_processes: int = attr.ib(default=1)
     profile_name: str = attr.ib(default=None)
+    adaptive_concurrency: AdaptiveConcurrency = attr.ib(default=None)
+    shared_memory: bool = attr.ib(default=False)
+    journal: IngestionJournal = attr.ib(default=None)
     _async_result: AsyncResult = attr.ib(default=None)
     _processing_pool: ProcessingPool = attr.ib(default=None)
     _failed_indices: List[int] = attr.ib(factory=list)
+    _ingestion_future: Future = attr.ib(default=None)
+    _stats: IngestionStats = attr.ib(default=None)
+    _shared_data_frame: _SharedDataFrame = attr.ib(default=None)
 
     @staticmethod
     def _ingest_single_batch(
@@ -220,6 +255,7 @@ class IngestionManagerPandas:
         end_index: int,
         target_stores: Sequence[TargetStoreEnum] = None,
         profile_name: str = None,
+        max_pool_connections: int = None,
     ) -> List[int]:
         """Ingest a single batch of DataFrame rows into FeatureStore.
 
@@ -236,32 +272,76 @@ class IngestionManagerPandas:
             target_stores (Sequence[TargetStoreEnum]): stores to be used for ingestion.
             profile_name (str): the profile credential should be used for ``PutRecord``
                 (default: None).
+            max_pool_connections (int): the minimum size of the connection pool of the
+                feature store runtime client (default: None).
 
         Returns:
             List of row indices that failed to be ingested.
         """
+        sagemaker_fs_runtime_client = IngestionManagerPandas._get_fs_runtime_client(
+            client_config, profile_name, max_pool_connections
+        )
+
+        logger.info("Started ingesting index %d to %d", start_index, end_index)
+        failed_rows = list()
+        IngestionManagerPandas._ingest_records(
+            data_frame=data_frame[start_index:end_index],
+            target_stores=target_stores,
+            feature_group_name=feature_group_name,
+            feature_definitions=feature_definitions,
+            sagemaker_fs_runtime_client=sagemaker_fs_runtime_client,
+            failed_rows=failed_rows,
+        )
+        return failed_rows
+
+    @staticmethod
+    def _get_fs_runtime_client(
+        client_config: Config, profile_name: str = None, max_pool_connections: int = None
+    ):
+        """Return a feature store runtime client for ``PutRecord`` calls.
+
+        boto3 clients are thread-safe, so the batches of a process ingested with the same
+        ``client_config`` object and profile share a single client, created on first use,
+        instead of each building its own ``boto3.Session`` and connection pool.
+
+        Args:
+            client_config (Config): Configuration for the sagemaker feature store runtime
+                client to perform boto calls.
+            profile_name (str): the profile credential should be used for ``PutRecord``
+                (default: None).
+            max_pool_connections (int): the minimum size of the connection pool of the
+                client (default: None).
+
+        Returns:
+            The sagemaker feature store runtime client.
+        """
+        key = (os.getpid(), id(client_config), profile_name, max_pool_connections)
+        with _FS_RUNTIME_CLIENTS_LOCK:
+            cached_config, client = _FS_RUNTIME_CLIENTS.get(key, (None, None))
+            if client is None or cached_config is not client_config:
+                client = IngestionManagerPandas._create_fs_runtime_client(
+                    client_config, profile_name, max_pool_connections
+                )
+                _FS_RUNTIME_CLIENTS[key] = (client_config, client)
+                while len(_FS_RUNTIME_CLIENTS) > _MAX_CACHED_FS_RUNTIME_CLIENTS:
+                    _FS_RUNTIME_CLIENTS.popitem(last=False)
+            return client
+
+    @staticmethod
+    def _create_fs_runtime_client(
+        client_config: Config, profile_name: str = None, max_pool_connections: int = None
+    ):
+        """Create a feature store runtime client for ``PutRecord`` calls."""
         retry_config = client_config.retries
         if "max_attempts" not in retry_config and "total_max_attempts" not in retry_config:
             client_config = copy.deepcopy(client_config)
             client_config.retries = {"max_attempts": 10, "mode": "standard"}
-        sagemaker_fs_runtime_client = boto3.Session(profile_name=profile_name).client(
+        if max_pool_connections and max_pool_connections > client_config.max_pool_connections:
+            client_config = client_config.merge(Config(max_pool_connections=max_pool_connections))
+        return boto3.Session(profile_name=profile_name).client(
             service_name="sagemaker-featurestore-runtime", config=client_config
         )
 
-        logger.info("Started ingesting index %d to %d", start_index, end_index)
-        failed_rows = list()
-        for row in data_frame[start_index:end_index].itertuples():
-            IngestionManagerPandas._ingest_row(
-                data_frame=data_frame,
-                target_stores=target_stores,
-                row=row,
-                feature_group_name=feature_group_name,
-                feature_definitions=feature_definitions,
-                sagemaker_fs_runtime_client=sagemaker_fs_runtime_client,
-                failed_rows=failed_rows,
-            )
-        return failed_rows
-
     @property
     def failed_rows(self) -> List[int]:
         """Get rows that failed to ingest.
@@ -271,6 +351,15 @@ class IngestionManagerPandas:
         """
         return self._failed_indices
 
+    @property
+    def stats(self) -> IngestionStats:
+        """Get the live statistics of an ingestion with adaptive concurrency.
+
+        Returns:
+            The statistics, or None if the concurrency is not adaptive.
+        """
+        return self._stats
+
     def wait(self, timeout=None):
         """Wait for the ingestion process to finish.
 
@@ -278,6 +367,12 @@ class IngestionManagerPandas:
             timeout (Union[int, float]): ``concurrent.futures.TimeoutError`` will be raised
                 if timeout is reached.
         """
+        if self._ingestion_future is not None:
+            self._failed_indices = self._ingestion_future.result(timeout=timeout)
+            self._raise_if_failed()
+            return
+
+        timed_out = False
         try:
             results = self._async_result.get(timeout=timeout)
         except KeyboardInterrupt as i:
@@ -286,15 +381,31 @@ class IngestionManagerPandas:
             self._processing_pool.close()
             self._processing_pool.clear()
             raise i
+        except Exception:
+            # the processes still read the shared DataFrame until the ingestion finishes.
+            timed_out = not self._async_result.ready()
+            raise
         else:
             # terminate normally
             self._processing_pool.close()
             self._processing_pool.clear()
+        finally:
+            if not timed_out:
+                self._close_shared_data_frame()
 
         self._failed_indices = [
             failed_index for failed_indices in results for failed_index in failed_indices
         ]
+        self._raise_if_failed()
+
+    def _close_shared_data_frame(self):
+        """Remove the memory-mapped copy of the DataFrame read by the processes, if any."""
+        if self._shared_data_frame is not None:
+            self._shared_data_frame.close()
+            self._shared_data_frame = None
 
+    def _raise_if_failed(self):
+        """Raise an ``IngestionError`` if some rows failed to be ingested."""
         if len(self._failed_indices) > 0:
             raise IngestionError(
                 self._failed_indices,
@@ -302,20 +413,18 @@ class IngestionManagerPandas:
             )
 
     @staticmethod
-    def _ingest_row(
+    def _ingest_records(
         data_frame: DataFrame,
-        row: Iterable[tuple[Any, ...]],
         feature_group_name: str,
         feature_definitions: Dict[str, Dict[Any, Any]],
         sagemaker_fs_runtime_client: Session,
         failed_rows: List[int],
         target_stores: Sequence[TargetStoreEnum] = None,
     ):
-        """Ingest a single Dataframe row into FeatureStore.
+        """Ingest the rows of a DataFrame into FeatureStore, one ``PutRecord`` call per row.
 
         Args:
             data_frame (DataFrame): source DataFrame to be ingested.
-            row (Iterable[tuple[Any, ...]]): current row that is being ingested
             feature_group_name (str): name of the Feature Group.
             feature_definitions (Dict[str, Dict[Any, Any]]):  dictionary of feature definitions.
                 where the key is the feature name and the value is the FeatureDefinition.
@@ -323,45 +432,141 @@ class IngestionManagerPandas:
             sagemaker_fs_runtime_client (Session): session instance to perform boto calls.
             failed_rows (List[int]): list of indices from the data frame for which ingestion failed.
             target_stores (Sequence[TargetStoreEnum]): stores to be used for ingestion.
+        """
+        put_record_params = IngestionManagerPandas._put_record_params(
+            feature_group_name, target_stores
+        )
+        for index, record, error in IngestionManagerPandas._iter_records(
+            data_frame, feature_definitions
+        ):
+            try:
+                if error is not None:
+                    raise error
+                sagemaker_fs_runtime_client.put_record(Record=record, **put_record_params)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error("Failed to ingest row %s: %s", index, e)
+                failed_rows.append(index)
 
+    @staticmethod
+    def _put_record_params(
+        feature_group_name: str, target_stores: Sequence[TargetStoreEnum] = None
+    ) -> Dict[str, Any]:
+        """Return the parameters of the ``PutRecord`` calls, other than the record."""
+        put_record_params = {"FeatureGroupName": feature_group_name}
+        if target_stores:
+            put_record_params["TargetStores"] = [
+                target_store.value for target_store in target_stores
+            ]
+        return put_record_params
+
+    @staticmethod
+    def _iter_records(
+        data_frame: DataFrame,
+        feature_definitions: Dict[str, Dict[Any, Any]],
+        chunk_size: int = _RECORD_ENCODING_CHUNK_SIZE,
+    ) -> Iterator[Tuple[Any, List[Dict[str, Any]], Exception]]:
+        """Yield the ``PutRecord`` record of each DataFrame row.
+
+        The rows are encoded ``chunk_size`` at a time, column by column: each column is
+        classified once, its null values are masked in bulk and numeric columns are
+        converted to strings by numpy, before the feature values are zipped into records.
+
+        Args:
+            data_frame (DataFrame): source DataFrame to be ingested.
+            feature_definitions (Dict[str, Dict[Any, Any]]):  dictionary of feature definitions.
+                where the key is the feature name and the value is the FeatureDefinition.
+            chunk_size (int): the number of rows encoded at once.
 
         Returns:
-            int of row indices that failed to be ingested.
+            Iterator of the index, the record and the error of each row. If the row cannot
+            be encoded, its record is None and the error is the exception raised.
         """
-        try:
-            record = [
-                (
-                    FeatureValue(
-                        feature_name=data_frame.columns[index - 1],
-                        value_as_string_list=IngestionManagerPandas._covert_feature_to_string_list(
-                            row[index]
-                        ),
-                    )
-                    if IngestionManagerPandas._is_feature_collection_type(
-                        feature_name=data_frame.columns[index - 1],
-                        feature_definitions=feature_definitions,
-                    )
-                    else FeatureValue(
-                        feature_name=data_frame.columns[index - 1], value_as_string=str(row[index])
-                    )
+        for start in range(0, data_frame.shape[0], chunk_size):
+            chunk = data_frame.iloc[start : start + chunk_size]
+            errors = [None] * chunk.shape[0]
+            columns = [
+                IngestionManagerPandas._encode_column(
+                    chunk.columns[position], chunk.iloc[:, position], feature_definitions, errors
                 )
-                for index in range(1, len(row))
-                if IngestionManagerPandas._feature_value_is_not_none(feature_value=row[index])
+                for position in range(chunk.shape[1])
             ]
+            for index, error, *feature_values in zip(chunk.index, errors, *columns):
+                if error is not None:
+                    yield index, None, error
+                else:
+                    yield index, [value for value in feature_values if value is not None], None
+
+    @staticmethod
+    def _encode_column(
+        feature_name: str,
+        column: Series,
+        feature_definitions: Dict[str, Dict[Any, Any]],
+        errors: List[Exception],
+    ) -> List[Dict[str, Any]]:
+        """Encode the values of a column as ``FeatureValue`` dictionaries.
+
+        Args:
+            feature_name (str): name of the feature.
+            column (Series): values of the feature.
+            feature_definitions (Dict[str, Dict[Any, Any]]):  dictionary of feature definitions.
+            errors (List[Exception]): the first error raised while encoding each row, which
+                is set for the values that cannot be encoded.
+
+        Returns:
+            List of the encoded values, None for the values that are not ingested.
+        """
+        if IngestionManagerPandas._is_feature_collection_type(
+            feature_name=feature_name, feature_definitions=feature_definitions
+        ):
+            return IngestionManagerPandas._encode_values(
+                feature_name,
+                column,
+                errors,
+                lambda value: {
+                    "FeatureName": feature_name,
+                    "ValueAsStringList": IngestionManagerPandas._covert_feature_to_string_list(
+                        value
+                    ),
+                },
+            )
 
-            put_record_params = {
-                "FeatureGroupName": feature_group_name,
-                "Record": [value.to_dict() for value in record],
-            }
-            if target_stores:
-                put_record_params["TargetStores"] = [
-                    target_store.value for target_store in target_stores
-                ]
+        values = column.to_numpy()
+        if values.dtype == object:
+            if pd.api.types.infer_dtype(column, skipna=True) not in ("string", "empty"):
+                # the column may hold lists, which are ingested as their string form
+                return IngestionManagerPandas._encode_values(
+                    feature_name,
+                    column,
+                    errors,
+                    lambda value: {"FeatureName": feature_name, "ValueAsString": str(value)},
+                )
+            strings = values
+        elif isinstance(column.dtype, np.dtype) and (
+            column.dtype.kind in "iub" or column.dtype == np.float64
+        ):
+            strings = values.astype(str).tolist()
+        else:
+            strings = [str(value) for value in column.tolist()]
 
-            sagemaker_fs_runtime_client.put_record(**put_record_params)
-        except Exception as e:  # pylint: disable=broad-except
-            logger.error("Failed to ingest row %d: %s", row[0], e)
-            failed_rows.append(row[0])
+        return [
+            {"FeatureName": feature_name, "ValueAsString": string} if not_null else None
+            for string, not_null in zip(strings, column.notna().to_numpy())
+        ]
+
+    @staticmethod
+    def _encode_values(feature_name: str, column: Series, errors: List[Exception], encode):
+        """Encode the values of a column one by one, recording the errors of each row."""
+        encoded_values = []
+        for position, value in enumerate(column.tolist()):
+            encoded_value = None
+            try:
+                if IngestionManagerPandas._feature_value_is_not_none(feature_value=value):
+                    encoded_value = encode(value)
+            except Exception as e:  # pylint: disable=broad-except
+                if errors[position] is None:
+                    errors[position] = e
+            encoded_values.append(encoded_value)
+        return encoded_values
 
     @staticmethod
     def _is_feature_collection_type(
@@ -448,23 +653,113 @@ class IngestionManagerPandas:
         logger.info("Started ingesting index %d to %d")
         failed_rows = list()
         sagemaker_fs_runtime_client = self.sagemaker_session.sagemaker_featurestore_runtime_client
-        for row in data_frame.itertuples():
-            IngestionManagerPandas._ingest_row(
-                data_frame=data_frame,
-                target_stores=target_stores,
-                row=row,
-                feature_group_name=self.feature_group_name,
-                feature_definitions=self.feature_definitions,
-                sagemaker_fs_runtime_client=sagemaker_fs_runtime_client,
-                failed_rows=failed_rows,
-            )
+        IngestionManagerPandas._ingest_records(
+            data_frame=data_frame,
+            target_stores=target_stores,
+            feature_group_name=self.feature_group_name,
+            feature_definitions=self.feature_definitions,
+            sagemaker_fs_runtime_client=sagemaker_fs_runtime_client,
+            failed_rows=failed_rows,
+        )
         self._failed_indices = failed_rows
+        self._raise_if_failed()
 
-        if len(self._failed_indices) > 0:
-            raise IngestionError(
-                self._failed_indices,
-                f"Failed to ingest some data into FeatureGroup {self.feature_group_name}",
+    def run_stream(
+        self,
+        data_frames: Iterable[DataFrame],
+        target_stores: Sequence[TargetStoreEnum] = None,
+        max_buffered_chunks: int = 2,
+        wait=True,
+        timeout=None,
+    ):
+        """Start ingesting a stream of DataFrames.
+
+        The DataFrames are read by a background thread, at most ``max_buffered_chunks`` of
+        them ahead of the one being ingested, so reading overlaps with sending and memory
+        stays bounded. The requests in flight are sized by ``adaptive_concurrency`` if it is
+        specified, otherwise ``max_workers`` requests are kept in flight.
+
+        Args:
+            data_frames (Iterable[DataFrame]): source DataFrames to be ingested.
+            target_stores (Sequence[TargetStoreEnum]): list of target stores to be used for
+                the ingestion. If None, the default target store is used.
+            max_buffered_chunks (int): the number of DataFrames read ahead (default: 2).
+            wait (bool): whether to wait for the ingestion to finish or not.
+            timeout (Union[int, float]): ``concurrent.futures.TimeoutError`` will be raised
+                if timeout is reached.
+        """
+        concurrency = self.adaptive_concurrency or AdaptiveConcurrency(
+            initial_concurrency=self.max_workers,
+            min_concurrency=self.max_workers,
+            max_concurrency=self.max_workers,
+        )
+        if self.journal is not None:
+            self.journal.load(self.feature_group_name, self.sagemaker_session)
+            # pylint: disable=protected-access
+            data_frames = map(self.journal._skip_completed, data_frames)
+        records = (
+            record
+            for data_frame in _prefetch(data_frames, max_buffered_chunks)
+            for record in IngestionManagerPandas._iter_records(data_frame, self.feature_definitions)
+        )
+        self._run_adaptive(
+            records=records,
+            concurrency=concurrency,
+            target_stores=target_stores,
+            wait=wait,
+            timeout=timeout,
+        )
+
+    def _run_adaptive(
+        self,
+        records: Iterator[Tuple[Any, List[Dict[str, Any]], Exception]],
+        concurrency: AdaptiveConcurrency,
+        target_stores: Sequence[TargetStoreEnum] = None,
+        wait=True,
+        timeout=None,
+    ):
+        """Ingest with an adaptive number of ``PutRecord`` requests in flight.
+
+        Args:
+            records (Iterator[Tuple[Any, List[Dict[str, Any]], Exception]]): the records to
+                be ingested, as yielded by ``_iter_records``.
+            concurrency (AdaptiveConcurrency): the configuration of the concurrency.
+            target_stores (Sequence[TargetStoreEnum]): target stores to ingest to.
+                If not specified, ingest to both online and offline stores.
+            wait (bool): whether to wait for the ingestion to finish or not.
+            timeout (Union[int, float]): ``concurrent.futures.TimeoutError`` will be raised
+                if timeout is reached.
+        """
+        if self.sagemaker_fs_runtime_client_config is None:
+            sagemaker_fs_runtime_client = (
+                self.sagemaker_session.sagemaker_featurestore_runtime_client
             )
+        else:
+            sagemaker_fs_runtime_client = IngestionManagerPandas._get_fs_runtime_client(
+                self.sagemaker_fs_runtime_client_config,
+                self.profile_name,
+                concurrency.max_concurrency,
+            )
+        put_record_params = IngestionManagerPandas._put_record_params(
+            self.feature_group_name, target_stores
+        )
+        self._stats = IngestionStats()
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._ingestion_future = executor.submit(
+            ingest_adaptively,
+            records=records,
+            put_record=lambda record: sagemaker_fs_runtime_client.put_record(
+                Record=record, **put_record_params
+            ),
+            config=concurrency,
+            stats=self._stats,
+            journal=self.journal,
+        )
+        executor.shutdown(wait=False)
+
+        if wait:
+            self.wait(timeout=timeout)
 
     def _run_multi_process(
         self,
@@ -487,17 +782,29 @@ class IngestionManagerPandas:
         batch_size = math.ceil(data_frame.shape[0] / self.max_processes)
         # pylint: enable=I1101
 
-        args = []
+        row_ranges = []
         for i in range(self.max_processes):
             start_index = min(i * batch_size, data_frame.shape[0])
             end_index = min(i * batch_size + batch_size, data_frame.shape[0])
+            row_ranges.append((start_index, end_index))
+
+        if self.shared_memory:
+            # write the DataFrame once, each process maps the rows it ingests.
+            self._shared_data_frame = _SharedDataFrame.create(data_frame, row_ranges)
+
+        args = []
+        for start_index, end_index in row_ranges:
+            if self._shared_data_frame is not None:
+                data_frame_partition = self._shared_data_frame.slice(start_index, end_index)
+            else:
+                data_frame_partition = data_frame[start_index:end_index]
             args += [
                 (
                     self.max_workers,
                     self.feature_group_name,
                     self.feature_definitions,
                     self.sagemaker_fs_runtime_client_config,
-                    data_frame[start_index:end_index],
+                    data_frame_partition,
                     target_stores,
                     start_index,
                     timeout,
@@ -509,11 +816,15 @@ class IngestionManagerPandas:
             # ignore keyboard interrupts in child processes.
             signal.signal(signal.SIGINT, signal.SIG_IGN)
 
-        self._processing_pool = ProcessingPool(self.max_processes, init_worker)
-        self._processing_pool.restart(force=True)
+        try:
+            self._processing_pool = ProcessingPool(self.max_processes, init_worker)
+            self._processing_pool.restart(force=True)
 
-        f = lambda x: IngestionManagerPandas._run_multi_threaded(*x)  # noqa: E731
-        self._async_result = self._processing_pool.amap(f, args)
+            f = lambda x: IngestionManagerPandas._run_multi_threaded(*x)  # noqa: E731
+            self._async_result = self._processing_pool.amap(f, args)
+        except BaseException:
+            self._close_shared_data_frame()
+            raise
 
         if wait:
             self.wait(timeout=timeout)
@@ -533,7 +844,8 @@ class IngestionManagerPandas:
         """Start the ingestion process.
 
         Args:
-            data_frame (DataFrame): source DataFrame to be ingested.
+            data_frame (DataFrame): source DataFrame to be ingested, or the rows of a
+                ``_SharedDataFrame`` to read it from.
             target_stores (Sequence[TargetStoreEnum]): target stores to ingest to.
                 If not specified, ingest to both online and offline stores.
             row_offset (int): if ``data_frame`` is a partition of a parent DataFrame, then the
@@ -547,6 +859,9 @@ class IngestionManagerPandas:
         Returns:
             List of row indices that failed to be ingested.
         """
+        if isinstance(data_frame, _SharedDataFrame):
+            data_frame = data_frame.read()
+
         executor = ThreadPoolExecutor(max_workers=max_workers)
         # pylint: disable=I1101
         batch_size = math.ceil(data_frame.shape[0] / max_workers)
@@ -567,6 +882,7 @@ class IngestionManagerPandas:
                     end_index=end_index,
                     client_config=sagemaker_fs_runtime_client_config,
                     profile_name=profile_name,
+                    max_pool_connections=max_workers,
                 )
             ] = (start_index + row_offset, end_index + row_offset)
 
@@ -599,7 +915,22 @@ class IngestionManagerPandas:
             timeout (Union[int, float]): ``concurrent.futures.TimeoutError`` will be raised
                 if timeout is reached.
         """
-        if self.max_workers == 1 and self.max_processes == 1 and self.profile_name is None:
+        if self.journal is not None:
+            self.run_stream(
+                data_frames=_iter_data_frames(data_frame, positional_index=True),
+                target_stores=target_stores,
+                wait=wait,
+                timeout=timeout,
+            )
+        elif self.adaptive_concurrency is not None:
+            self._run_adaptive(
+                records=IngestionManagerPandas._iter_records(data_frame, self.feature_definitions),
+                concurrency=self.adaptive_concurrency,
+                target_stores=target_stores,
+                wait=wait,
+                timeout=timeout,
+            )
+        elif self.max_workers == 1 and self.max_processes == 1 and self.profile_name is None:
             self._run_single_process_single_thread(
                 data_frame=data_frame, target_stores=target_stores
             )
@@ -1113,6 +1444,9 @@ class FeatureGroup:
         wait: bool = True,
         timeout: Union[int, float] = None,
         profile_name: str = None,
+        adaptive_concurrency: AdaptiveConcurrency = None,
+        shared_memory: bool = False,
+        journal: IngestionJournal = None,
     ) -> IngestionManagerPandas:
         """Ingest the content of a pandas DataFrame to feature store.
 
@@ -1141,6 +1475,26 @@ class FeatureGroup:
         https://boto3.amazonaws.com/v1/documentation/api/latest/guide/credentials.html for more
         about the default credential.
 
+        If ``adaptive_concurrency`` is specified, ``max_workers`` is ignored and the rows are
+        sent by the current process, which keeps a window of ``PutRecord`` requests in flight
+        and adjusts its size to the throughput the online store accepts: it grows while the
+        requests succeed, and shrinks when they are throttled or slow down. The throttled rows
+        are sent again, up to ``max_throttling_retries`` times. The rows ingested per second and the p99 latency are logged during the ingestion, and are available
+        from ``IngestionManagerPandas.stats``.
+
+        If ``shared_memory`` is ``True``, the ``data_frame`` is written once to a memory-mapped
+        file, in ``/dev/shm`` when it exists, instead of pickling a partition of it for each
+        of the ``max_processes`` processes. The processes map the columns with a numpy dtype
+        without copying them, and only unpickle the other columns of their own rows. The file
+        is removed when the ingestion finishes, so call ``wait`` if ``wait`` is ``False``.
+
+        If a ``journal`` is specified, the rows are sent by the current process, and the
+        ingestion can resume after a failure or a restart: the journal records the rows
+        ingested and the rows that failed with their error code, and ingesting the same
+        ``data_frame`` again with the same journal only sends the rows that were not
+        ingested. The rows are then identified by their position in the ``data_frame``,
+        including in ``IngestionError.failed_rows``.
+
         Args:
             data_frame (DataFrame): data_frame to be ingested to feature store.
             target_stores (Sequence[TargetStoreEnum]): target stores to be used for
@@ -1153,6 +1507,13 @@ class FeatureGroup:
                 if timeout is reached.
             profile_name (str): the profile credential should be used for ``PutRecord``
                 (default: None).
+            adaptive_concurrency (AdaptiveConcurrency): the configuration of the adaptive
+                number of requests in flight (default: None). If not specified, the number
+                of requests in flight is ``max_processes`` times ``max_workers``.
+            shared_memory (bool): whether to hand the ``data_frame`` to the processes
+                through a memory-mapped file (default: False).
+            journal (IngestionJournal): the journal recording the progress of the ingestion,
+                from which it resumes (default: None).
 
         Returns:
             An instance of IngestionManagerPandas.
@@ -1163,6 +1524,12 @@ class FeatureGroup:
         if max_workers <= 0:
             raise RuntimeError("max_workers must be greater than 0.")
 
+        if adaptive_concurrency is not None and max_processes > 1:
+            raise RuntimeError("max_processes must be 1 when adaptive_concurrency is specified.")
+
+        if journal is not None and max_processes > 1:
+            raise RuntimeError("max_processes must be 1 when journal is specified.")
+
         if profile_name is None and self.sagemaker_session.boto_session.profile_name != "default":
             profile_name = self.sagemaker_session.boto_session.profile_name
 
@@ -1178,12 +1545,124 @@ class FeatureGroup:
             max_workers=max_workers,
             max_processes=max_processes,
             profile_name=profile_name,
+            adaptive_concurrency=adaptive_concurrency,
+            shared_memory=shared_memory,
+            journal=journal,
         )
 
         manager.run(data_frame=data_frame, target_stores=target_stores, wait=wait, timeout=timeout)
 
         return manager
 
+    def ingest_stream(
+        self,
+        source: Union[str, DataFrame, Iterable[DataFrame]],
+        target_stores: Sequence[TargetStoreEnum] = None,
+        max_workers: int = 1,
+        adaptive_concurrency: AdaptiveConcurrency = None,
+        chunk_size: int = 10000,
+        file_format: str = None,
+        read_csv_kwargs: Dict[str, Any] = None,
+        max_buffered_chunks: int = 2,
+        wait: bool = True,
+        timeout: Union[int, float] = None,
+        profile_name: str = None,
+        journal: IngestionJournal = None,
+    ) -> IngestionManagerPandas:
+        """Ingest rows read lazily from files, or from an iterable of DataFrames.
+
+        Unlike ``ingest``, the rows do not need to fit in memory. The ``source`` is read
+        ``chunk_size`` rows at a time by a background thread, which reads at most
+        ``max_buffered_chunks`` chunks ahead of the one being ingested, so that reading
+        overlaps with sending and the memory used does not depend on the size of the
+        dataset.
+
+        The ``source`` can be:
+
+        * the path of a CSV or Parquet file, or of a directory of such files, in which all
+          the files are read in order. Files whose name starts with ``_`` or ``.`` are
+          skipped.
+        * an S3 URI, in which case all the objects under this prefix are read in order.
+        * a DataFrame, which is ingested in chunks of ``chunk_size`` rows.
+        * an iterable of DataFrames, such as the reader returned by ``pandas.read_csv`` with
+          ``chunksize``.
+
+        The format of each file is inferred from its extension, such as ``.csv``,
+        ``.csv.gz`` or ``.parquet``, unless ``file_format`` is specified. Reading Parquet
+        files requires ``pyarrow``. As the types of the columns of a CSV file are inferred
+        for each chunk, specify them with the ``dtype`` of ``read_csv_kwargs`` to ingest the
+        same value the same way in every chunk.
+
+        The rows read from files are identified by the path of the file and the position
+        of the row in it, for example in ``IngestionError.failed_rows``.
+
+        If a ``journal`` is specified, the ingestion can resume after a failure or a restart
+        like with ``ingest``. The rows of DataFrames are then identified by their position in
+        the ``source``.
+
+        Args:
+            source (Union[str, DataFrame, Iterable[DataFrame]]): the rows to ingest.
+            target_stores (Sequence[TargetStoreEnum]): target stores to be used for
+                ingestion. (default: None).
+            max_workers (int): number of ``PutRecord`` requests in flight, if
+                ``adaptive_concurrency`` is not specified (default: 1).
+            adaptive_concurrency (AdaptiveConcurrency): the configuration of the adaptive
+                number of requests in flight (default: None).
+            chunk_size (int): the number of rows read at once (default: 10000).
+            file_format (str): ``"csv"`` or ``"parquet"`` (default: None).
+            read_csv_kwargs (Dict[str, Any]): keyword arguments of ``pandas.read_csv``, used
+                to read CSV files (default: None).
+            max_buffered_chunks (int): the number of chunks read ahead (default: 2).
+            wait (bool): whether to wait for the ingestion to finish or not.
+            timeout (Union[int, float]): ``concurrent.futures.TimeoutError`` will be raised
+                if timeout is reached.
+            profile_name (str): the profile credential should be used for ``PutRecord``
+                (default: None).
+            journal (IngestionJournal): the journal recording the progress of the ingestion,
+                from which it resumes (default: None).
+
+        Returns:
+            An instance of IngestionManagerPandas.
+        """
+        if max_workers <= 0:
+            raise RuntimeError("max_workers must be greater than 0.")
+
+        if chunk_size <= 0:
+            raise RuntimeError("chunk_size must be greater than 0.")
+
+        if profile_name is None and self.sagemaker_session.boto_session.profile_name != "default":
+            profile_name = self.sagemaker_session.boto_session.profile_name
+
+        manager = IngestionManagerPandas(
+            feature_group_name=self.name,
+            feature_definitions=self._get_feature_definition_dict(),
+            sagemaker_session=self.sagemaker_session,
+            sagemaker_fs_runtime_client_config=(
+                self.sagemaker_session.sagemaker_featurestore_runtime_client.meta.config
+            ),
+            max_workers=max_workers,
+            profile_name=profile_name,
+            adaptive_concurrency=adaptive_concurrency,
+            journal=journal,
+        )
+
+        manager.run_stream(
+            data_frames=_iter_data_frames(
+                source,
+                sagemaker_session=self.sagemaker_session,
+                chunk_size=chunk_size,
+                file_format=file_format,
+                read_csv_kwargs=read_csv_kwargs,
+                positional_index=journal is not None,
+            ),
+            target_stores=target_stores,
+            max_buffered_chunks=max_buffered_chunks,
+            wait=wait,
+            timeout=timeout,
+        )
+
+        return manager
+
     def _get_feature_definition_dict(self) -> Dict[str, Dict[Any, Any]]:
         """Get a dictionary of feature definitions with Feature Name as Key.
 
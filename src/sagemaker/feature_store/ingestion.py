@@ -0,0 +1,998 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Engines used to ingest records into a Feature Group.
+
+The adaptive-concurrency engine keeps a window of in-flight ``PutRecord`` requests and
+sizes it like TCP congestion control: the window grows by about one request per round trip
+while the requests succeed, and is cut by a constant factor (additive increase,
+multiplicative decrease) when the online store throttles or when the latency rises above
+its baseline.
+
+``_SharedDataFrame`` hands a DataFrame to the ingestion processes through a memory-mapped
+file instead of pickling a slice of it for each of them.
+
+``_iter_data_frames`` reads CSV and Parquet files, locally or in S3, in chunks of rows, and
+``_prefetch`` reads them ahead in a background thread, so that a dataset of any size can be
+ingested with bounded memory.
+"""
+from __future__ import absolute_import
+
+import bisect
+import collections
+import errno
+import json
+import logging
+import math
+import os
+import pickle
+import queue
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+import attr
+import numpy as np
+import pandas as pd
+from botocore.exceptions import ClientError
+
+from sagemaker.s3 import S3Downloader, S3Uploader, parse_s3_url
+from sagemaker.utilities.polling import is_throttling_error
+
+logger = logging.getLogger(__name__)
+
+# The number of recent latencies used to compute the latency percentiles.
+_LATENCY_WINDOW = 10000
+
+# The weight of each new latency in the smoothed latency.
+_LATENCY_SMOOTHING = 0.1
+
+# The number of recent latencies of which the lowest is the baseline latency, so that the
+# baseline follows a lasting change of the latency of the online store.
+_BASELINE_LATENCY_WINDOW = 1000
+
+# The directory of the memory-mapped files, which is backed by memory on Linux. It may be
+# small, such as 64 MB in a Docker container, in which case the files are written to the
+# temporary directory instead.
+_SHARED_MEMORY_DIR = "/dev/shm"
+
+# The alignment of the columns in the memory-mapped files, in bytes.
+_SHARED_COLUMN_ALIGNMENT = 64
+
+# The formats of the files read by ``_iter_data_frames``, by extension.
+_FILE_FORMATS = {".csv": "csv", ".parquet": "parquet", ".pq": "parquet"}
+
+# The version of the format of the ingestion journals.
+_JOURNAL_VERSION = 1
+
+# The compression of the CSV files, by extension.
+_CSV_COMPRESSIONS = {".gz": "gzip", ".bz2": "bz2", ".zip": "zip", ".xz": "xz", ".zst": "zstd"}
+
+
+@attr.s
+class AdaptiveConcurrency:
+    """Configuration of the adaptive concurrency of ``FeatureGroup.ingest``.
+
+    The number of ``PutRecord`` requests in flight starts at ``initial_concurrency``. It
+    grows by ``1 / concurrency`` after each successful request, that is by about one
+    request per round trip, up to ``max_concurrency``. It is multiplied by
+    ``decrease_ratio``, down to ``min_concurrency``, when a request is throttled or when
+    the smoothed latency exceeds ``latency_target``, at most once per round trip. The
+    record of a throttled request is sent again with the decreased concurrency, up to
+    ``max_throttling_retries`` times, before its row is considered failed.
+
+    Attributes:
+        initial_concurrency (int): the number of requests in flight at the start
+            (default: 4).
+        min_concurrency (int): the smallest number of requests in flight (default: 1).
+        max_concurrency (int): the largest number of requests in flight, which is also the
+            number of threads sending the requests (default: 64).
+        decrease_ratio (float): the factor applied to the concurrency when it decreases
+            (default: 0.5).
+        latency_target (float): the smoothed latency, in seconds, above which the
+            concurrency decreases (default: None). If not specified, it is
+            ``latency_tolerance`` times the lowest of the recent latencies.
+        latency_tolerance (float): the ratio of the smoothed latency to the lowest latency
+            above which the concurrency decreases, when ``latency_target`` is not
+            specified (default: 2.0).
+        report_interval (float): the number of seconds between two progress reports
+            logged during ingestion (default: 30).
+        max_throttling_retries (int): the number of times the record of a throttled
+            request is sent again (default: 5).
+    """
+
+    initial_concurrency: int = attr.ib(default=4)
+    min_concurrency: int = attr.ib(default=1)
+    max_concurrency: int = attr.ib(default=64)
+    decrease_ratio: float = attr.ib(default=0.5)
+    latency_target: float = attr.ib(default=None)
+    latency_tolerance: float = attr.ib(default=2.0)
+    report_interval: float = attr.ib(default=30)
+    max_throttling_retries: int = attr.ib(default=5)
+
+    def __attrs_post_init__(self):
+        """Validate the configuration."""
+        if not 1 <= self.min_concurrency <= self.initial_concurrency <= self.max_concurrency:
+            raise ValueError(
+                "The concurrency must satisfy "
+                "1 <= min_concurrency <= initial_concurrency <= max_concurrency."
+            )
+        if not 0 < self.decrease_ratio < 1:
+            raise ValueError("decrease_ratio must be between 0 and 1.")
+        if self.max_throttling_retries < 0:
+            raise ValueError("max_throttling_retries must not be negative.")
+
+
+class IngestionStats:
+    """Live statistics of an ingestion.
+
+    The statistics are updated by the threads sending the requests while the ingestion
+    runs, and can be read at any time.
+    """
+
+    def __init__(self):
+        """Initialize ``IngestionStats``."""
+        self.ingested_rows = 0
+        self.failed_rows = 0
+        self.throttled_requests = 0
+        self.concurrency = 0
+        self._start_time = time.monotonic()
+        self._end_time = None
+        self._latencies = collections.deque(maxlen=_LATENCY_WINDOW)
+        self._lock = threading.Lock()
+
+    @property
+    def elapsed(self) -> float:
+        """The number of seconds the ingestion has been running for."""
+        return (self._end_time or time.monotonic()) - self._start_time
+
+    @property
+    def rows_per_second(self) -> float:
+        """The average number of rows ingested per second."""
+        elapsed = self.elapsed
+        return self.ingested_rows / elapsed if elapsed > 0 else 0.0
+
+    def latency_percentile(self, percentile: float) -> float:
+        """Return a percentile of the latency of the recent requests, in seconds.
+
+        Args:
+            percentile (float): the percentile, between 0 and 100.
+
+        Returns:
+            The latency, or None if no request completed yet.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if not latencies:
+            return None
+        rank = max(math.ceil(percentile / 100 * len(latencies)), 1)
+        return latencies[rank - 1]
+
+    @property
+    def p99_latency(self) -> float:
+        """The 99th percentile of the latency of the recent requests, in seconds."""
+        return self.latency_percentile(99)
+
+    def _record(
+        self, latency: float, succeeded: bool, throttled: bool = False, retried: bool = False
+    ):
+        """Record the outcome of a request, whose row is sent again if it is retried."""
+        with self._lock:
+            self._latencies.append(latency)
+            if succeeded:
+                self.ingested_rows += 1
+            elif not retried:
+                self.failed_rows += 1
+            if throttled:
+                self.throttled_requests += 1
+
+    def _record_failure(self):
+        """Record a row that failed before its request was sent."""
+        with self._lock:
+            self.failed_rows += 1
+
+    def _finish(self):
+        """Stop the clock of the ingestion."""
+        self._end_time = time.monotonic()
+
+    def __str__(self) -> str:
+        """Summary of the statistics."""
+        p99_latency = self.p99_latency
+        return (
+            f"{self.ingested_rows} rows ingested ({self.rows_per_second:.1f} rows/s), "
+            f"{self.failed_rows} failed, p99 latency "
+            f"{'n/a' if p99_latency is None else f'{p99_latency * 1000:.0f} ms'}, "
+            f"concurrency {self.concurrency}"
+        )
+
+
+class _ConcurrencyLimiter:
+    """Bound the number of requests in flight, and adjust the bound AIMD-style."""
+
+    def __init__(self, config: AdaptiveConcurrency, stats: IngestionStats):
+        """Initialize a ``_ConcurrencyLimiter``."""
+        self._config = config
+        self._stats = stats
+        self._limit = float(config.initial_concurrency)
+        self._in_flight = 0
+        # the recent latencies in increasing order with their request numbers, each later
+        # than the previous one, so that the first is the lowest latency in the window.
+        self._min_latencies = collections.deque()
+        self._requests = 0
+        self._smoothed_latency = None
+        self._last_decrease = None
+        self._condition = threading.Condition()
+        stats.concurrency = config.initial_concurrency
+
+    @property
+    def limit(self) -> int:
+        """The number of requests allowed in flight."""
+        return int(self._limit)
+
+    def acquire(self):
+        """Wait until a request can be sent."""
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def wait_idle(self):
+        """Wait until no request is in flight."""
+        with self._condition:
+            while self._in_flight:
+                self._condition.wait()
+
+    def release(self, latency: float, throttled: bool = False):
+        """Record the outcome of a request, and adjust the number of requests in flight."""
+        with self._condition:
+            self._in_flight -= 1
+            now = time.monotonic()
+            if not throttled:
+                self._record_min_latency(latency)
+                self._smoothed_latency = (
+                    latency
+                    if self._smoothed_latency is None
+                    else self._smoothed_latency
+                    + _LATENCY_SMOOTHING * (latency - self._smoothed_latency)
+                )
+            if throttled or self._smoothed_latency > self._latency_target():
+                # decrease at most once per round trip, the requests already in flight were
+                # sent with the previous limit.
+                if self._last_decrease is None or now - self._last_decrease >= (
+                    self._smoothed_latency or 0
+                ):
+                    self._limit = max(
+                        self._limit * self._config.decrease_ratio, self._config.min_concurrency
+                    )
+                    self._last_decrease = now
+            else:
+                self._limit = min(self._limit + 1 / self._limit, self._config.max_concurrency)
+            self._stats.concurrency = int(self._limit)
+            self._condition.notify_all()
+
+    def _record_min_latency(self, latency: float):
+        """Add a latency to the window of which the lowest is the baseline latency."""
+        self._requests += 1
+        while self._min_latencies and self._min_latencies[-1][1] >= latency:
+            self._min_latencies.pop()
+        self._min_latencies.append((self._requests, latency))
+        if self._min_latencies[0][0] <= self._requests - _BASELINE_LATENCY_WINDOW:
+            self._min_latencies.popleft()
+
+    def _latency_target(self) -> float:
+        """Return the smoothed latency above which the concurrency decreases."""
+        if self._config.latency_target is not None:
+            return self._config.latency_target
+        min_latency = self._min_latencies[0][1] if self._min_latencies else 0
+        return min_latency * self._config.latency_tolerance
+
+
+def ingest_adaptively(
+    records: Iterator[Tuple[Any, List[Dict[str, Any]], Exception]],
+    put_record: Callable[[List[Dict[str, Any]]], Any],
+    config: AdaptiveConcurrency,
+    stats: IngestionStats = None,
+    journal: "IngestionJournal" = None,
+) -> List[Any]:
+    """Send records with ``put_record``, keeping an adaptive number of requests in flight.
+
+    Args:
+        records (Iterator[Tuple[Any, List[Dict[str, Any]], Exception]]): the index, the
+            record and the encoding error of each row, as yielded by
+            ``IngestionManagerPandas._iter_records``.
+        put_record (Callable[[List[Dict[str, Any]]], Any]): the function sending a record.
+        config (AdaptiveConcurrency): the configuration of the concurrency.
+        stats (IngestionStats): the statistics updated during the ingestion (default: None).
+        journal (IngestionJournal): the journal recording the rows ingested and the rows
+            that failed (default: None).
+
+    Returns:
+        List of the indices of the rows that failed to be ingested.
+    """
+    # pylint: disable=protected-access
+    stats = stats or IngestionStats()
+    limiter = _ConcurrencyLimiter(config, stats)
+    failed_rows = []
+    failed_rows_lock = threading.Lock()
+    # the records of the throttled requests, with their number of retries, queued before
+    # the limiter is released, so that they are all queued once no request is in flight.
+    retries = queue.Queue()
+
+    def fail(index, error):
+        logger.error("Failed to ingest row %s: %s", index, error)
+        with failed_rows_lock:
+            failed_rows.append(index)
+        if journal is not None:
+            journal._record_failure(index, error)
+
+    def send(index, record, attempt):
+        start = time.monotonic()
+        succeeded, throttled, retried = True, False, False
+        try:
+            put_record(record)
+        except Exception as e:  # pylint: disable=broad-except
+            succeeded, throttled = False, is_throttling_error(e)
+            retried = throttled and attempt < config.max_throttling_retries
+            if retried:
+                retries.put((index, record, None, attempt + 1))
+            else:
+                fail(index, e)
+        else:
+            if journal is not None:
+                journal._record_success(index)
+        latency = time.monotonic() - start
+        stats._record(latency, succeeded=succeeded, throttled=throttled, retried=retried)
+        limiter.release(latency, throttled=throttled)
+
+    def pending_records():
+        for index, record, error in records:
+            while not retries.empty():
+                yield retries.get()
+            yield index, record, error, 0
+        while True:
+            limiter.wait_idle()
+            if retries.empty():
+                return
+            while not retries.empty():
+                yield retries.get()
+
+    last_report = time.monotonic()
+    try:
+        with ThreadPoolExecutor(
+            max_workers=config.max_concurrency, thread_name_prefix="sagemaker-fs-ingest"
+        ) as executor:
+            for index, record, error, attempt in pending_records():
+                if error is not None:
+                    fail(index, error)
+                    stats._record_failure()
+                    continue
+                limiter.acquire()
+                executor.submit(send, index, record, attempt)
+                if time.monotonic() - last_report >= config.report_interval:
+                    logger.info("Ingestion progress: %s", stats)
+                    last_report = time.monotonic()
+                if journal is not None:
+                    journal._checkpoint()
+    finally:
+        if journal is not None:
+            journal.save()
+    stats._finish()
+    logger.info("Ingestion finished: %s", stats)
+    return failed_rows
+
+
+class IngestionJournal:
+    """Record the progress of an ingestion, so that it can resume where it stopped.
+
+    The journal is a JSON file, local or in S3, which records the ranges of rows ingested
+    and the rows that failed to be ingested with the code of their error. It is saved
+    every ``checkpoint_interval`` seconds and when the ingestion ends. When an ingestion
+    is started with a journal that already records some progress, the rows it records as
+    ingested are skipped, and the other rows, including the ones that failed, are sent.
+
+    A row is only recorded as ingested once its ``PutRecord`` request succeeded, so after a
+    crash, the requests that were in flight are sent again. ``PutRecord`` overwrites a
+    record with the same identifier and event time, so this does not duplicate records.
+
+    The rows of a DataFrame, or of an iterable of DataFrames, are identified by their
+    position in it, and the rows read from files by the path of the file and their position
+    in it. Resume an ingestion with the same source, in the same order.
+
+    Example:
+        >>> journal = IngestionJournal("s3://bucket/journals/backfill.json")
+        >>> feature_group.ingest_stream("s3://bucket/history/", journal=journal)
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        sagemaker_session=None,
+        kms_key: str = None,
+        checkpoint_interval: float = 30,
+    ):
+        """Initialize an ``IngestionJournal``.
+
+        Args:
+            uri (str): the path of the journal, local or in S3.
+            sagemaker_session (sagemaker.session.Session): session used to read and write the
+                journal in S3 (default: None). If not specified, the session of the Feature
+                Group is used.
+            kms_key (str): the KMS key used to encrypt the journal in S3 (default: None).
+            checkpoint_interval (float): the number of seconds between two saves of the
+                journal during an ingestion (default: 30).
+        """
+        self.uri = uri
+        self.sagemaker_session = sagemaker_session
+        self.kms_key = kms_key
+        self.checkpoint_interval = checkpoint_interval
+        self._feature_group_name = None
+        self._completed = {}
+        self._failed = {}
+        self._last_save = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def completed_rows(self) -> int:
+        """The number of rows recorded as ingested."""
+        with self._lock:
+            return sum(end - start for ranges in self._completed.values() for start, end in ranges)
+
+    @property
+    def failed_rows(self) -> List[Tuple[str, int, str]]:
+        """The source, the position and the error code of the rows that failed.
+
+        The source is the path of the file the row was read from, or ``""`` for the rows of
+        a DataFrame.
+        """
+        with self._lock:
+            return [
+                (source, position, error_code)
+                for source, failed in sorted(self._failed.items())
+                for position, error_code in sorted(failed.items())
+            ]
+
+    def load(self, feature_group_name: str, sagemaker_session=None):
+        """Read the journal, if it exists.
+
+        Args:
+            feature_group_name (str): the name of the Feature Group ingested.
+            sagemaker_session (sagemaker.session.Session): session used if the journal has
+                none (default: None).
+
+        Raises:
+            ValueError: if the journal records the ingestion of another Feature Group.
+        """
+        self.sagemaker_session = self.sagemaker_session or sagemaker_session
+        content = self._read()
+        with self._lock:
+            self._feature_group_name = feature_group_name
+            self._completed, self._failed = {}, {}
+            self._last_save = time.monotonic()
+            if content is None:
+                return
+            journal = json.loads(content)
+            if journal["feature_group_name"] != feature_group_name:
+                raise ValueError(
+                    f"The journal {self.uri} records the ingestion of Feature Group "
+                    f"{journal['feature_group_name']}, not {feature_group_name}."
+                )
+            self._completed = {
+                source: [list(completed_range) for completed_range in ranges]
+                for source, ranges in journal["completed"].items()
+            }
+            self._failed = {
+                source: {int(position): error_code for position, error_code in failed.items()}
+                for source, failed in journal["failed"].items()
+            }
+        logger.info(
+            "Resuming ingestion from journal %s: %d rows ingested, %d failed.",
+            self.uri,
+            self.completed_rows,
+            len(self.failed_rows),
+        )
+
+    def save(self):
+        """Write the journal."""
+        with self._lock:
+            content = json.dumps(
+                {
+                    "version": _JOURNAL_VERSION,
+                    "feature_group_name": self._feature_group_name,
+                    "completed": self._completed,
+                    "failed": {
+                        source: {str(position): code for position, code in failed.items()}
+                        for source, failed in self._failed.items()
+                        if failed
+                    },
+                }
+            )
+            self._last_save = time.monotonic()
+        if self.uri.startswith("s3://"):
+            S3Uploader.upload_string_as_file_body(
+                content, self.uri, self.kms_key, self.sagemaker_session
+            )
+        else:
+            directory = os.path.dirname(os.path.abspath(self.uri))
+            os.makedirs(directory, exist_ok=True)
+            fd, path = tempfile.mkstemp(dir=directory, prefix=".journal-")
+            with os.fdopen(fd, "w") as f:
+                f.write(content)
+            os.replace(path, self.uri)
+
+    def _read(self) -> str:
+        """Return the content of the journal, or None if it does not exist."""
+        if self.uri.startswith("s3://"):
+            try:
+                return S3Downloader.read_file(self.uri, self.sagemaker_session)
+            except ClientError as e:
+                if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                    return None
+                raise
+        if not os.path.exists(self.uri):
+            return None
+        with open(self.uri) as f:
+            return f.read()
+
+    def _checkpoint(self):
+        """Save the journal if it was not saved for ``checkpoint_interval`` seconds."""
+        if time.monotonic() - self._last_save >= self.checkpoint_interval:
+            self.save()
+
+    def _skip_completed(self, data_frame: pd.DataFrame) -> pd.DataFrame:
+        """Return the rows of a DataFrame that are not recorded as ingested."""
+        if data_frame.shape[0] == 0:
+            return data_frame
+        sources, positions = _row_keys(data_frame.index)
+        completed = np.zeros(data_frame.shape[0], dtype=bool)
+        with self._lock:
+            for source in set(sources):
+                if not self._completed.get(source):
+                    continue
+                ranges = np.array(self._completed[source], dtype=np.int64)
+                in_source = sources == source
+                i = np.searchsorted(ranges[:, 0], positions[in_source], side="right") - 1
+                completed[in_source] = (i >= 0) & (positions[in_source] < ranges[i, 1])
+        return data_frame[~completed] if completed.any() else data_frame
+
+    def _record_success(self, index):
+        """Record that a row was ingested."""
+        source, position = _row_key(index)
+        with self._lock:
+            _add_to_ranges(self._completed.setdefault(source, []), position)
+            failed = self._failed.get(source)
+            if failed:
+                failed.pop(position, None)
+
+    def _record_failure(self, index, error: Exception):
+        """Record that a row failed to be ingested, with the code of its error."""
+        source, position = _row_key(index)
+        if isinstance(error, ClientError):
+            error_code = error.response.get("Error", {}).get("Code", "ClientError")
+        else:
+            error_code = type(error).__name__
+        with self._lock:
+            self._failed.setdefault(source, {})[position] = error_code
+
+
+def _row_key(index) -> Tuple[str, int]:
+    """Return the source and the position of a row from its index."""
+    if isinstance(index, tuple):
+        return str(index[0]), int(index[1])
+    return "", int(index)
+
+
+def _row_keys(index: pd.Index) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the sources and the positions of rows from their index."""
+    if isinstance(index, pd.MultiIndex):
+        return (
+            index.get_level_values(0).astype(str).to_numpy(),
+            index.get_level_values(1).to_numpy(dtype=np.int64),
+        )
+    return np.full(len(index), "", dtype=object), index.to_numpy(dtype=np.int64)
+
+
+def _add_to_ranges(ranges: List[List[int]], position: int):
+    """Add a position to a sorted list of disjoint ``[start, end)`` ranges."""
+    i = bisect.bisect_right(ranges, [position, math.inf])
+    if i > 0 and ranges[i - 1][1] >= position:
+        # the position extends, or is in, the previous range
+        ranges[i - 1][1] = max(ranges[i - 1][1], position + 1)
+        i -= 1
+    elif i < len(ranges) and ranges[i][0] == position + 1:
+        ranges[i][0] = position
+        return
+    else:
+        ranges.insert(i, [position, position + 1])
+    if i + 1 < len(ranges) and ranges[i + 1][0] <= ranges[i][1]:
+        ranges[i][1] = max(ranges[i][1], ranges.pop(i + 1)[1])
+
+
+@attr.s(frozen=True)
+class _SharedDataFrame:
+    """A DataFrame written once to a memory-mapped file, and read back by row range.
+
+    The columns with a numpy dtype are stored contiguously in the file, and ``read`` returns
+    read-only views of them without copying. The other columns, such as strings and lists,
+    cannot be mapped and are pickled once for each row range given to ``create``, together
+    with the index when it is not a ``RangeIndex`` or numpy array. Only the file path and a
+    description of its layout are pickled when the instance is sent to another process.
+
+    Attributes:
+        path (str): the path of the memory-mapped file.
+        num_rows (int): the number of rows of the DataFrame.
+        columns (List[Tuple[Any, str, int]]): the name of each column, with the dtype and
+            the offset of its values in the file, or None if the column is pickled.
+        index (Tuple): ``("range", start, step)``, ``("array", dtype, offset)`` or
+            ``("pickled",)``.
+        pickled_ranges (Dict[Tuple[int, int], Tuple[int, int]]): the offset and the length
+            of the pickled part of each row range.
+        start (int): the first row read by ``read``.
+        end (int): the row after the last row read by ``read``.
+    """
+
+    path: str = attr.ib()
+    num_rows: int = attr.ib()
+    columns: List[Tuple[Any, str, int]] = attr.ib()
+    index: Tuple = attr.ib()
+    pickled_ranges: Dict[Tuple[int, int], Tuple[int, int]] = attr.ib()
+    start: int = attr.ib(default=0)
+    end: int = attr.ib(default=None)
+
+    @classmethod
+    def create(
+        cls, data_frame: pd.DataFrame, row_ranges: List[Tuple[int, int]]
+    ) -> "_SharedDataFrame":
+        """Write a DataFrame to a memory-mapped file.
+
+        Args:
+            data_frame (DataFrame): the DataFrame to share.
+            row_ranges (List[Tuple[int, int]]): the ranges of rows that are read.
+
+        Returns:
+            The shared DataFrame, whose file must be removed with ``close``.
+        """
+        directory = tempfile.gettempdir()
+        if _has_free_space(_SHARED_MEMORY_DIR, data_frame.memory_usage().sum()):
+            directory = _SHARED_MEMORY_DIR
+        try:
+            return cls._write(data_frame, row_ranges, directory)
+        except OSError as e:
+            if e.errno != errno.ENOSPC or directory == tempfile.gettempdir():
+                raise
+            logger.info(
+                "%s is full, sharing the DataFrame from the temporary directory.", directory
+            )
+            return cls._write(data_frame, row_ranges, tempfile.gettempdir())
+
+    @classmethod
+    def _write(
+        cls, data_frame: pd.DataFrame, row_ranges: List[Tuple[int, int]], directory: str
+    ) -> "_SharedDataFrame":
+        """Write a DataFrame to a memory-mapped file in a directory."""
+        fd, path = tempfile.mkstemp(prefix="sagemaker-fs-ingest-", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                columns = []
+                pickled_columns = []
+                for position, name in enumerate(data_frame.columns):
+                    values = data_frame.iloc[:, position]
+                    if _is_mappable(values.dtype):
+                        columns.append((name, values.dtype.str, _write_array(f, values)))
+                    else:
+                        columns.append((name, None, None))
+                        pickled_columns.append(position)
+
+                if isinstance(data_frame.index, pd.RangeIndex):
+                    index = ("range", data_frame.index.start, data_frame.index.step)
+                elif _is_mappable(data_frame.index.dtype):
+                    index = ("array", data_frame.index.dtype.str, _write_array(f, data_frame.index))
+                else:
+                    index = ("pickled",)
+
+                pickled_ranges = {}
+                if pickled_columns or index[0] == "pickled":
+                    for start, end in row_ranges:
+                        offset = f.tell()
+                        pickle.dump(
+                            data_frame.iloc[start:end, pickled_columns],
+                            f,
+                            protocol=pickle.HIGHEST_PROTOCOL,
+                        )
+                        pickled_ranges[(start, end)] = (offset, f.tell() - offset)
+        except BaseException:
+            os.remove(path)
+            raise
+        return cls(path, data_frame.shape[0], columns, index, pickled_ranges)
+
+    def slice(self, start: int, end: int) -> "_SharedDataFrame":
+        """Return the shared DataFrame restricted to a row range given to ``create``."""
+        return attr.evolve(self, start=start, end=end)
+
+    def read(self) -> pd.DataFrame:
+        """Map the rows of the shared DataFrame into a DataFrame."""
+        end = self.num_rows if self.end is None else self.end
+        pickled = None
+        if self.pickled_ranges:
+            offset, length = self.pickled_ranges[(self.start, end)]
+            pickled = pickle.loads(self._map(np.uint8, offset, length))
+
+        if self.index[0] == "range":
+            _, index_start, step = self.index
+            index = pd.RangeIndex(index_start + self.start * step, index_start + end * step, step)
+        elif self.index[0] == "array":
+            index = pd.Index(
+                self._map(self.index[1], self.index[2], self.num_rows)[self.start : end]
+            )
+        else:
+            index = pickled.index
+
+        columns = {}
+        pickled_position = 0
+        for position, (_, dtype, offset) in enumerate(self.columns):
+            if dtype is None:
+                values = pickled.iloc[:, pickled_position].array
+                pickled_position += 1
+            else:
+                values = self._map(dtype, offset, self.num_rows)[self.start : end]
+            columns[position] = pd.Series(values, index=index, copy=False)
+        data_frame = pd.DataFrame(columns, index=index, copy=False)
+        data_frame.columns = pd.Index([name for name, _, _ in self.columns], tupleize_cols=False)
+        return data_frame
+
+    def close(self):
+        """Remove the memory-mapped file."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _map(self, dtype: str, offset: int, length: int) -> np.ndarray:
+        """Map an array of the file in memory."""
+        if length == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(self.path, dtype=dtype, mode="r", offset=offset, shape=(length,))
+
+
+def _has_free_space(directory: str, size: int) -> bool:
+    """Return True if a directory exists and has at least ``size`` bytes available."""
+    if not os.path.isdir(directory):
+        return False
+    stat = os.statvfs(directory)
+    return stat.f_bavail * stat.f_frsize >= size
+
+
+def _is_mappable(dtype) -> bool:
+    """Return True if the values of a dtype can be mapped from a file."""
+    return isinstance(dtype, np.dtype) and dtype.kind in "biufcmM"
+
+
+def _write_array(f, values) -> int:
+    """Write the values of a column to a file, and return their offset."""
+    offset = -f.tell() % _SHARED_COLUMN_ALIGNMENT
+    f.write(b"\0" * offset)
+    offset = f.tell()
+    f.write(np.ascontiguousarray(values.to_numpy()).view(np.uint8))
+    return offset
+
+
+def _prefetch(iterable: Iterable[Any], max_buffered: int) -> Iterator[Any]:
+    """Iterate over an iterable in a background thread, up to ``max_buffered`` items ahead.
+
+    Args:
+        iterable (Iterable[Any]): the items, which are produced by the background thread.
+        max_buffered (int): the largest number of items produced but not consumed yet.
+
+    Returns:
+        Iterator of the items. An exception raised by the iterable is raised again by the
+        iterator, and the background thread stops when the iterator is closed.
+    """
+    if max_buffered < 1:
+        raise ValueError("max_buffered must be at least 1.")
+    buffer = queue.Queue(maxsize=max_buffered)
+    stopped = threading.Event()
+    end = object()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except BaseException as e:  # pylint: disable=broad-except
+            put((end, e))
+        else:
+            put((end, None))
+
+    thread = threading.Thread(target=produce, name="sagemaker-fs-ingest-reader", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is end:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stopped.set()
+
+
+def _iter_data_frames(
+    source: Any,
+    sagemaker_session=None,
+    chunk_size: int = 10000,
+    file_format: str = None,
+    read_csv_kwargs: Dict[str, Any] = None,
+    positional_index: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """Read a source of rows lazily, as DataFrames of at most ``chunk_size`` rows.
+
+    Args:
+        source (Any): a DataFrame, an iterable of DataFrames, or the path of a file or a
+            directory, local or in S3, of CSV or Parquet files.
+        sagemaker_session (sagemaker.session.Session): session used to read from S3
+            (default: None).
+        chunk_size (int): the number of rows of each DataFrame read from files or sliced
+            from a DataFrame (default: 10000).
+        file_format (str): ``"csv"`` or ``"parquet"`` (default: None). If not specified, the
+            format of each file is inferred from its extension.
+        read_csv_kwargs (Dict[str, Any]): keyword arguments of ``pandas.read_csv``
+            (default: None).
+        positional_index (bool): whether the rows of DataFrames are indexed by their
+            position in the source instead of their own index (default: False).
+
+    Returns:
+        Iterator of DataFrames. The rows of the DataFrames read from files are indexed by
+        the path of the file and the position of the row in it.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        for path, open_file in _list_files(os.fspath(source), sagemaker_session):
+            yield from _read_file(path, open_file, chunk_size, file_format, read_csv_kwargs)
+        return
+
+    data_frames = source
+    if isinstance(source, pd.DataFrame):
+        data_frames = (
+            source.iloc[start : start + chunk_size]
+            for start in range(0, source.shape[0], chunk_size)
+        )
+    position = 0
+    for data_frame in data_frames:
+        if positional_index:
+            data_frame = data_frame.set_axis(
+                pd.RangeIndex(position, position + data_frame.shape[0]), axis=0
+            )
+        position += data_frame.shape[0]
+        yield data_frame
+
+
+def _list_files(path: str, sagemaker_session) -> Iterator[Tuple[str, Callable]]:
+    """List the files under a path, local or in S3, with a function opening each of them.
+
+    Files whose name starts with ``_`` or ``.``, such as the ``_SUCCESS`` markers of Spark
+    jobs, are skipped.
+    """
+    if path.startswith("s3://"):
+        s3_client = sagemaker_session.get_client("s3")
+        bucket, prefix = parse_s3_url(path)
+        paginator = s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            for s3_object in page.get("Contents", []):
+                key = s3_object["Key"]
+                if key.endswith("/") or not _is_data_file(key):
+                    continue
+                yield f"s3://{bucket}/{key}", _s3_file_opener(s3_client, bucket, key)
+    elif os.path.isdir(path):
+        for directory, dir_names, file_names in os.walk(path):
+            dir_names.sort()
+            for file_name in sorted(file_names):
+                file_path = os.path.join(directory, file_name)
+                if _is_data_file(file_path):
+                    yield file_path, _local_file_opener(file_path)
+    else:
+        yield path, _local_file_opener(path)
+
+
+def _is_data_file(path: str) -> bool:
+    """Return False for the metadata files written next to data files."""
+    return not os.path.basename(path).startswith(("_", "."))
+
+
+def _local_file_opener(path: str) -> Callable:
+    """Return a function opening a local file for reading."""
+    return lambda seekable=False: open(path, "rb")
+
+
+def _s3_file_opener(s3_client, bucket: str, key: str) -> Callable:
+    """Return a function opening an S3 object for reading.
+
+    The object is streamed, except for the Parquet files, which are downloaded to a
+    temporary file because their metadata is at the end.
+    """
+
+    def open_file(seekable=False):
+        if not seekable:
+            return s3_client.get_object(Bucket=bucket, Key=key)["Body"]
+        f = tempfile.TemporaryFile()
+        s3_client.download_fileobj(bucket, key, f)
+        f.seek(0)
+        return f
+
+    return open_file
+
+
+def _file_format(path: str, file_format: str = None) -> Tuple[str, str]:
+    """Return the format and the compression of a file."""
+    root, extension = os.path.splitext(path.lower())
+    compression = _CSV_COMPRESSIONS.get(extension)
+    if compression is not None:
+        extension = os.path.splitext(root)[1]
+    file_format = file_format or _FILE_FORMATS.get(extension)
+    if file_format not in ("csv", "parquet"):
+        raise ValueError(
+            f"Cannot read {path}, file_format must be 'csv' or 'parquet' "
+            "for files without a .csv or .parquet extension."
+        )
+    return file_format, compression
+
+
+def _read_file(
+    path: str,
+    open_file: Callable,
+    chunk_size: int,
+    file_format: str = None,
+    read_csv_kwargs: Dict[str, Any] = None,
+) -> Iterator[pd.DataFrame]:
+    """Read a CSV or Parquet file as DataFrames of at most ``chunk_size`` rows."""
+    file_format, compression = _file_format(path, file_format)
+    position = 0
+    if file_format == "csv":
+        with open_file() as f:
+            read_csv_kwargs = {"compression": compression, **(read_csv_kwargs or {})}
+            with pd.read_csv(f, chunksize=chunk_size, **read_csv_kwargs) as reader:
+                for data_frame in reader:
+                    yield _index_rows(data_frame, path, position)
+                    position += data_frame.shape[0]
+    else:
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Unable to import pyarrow, install it to ingest Parquet files."
+            ) from e
+
+        with open_file(seekable=True) as f:
+            for batch in pq.ParquetFile(f).iter_batches(batch_size=chunk_size):
+                data_frame = batch.to_pandas()
+                yield _index_rows(data_frame, path, position)
+                position += data_frame.shape[0]
+
+
+def _index_rows(data_frame: pd.DataFrame, path: str, position: int) -> pd.DataFrame:
+    """Index the rows of a DataFrame read from a file by the path and their position."""
+    data_frame.index = pd.MultiIndex.from_arrays(
+        [
+            np.full(data_frame.shape[0], path, dtype=object),
+            np.arange(position, position + data_frame.shape[0]),
+        ]
+    )
+    return data_frame
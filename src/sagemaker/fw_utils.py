@@ -13,6 +13,7 @@
 """Utility methods used by framework classes."""
 from __future__ import absolute_import
 
+import hashlib
 import json
 import logging
 import os
@@ -23,13 +24,14 @@ import time
 from collections import namedtuple
 from typing import Dict, List, Optional, Union
 
+import botocore
 from packaging import version
 
 import sagemaker.image_uris
 import sagemaker.utils
 from sagemaker.deprecations import deprecation_warn_base, renamed_kwargs, renamed_warning
 from sagemaker.instance_group import InstanceGroup
-from sagemaker.s3_utils import s3_path_join
+from sagemaker.s3_utils import S3MultipartUploadWriter, s3_path_join
 from sagemaker.session_settings import SessionSettings
 from sagemaker.workflow import is_pipeline_variable
 from sagemaker.workflow.entities import PipelineVariable
@@ -402,6 +404,12 @@ def tar_and_upload_dir(
     """Package source files and upload a compress tar file to S3.
 
     The S3 location will be ``s3://<bucket>/s3_key_prefix/sourcedir.tar.gz``.
+    If the ``source_code_cache_prefix`` of ``settings`` is set, the archive is instead keyed
+    by the digest of its content, at
+    ``s3://<bucket>/<source_code_cache_prefix>/<digest>/sourcedir.tar.gz``, and an archive
+    already present at that location is reused without being built or uploaded again.
+    If ``stream_archive_uploads`` is enabled in ``settings``, the archive is compressed
+    straight into an S3 multipart upload instead of a temporary file.
     If directory is an S3 URI, an UploadedCode object will be returned, but
     nothing will be uploaded to S3 (this allow reuse of code already in S3).
     If directory is None, the script will be added to the archive at
@@ -453,12 +461,21 @@ def tar_and_upload_dir(
     local_download_dir = None if settings is None else settings.local_download_dir
     tmp = tempfile.mkdtemp(dir=local_download_dir)
     encrypt_artifact = True if settings is None else settings.encrypt_repacked_artifacts
+    cache_prefix = None if settings is None else settings.source_code_cache_prefix
 
     try:
         source_files = _list_files_to_compress(script, directory) + dependencies
-        tar_file = sagemaker.utils.create_tar_file(
-            source_files, os.path.join(tmp, _TAR_SOURCE_FILENAME)
-        )
+
+        if s3_resource is None:
+            s3_resource = session.resource("s3", region_name=session.region_name)
+        else:
+            logger.debug("Using provided s3_resource")
+
+        if cache_prefix:
+            key = _cached_source_code_key(cache_prefix, source_files, kms_key)
+            if _s3_object_exists(s3_resource, bucket, key):
+                logger.info("Reusing cached source code archive s3://%s/%s", bucket, key)
+                return UploadedCode(s3_prefix="s3://%s/%s" % (bucket, key), script_name=script_name)
 
         if kms_key:
             extra_args = {"ServerSideEncryption": "aws:kms", "SSEKMSKeyId": kms_key}
@@ -469,18 +486,50 @@ def tar_and_upload_dir(
         else:
             extra_args = None
 
-        if s3_resource is None:
-            s3_resource = session.resource("s3", region_name=session.region_name)
+        if settings is not None and settings.stream_archive_uploads:
+            with S3MultipartUploadWriter(
+                s3_resource.meta.client, bucket, key, extra_args
+            ) as writer:
+                sagemaker.utils.write_tar_file(
+                    source_files, writer, deterministic=bool(cache_prefix), settings=settings
+                )
         else:
-            logger.debug("Using provided s3_resource")
-
-        s3_resource.Object(bucket, key).upload_file(tar_file, ExtraArgs=extra_args)
+            tar_file = sagemaker.utils.create_tar_file(
+                source_files,
+                os.path.join(tmp, _TAR_SOURCE_FILENAME),
+                deterministic=bool(cache_prefix),
+                settings=settings,
+            )
+            s3_resource.Object(bucket, key).upload_file(tar_file, ExtraArgs=extra_args)
     finally:
         shutil.rmtree(tmp)
 
     return UploadedCode(s3_prefix="s3://%s/%s" % (bucket, key), script_name=script_name)
 
 
+def _cached_source_code_key(cache_prefix, source_files, kms_key=None):
+    """Return the S3 key of the cached source code archive for the given files.
+
+    The KMS key is part of the digest so that archives encrypted with different keys are
+    never shared.
+    """
+    digest = sagemaker.utils.compute_tar_content_digest(source_files)
+    if kms_key:
+        digest = hashlib.sha256("{}:{}".format(digest, kms_key).encode("utf-8")).hexdigest()
+    return s3_path_join(cache_prefix, digest, "sourcedir.tar.gz")
+
+
+def _s3_object_exists(s3_resource, bucket, key):
+    """Return True if the S3 object exists, False if S3 reports that it does not."""
+    try:
+        s3_resource.Object(bucket, key).load()
+    except botocore.exceptions.ClientError as e:
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+            return False
+        raise
+    return True
+
+
 def _list_files_to_compress(script, directory):
     """Placeholder docstring."""
     if directory is None:
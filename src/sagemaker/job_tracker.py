@@ -0,0 +1,274 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""This module tracks the status of many SageMaker jobs with a few list calls per poll."""
+from __future__ import absolute_import
+
+import collections
+import datetime
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+# The SageMaker API names of the job types, as used in the list and describe operations,
+# for example ``list_training_jobs``, ``describe_training_job`` and ``TrainingJobSummaries``.
+_JOB_TYPES = {
+    "training": ("training_job", "TrainingJob"),
+    "processing": ("processing_job", "ProcessingJob"),
+    "transform": ("transform_job", "TransformJob"),
+}
+_TERMINAL_STATUSES = ("Completed", "Failed", "Stopped")
+_MAX_RESULTS = 100
+
+FinishedJob = collections.namedtuple(
+    "FinishedJob", ["job_type", "job_name", "status", "description"]
+)
+FinishedJob.__doc__ = """A job that reached a terminal status.
+
+Attributes:
+    job_type (str): One of "training", "processing" or "transform".
+    job_name (str): The name of the job.
+    status (str): Either "Completed", "Failed" or "Stopped".
+    description (dict): The response of the ``Describe*Job`` API for the job.
+"""
+
+
+class JobTracker(object):
+    """Wait for many training, processing and transform jobs with one polling loop.
+
+    Instead of describing every job on every poll, each poll lists the jobs of each type that
+    were modified since the previous poll, filtered on the creation time of the oldest tracked
+    job, so that a single request refreshes up to 100 jobs. The first poll lists the jobs
+    that are in progress, which also provides the creation time of every job. Every list call
+    is also filtered on the longest common prefix of the names of the tracked jobs, if any. A
+    job is only described once, when it reaches a terminal status, to return its full
+    description.
+
+    Example:
+        >>> tracker = JobTracker(sagemaker_session)
+        >>> tracker.add_jobs(training_job_names, job_type="training")
+        >>> for job in tracker.as_completed():
+        ...     print(job.job_name, job.status)
+    """
+
+    def __init__(self, sagemaker_session, poll=30, modified_time_margin=300):
+        """Initialize a ``JobTracker``.
+
+        Args:
+            sagemaker_session (sagemaker.session.Session): The session used to call SageMaker.
+            poll (int): The interval in seconds between refreshes (default: 30).
+            modified_time_margin (int): How many seconds before the previous refresh the
+                last modification time filter starts, to allow for clock skew between the
+                client and SageMaker (default: 300).
+        """
+        self.sagemaker_session = sagemaker_session
+        self.poll = poll
+        self.modified_time_margin = modified_time_margin
+        self._pending = {job_type: {} for job_type in _JOB_TYPES}
+        self._finished = collections.OrderedDict()
+        self._last_refresh = {job_type: None for job_type in _JOB_TYPES}
+
+    @property
+    def pending(self):
+        """list[tuple[str, str]]: The (job type, job name) of the jobs that are not finished."""
+        return [(job_type, name) for job_type, jobs in self._pending.items() for name in jobs]
+
+    @property
+    def finished(self):
+        """list[FinishedJob]: The jobs that reached a terminal status, in order of completion."""
+        return list(self._finished.values())
+
+    def add_job(self, job_name, job_type="training"):
+        """Start tracking a job.
+
+        Args:
+            job_name (str): The name of the job.
+            job_type (str): One of "training", "processing" or "transform"
+                (default: "training").
+        """
+        if job_type not in _JOB_TYPES:
+            raise ValueError(
+                "job_type must be one of {}, got {}.".format(sorted(_JOB_TYPES), job_type)
+            )
+        if (job_type, job_name) in self._finished or job_name in self._pending[job_type]:
+            return
+        self._pending[job_type][job_name] = None
+        # The creation time of the new job is not known, so the next refresh starts over.
+        self._last_refresh[job_type] = None
+
+    def add_jobs(self, job_names, job_type="training"):
+        """Start tracking several jobs of the same type.
+
+        Args:
+            job_names (list[str]): The names of the jobs.
+            job_type (str): One of "training", "processing" or "transform"
+                (default: "training").
+        """
+        for job_name in job_names:
+            self.add_job(job_name, job_type)
+
+    def refresh(self):
+        """Refresh the status of the tracked jobs.
+
+        Returns:
+            list[FinishedJob]: The jobs that reached a terminal status since the last refresh.
+        """
+        finished = []
+        for job_type, jobs in self._pending.items():
+            if not jobs:
+                continue
+            refresh_time = time.time()
+            if self._last_refresh[job_type] is None:
+                statuses = self._refresh_all(job_type)
+            else:
+                statuses = self._refresh_modified(job_type)
+            self._last_refresh[job_type] = refresh_time
+
+            for job_name, status in statuses.items():
+                if status in _TERMINAL_STATUSES:
+                    job = self._finish(job_type, job_name)
+                    if job is not None:
+                        finished.append(job)
+        return finished
+
+    def as_completed(self, timeout=None):
+        """Yield the tracked jobs as they reach a terminal status.
+
+        Args:
+            timeout (int): The maximum number of seconds to wait for all the jobs
+                (default: None). If not specified, wait until every job is finished.
+
+        Yields:
+            FinishedJob: A job that reached a terminal status.
+
+        Raises:
+            TimeoutError: If some jobs are not finished after ``timeout`` seconds.
+        """
+        deadline = time.time() + timeout if timeout is not None else None
+        while True:
+            for job in self.refresh():
+                yield job
+            if not self.pending:
+                return
+            if deadline is not None and time.time() + self.poll > deadline:
+                raise TimeoutError(
+                    "Timed out waiting for {} jobs: {}".format(
+                        len(self.pending), ", ".join(name for _, name in self.pending)
+                    )
+                )
+            time.sleep(self.poll)
+
+    def wait(self, callback=None, timeout=None):
+        """Wait until every tracked job reaches a terminal status.
+
+        Args:
+            callback (callable[[FinishedJob], None]): A function called with each job as soon
+                as it reaches a terminal status (default: None).
+            timeout (int): The maximum number of seconds to wait for all the jobs
+                (default: None). If not specified, wait until every job is finished.
+
+        Returns:
+            list[FinishedJob]: All the finished jobs, in order of completion.
+
+        Raises:
+            TimeoutError: If some jobs are not finished after ``timeout`` seconds.
+        """
+        for job in self.as_completed(timeout=timeout):
+            if callback is not None:
+                callback(job)
+        return self.finished
+
+    def _refresh_all(self, job_type):
+        """List the jobs in progress and describe the tracked jobs that are not among them."""
+        jobs = self._pending[job_type]
+        statuses = {}
+        for summary in self._list_jobs(job_type, StatusEquals="InProgress"):
+            name = summary[_JOB_TYPES[job_type][1] + "Name"]
+            if name in jobs:
+                jobs[name] = summary["CreationTime"]
+                statuses[name] = "InProgress"
+        for name in [name for name in jobs if name not in statuses]:
+            # The job is either finished or stopping, its description is needed in both cases.
+            description = self._describe_job(job_type, name)
+            jobs[name] = description["CreationTime"]
+            statuses[name] = description[_JOB_TYPES[job_type][1] + "Status"]
+            if statuses[name] in _TERMINAL_STATUSES:
+                self._finished[(job_type, name)] = self._finished_job(job_type, description)
+        return statuses
+
+    def _refresh_modified(self, job_type):
+        """List the jobs modified since the last refresh, created after the oldest tracked job."""
+        jobs = self._pending[job_type]
+        margin = datetime.timedelta(seconds=self.modified_time_margin)
+        modified_after = datetime.datetime.fromtimestamp(
+            self._last_refresh[job_type], tz=datetime.timezone.utc
+        )
+        statuses = {}
+        for summary in self._list_jobs(
+            job_type,
+            CreationTimeAfter=min(jobs.values()) - datetime.timedelta(seconds=1),
+            LastModifiedTimeAfter=modified_after - margin,
+        ):
+            name = summary[_JOB_TYPES[job_type][1] + "Name"]
+            if name in jobs:
+                statuses[name] = summary[_JOB_TYPES[job_type][1] + "Status"]
+        return statuses
+
+    def _list_jobs(self, job_type, **filters):
+        """Yield the summaries of the jobs of a type that match ``filters``.
+
+        The jobs are also filtered on the common prefix of the names of the tracked jobs.
+        """
+        operation, resource = _JOB_TYPES[job_type]
+        list_jobs = getattr(self.sagemaker_session.sagemaker_client, "list_{}s".format(operation))
+        name_prefix = os.path.commonprefix(list(self._pending[job_type]))
+        if name_prefix:
+            filters["NameContains"] = name_prefix
+        token_arg = {}
+        while True:
+            response = list_jobs(MaxResults=_MAX_RESULTS, **filters, **token_arg)
+            for summary in response[resource + "Summaries"]:
+                yield summary
+            if not response.get("NextToken"):
+                return
+            token_arg = {"NextToken": response["NextToken"]}
+
+    def _describe_job(self, job_type, job_name):
+        """Call the ``Describe*Job`` API for a job."""
+        operation, resource = _JOB_TYPES[job_type]
+        describe_job = getattr(self.sagemaker_session.sagemaker_client, "describe_" + operation)
+        return describe_job(**{resource + "Name": job_name})
+
+    def _finished_job(self, job_type, description):
+        """Build the ``FinishedJob`` of a job from its description."""
+        resource = _JOB_TYPES[job_type][1]
+        return FinishedJob(
+            job_type=job_type,
+            job_name=description[resource + "Name"],
+            status=description[resource + "Status"],
+            description=description,
+        )
+
+    def _finish(self, job_type, job_name):
+        """Stop tracking a finished job and return it, or None if it is not finished yet."""
+        job = self._finished.get((job_type, job_name))
+        if job is None:
+            job = self._finished_job(job_type, self._describe_job(job_type, job_name))
+            if job.status not in _TERMINAL_STATUSES:
+                # The job list was ahead of the description, try again on the next refresh.
+                return None
+            self._finished[(job_type, job_name)] = job
+        del self._pending[job_type][job_name]
+        logger.debug("%s job %s is %s.", job_type, job_name, job.status)
+        return job
@@ -427,11 +427,12 @@ class _SageMakerContainer(object):
         output_files = [
             os.path.join(output_artifacts, name) for name in os.listdir(output_artifacts)
         ]
+        settings = self.sagemaker_session.settings
         sagemaker.utils.create_tar_file(
-            model_files, os.path.join(compressed_artifacts, "model.tar.gz")
+            model_files, os.path.join(compressed_artifacts, "model.tar.gz"), settings=settings
         )
         sagemaker.utils.create_tar_file(
-            output_files, os.path.join(compressed_artifacts, "output.tar.gz")
+            output_files, os.path.join(compressed_artifacts, "output.tar.gz"), settings=settings
         )
 
         if output_data_config["S3OutputPath"] == "":
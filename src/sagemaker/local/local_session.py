@@ -746,6 +746,7 @@ class LocalSession(Session):
             self.sagemaker_config = (
                 sagemaker_config if sagemaker_config else load_sagemaker_config()
             )
+        self._default_s3 = (self.s3_client, self.s3_resource)
 
         sagemaker_config = kwargs.get("sagemaker_config", None)
         if sagemaker_config:
@@ -15,8 +15,11 @@ from __future__ import absolute_import
 
 import collections
 import functools
+import heapq
+import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 ##############################################################################
 #
@@ -92,11 +95,18 @@ def some(arr):
 Position = collections.namedtuple("Position", ["timestamp", "skip"])
 
 
-def multi_stream_iter(client, log_group, streams, positions=None):
+# The maximum number of log streams fetched at the same time by ``multi_stream_iter``.
+MAX_CONCURRENT_STREAMS = 16
+
+
+def multi_stream_iter(client, log_group, streams, positions=None, max_workers=None):
     """Iterate over the available events coming from a set of log streams.
 
     Log streams are in a single log group interleaving the events from each stream
-    so they're yielded in timestamp order.
+    so they're yielded in timestamp order. The streams are read concurrently: the first
+    page of every stream is requested up front, and the next page of a stream is requested
+    as soon as the previous one arrives. The events are merged with a heap, so each event
+    costs O(log n) for n streams.
 
     Args:
         client (boto3 client): The boto client for logs.
@@ -105,31 +115,100 @@ def multi_stream_iter(client, log_group, streams, positions=None):
         this list is the stream number.
         positions: (list of Positions): A list of pairs of (timestamp, skip) which represents
         the last record read from each stream.
+        max_workers (int): The maximum number of streams fetched at the same time
+            (default: None). If not specified, up to ``MAX_CONCURRENT_STREAMS`` streams
+            are fetched at the same time. If 1, the streams are read one page at a time.
 
     Yields:
         A tuple of (stream number, cloudwatch log event).
     """
     positions = positions or {s: Position(timestamp=0, skip=0) for s in streams}
-    event_iters = [
-        log_stream(client, log_group, s, positions[s].timestamp, positions[s].skip) for s in streams
-    ]
-    events = []
-    for s in event_iters:
-        if not s:
-            events.append(None)
-            continue
-        try:
-            events.append(next(s))
-        except StopIteration:
-            events.append(None)
-
-    while some(events):
-        i = argmin(events, lambda x: x["timestamp"] if x else 9999999999)
-        yield (i, events[i])
-        try:
-            events[i] = next(event_iters[i])
-        except StopIteration:
-            events[i] = None
+    if max_workers is None:
+        max_workers = min(len(streams), MAX_CONCURRENT_STREAMS)
+    executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+    try:
+        readers = [
+            _LogStreamReader(
+                client, log_group, s, positions[s].timestamp, positions[s].skip, executor
+            )
+            for s in streams
+        ]
+        heap = []
+        for i, reader in enumerate(readers):
+            event = reader.next_event()
+            if event is not None:
+                heap.append((event["timestamp"], i, event))
+        heapq.heapify(heap)
+
+        while heap:
+            _, i, event = heap[0]
+            yield (i, event)
+            event = readers[i].next_event()
+            if event is None:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, (event["timestamp"], i, event))
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+class _LogStreamReader(object):
+    """Read the events of a log stream page by page, prefetching the next page."""
+
+    def __init__(self, client, log_group, stream_name, start_time, skip, executor):
+        """Initialize a ``_LogStreamReader`` and request the first page of events.
+
+        Args:
+            client (boto3.CloudWatchLogs.Client): The Boto client for CloudWatch logs.
+            log_group (str): The name of the log group.
+            stream_name (str): The name of the specific stream.
+            start_time (int): The time stamp value to start reading the logs from.
+            skip (int): The number of log entries to skip at the start.
+            executor (concurrent.futures.Executor): The executor the pages are fetched on, or
+                None to fetch them on the calling thread.
+        """
+        self._client = client
+        self._log_group = log_group
+        self._stream_name = stream_name
+        self._start_time = start_time
+        self._skip = skip
+        self._executor = executor
+        self._events = collections.deque()
+        self._pending = self._request_page(None)
+
+    def next_event(self):
+        """Return the next available event of the stream, or None if there is none."""
+        while not self._events and self._pending is not None:
+            response = self._pending.result() if self._executor else self._pending()
+            events = response["events"]
+            if events:
+                # Request the next page before handing out the events of this one.
+                self._pending = self._request_page(response["nextForwardToken"])
+            else:
+                self._pending = None
+            if len(events) > self._skip:
+                self._events.extend(events[self._skip :])
+                self._skip = 0
+            else:
+                self._skip -= len(events)
+        return self._events.popleft() if self._events else None
+
+    def _request_page(self, next_token):
+        """Start fetching a page of events, or defer it if there is no executor."""
+        fetch = functools.partial(self._get_log_events, next_token)
+        return self._executor.submit(fetch) if self._executor else fetch
+
+    def _get_log_events(self, next_token):
+        """Call ``get_log_events`` for the page following ``next_token``."""
+        token_arg = {"nextToken": next_token} if next_token is not None else {}
+        return self._client.get_log_events(
+            logGroupName=self._log_group,
+            logStreamName=self._stream_name,
+            startTime=self._start_time,
+            startFromHead=True,
+            **token_arg,
+        )
 
 
 def log_stream(client, log_group, stream_name, start_time=0, skip=0):
@@ -179,3 +258,134 @@ def log_stream(client, log_group, stream_name, start_time=0, skip=0):
             events = []
         for ev in events:
             yield ev
+
+
+class LogExporter(object):
+    """Write the log events of a job to local files and checkpoint the position of each stream.
+
+    The events are written to ``events.jsonl``, one JSON object per event, or to one text file
+    per host. The events are buffered until the next checkpoint, which appends them to the
+    files and then saves the position of every stream, together with the size of every file,
+    to ``positions.json``. When an exporter is created on a directory that already holds a
+    checkpoint, reading resumes from the checkpointed positions, and the files are truncated
+    back to their checkpointed size, so no event is lost or written twice.
+    """
+
+    CHECKPOINT_FILE = "positions.json"
+    JSONL_FILE = "events.jsonl"
+    FORMATS = ("jsonl", "per_host")
+
+    def __init__(self, output_dir, job_name, export_format="jsonl"):
+        """Initialize a ``LogExporter`` and load the checkpoint of a previous export, if any.
+
+        Args:
+            output_dir (str): The local directory the logs and the checkpoint are written to.
+                It is created if it does not exist.
+            job_name (str): The name of the job the logs belong to.
+            export_format (str): Either "jsonl", to write every event to ``events.jsonl``, or
+                "per_host", to write the messages of each stream to ``<host>.log``
+                (default: "jsonl").
+
+        Raises:
+            ValueError: If ``export_format`` is not supported, or if ``output_dir`` holds the
+                export of another job or of another format.
+        """
+        if export_format not in self.FORMATS:
+            raise ValueError(
+                "export_format must be one of {}, got {}.".format(self.FORMATS, export_format)
+            )
+        self.output_dir = output_dir
+        self.job_name = job_name
+        self.export_format = export_format
+        self._pending = collections.OrderedDict()
+        self._truncated = set()
+        os.makedirs(output_dir, exist_ok=True)
+
+        self._positions = {}
+        self._sizes = {}
+        checkpoint_path = os.path.join(output_dir, self.CHECKPOINT_FILE)
+        if os.path.exists(checkpoint_path):
+            with open(checkpoint_path, "r") as f:
+                checkpoint = json.load(f)
+            if (checkpoint["job_name"], checkpoint["format"]) != (job_name, export_format):
+                raise ValueError(
+                    "{} holds the {} export of job {}, not the {} export of job {}.".format(
+                        output_dir,
+                        checkpoint["format"],
+                        checkpoint["job_name"],
+                        export_format,
+                        job_name,
+                    )
+                )
+            self._positions = {
+                stream: Position(*position) for stream, position in checkpoint["streams"].items()
+            }
+            self._sizes = checkpoint["files"]
+
+    @property
+    def positions(self):
+        """dict[str, Position]: The checkpointed position of each stream."""
+        return dict(self._positions)
+
+    def write(self, stream_name, event):
+        """Buffer a log event of a stream until the next checkpoint.
+
+        Args:
+            stream_name (str): The name of the log stream the event was read from.
+            event (dict): The CloudWatch log event.
+        """
+        if self.export_format == "jsonl":
+            record = {
+                "stream": stream_name,
+                "timestamp": event["timestamp"],
+                "message": event["message"],
+            }
+            if "ingestionTime" in event:
+                record["ingestionTime"] = event["ingestionTime"]
+            line = json.dumps(record)
+            filename = self.JSONL_FILE
+        else:
+            line = event["message"]
+            filename = self._host_filename(stream_name)
+        self._pending.setdefault(filename, []).append(line + "\n")
+
+    def checkpoint(self, positions):
+        """Append the buffered events to the files, then save the position of each stream.
+
+        Args:
+            positions (dict[str, Position]): The position of each stream after the buffered
+                events.
+        """
+        for filename, lines in self._pending.items():
+            with open(os.path.join(self.output_dir, filename), "ab") as f:
+                if filename not in self._truncated:
+                    # Drop what was written after the last checkpoint, it is read again.
+                    f.truncate(self._sizes.get(filename, 0))
+                    self._truncated.add(filename)
+                f.write("".join(lines).encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+                self._sizes[filename] = f.tell()
+        self._pending.clear()
+
+        self._positions = dict(positions)
+        checkpoint = {
+            "version": 1,
+            "job_name": self.job_name,
+            "format": self.export_format,
+            "streams": {stream: list(position) for stream, position in positions.items()},
+            "files": self._sizes,
+        }
+        checkpoint_path = os.path.join(self.output_dir, self.CHECKPOINT_FILE)
+        with open(checkpoint_path + ".tmp", "w") as f:
+            json.dump(checkpoint, f, indent=2, sort_keys=True)
+        os.replace(checkpoint_path + ".tmp", checkpoint_path)
+
+    def _host_filename(self, stream_name):
+        """Return the name of the file of a stream, which is named after its host."""
+        host = (
+            stream_name[len(self.job_name) + 1 :]
+            if stream_name.startswith(self.job_name + "/")
+            else stream_name
+        )
+        return host.replace("/", "_") + ".log"
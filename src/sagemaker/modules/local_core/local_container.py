@@ -262,8 +262,13 @@ class _LocalContainer(BaseModel):
         output_files = [
             os.path.join(output_artifacts, name) for name in os.listdir(output_artifacts)
         ]
-        create_tar_file(model_files, os.path.join(compressed_artifacts, "model.tar.gz"))
-        create_tar_file(output_files, os.path.join(compressed_artifacts, "output.tar.gz"))
+        settings = self.sagemaker_session.settings
+        create_tar_file(
+            model_files, os.path.join(compressed_artifacts, "model.tar.gz"), settings=settings
+        )
+        create_tar_file(
+            output_files, os.path.join(compressed_artifacts, "output.tar.gz"), settings=settings
+        )
 
         output_data = "file://%s" % compressed_artifacts
 
@@ -16,4 +16,5 @@ from __future__ import absolute_import
 from sagemaker.remote_function.client import remote, RemoteExecutor  # noqa: F401
 from sagemaker.remote_function.checkpoint_location import CheckpointLocation  # noqa: F401
 from sagemaker.remote_function.custom_file_filter import CustomFileFilter  # noqa: F401
+from sagemaker.remote_function.result_cache import ResultCache  # noqa: F401
 from sagemaker.remote_function.spark_config import SparkConfig  # noqa: F401
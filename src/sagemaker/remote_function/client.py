@@ -13,8 +13,10 @@
 """SageMaker remote function client."""
 from __future__ import absolute_import
 
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from collections import deque
+import datetime
+import os
 import time
 import threading
 from typing import Callable, Dict, List, Optional, Tuple, Any, Union
@@ -22,6 +24,7 @@ import functools
 import itertools
 import inspect
 
+import cloudpickle
 from botocore.exceptions import ClientError
 from sagemaker.exceptions import UnexpectedStatusException
 from sagemaker.experiments._run_context import _RunContext
@@ -40,14 +43,19 @@ from sagemaker.remote_function import logging_config
 from sagemaker.utils import name_from_base, base_from_name
 from sagemaker.remote_function.spark_config import SparkConfig
 from sagemaker.remote_function.custom_file_filter import CustomFileFilter
+from sagemaker.remote_function.result_cache import ResultCache
 from sagemaker.telemetry.telemetry_logging import _telemetry_emitter
 from sagemaker.telemetry.constants import Feature
+from sagemaker.utilities.polling import is_throttling_error
 
 _API_CALL_LIMIT = {
     "SubmittingIntervalInSecs": 1,
     "MinBatchPollingIntervalInSecs": 10,
     "PollingIntervalInSecs": 0.5,
 }
+_TERMINAL_JOB_STATUSES = ("Completed", "Failed", "Stopped")
+# Jobs are listed by creation time, this margin allows for clock skew with SageMaker.
+_CREATION_TIME_MARGIN_IN_SECS = 300
 
 # Possible future states.
 _PENDING = "PENDING"
@@ -94,6 +102,7 @@ def remote(
     use_torchrun: bool = False,
     use_mpirun: bool = False,
     nproc_per_node: Optional[int] = None,
+    cache: Union[bool, ResultCache] = None,
 ):
     """Decorator for running the annotated function as a SageMaker training job.
 
@@ -296,7 +305,14 @@ def remote(
         nproc_per_node (int): Optional. Specifies the number of processes per node for
           distributed training. Defaults to ``None``.
           This is defined automatically configured on the instance type.
+
+        cache (bool, ResultCache): Either ``True`` or a ``ResultCache`` to reuse the result of
+          a previous call with the same function, arguments and runtime environment instead of
+          starting a job. ``True`` uses a ``ResultCache`` whose results never expire. The
+          cached result of a call is removed with ``invalidate_cache(*args, **kwargs)`` on the
+          decorated function. Defaults to ``None``, which means that every call starts a job.
     """
+    result_cache = ResultCache() if cache is True else cache or None
 
     def _remote(func):
 
@@ -350,6 +366,13 @@ def remote(
 
             RemoteExecutor._validate_submit_args(func, *args, **kwargs)
 
+            cache_key = None
+            if result_cache:
+                cache_key = result_cache._key(job_settings, func, args, kwargs)
+                cached = result_cache._load(job_settings, cache_key)
+                if cached:
+                    return cached[1]
+
             job = _Job.start(job_settings, func, args, kwargs)
 
             try:
@@ -396,19 +419,31 @@ def remote(
                 )
 
             if job.describe()["TrainingJobStatus"] == "Completed":
-                return serialization.deserialize_obj_from_s3(
+                result = serialization.deserialize_obj_from_s3(
                     sagemaker_session=job_settings.sagemaker_session,
                     s3_uri=s3_path_join(job_settings.s3_root_uri, job.job_name, RESULTS_FOLDER),
                     hmac_key=job.hmac_key,
                 )
+                if cache_key:
+                    result_cache._save(job_settings, cache_key, job.job_name)
+                return result
 
             if job.describe()["TrainingJobStatus"] == "Stopped":
                 raise RemoteFunctionError("Job for remote function has been aborted.")
 
             return None
 
+        def invalidate_cache(*args, **kwargs):
+            """Remove the cached result of the call with the given arguments."""
+            if not result_cache:
+                raise ValueError("The remote function was not decorated with a cache.")
+            result_cache._invalidate(
+                job_settings, result_cache._key(job_settings, func, args, kwargs)
+            )
+
         wrapper.job_settings = job_settings
         wrapper.wrapped_func = func
+        wrapper.invalidate_cache = invalidate_cache
         return wrapper
 
     if _func is None:
@@ -466,54 +501,153 @@ def _submit_worker(executor):
         logger.exception("Error occurred while submitting CreateTrainingJob requests.")
 
 
+def _list_job_statuses(sagemaker_session, job_names, created_after):
+    """Return the status of the jobs among ``job_names`` found by ListTrainingJobs.
+
+    The jobs of an executor share the prefix of their names, so listing the jobs that contain
+    it and were created after the oldest running job returns all of them, 100 per call.
+    """
+    filters = {"CreationTimeAfter": created_after, "MaxResults": 100}
+    name_prefix = os.path.commonprefix(job_names)
+    if name_prefix:
+        filters["NameContains"] = name_prefix
+    paginator = sagemaker_session.sagemaker_client.get_paginator("list_training_jobs")
+    statuses = {}
+    for page in paginator.paginate(**filters):
+        for summary in page["TrainingJobSummaries"]:
+            if summary["TrainingJobName"] in job_names:
+                statuses[summary["TrainingJobName"]] = summary["TrainingJobStatus"]
+    return statuses
+
+
+def _refresh_job_status(executor, job_name, job):
+    """Describe a running job and stop tracking it if it is terminated."""
+    try:
+        time.sleep(_API_CALL_LIMIT["PollingIntervalInSecs"])
+        if job.describe()["TrainingJobStatus"] in _TERMINAL_JOB_STATUSES:
+            with executor._state_condition:
+                del executor._running_jobs[job_name]
+                executor._state_condition.notify_all()
+    except Exception as e:  # pylint: disable=broad-except
+        if (
+            not isinstance(e, ClientError)
+            or e.response["Error"]["Code"] != "LimitExceededException"  # pylint: disable=no-member
+        ):
+            # Couldn't check the job status, move on
+            logger.exception("Error occurred while checking the status of job %s", job_name)
+            with executor._state_condition:
+                del executor._running_jobs[job_name]
+                executor._state_condition.notify_all()
+
+
 def _polling_worker(executor):
-    """Background worker that polls the status of the running jobs."""
+    """Background worker that polls the status of the running jobs.
+
+    When several jobs are running, their statuses are refreshed in bulk with ListTrainingJobs,
+    and only the terminated jobs are described. Jobs missing from the listing, which happens
+    right after they are created, are described individually, as are all the jobs if the
+    role is not allowed to list them. A terminated job is removed from the running jobs right
+    away, which wakes up the submitting worker to start the next pending request.
+    """
+
+    def is_done():
+        return (
+            executor._shutdown
+            and len(executor._running_jobs) + len(executor._pending_request_queue) == 0
+        )
+
+    creation_times = {}
+    can_list_jobs = True
     try:
         while True:
             with executor._state_condition:
-                if (
-                    executor._shutdown
-                    and len(executor._running_jobs) + len(executor._pending_request_queue) == 0
+                if executor._state_condition.wait_for(
+                    is_done, timeout=_API_CALL_LIMIT["MinBatchPollingIntervalInSecs"]
                 ):
                     return
-
-            time.sleep(
-                max(
-                    _API_CALL_LIMIT["MinBatchPollingIntervalInSecs"]
-                    - len(executor._running_jobs) * _API_CALL_LIMIT["PollingIntervalInSecs"],
-                    0,
+                running_jobs = dict(executor._running_jobs)
+
+            # The jobs were created before they were first seen here.
+            now = time.time()
+            for job_name in list(creation_times):
+                if job_name not in running_jobs:
+                    del creation_times[job_name]
+            for job_name in running_jobs:
+                creation_times.setdefault(job_name, now)
+
+            statuses = {}
+            if can_list_jobs and len(running_jobs) > 1:
+                created_after = datetime.datetime.fromtimestamp(
+                    min(creation_times.values()) - _CREATION_TIME_MARGIN_IN_SECS,
+                    tz=datetime.timezone.utc,
                 )
-            )
-
-            # check if running jobs are terminated
-            for job_name in list(executor._running_jobs.keys()):
                 try:
-                    time.sleep(_API_CALL_LIMIT["PollingIntervalInSecs"])
-                    if executor._running_jobs[job_name].describe()["TrainingJobStatus"] in [
-                        "Completed",
-                        "Failed",
-                        "Stopped",
-                    ]:
-                        with executor._state_condition:
-                            del executor._running_jobs[job_name]
-                            executor._state_condition.notify_all()
-                except Exception as e:  # pylint: disable=broad-except
-                    if (
-                        not isinstance(e, ClientError)
-                        or e.response["Error"]["Code"]  # pylint: disable=no-member
-                        != "LimitExceededException"
+                    statuses = _list_job_statuses(
+                        executor.job_settings.sagemaker_session, list(running_jobs), created_after
+                    )
+                except ClientError as e:
+                    if is_throttling_error(e) or (
+                        e.response["Error"]["Code"] == "LimitExceededException"
                     ):
-                        # Couldn't check the job status, move on
-                        logger.exception(
-                            "Error occurred while checking the status of job %s", job_name
-                        )
-                        with executor._state_condition:
-                            del executor._running_jobs[job_name]
-                            executor._state_condition.notify_all()
+                        continue
+                    logger.warning(
+                        "Could not list the training jobs, describing each job instead: %s", e
+                    )
+                    can_list_jobs = False
+
+            # describe the jobs that are terminated or missing from the listing
+            for job_name, job in running_jobs.items():
+                status = statuses.get(job_name)
+                if status is None or status in _TERMINAL_JOB_STATUSES:
+                    _refresh_job_status(executor, job_name, job)
     except Exception:  # pylint: disable=broad-except
         logger.exception("Error occurred while monitoring the job statuses.")
 
 
+def _run_chunk_item(serialized_func, args):
+    """Call a serialized function in a worker process, see ``_ChunkRunner``."""
+    return _ChunkRunner._call(cloudpickle.loads(serialized_func), args)
+
+
+class _ChunkRunner(object):
+    """Call a function on each item of a chunk of arguments, inside a single job.
+
+    It returns a ``(succeeded, value)`` pair per item, where ``value`` is either the result or
+    the exception raised for the item, so that one failing item does not fail the others.
+    """
+
+    def __init__(self, func, processes=1):
+        """Initialize a ``_ChunkRunner``.
+
+        Args:
+            func: The function called on each item.
+            processes (int): The number of processes calling the function, or ``None`` for
+                one per CPU.
+        """
+        self.func = func
+        self.processes = processes
+        # The job is named after the function.
+        self.__name__ = func.__name__
+
+    def __call__(self, *args_list):
+        """Call the function on each tuple of positional arguments."""
+        if self.processes == 1 or len(args_list) <= 1:
+            return [self._call(self.func, args) for args in args_list]
+
+        # Remote functions are often defined in __main__, so they are pickled by value.
+        serialized_func = cloudpickle.dumps(self.func)
+        with ProcessPoolExecutor(max_workers=self.processes) as pool:
+            return list(pool.map(_run_chunk_item, itertools.repeat(serialized_func), args_list))
+
+    @staticmethod
+    def _call(func, args):
+        """Call the function and return whether it succeeded with its result or exception."""
+        try:
+            return True, func(*args)
+        except Exception as e:  # pylint: disable=broad-except
+            return False, e
+
+
 class RemoteExecutor(object):
     """Run Python functions asynchronously as SageMaker jobs"""
 
@@ -552,6 +686,7 @@ class RemoteExecutor(object):
         use_torchrun: bool = False,
         use_mpirun: bool = False,
         nproc_per_node: Optional[int] = None,
+        cache: Union[bool, ResultCache] = None,
     ):
         """Constructor for RemoteExecutor
 
@@ -754,8 +889,15 @@ class RemoteExecutor(object):
             nproc_per_node (int): Optional. Specifies the number of processes per node for
               distributed training. Defaults to ``None``.
               This is defined automatically configured on the instance type.
+
+            cache (bool, ResultCache): Either ``True`` or a ``ResultCache`` to reuse the result
+              of a previous call with the same function, arguments and runtime environment
+              instead of starting a job. ``True`` uses a ``ResultCache`` whose results never
+              expire. The cached result of a call is removed with ``invalidate_cache``.
+              Defaults to ``None``, which means that every call starts a job.
         """
         self.max_parallel_jobs = max_parallel_jobs
+        self._result_cache = ResultCache() if cache is True else cache or None
 
         if self.max_parallel_jobs <= 0:
             raise ValueError("max_parallel_jobs must be greater than 0.")
@@ -826,9 +968,23 @@ class RemoteExecutor(object):
             raise RuntimeError("Cannot schedule new remote function executions after shutdown")
 
         self._validate_submit_args(func, *args, **kwargs)
+        return self._submit(func, args, kwargs)
+
+    def _submit(self, func, args, kwargs):
+        """Queue a job request for validated arguments and return its future."""
+        on_result = None
+        if self._result_cache:
+            cache_key = self._result_cache._key(self.job_settings, func, args, kwargs)
+            cached = self._result_cache._load(self.job_settings, cache_key)
+            if cached:
+                return Future._from_cached_result(
+                    cached[0], cached[1], self.job_settings.sagemaker_session
+                )
+            on_result = functools.partial(self._result_cache._save, self.job_settings, cache_key)
 
         with self._state_condition:
             future = Future()
+            future._on_result = on_result
 
             run_info = None
             if _RunContext.get_current_run() is not None:
@@ -848,20 +1004,64 @@ class RemoteExecutor(object):
 
         return future
 
-    def map(self, func, *iterables):
+    def map(self, func, *iterables, chunksize=1, processes=1):
         """Return an iterator that applies function to every item of iterable, yielding the results.
 
         If additional iterables arguments are passed, function must take that many arguments and
         is applied to the items from all iterables in parallel. With multiple iterables, the
         iterator stops when the shortest iterable is exhausted.
 
+        Each SageMaker job spends minutes starting up, so short function calls can be packed
+        into fewer jobs with ``chunksize``. The calls of a chunk run one after the other in the
+        same job, or on several processes of its instance with ``processes``. The results are
+        still returned per item, and the exception raised by the first failing item is raised.
+
         Args:
             func: Python function to run as a SageMaker job.
             iterables: Arguments of the input python function.
+            chunksize (int): The number of items run by each SageMaker job (default: 1).
+            processes (int): The number of processes running the items of a chunk in its job
+                (default: 1). If ``None``, one process per CPU of the instance is used.
         """
+        if chunksize < 1:
+            raise ValueError("chunksize must be a positive integer.")
+        if chunksize == 1 and processes == 1:
+            futures = map(self.submit, itertools.repeat(func), *iterables)
+            return [future.result() for future in futures]
+
+        if self._shutdown:
+            raise RuntimeError("Cannot schedule new remote function executions after shutdown")
 
-        futures = map(self.submit, itertools.repeat(func), *iterables)
-        return [future.result() for future in futures]
+        args_list = list(zip(*iterables))
+        for args in args_list:
+            self._validate_submit_args(func, *args)
+
+        runner = _ChunkRunner(func, processes)
+        futures = [
+            self._submit(runner, tuple(args_list[start : start + chunksize]), {})
+            for start in range(0, len(args_list), chunksize)
+        ]
+        results = []
+        for future in futures:
+            for succeeded, value in future.result():
+                if not succeeded:
+                    raise value
+                results.append(value)
+        return results
+
+    def invalidate_cache(self, func, *args, **kwargs):
+        """Remove the cached result of a function call.
+
+        Args:
+            func: Python function whose result was cached.
+            *args: Positional arguments of the call.
+            **kwargs: keyword arguments of the call.
+        """
+        if not self._result_cache:
+            raise ValueError("The executor was not created with a cache.")
+        self._result_cache._invalidate(
+            self.job_settings, self._result_cache._key(self.job_settings, func, args, kwargs)
+        )
 
     def shutdown(self):
         """Prevent more function executions to be submitted to this executor."""
@@ -962,6 +1162,17 @@ class Future(object):
         self._job = None
         self._exception = None
         self._return = None
+        # Called with the job name once the result of the job is retrieved.
+        self._on_result = None
+
+    @staticmethod
+    def _from_cached_result(describe_training_job_response, result, sagemaker_session):
+        """Construct a finished Future from the result cached by a completed job."""
+        future = Future()
+        future._job = _Job.from_describe_response(describe_training_job_response, sagemaker_session)
+        future._state = _FINISHED
+        future._return = result
+        return future
 
     @staticmethod
     def from_describe_response(describe_training_job_response, sagemaker_session):
@@ -1084,6 +1295,8 @@ class Future(object):
                         hmac_key=self._job.hmac_key,
                     )
                     self._state = _FINISHED
+                    if self._on_result:
+                        self._on_result(self._job.job_name)
                     return self._return
                 if self._job.describe()["TrainingJobStatus"] == "Failed":
                     try:
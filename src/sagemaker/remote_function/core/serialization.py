@@ -22,19 +22,32 @@ import sys
 import hmac
 import hashlib
 import pickle
+import zlib
 
-from typing import Any, Callable, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Union
 
 import cloudpickle
 from tblib import pickling_support
 
 from sagemaker.remote_function.errors import ServiceError, SerializationError, DeserializationError
-from sagemaker.s3 import S3Downloader, S3Uploader
+from sagemaker.s3 import S3Downloader, S3Uploader, parse_s3_url
 from sagemaker.session import Session
 from ._custom_dispatch_table import dispatch_table
 
 # Note: do not use os.path.join for s3 uris, fails on windows
 
+BUFFERS_FOLDER = "buffers"
+
+# Buffers of at least this many bytes are pickled out-of-band and uploaded as separate objects.
+_MIN_OUT_OF_BAND_BUFFER_SIZE = 1024 * 1024
+
+# The number of threads uploading or downloading the out-of-band buffers of a payload.
+_BUFFER_TRANSFER_MAX_WORKERS = 8
+
+_BUFFER_COMPRESSION = "zlib"
+_DECOMPRESSION_CHUNK_SIZE = 16 * 1024 * 1024
+
 
 def _get_python_version():
     """Returns the current python version."""
@@ -49,6 +62,7 @@ class _MetaData:
     version: str = "2023-04-24"
     python_version: str = _get_python_version()
     serialization_module: str = "cloudpickle"
+    buffers: Optional[List[dict]] = None
 
     def to_json(self):
         """Converts metadata to json string."""
@@ -67,6 +81,7 @@ class _MetaData:
         metadata.version = obj.get("version")
         metadata.python_version = obj.get("python_version")
         metadata.serialization_module = obj.get("serialization_module")
+        metadata.buffers = obj.get("buffers")
 
         if not sha256_hash:
             raise DeserializationError(
@@ -89,17 +104,26 @@ class CloudpickleSerializer:
     """Serializer using cloudpickle."""
 
     @staticmethod
-    def serialize(obj: Any) -> bytes:
+    def serialize(obj: Any, buffers: list = None) -> bytes:
         """Serializes data object and uploads it to S3.
 
         Args:
             obj: object to be serialized and persisted
+            buffers (list): If given, the large contiguous buffers of the object, such as the
+                data of numpy arrays and pandas data frames, are appended to this list as
+                ``pickle.PickleBuffer`` objects instead of being copied into the returned bytes.
+                They must be passed to ``deserialize`` in the same order.
         Raises:
             SerializationError: when fail to serialize object to bytes.
         """
         try:
             io_buffer = io.BytesIO()
-            custom_pickler = cloudpickle.CloudPickler(io_buffer)
+            if buffers is None:
+                custom_pickler = cloudpickle.CloudPickler(io_buffer)
+            else:
+                custom_pickler = cloudpickle.CloudPickler(
+                    io_buffer, protocol=5, buffer_callback=_out_of_band_callback(buffers)
+                )
             dt = pickle.Pickler.dispatch_table.__get__(custom_pickler)  # pylint: disable=no-member
             new_dt = dt.new_child(dispatch_table)
             pickle.Pickler.dispatch_table.__set__(  # pylint: disable=no-member
@@ -125,12 +149,13 @@ class CloudpickleSerializer:
             ) from e
 
     @staticmethod
-    def deserialize(s3_uri: str, bytes_to_deserialize: bytes) -> Any:
+    def deserialize(s3_uri: str, bytes_to_deserialize: bytes, buffers: list = None) -> Any:
         """Downloads from S3 and then deserializes data objects.
 
         Args:
             s3_uri (str): S3 root uri to which resulting serialized artifacts will be uploaded.
             bytes_to_deserialize: bytes to be deserialized.
+            buffers (list): The out-of-band buffers collected by ``serialize``, if any.
         Returns :
             List of deserialized python objects.
         Raises:
@@ -138,7 +163,7 @@ class CloudpickleSerializer:
         """
 
         try:
-            return cloudpickle.loads(bytes_to_deserialize)
+            return cloudpickle.loads(bytes_to_deserialize, buffers=buffers)
         except Exception as e:
             raise DeserializationError(
                 "Error when deserializing bytes downloaded from {}: {}. "
@@ -167,12 +192,14 @@ def serialize_func_to_s3(
         SerializationError: when fail to serialize function to bytes.
     """
 
+    buffers = []
     _upload_payload_and_metadata_to_s3(
-        bytes_to_upload=CloudpickleSerializer.serialize(func),
+        bytes_to_upload=CloudpickleSerializer.serialize(func, buffers=buffers),
         hmac_key=hmac_key,
         s3_uri=s3_uri,
         sagemaker_session=sagemaker_session,
         s3_kms_key=s3_kms_key,
+        buffers=buffers,
     )
 
 
@@ -192,18 +219,14 @@ def deserialize_func_from_s3(sagemaker_session: Session, s3_uri: str, hmac_key:
     Raises:
         DeserializationError: when fail to serialize function to bytes.
     """
-    metadata = _MetaData.from_json(
-        _read_bytes_from_s3(f"{s3_uri}/metadata.json", sagemaker_session)
+    bytes_to_deserialize, buffers = _read_payload_and_buffers_from_s3(
+        s3_uri, sagemaker_session, hmac_key
     )
 
-    bytes_to_deserialize = _read_bytes_from_s3(f"{s3_uri}/payload.pkl", sagemaker_session)
-
-    _perform_integrity_check(
-        expected_hash_value=metadata.sha256_hash, secret_key=hmac_key, buffer=bytes_to_deserialize
+    return CloudpickleSerializer.deserialize(
+        f"{s3_uri}/payload.pkl", bytes_to_deserialize, buffers=buffers
     )
 
-    return CloudpickleSerializer.deserialize(f"{s3_uri}/payload.pkl", bytes_to_deserialize)
-
 
 def serialize_obj_to_s3(
     obj: Any, sagemaker_session: Session, s3_uri: str, hmac_key: str, s3_kms_key: str = None
@@ -221,12 +244,14 @@ def serialize_obj_to_s3(
         SerializationError: when fail to serialize object to bytes.
     """
 
+    buffers = []
     _upload_payload_and_metadata_to_s3(
-        bytes_to_upload=CloudpickleSerializer.serialize(obj),
+        bytes_to_upload=CloudpickleSerializer.serialize(obj, buffers=buffers),
         hmac_key=hmac_key,
         s3_uri=s3_uri,
         sagemaker_session=sagemaker_session,
         s3_kms_key=s3_kms_key,
+        buffers=buffers,
     )
 
 
@@ -284,18 +309,14 @@ def deserialize_obj_from_s3(sagemaker_session: Session, s3_uri: str, hmac_key: s
         DeserializationError: when fail to serialize object to bytes.
     """
 
-    metadata = _MetaData.from_json(
-        _read_bytes_from_s3(f"{s3_uri}/metadata.json", sagemaker_session)
+    bytes_to_deserialize, buffers = _read_payload_and_buffers_from_s3(
+        s3_uri, sagemaker_session, hmac_key
     )
 
-    bytes_to_deserialize = _read_bytes_from_s3(f"{s3_uri}/payload.pkl", sagemaker_session)
-
-    _perform_integrity_check(
-        expected_hash_value=metadata.sha256_hash, secret_key=hmac_key, buffer=bytes_to_deserialize
+    return CloudpickleSerializer.deserialize(
+        f"{s3_uri}/payload.pkl", bytes_to_deserialize, buffers=buffers
     )
 
-    return CloudpickleSerializer.deserialize(f"{s3_uri}/payload.pkl", bytes_to_deserialize)
-
 
 def serialize_exception_to_s3(
     exc: Exception, sagemaker_session: Session, s3_uri: str, hmac_key: str, s3_kms_key: str = None
@@ -314,12 +335,14 @@ def serialize_exception_to_s3(
     """
     pickling_support.install()
 
+    buffers = []
     _upload_payload_and_metadata_to_s3(
-        bytes_to_upload=CloudpickleSerializer.serialize(exc),
+        bytes_to_upload=CloudpickleSerializer.serialize(exc, buffers=buffers),
         hmac_key=hmac_key,
         s3_uri=s3_uri,
         sagemaker_session=sagemaker_session,
         s3_kms_key=s3_kms_key,
+        buffers=buffers,
     )
 
 
@@ -329,9 +352,15 @@ def _upload_payload_and_metadata_to_s3(
     s3_uri: str,
     sagemaker_session: Session,
     s3_kms_key,
+    buffers: List[pickle.PickleBuffer] = None,
 ):
     """Uploads serialized payload and metadata to s3.
 
+    The out-of-band buffers are uploaded in parallel as separate objects under the
+    ``buffers`` folder, and compressed if the ``compress_remote_function_buffers`` session
+    setting is set. The hmac-sha256 hash then covers the payload, every stored buffer and
+    their description in the metadata.
+
     Args:
         bytes_to_upload (bytes): Serialized bytes to upload.
         hmac_key (str): Key used to calculate hmac-sha256 hash of the serialized obj.
@@ -339,19 +368,122 @@ def _upload_payload_and_metadata_to_s3(
         sagemaker_session (sagemaker.session.Session):
             The underlying Boto3 session which AWS service calls are delegated to.
         s3_kms_key (str): KMS key used to encrypt artifacts uploaded to S3.
+        buffers (list[pickle.PickleBuffer]): The out-of-band buffers of the payload.
     """
     _upload_bytes_to_s3(bytes_to_upload, f"{s3_uri}/payload.pkl", s3_kms_key, sagemaker_session)
 
-    sha256_hash = _compute_hash(bytes_to_upload, secret_key=hmac_key)
+    if not buffers:
+        metadata = _MetaData(_compute_hash(bytes_to_upload, secret_key=hmac_key))
+    else:
+        settings = getattr(sagemaker_session, "settings", None)
+        compress = getattr(settings, "compress_remote_function_buffers", False) is True
+
+        def upload_buffer(index):
+            return _upload_buffer_to_s3(
+                buffers[index],
+                f"{s3_uri}/{BUFFERS_FOLDER}/{index}.bin",
+                compress,
+                s3_kms_key,
+                sagemaker_session,
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(buffers), _BUFFER_TRANSFER_MAX_WORKERS)
+        ) as executor:
+            uploaded = list(executor.map(upload_buffer, range(len(buffers))))
+
+        descriptions = [description for description, _ in uploaded]
+        metadata = _MetaData(
+            _compute_hash_of_parts(
+                bytes_to_upload, descriptions, [digest for _, digest in uploaded], hmac_key
+            ),
+            buffers=descriptions,
+        )
 
     _upload_bytes_to_s3(
-        _MetaData(sha256_hash).to_json(),
+        metadata.to_json(),
         f"{s3_uri}/metadata.json",
         s3_kms_key,
         sagemaker_session,
     )
 
 
+def _upload_buffer_to_s3(buffer, s3_uri, compress, s3_kms_key, sagemaker_session):
+    """Uploads an out-of-band buffer, and returns its description and the digest of the object."""
+    with buffer.raw() as view:
+        description = {"size": view.nbytes, "compression": None}
+        if compress:
+            stored = zlib.compress(view)
+            description["compression"] = _BUFFER_COMPRESSION
+            digest = hashlib.sha256(stored).digest()
+            _write_buffer_to_s3(io.BytesIO(stored), s3_uri, s3_kms_key, sagemaker_session)
+        else:
+            digest = hashlib.sha256(view).digest()
+            _write_buffer_to_s3(_MemoryViewReader(view), s3_uri, s3_kms_key, sagemaker_session)
+    return description, digest
+
+
+def _write_buffer_to_s3(fileobj, s3_uri, s3_kms_key, sagemaker_session):
+    """Uploads a buffer with the shared S3 client, which unlike a resource is thread-safe."""
+    bucket, object_key = parse_s3_url(s3_uri)
+    extra_args = None
+    if s3_kms_key is not None:
+        extra_args = {"SSEKMSKeyId": s3_kms_key, "ServerSideEncryption": "aws:kms"}
+    try:
+        sagemaker_session.get_client("s3").upload_fileobj(
+            fileobj, bucket, object_key, ExtraArgs=extra_args
+        )
+    except Exception as e:
+        raise ServiceError(
+            "Failed to upload serialized bytes to {}: {}".format(s3_uri, repr(e))
+        ) from e
+
+
+def _read_payload_and_buffers_from_s3(s3_uri, sagemaker_session, hmac_key):
+    """Downloads the payload and its out-of-band buffers, and checks their integrity."""
+    metadata = _MetaData.from_json(
+        _read_bytes_from_s3(f"{s3_uri}/metadata.json", sagemaker_session)
+    )
+
+    bytes_to_deserialize = _read_bytes_from_s3(f"{s3_uri}/payload.pkl", sagemaker_session)
+
+    if not metadata.buffers:
+        _perform_integrity_check(
+            expected_hash_value=metadata.sha256_hash,
+            secret_key=hmac_key,
+            buffer=bytes_to_deserialize,
+        )
+        return bytes_to_deserialize, None
+
+    def read_buffer(index):
+        description = metadata.buffers[index]
+        buffer_uri = f"{s3_uri}/{BUFFERS_FOLDER}/{index}.bin"
+        if description.get("compression"):
+            return _read_bytes_from_s3(buffer_uri, sagemaker_session)
+        return _read_buffer_from_s3(buffer_uri, description["size"], sagemaker_session)
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(metadata.buffers), _BUFFER_TRANSFER_MAX_WORKERS)
+    ) as executor:
+        stored = list(executor.map(read_buffer, range(len(metadata.buffers))))
+        digests = list(executor.map(lambda part: hashlib.sha256(part).digest(), stored))
+
+    actual_hash_value = _compute_hash_of_parts(
+        bytes_to_deserialize, metadata.buffers, digests, hmac_key
+    )
+    if not hmac.compare_digest(metadata.sha256_hash, actual_hash_value):
+        raise DeserializationError(
+            "Integrity check for the serialized function or data failed. "
+            "Please restrict access to your S3 bucket"
+        )
+
+    buffers = [
+        _decompress(part, description) if description.get("compression") else part
+        for part, description in zip(stored, metadata.buffers)
+    ]
+    return bytes_to_deserialize, buffers
+
+
 def deserialize_exception_from_s3(sagemaker_session: Session, s3_uri: str, hmac_key: str) -> Any:
     """Downloads from S3 and then deserializes exception.
 
@@ -366,18 +498,14 @@ def deserialize_exception_from_s3(sagemaker_session: Session, s3_uri: str, hmac_
         DeserializationError: when fail to serialize object to bytes.
     """
 
-    metadata = _MetaData.from_json(
-        _read_bytes_from_s3(f"{s3_uri}/metadata.json", sagemaker_session)
+    bytes_to_deserialize, buffers = _read_payload_and_buffers_from_s3(
+        s3_uri, sagemaker_session, hmac_key
     )
 
-    bytes_to_deserialize = _read_bytes_from_s3(f"{s3_uri}/payload.pkl", sagemaker_session)
-
-    _perform_integrity_check(
-        expected_hash_value=metadata.sha256_hash, secret_key=hmac_key, buffer=bytes_to_deserialize
+    return CloudpickleSerializer.deserialize(
+        f"{s3_uri}/payload.pkl", bytes_to_deserialize, buffers=buffers
     )
 
-    return CloudpickleSerializer.deserialize(f"{s3_uri}/payload.pkl", bytes_to_deserialize)
-
 
 def _upload_bytes_to_s3(b: Union[bytes, io.BytesIO], s3_uri, s3_kms_key, sagemaker_session):
     """Wrapping s3 uploading with exception translation for remote function."""
@@ -399,11 +527,139 @@ def _read_bytes_from_s3(s3_uri, sagemaker_session):
         ) from e
 
 
+def _read_buffer_from_s3(s3_uri, size, sagemaker_session) -> bytearray:
+    """Downloads an object straight into a writable buffer of the given size."""
+    buffer = bytearray(size)
+    try:
+        bucket, object_key = parse_s3_url(s3_uri)
+        with memoryview(buffer) as view:
+            sagemaker_session.get_client("s3").download_fileobj(
+                bucket, object_key, _MemoryViewWriter(view)
+            )
+    except Exception as e:
+        raise ServiceError(
+            "Failed to read serialized bytes from {}: {}".format(s3_uri, repr(e))
+        ) from e
+    return buffer
+
+
+def _decompress(data, description) -> bytearray:
+    """Decompresses a stored buffer into a writable buffer of its original size."""
+    if description["compression"] != _BUFFER_COMPRESSION:
+        raise DeserializationError(
+            "Corrupt metadata file. Compression {} is not supported.".format(
+                description["compression"]
+            )
+        )
+    buffer = bytearray(description["size"])
+    decompressor = zlib.decompressobj()
+    position = 0
+    with memoryview(buffer) as view:
+        while data:
+            chunk = decompressor.decompress(data, _DECOMPRESSION_CHUNK_SIZE)
+            view[position : position + len(chunk)] = chunk
+            position += len(chunk)
+            data = decompressor.unconsumed_tail
+    return buffer
+
+
+def _out_of_band_callback(buffers):
+    """Returns a pickle buffer callback keeping the large contiguous buffers out-of-band."""
+
+    def callback(buffer):
+        try:
+            with buffer.raw() as view:
+                if view.nbytes < _MIN_OUT_OF_BAND_BUFFER_SIZE:
+                    return True
+        except BufferError:
+            # Non-contiguous buffers are copied into the payload.
+            return True
+        buffers.append(buffer)
+        return False
+
+    return callback
+
+
+class _MemoryViewReader(io.RawIOBase):
+    """A readable binary file object over a memoryview, so that it is uploaded without a copy."""
+
+    def __init__(self, view):
+        super(_MemoryViewReader, self).__init__()
+        self._view = view.cast("B")
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._position = max(0, offset)
+        return self._position
+
+    def readinto(self, b):
+        chunk = self._view[self._position : self._position + len(b)]
+        b[: len(chunk)] = chunk
+        self._position += len(chunk)
+        return len(chunk)
+
+
+class _MemoryViewWriter(io.RawIOBase):
+    """A writable binary file object filling a memoryview, at the position of each part."""
+
+    def __init__(self, view):
+        super(_MemoryViewWriter, self).__init__()
+        self._view = view
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._position = offset
+        return self._position
+
+    def write(self, b):
+        size = len(b)
+        self._view[self._position : self._position + size] = b
+        self._position += size
+        return size
+
+
 def _compute_hash(buffer: bytes, secret_key: str) -> str:
     """Compute the hmac-sha256 hash"""
     return hmac.new(secret_key.encode(), msg=buffer, digestmod=hashlib.sha256).hexdigest()
 
 
+def _compute_hash_of_parts(payload: bytes, descriptions, digests, secret_key: str) -> str:
+    """Compute the hmac-sha256 hash of a payload, its stored buffers and their description."""
+    mac = hmac.new(
+        secret_key.encode(), msg=hashlib.sha256(payload).digest(), digestmod=hashlib.sha256
+    )
+    for digest in digests:
+        mac.update(digest)
+    mac.update(json.dumps(descriptions, sort_keys=True).encode())
+    return mac.hexdigest()
+
+
 def _perform_integrity_check(expected_hash_value: str, secret_key: str, buffer: bytes):
     """Performs integrity checks for serialized code/arguments uploaded to s3.
 
@@ -13,6 +13,7 @@
 """Helper classes that interact with SageMaker Training service."""
 from __future__ import absolute_import
 import dataclasses
+import hashlib
 
 import os
 import re
@@ -25,6 +26,8 @@ from typing import Callable, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 from urllib.parse import urlparse
 from io import BytesIO
 
+from botocore.exceptions import ClientError
+
 from sagemaker.config.config_schema import (
     REMOTE_FUNCTION_ENVIRONMENT_VARIABLES,
     REMOTE_FUNCTION_IMAGE_URI,
@@ -55,8 +58,9 @@ from sagemaker.utils import (
     resolve_value_from_config,
     format_tags,
     Tags,
+    compute_tar_content_digest,
 )
-from sagemaker.s3 import s3_path_join, S3Uploader
+from sagemaker.s3 import s3_path_join, S3Uploader, parse_s3_url
 from sagemaker import vpc_utils
 from sagemaker.remote_function.core.stored_function import StoredFunction, _SerializedData
 from sagemaker.remote_function.core.pipeline_variables import Context
@@ -336,6 +340,13 @@ smspark-submit "$@"
 
 logger = logging_config.get_logger()
 
+# The S3 locations of content-addressed uploads found complete, whose files are then only
+# checked with HEAD requests, since a lifecycle rule or a user may delete them.
+_CACHED_UPLOAD_URIS = set()
+
+# The runtime environment cache locations ignored for the lack of a shared secret key.
+_UNSIGNED_RUNTIME_ENVIRONMENT_CACHE_URIS = set()
+
 
 class _JobSettings:
     """Helper class that processes the job settings.
@@ -974,14 +985,34 @@ class _Job:
                 RuntimeEnvironmentManager()._current_sagemaker_pysdk_version(),
             ]
         )
-        container_args.extend(
-            [
-                "--dependency_settings",
-                _DependencySettings.from_dependency_file_path(
-                    job_settings.dependencies
-                ).to_string(),
-            ]
+        dependency_settings = _DependencySettings.from_dependency_file_path(
+            job_settings.dependencies
         )
+        settings = job_settings.sagemaker_session.settings
+        cache_uri = settings.runtime_environment_cache_uri
+        if (
+            cache_uri
+            and job_settings.dependencies
+            and not settings.runtime_environment_cache_secret_key
+            and step_compilation_context is None
+        ):
+            # each job signs the snapshots with its own secret key, no other job would
+            # restore them.
+            if cache_uri not in _UNSIGNED_RUNTIME_ENVIRONMENT_CACHE_URIS:
+                logger.warning(
+                    "The runtime environment is not cached in '%s': remote functions only "
+                    "share it with a runtime_environment_cache_secret_key in the session "
+                    "settings.",
+                    cache_uri,
+                )
+                _UNSIGNED_RUNTIME_ENVIRONMENT_CACHE_URIS.add(cache_uri)
+            cache_uri = None
+        if cache_uri and job_settings.dependencies:
+            dependency_settings.cache_uri = cache_uri
+            dependency_settings.image_uri = job_settings.image_uri
+            dependency_settings.s3_kms_key = job_settings.s3_kms_key
+            dependency_settings.region = job_settings.sagemaker_session.boto_region_name
+        container_args.extend(["--dependency_settings", dependency_settings.to_string()])
         if job_settings.use_torchrun:
             container_args.extend(["--distribution", "torchrun"])
         elif job_settings.use_mpirun:
@@ -1060,8 +1091,12 @@ class _Job:
 
         request_dict["EnableManagedSpotTraining"] = job_settings.use_spot_instances
 
-        request_dict["Environment"] = job_settings.environment_variables
+        request_dict["Environment"] = dict(job_settings.environment_variables)
         request_dict["Environment"].update({"REMOTE_FUNCTION_SECRET_KEY": hmac_key})
+        if dependency_settings.cache_uri and settings.runtime_environment_cache_secret_key:
+            request_dict["Environment"].update(
+                {"REMOTE_FUNCTION_CACHE_SECRET_KEY": settings.runtime_environment_cache_secret_key}
+            )
 
         extended_request = _extend_spark_config_to_request(request_dict, job_settings, s3_base_uri)
         extended_request = _extend_mpirun_to_request(extended_request, job_settings)
@@ -1147,12 +1182,15 @@ def _prepare_and_upload_runtime_scripts(
     sagemaker_session: Session,
     use_torchrun: bool = False,
     use_mpirun: bool = False,
+    cache_s3_uri: str = None,
 ):
     """Copy runtime scripts to a folder and upload to S3.
 
     In case of remote function, s3_base_uri is s3_root_uri + function_name.
     In case of pipeline, s3_base_uri is s3_root_uri + pipeline_name. The runtime scripts are
     uploaded only once per pipeline.
+    If cache_s3_uri is provided, the scripts are uploaded under the digest of their content
+      instead, and scripts already uploaded there are reused.
 
     Args:
         spark_config (SparkConfig): remote Spark job configurations.
@@ -1168,6 +1206,8 @@ def _prepare_and_upload_runtime_scripts(
         use_mpirun (bool): Whether to use mpirun or not.
 
         nproc_per_node (Optional[int]): Number of processes per node
+
+        cache_s3_uri (str): S3 location under which uploads are cached by content digest.
     """
 
     from sagemaker.workflow.utilities import load_step_compilation_context
@@ -1213,13 +1253,23 @@ def _prepare_and_upload_runtime_scripts(
         shutil.copy2(mpi_utils_path, bootstrap_scripts)
         shutil.copy2(runtime_manager_script_path, bootstrap_scripts)
 
+        if cache_s3_uri:
+            upload_uri = _content_cache_uri(cache_s3_uri, bootstrap_scripts, s3_kms_key)
+            if _is_cached(upload_uri, os.listdir(bootstrap_scripts), sagemaker_session):
+                logger.info("Reusing the runtime scripts uploaded to '%s'", upload_uri)
+                return upload_uri
+        else:
+            upload_uri = s3_path_join(s3_base_uri, RUNTIME_SCRIPTS_CHANNEL_NAME)
+
         upload_path = S3Uploader.upload(
             bootstrap_scripts,
-            s3_path_join(s3_base_uri, RUNTIME_SCRIPTS_CHANNEL_NAME),
+            upload_uri,
             s3_kms_key,
             sagemaker_session,
         )
 
+        if cache_s3_uri:
+            _CACHED_UPLOAD_URIS.add(upload_uri)
         if step_compilation_context:
             step_compilation_context.upload_runtime_scripts = False
         return upload_path
@@ -1231,6 +1281,11 @@ def _generate_input_data_config(job_settings: _JobSettings, s3_base_uri: str):
 
     step_compilation_context = load_step_compilation_context()
 
+    cache_s3_uri = None
+    cache_prefix = job_settings.sagemaker_session.settings.source_code_cache_prefix
+    if cache_prefix and not step_compilation_context:
+        cache_s3_uri = s3_path_join(job_settings.s3_root_uri, cache_prefix)
+
     bootstrap_scripts_s3uri = _prepare_and_upload_runtime_scripts(
         spark_config=job_settings.spark_config,
         s3_base_uri=s3_base_uri,
@@ -1238,6 +1293,7 @@ def _generate_input_data_config(job_settings: _JobSettings, s3_base_uri: str):
         sagemaker_session=job_settings.sagemaker_session,
         use_torchrun=job_settings.use_torchrun,
         use_mpirun=job_settings.use_mpirun,
+        cache_s3_uri=cache_s3_uri,
     )
 
     input_data_config = [
@@ -1288,6 +1344,7 @@ def _generate_input_data_config(job_settings: _JobSettings, s3_base_uri: str):
         s3_kms_key=job_settings.s3_kms_key,
         sagemaker_session=job_settings.sagemaker_session,
         custom_file_filter=job_settings.custom_file_filter,
+        cache_s3_uri=cache_s3_uri,
     )
 
     if user_workspace_s3uri:
@@ -1385,12 +1442,15 @@ def _prepare_and_upload_workspace(
     s3_kms_key: str,
     sagemaker_session: Session,
     custom_file_filter: Optional[Union[Callable[[str, List], List], CustomFileFilter]] = None,
+    cache_s3_uri: str = None,
 ) -> str:
     """Prepare and upload the workspace to S3.
 
     Under pipeline context, only workdir is packaged in the workspace folder and uploaded to s3.
     Under remote function context, workdir along with pre execution scripts and dependencies
       are packaged together into the workspace folder and uploaded to S3.
+    If cache_s3_uri is provided, the archive is uploaded under the digest of the workspace
+      folder instead, and an archive already uploaded there is reused without being created.
     """
     from sagemaker.workflow.utilities import load_step_compilation_context
 
@@ -1437,6 +1497,14 @@ def _prepare_and_upload_workspace(
                 tmp_dir=tmp_workspace,
             )
 
+        if cache_s3_uri:
+            upload_uri = _content_cache_uri(cache_s3_uri, tmp_workspace_dir, s3_kms_key)
+            if _is_cached(upload_uri, ["workspace.zip"], sagemaker_session):
+                logger.info("Reusing the workdir archive uploaded to '%s'", upload_uri)
+                return s3_path_join(upload_uri, "workspace.zip")
+        else:
+            upload_uri = s3_path_join(s3_base_uri, REMOTE_FUNCTION_WORKSPACE, func_step_s3_dir)
+
         workspace_archive_path = os.path.join(tmp_dir, "workspace")
         workspace_archive_path = shutil.make_archive(
             workspace_archive_path, "zip", tmp_workspace_dir
@@ -1445,16 +1513,67 @@ def _prepare_and_upload_workspace(
 
         upload_path = S3Uploader.upload(
             workspace_archive_path,
-            s3_path_join(s3_base_uri, REMOTE_FUNCTION_WORKSPACE, func_step_s3_dir),
+            upload_uri,
             s3_kms_key,
             sagemaker_session,
         )
         logger.info("Successfully uploaded workdir to '%s'", upload_path)
+        if cache_s3_uri:
+            _CACHED_UPLOAD_URIS.add(upload_uri)
         if step_compilation_context:
             step_compilation_context.upload_workspace = False
         return upload_path
 
 
+def _content_cache_uri(cache_s3_uri: str, local_dir: str, s3_kms_key: str = None) -> str:
+    """Return the S3 location of an upload keyed by the digest of a local directory's content.
+
+    The KMS key is part of the digest so that uploads encrypted with different keys are
+    never shared.
+    """
+    digest = compute_tar_content_digest(
+        [os.path.join(local_dir, name) for name in os.listdir(local_dir)]
+    )
+    if s3_kms_key:
+        digest = hashlib.sha256("{}:{}".format(digest, s3_kms_key).encode("utf-8")).hexdigest()
+    return s3_path_join(cache_s3_uri, digest)
+
+
+def _is_cached(s3_uri: str, file_names: List[str], sagemaker_session: Session) -> bool:
+    """Return True if all the files were uploaded under the S3 location.
+
+    Locations found complete are remembered, so they are only listed once per process, and
+    their files are then checked with HEAD requests in case they were deleted since.
+    """
+    bucket, key_prefix = parse_s3_url(s3_uri)
+    if s3_uri in _CACHED_UPLOAD_URIS:
+        s3_client = sagemaker_session.get_client("s3")
+        if all(
+            _s3_object_exists(s3_client, bucket, s3_path_join(key_prefix, name))
+            for name in file_names
+        ):
+            return True
+        logger.info("The files uploaded to '%s' were deleted, uploading them again.", s3_uri)
+        _CACHED_UPLOAD_URIS.discard(s3_uri)
+        return False
+    uploaded_keys = set(sagemaker_session.list_s3_files(bucket, key_prefix))
+    if all(s3_path_join(key_prefix, name) in uploaded_keys for name in file_names):
+        _CACHED_UPLOAD_URIS.add(s3_uri)
+        return True
+    return False
+
+
+def _s3_object_exists(s3_client, bucket: str, key: str) -> bool:
+    """Return True if the S3 object exists."""
+    try:
+        s3_client.head_object(Bucket=bucket, Key=key)
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+            return False
+        raise
+    return True
+
+
 def _convert_run_to_json(run: Run) -> str:
     """Convert current run into json string"""
     run_info = _RunInfo(run.experiment_name, run.run_name)
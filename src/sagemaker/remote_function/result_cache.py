@@ -0,0 +1,167 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""This module is used to define the ResultCache of remote functions."""
+from __future__ import absolute_import
+
+import hashlib
+import json
+import os
+import time
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from sagemaker.remote_function import logging_config
+from sagemaker.remote_function.core import serialization
+from sagemaker.remote_function.core.stored_function import RESULTS_FOLDER
+from sagemaker.remote_function.errors import DeserializationError, ServiceError
+from sagemaker.s3 import S3Downloader, S3Uploader, parse_s3_url, s3_path_join
+
+RESULT_CACHE_FOLDER = "result_cache"
+
+# The secret key is generated for each job, so it is left out of the cache key, like the
+# key signing the runtime environment, which is added to the job environment when it starts.
+_SECRET_KEY_ENV_VAR = "REMOTE_FUNCTION_SECRET_KEY"
+_CACHE_SECRET_KEY_ENV_VAR = "REMOTE_FUNCTION_CACHE_SECRET_KEY"
+
+logger = logging_config.get_logger()
+
+
+class ResultCache(object):
+    """Reuse the results of remote function calls instead of running the same job again.
+
+    Pass a ``ResultCache`` as the ``cache`` of the ``remote`` decorator or of a
+    ``RemoteExecutor``. The result of each call is then keyed by a digest of the serialized
+    function, of its arguments and of the runtime environment: the image, the dependencies
+    file, the pre-execution commands or script and the environment variables. A call with the
+    same key returns the result stored in S3 by the job that completed first, without starting
+    a new job.
+
+    Only the code serialized with the function is covered by the key, so a function imported
+    from a module is identified by its name. Change the ``namespace`` to stop reusing the
+    results computed before a change to such code.
+    """
+
+    def __init__(self, ttl_in_seconds: int = None, namespace: str = None):
+        """Initialize a ``ResultCache``.
+
+        Args:
+            ttl_in_seconds (int): How long a result is reused after it was cached. Defaults to
+              ``None``, which means that results do not expire.
+            namespace (str): A string that is part of every key, so that results cached under
+              another namespace are not reused. Defaults to ``None``.
+        """
+        self.ttl_in_seconds = ttl_in_seconds
+        self.namespace = namespace
+
+    def _key(self, job_settings, func, args, kwargs) -> str:
+        """Return the cache key of a function call."""
+        environment_variables = {
+            name: value
+            for name, value in (job_settings.environment_variables or {}).items()
+            if name not in (_SECRET_KEY_ENV_VAR, _CACHE_SECRET_KEY_ENV_VAR)
+        }
+        environment = {
+            "namespace": self.namespace,
+            "image_uri": job_settings.image_uri,
+            "dependencies": _file_digest(job_settings.dependencies),
+            "pre_execution_commands": job_settings.pre_execution_commands,
+            "pre_execution_script": _file_digest(job_settings.pre_execution_script),
+            "environment_variables": environment_variables,
+            "job_conda_env": job_settings.job_conda_env,
+        }
+        digest = hashlib.sha256()
+        for part in (
+            serialization.CloudpickleSerializer.serialize(func),
+            serialization.CloudpickleSerializer.serialize((args, kwargs)),
+            json.dumps(environment, sort_keys=True, default=str).encode("utf-8"),
+        ):
+            digest.update(hashlib.sha256(part).digest())
+        return digest.hexdigest()
+
+    def _load(self, job_settings, key):
+        """Return the description of the job that cached a result and the result, or None."""
+        sagemaker_session = job_settings.sagemaker_session
+        entry_uri = _entry_uri(job_settings, key)
+        try:
+            entry = json.loads(S3Downloader.read_file(entry_uri, sagemaker_session))
+            job_name = entry["job_name"]
+            created_time = float(entry["created_time"])
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                return None
+            if e.response["Error"]["Code"] == "NoSuchBucket":
+                raise
+            # a missing entry is also denied without the permission to list the bucket.
+            logger.warning("Could not read the cache entry %s: %s", entry_uri, e)
+            return None
+        except (BotoCoreError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Could not read the cache entry %s: %s", entry_uri, e)
+            return None
+
+        if self.ttl_in_seconds is not None and time.time() - created_time > self.ttl_in_seconds:
+            logger.info("The result cached by job %s expired.", job_name)
+            return None
+
+        try:
+            describe_response = sagemaker_session.sagemaker_client.describe_training_job(
+                TrainingJobName=job_name
+            )
+            result = serialization.deserialize_obj_from_s3(
+                sagemaker_session=sagemaker_session,
+                s3_uri=s3_path_join(
+                    describe_response["OutputDataConfig"]["S3OutputPath"], RESULTS_FOLDER
+                ),
+                hmac_key=describe_response["Environment"][_SECRET_KEY_ENV_VAR],
+            )
+        except (ClientError, ServiceError, DeserializationError) as e:
+            logger.warning("Could not reuse the result of job %s: %s", job_name, e)
+            return None
+
+        logger.info("Reusing the result of job %s.", job_name)
+        return describe_response, result
+
+    def _save(self, job_settings, key, job_name):
+        """Record that a completed job stored the result of the call with the given key.
+
+        The result was computed anyway, so a failure to record it only logs a warning.
+        """
+        try:
+            S3Uploader.upload_string_as_file_body(
+                json.dumps({"job_name": job_name, "created_time": time.time()}),
+                _entry_uri(job_settings, key),
+                job_settings.s3_kms_key,
+                job_settings.sagemaker_session,
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning("Could not cache the result of job %s: %s", job_name, e)
+
+    def _invalidate(self, job_settings, key):
+        """Forget the result cached for the call with the given key."""
+        bucket, object_key = parse_s3_url(_entry_uri(job_settings, key))
+        job_settings.sagemaker_session.get_client("s3").delete_object(Bucket=bucket, Key=object_key)
+
+
+def _entry_uri(job_settings, key):
+    """Return the S3 URI of the cache entry with the given key."""
+    return s3_path_join(job_settings.s3_root_uri, RESULT_CACHE_FOLDER, key + ".json")
+
+
+def _file_digest(path):
+    """Return the digest of a file's content, or the value itself if it is not a file."""
+    if not path or not os.path.isfile(path):
+        return path
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -28,12 +28,14 @@ if __package__ is None or __package__ == "":
     from runtime_environment_manager import (
         RuntimeEnvironmentManager,
         _DependencySettings,
+        _RuntimeEnvironmentCache,
         get_logger,
     )
 else:
     from sagemaker.remote_function.runtime_environment.runtime_environment_manager import (
         RuntimeEnvironmentManager,
         _DependencySettings,
+        _RuntimeEnvironmentCache,
         get_logger,
     )
 
@@ -196,6 +198,7 @@ def _install_dependencies(
             local_dependencies_file=dependencies_file,
             conda_env=conda_env,
             client_python_version=client_python_version,
+            cache=_RuntimeEnvironmentCache.from_dependency_settings(dependency_settings),
         )
     else:
         # no dependency file name is passed when an older version of the SDK is used
@@ -18,11 +18,19 @@ from __future__ import absolute_import
 import logging
 import sys
 import shlex
+import shutil
 import os
+import platform
 import subprocess
+import sysconfig
+import tarfile
+import tempfile
 import time
 import dataclasses
+import hashlib
+import hmac
 import json
+from urllib.parse import urlparse
 
 
 class _UTCFormatter(logging.Formatter):
@@ -48,6 +56,11 @@ def get_logger():
 
 logger = get_logger()
 
+_SECRET_KEY_ENV_VAR = "REMOTE_FUNCTION_SECRET_KEY"
+_CACHE_SECRET_KEY_ENV_VAR = "REMOTE_FUNCTION_CACHE_SECRET_KEY"
+# A hex hmac-sha256 hash and a new line.
+_SIGNATURE_LENGTH = 65
+
 
 @dataclasses.dataclass
 class _DependencySettings:
@@ -57,13 +70,23 @@ class _DependencySettings:
     If ``dependency_file`` is set, the runtime environment script will attempt
     to install the dependencies. If ``dependency_file`` is not set, the runtime
     environment script will assume no dependencies are required.
+    If ``cache_uri`` is set, the files installed by the dependencies are cached
+    there, see ``_RuntimeEnvironmentCache``.
     """
 
     dependency_file: str = None
+    cache_uri: str = None
+    image_uri: str = None
+    s3_kms_key: str = None
+    region: str = None
 
     def to_string(self):
         """Converts the dependency settings to a string."""
-        return json.dumps(dataclasses.asdict(self))
+        settings = {"dependency_file": self.dependency_file}
+        settings.update(
+            (name, value) for name, value in dataclasses.asdict(self).items() if value is not None
+        )
+        return json.dumps(settings)
 
     @staticmethod
     def from_string(dependency_settings_string):
@@ -75,7 +98,13 @@ class _DependencySettings:
         if dependency_settings_string is None:
             return None
         dependency_settings_dict = json.loads(dependency_settings_string)
-        return _DependencySettings(dependency_settings_dict.get("dependency_file"))
+        return _DependencySettings(
+            dependency_settings_dict.get("dependency_file"),
+            cache_uri=dependency_settings_dict.get("cache_uri"),
+            image_uri=dependency_settings_dict.get("image_uri"),
+            s3_kms_key=dependency_settings_dict.get("s3_kms_key"),
+            region=dependency_settings_dict.get("region"),
+        )
 
     @staticmethod
     def from_dependency_file_path(dependency_file_path):
@@ -167,34 +196,100 @@ class RuntimeEnvironmentManager:
         return os.getenv("CONDA_DEFAULT_ENV")
 
     def bootstrap(
-        self, local_dependencies_file: str, client_python_version: str, conda_env: str = None
+        self,
+        local_dependencies_file: str,
+        client_python_version: str,
+        conda_env: str = None,
+        cache: "_RuntimeEnvironmentCache" = None,
     ):
         """Bootstraps the runtime environment by installing the additional dependencies if any.
 
         Args:
             local_dependencies_file (str): path where dependencies file exists.
             conda_env (str): conda environment to be activated. Default is None.
+            cache (_RuntimeEnvironmentCache): cache of the installed dependencies. If the
+                environment was cached, it is restored instead of installing the dependencies,
+                otherwise it is cached after they are installed. Default is None.
 
         Returns: None
         """
 
         if local_dependencies_file.endswith(".txt"):
             if conda_env:
-                self._install_req_txt_in_conda_env(conda_env, local_dependencies_file)
+                self._install_with_cache(
+                    cache,
+                    local_dependencies_file,
+                    conda_env,
+                    lambda: self._install_req_txt_in_conda_env(conda_env, local_dependencies_file),
+                )
                 self._write_conda_env_to_file(conda_env)
 
             else:
-                self._install_requirements_txt(local_dependencies_file, _python_executable())
+                self._install_with_cache(
+                    cache,
+                    local_dependencies_file,
+                    None,
+                    lambda: self._install_requirements_txt(
+                        local_dependencies_file, _python_executable()
+                    ),
+                )
 
         elif local_dependencies_file.endswith(".yml") or local_dependencies_file.endswith(".yaml"):
             if conda_env:
-                self._update_conda_env(conda_env, local_dependencies_file)
+                self._install_with_cache(
+                    cache,
+                    local_dependencies_file,
+                    conda_env,
+                    lambda: self._update_conda_env(conda_env, local_dependencies_file),
+                )
             else:
                 conda_env = "sagemaker-runtime-env"
-                self._create_conda_env(conda_env, local_dependencies_file)
+                self._install_with_cache(
+                    cache,
+                    local_dependencies_file,
+                    conda_env,
+                    lambda: self._create_conda_env(conda_env, local_dependencies_file),
+                )
                 self._validate_python_version(client_python_version, conda_env)
             self._write_conda_env_to_file(conda_env)
 
+    def _install_with_cache(self, cache, local_dependencies_file, conda_env, install):
+        """Restores the environment from the cache, or installs the dependencies and caches it."""
+        if cache is None:
+            install()
+            return
+
+        try:
+            key = cache.key(local_dependencies_file, conda_env)
+            roots = self._environment_roots(conda_env)
+            if cache.restore(key, roots):
+                return
+            files_before = _list_files(roots)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning("Failed to use the runtime environment cache: %s", e)
+            install()
+            return
+
+        install()
+        cache.save(key, roots, files_before)
+
+    def _environment_roots(self, conda_env):
+        """Returns the directories where the dependencies are installed."""
+        if conda_env:
+            return [self._conda_env_prefix(conda_env)]
+        paths = sysconfig.get_paths()
+        return sorted({paths["purelib"], paths["platlib"], paths["scripts"]})
+
+    def _conda_env_prefix(self, env_name):
+        """Returns the prefix of a conda environment, which may not exist yet."""
+        info = json.loads(_run_and_get_output_shell_cmd(f"{self._get_conda_exe()} info --json"))
+        if env_name == "base":
+            return info["root_prefix"]
+        for prefix in info.get("envs", []):
+            if os.path.basename(prefix) == env_name:
+                return prefix
+        return os.path.join(info["envs_dirs"][0], env_name)
+
     def run_pre_exec_script(self, pre_exec_script_path: str):
         """Runs script of pre-execution commands if existing.
 
@@ -374,6 +469,291 @@ class RuntimeEnvironmentManager:
             )
 
 
+class _RuntimeEnvironmentCache:
+    """Snapshots of the files installed by the dependencies of remote functions.
+
+    A snapshot is keyed by the content of the dependency file, the Python version, the
+    image and the conda environment. It is a tarball of the files that the installation
+    added or changed in the site-packages or conda environment, with the list of the files
+    it removed, so that it can be restored on top of the same image. The snapshots are
+    stored under an S3 URI, or a local directory such as a warm pool persistent cache.
+
+    Dependencies that are not pinned in the dependency file are not resolved again while
+    a snapshot exists, and a failure to read or write a snapshot only logs a warning.
+
+    Like the other artifacts of remote functions, a snapshot is signed with an hmac-sha256
+    hash, keyed by the secret key of the job, and is only restored if the hash matches and
+    all its files are in the environment it was saved from. So that jobs with different
+    secret keys share snapshots, the same cache secret key can be passed to them instead.
+    """
+
+    MANIFEST_NAME = ".sagemaker_runtime_environment_cache.json"
+
+    def __init__(
+        self,
+        cache_uri: str,
+        secret_key: str,
+        image_uri: str = None,
+        s3_kms_key: str = None,
+        region: str = None,
+    ):
+        """Initializes the cache.
+
+        Args:
+            cache_uri (str): The S3 URI or local directory where the snapshots are stored.
+            secret_key (str): The key used to sign and verify the snapshots.
+            image_uri (str): The image of the job. Default is None.
+            s3_kms_key (str): The KMS key encrypting the snapshots uploaded to S3.
+                Default is None.
+            region (str): The region of the S3 client. Default is None, which uses the
+                ``AWS_DEFAULT_REGION`` of the job.
+        """
+        self.cache_uri = cache_uri
+        self.secret_key = secret_key
+        self.image_uri = image_uri
+        self.s3_kms_key = s3_kms_key
+        self.region = region
+        self._s3_client = None
+
+    @staticmethod
+    def from_dependency_settings(dependency_settings):
+        """Returns the cache configured by dependency settings, or None.
+
+        The snapshots are signed with the ``REMOTE_FUNCTION_CACHE_SECRET_KEY`` environment
+        variable if it is set, otherwise with the ``REMOTE_FUNCTION_SECRET_KEY`` of the job.
+
+        Args:
+            dependency_settings (_DependencySettings): The dependency settings of the job.
+        """
+        if dependency_settings is None or not dependency_settings.cache_uri:
+            return None
+        secret_key = os.getenv(_CACHE_SECRET_KEY_ENV_VAR) or os.getenv(_SECRET_KEY_ENV_VAR)
+        if not secret_key:
+            logger.warning("No secret key to sign the runtime environment, it is not cached.")
+            return None
+        return _RuntimeEnvironmentCache(
+            dependency_settings.cache_uri,
+            secret_key,
+            image_uri=dependency_settings.image_uri,
+            s3_kms_key=dependency_settings.s3_kms_key,
+            region=dependency_settings.region,
+        )
+
+    def key(self, local_dependencies_file: str, conda_env: str = None) -> str:
+        """Returns the key of the environment built from a dependency file.
+
+        Args:
+            local_dependencies_file (str): path where dependencies file exists.
+            conda_env (str): conda environment the dependencies are installed in.
+        """
+        with open(local_dependencies_file, "rb") as f:
+            dependencies_digest = hashlib.sha256(f.read()).hexdigest()
+        environment = {
+            "dependencies": dependencies_digest,
+            "dependencies_type": os.path.splitext(local_dependencies_file)[1],
+            "python_version": sys.version,
+            "machine": platform.machine(),
+            "image_uri": self.image_uri,
+            "conda_env": conda_env,
+        }
+        return hashlib.sha256(json.dumps(environment, sort_keys=True).encode()).hexdigest()
+
+    def restore(self, key: str, roots: list) -> bool:
+        """Restores the snapshot with the given key, and returns whether it was cached.
+
+        Args:
+            key (str): The key of the environment.
+            roots (list[str]): The directories where the dependencies are installed. The
+                snapshot is not restored if it has files outside of them.
+        """
+        start = time.time()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            try:
+                snapshot_path = self._fetch(key, tmp_dir)
+                if snapshot_path is None:
+                    logger.info("The runtime environment %s is not cached.", key)
+                    return False
+                with open(snapshot_path, "rb") as f:
+                    self._verify(key, f)
+                    with tarfile.open(fileobj=f, mode="r:*") as tar:
+                        manifest = json.load(tar.extractfile(self.MANIFEST_NAME))
+                        members = [
+                            member
+                            for member in tar.getmembers()
+                            if member.name != self.MANIFEST_NAME
+                        ]
+                        _check_snapshot_paths(members, manifest["removed_files"], roots)
+                        for path in manifest["removed_files"]:
+                            try:
+                                os.remove(path)
+                            except (FileNotFoundError, IsADirectoryError):
+                                pass
+                        extract_kwargs = {"filter": "tar"} if hasattr(tarfile, "tar_filter") else {}
+                        tar.extractall(path=os.sep, members=members, **extract_kwargs)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.warning("Failed to restore the cached runtime environment %s: %s", key, e)
+                return False
+
+        logger.info(
+            "Restored the cached runtime environment %s in %.1f seconds.", key, time.time() - start
+        )
+        return True
+
+    def save(self, key: str, roots: list, files_before: dict):
+        """Saves a snapshot of the files that changed since ``files_before`` was listed.
+
+        Args:
+            key (str): The key of the environment.
+            roots (list[str]): The directories where the dependencies were installed.
+            files_before (dict): The files under ``roots`` before the installation,
+                as listed by ``_list_files``.
+        """
+        files_after = _list_files(roots)
+        changed_files = sorted(
+            path for path, stat in files_after.items() if files_before.get(path) != stat
+        )
+        removed_files = sorted(path for path in files_before if path not in files_after)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            try:
+                snapshot_path = os.path.join(tmp_dir, "snapshot.tar.gz")
+                manifest_path = os.path.join(tmp_dir, "manifest.json")
+                with open(manifest_path, "w") as f:
+                    json.dump({"removed_files": removed_files}, f)
+                with open(snapshot_path, "w+b") as f:
+                    # the signature is written in front of the tarball once it is complete
+                    f.write(b"0" * _SIGNATURE_LENGTH)
+                    with tarfile.open(fileobj=f, mode="w:gz", compresslevel=1) as tar:
+                        tar.add(manifest_path, arcname=self.MANIFEST_NAME)
+                        for path in changed_files:
+                            tar.add(path, arcname=path.lstrip(os.sep), recursive=False)
+                    f.seek(_SIGNATURE_LENGTH)
+                    signature = self._signature(key, f)
+                    f.seek(0)
+                    f.write(signature)
+                self._store(key, snapshot_path)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.warning("Failed to cache the runtime environment %s: %s", key, e)
+                return
+
+        logger.info(
+            "Cached the runtime environment %s: %d files changed, %d files removed.",
+            key,
+            len(changed_files),
+            len(removed_files),
+        )
+
+    def _signature(self, key, f) -> bytes:
+        """Returns the hmac-sha256 hash of the key and of the rest of a snapshot file."""
+        digest = hmac.new(self.secret_key.encode(), key.encode() + b"\n", hashlib.sha256)
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+        return digest.hexdigest().encode() + b"\n"
+
+    def _verify(self, key, f):
+        """Checks the signature of a snapshot file, and leaves it at the start of the tarball."""
+        signature = f.read(_SIGNATURE_LENGTH)
+        if not hmac.compare_digest(signature, self._signature(key, f)):
+            raise RuntimeEnvironmentError(
+                "Integrity check for the cached runtime environment failed. "
+                "Please restrict access to the cache location."
+            )
+        f.seek(_SIGNATURE_LENGTH)
+
+    def _fetch(self, key, tmp_dir):
+        """Copies the snapshot with the given key to a local file, returns None if missing."""
+        if not self.cache_uri.startswith("s3://"):
+            path = os.path.join(self.cache_uri, f"{key}.tar.gz")
+            return path if os.path.isfile(path) else None
+
+        from botocore.exceptions import ClientError
+
+        bucket, object_key = self._s3_location(key)
+        path = os.path.join(tmp_dir, "snapshot.tar.gz")
+        try:
+            self._get_s3_client().download_file(bucket, object_key, path)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                return None
+            raise
+        return path
+
+    def _store(self, key, snapshot_path):
+        """Stores a snapshot under the given key."""
+        if not self.cache_uri.startswith("s3://"):
+            os.makedirs(self.cache_uri, exist_ok=True)
+            path = os.path.join(self.cache_uri, f"{key}.tar.gz")
+            # write to a temporary file first, so that concurrent jobs never read a partial one
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            shutil.copyfile(snapshot_path, tmp_path)
+            os.replace(tmp_path, path)
+            return
+
+        bucket, object_key = self._s3_location(key)
+        extra_args = (
+            {"SSEKMSKeyId": self.s3_kms_key, "ServerSideEncryption": "aws:kms"}
+            if self.s3_kms_key
+            else None
+        )
+        self._get_s3_client().upload_file(snapshot_path, bucket, object_key, ExtraArgs=extra_args)
+
+    def _get_s3_client(self):
+        """Returns the S3 client of the cache, created on first use."""
+        if self._s3_client is None:
+            import boto3
+
+            region = self.region or os.getenv("AWS_DEFAULT_REGION")
+            self._s3_client = boto3.session.Session(region_name=region).client("s3")
+        return self._s3_client
+
+    def _s3_location(self, key):
+        """Returns the bucket and object key of the snapshot with the given key."""
+        parsed = urlparse(self.cache_uri)
+        prefix = parsed.path.strip("/")
+        object_key = f"{prefix}/{key}.tar.gz" if prefix else f"{key}.tar.gz"
+        return parsed.netloc, object_key
+
+
+def _check_snapshot_paths(members: list, removed_files: list, roots: list):
+    """Raises an error if a snapshot changes files outside of the environment roots."""
+    roots = [os.path.normpath(root) for root in roots]
+
+    def check(path):
+        path = os.path.normpath(path)
+        if not any(path == root or path.startswith(root.rstrip(os.sep) + os.sep) for root in roots):
+            raise RuntimeEnvironmentError(
+                f"The cached runtime environment has a file outside of {roots}: {path}"
+            )
+
+    for path in removed_files:
+        check(path)
+    for member in members:
+        path = os.path.join(os.sep, member.name)
+        check(path)
+        if member.issym():
+            check(os.path.join(os.path.dirname(path), member.linkname))
+        elif member.islnk():
+            check(os.path.join(os.sep, member.linkname))
+        elif not (member.isreg() or member.isdir()):
+            raise RuntimeEnvironmentError(
+                f"The cached runtime environment has an unsupported file: {path}"
+            )
+
+
+def _list_files(roots: list) -> dict:
+    """Returns the size, modification time and mode of the files and links under directories."""
+    files = {}
+    for root in roots:
+        for dir_path, dir_names, file_names in os.walk(root):
+            # links to directories are listed with the directories, but not walked into
+            links = [name for name in dir_names if os.path.islink(os.path.join(dir_path, name))]
+            for name in file_names + links:
+                path = os.path.join(dir_path, name)
+                stat = os.lstat(path)
+                files[path] = (stat.st_size, stat.st_mtime_ns, stat.st_mode)
+    return files
+
+
 def _run_and_get_output_shell_cmd(cmd: str) -> str:
     """Run and return the output of the given shell command"""
     return subprocess.check_output(shlex.split(cmd), stderr=subprocess.STDOUT).decode("utf-8")
@@ -18,6 +18,7 @@ import io
 
 from typing import Union
 from sagemaker.session import Session
+from sagemaker.s3_utils import S3ObjectReader, sync_local_to_s3, sync_s3_to_local
 
 # These were defined inside s3.py initially. Kept here for backward compatibility
 from sagemaker.s3_utils import (  # pylint: disable=unused-import # noqa: F401
@@ -66,6 +67,69 @@ class S3Uploader(object):
             extra_args=extra_args,
         )
 
+    @staticmethod
+    def sync(
+        local_path,
+        desired_s3_uri,
+        kms_key=None,
+        sagemaker_session=None,
+        delete=False,
+        compare_hash=False,
+        manifest_path=None,
+        max_workers=None,
+    ):
+        """Static method that uploads the changed files of a local directory to S3.
+
+        Only the files missing under ``desired_s3_uri`` or differing from their object are
+        uploaded. Files and objects of different sizes always differ. Files of the same size
+        differ if the local file is newer than the object or, with ``compare_hash``, if its
+        MD5 does not match the ETag of the object.
+
+        Args:
+            local_path (str): Path (absolute or relative) of the local directory to upload.
+            desired_s3_uri (str): The S3 prefix to which the relative paths of the files
+                are added.
+            kms_key (str): The KMS key to use to encrypt the files.
+            sagemaker_session (sagemaker.session.Session): Session object which
+                manages interactions with Amazon SageMaker APIs and any other
+                AWS services needed. If not specified, one is created
+                using the default AWS configuration chain.
+            delete (bool): Delete the objects under ``desired_s3_uri`` that have no local
+                file (default: False).
+            compare_hash (bool): Compare files with objects by MD5 hash instead of
+                modification time (default: False). Objects encrypted with SSE-KMS do not
+                have an MD5 ETag and are always uploaded again.
+            manifest_path (str): Optional path of a local JSON manifest recording the files
+                found in sync (default: None). Files that did not change since the previous
+                sync are not hashed again. The manifest is never uploaded.
+            max_workers (int): Optional number of threads uploading concurrently
+                (default: None). If not specified, the ``s3_transfer_max_workers`` value of
+                the session settings is used.
+
+        Returns:
+            sagemaker.s3_utils.SyncResult: The S3 URIs that were uploaded, unchanged
+                and deleted.
+        """
+        sagemaker_session = sagemaker_session or Session()
+        bucket, key_prefix = parse_s3_url(url=desired_s3_uri)
+        if kms_key is not None:
+            extra_args = {"SSEKMSKeyId": kms_key, "ServerSideEncryption": "aws:kms"}
+        else:
+            extra_args = None
+        max_workers = max_workers or sagemaker_session.settings.s3_transfer_max_workers
+
+        return sync_local_to_s3(
+            sagemaker_session.get_client("s3", max_pool_connections=max_workers),
+            local_path,
+            bucket,
+            key_prefix,
+            extra_args=extra_args,
+            delete=delete,
+            compare_hash=compare_hash,
+            manifest_path=manifest_path,
+            max_workers=max_workers,
+        )
+
     @staticmethod
     def upload_string_as_file_body(
         body: str, desired_s3_uri=None, kms_key=None, sagemaker_session=None
@@ -100,7 +164,7 @@ class S3Uploader(object):
         """Static method that uploads a given file or directory to S3.
 
         Args:
-            b (bytes or io.BytesIO): bytes.
+            b (bytes or io.BytesIO): bytes, or a readable binary file object.
             s3_uri (str): The S3 uri to upload to.
             kms_key (str): The KMS key to use to encrypt the files.
             sagemaker_session (sagemaker.session.Session): Session object which
@@ -121,7 +185,7 @@ class S3Uploader(object):
         else:
             extra_args = None
 
-        b = b if isinstance(b, io.BytesIO) else io.BytesIO(b)
+        b = io.BytesIO(b) if isinstance(b, (bytes, bytearray, memoryview)) else b
         sagemaker_session.s3_resource.Bucket(bucket).upload_fileobj(
             b, object_key, ExtraArgs=extra_args
         )
@@ -159,6 +223,67 @@ class S3Downloader(object):
             path=local_path, bucket=bucket, key_prefix=key_prefix, extra_args=extra_args
         )
 
+    @staticmethod
+    def sync(
+        s3_uri,
+        local_path,
+        kms_key=None,
+        sagemaker_session=None,
+        delete=False,
+        compare_hash=False,
+        manifest_path=None,
+        max_workers=None,
+    ):
+        """Static method that downloads the changed objects under an S3 uri to a local directory.
+
+        Only the objects missing from ``local_path`` or differing from their local file are
+        downloaded. Files and objects of different sizes always differ. Files of the same size
+        differ if the object is newer than the local file or, with ``compare_hash``, if the
+        MD5 of the file does not match the ETag of the object.
+
+        Args:
+            s3_uri (str): The S3 prefix to download from.
+            local_path (str): The local directory to download the objects to.
+            kms_key (str): The KMS key to use to decrypt the files.
+            sagemaker_session (sagemaker.session.Session): Session object which
+                manages interactions with Amazon SageMaker APIs and any other
+                AWS services needed. If not specified, one is created
+                using the default AWS configuration chain.
+            delete (bool): Delete the local files that have no object under ``s3_uri``
+                (default: False).
+            compare_hash (bool): Compare files with objects by MD5 hash instead of
+                modification time (default: False).
+            manifest_path (str): Optional path of a local JSON manifest recording the files
+                found in sync (default: None). Files that did not change since the previous
+                sync are not hashed again. The manifest is never deleted by ``delete``.
+            max_workers (int): Optional number of threads downloading concurrently
+                (default: None). If not specified, the ``s3_transfer_max_workers`` value of
+                the session settings is used.
+
+        Returns:
+            sagemaker.s3_utils.SyncResult: The local paths that were downloaded, unchanged
+                and deleted.
+        """
+        sagemaker_session = sagemaker_session or Session()
+        bucket, key_prefix = parse_s3_url(url=s3_uri)
+        if kms_key is not None:
+            extra_args = {"SSECustomerKey": kms_key}
+        else:
+            extra_args = None
+        max_workers = max_workers or sagemaker_session.settings.s3_transfer_max_workers
+
+        return sync_s3_to_local(
+            sagemaker_session.get_client("s3", max_pool_connections=max_workers),
+            bucket,
+            key_prefix,
+            local_path,
+            extra_args=extra_args,
+            delete=delete,
+            compare_hash=compare_hash,
+            manifest_path=manifest_path,
+            max_workers=max_workers,
+        )
+
     @staticmethod
     def read_file(s3_uri, sagemaker_session=None) -> str:
         """Static method that returns the contents of a s3 uri file body as a string.
@@ -198,10 +323,57 @@ class S3Downloader(object):
         bucket, object_key = parse_s3_url(s3_uri)
 
         bytes_io = io.BytesIO()
-        sagemaker_session.s3_resource.Bucket(bucket).download_fileobj(object_key, bytes_io)
+        sagemaker_session.get_client("s3").download_fileobj(bucket, object_key, bytes_io)
         bytes_io.seek(0)
         return bytes_io.read()
 
+    @staticmethod
+    def open(
+        s3_uri,
+        sagemaker_session=None,
+        block_size=8 * 1024 * 1024,
+        read_ahead=2,
+        max_cached_blocks=8,
+    ) -> S3ObjectReader:
+        """Static method that opens an S3 object as a seekable, read-only binary file object.
+
+        The object is not downloaded. Its contents are fetched block by block with ranged
+        requests as they are read, and the blocks following the last one read are fetched
+        ahead on background threads.
+
+        Example:
+            >>> with S3Downloader.open("s3://bucket/capture.jsonl") as f:
+            ...     f.seek(-1024, io.SEEK_END)
+            ...     tail = f.read()
+
+        Args:
+            s3_uri (str): An S3 uri that refers to a s3 object.
+            sagemaker_session (sagemaker.session.Session): Session object which
+                manages interactions with Amazon SageMaker APIs and any other
+                AWS services needed. If not specified, one is created
+                using the default AWS configuration chain.
+            block_size (int): The size in bytes of the ranges requested (default: 8 MiB).
+            read_ahead (int): The number of blocks fetched ahead of the last block read
+                (default: 2).
+            max_cached_blocks (int): The number of blocks kept in memory (default: 8).
+
+        Returns:
+            sagemaker.s3_utils.S3ObjectReader: The file object. Close it, or use it as a
+                context manager, to stop its read-ahead threads.
+        """
+        sagemaker_session = sagemaker_session or Session()
+
+        bucket, object_key = parse_s3_url(s3_uri)
+
+        return S3ObjectReader(
+            sagemaker_session.get_client("s3", max_pool_connections=read_ahead + 1),
+            bucket,
+            object_key,
+            block_size=block_size,
+            read_ahead=read_ahead,
+            max_cached_blocks=max_cached_blocks,
+        )
+
     @staticmethod
     def list(s3_uri, sagemaker_session=None):
         """Static method that lists the contents of an S3 uri.
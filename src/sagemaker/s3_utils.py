@@ -18,8 +18,16 @@ functions that were originally in `s3.py` so that those functions could be impor
 """
 from __future__ import print_function, absolute_import
 
+import collections
+import hashlib
+import io
+import json
 import logging
-from functools import reduce
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, reduce
 from typing import Optional
 
 from six.moves.urllib.parse import urlparse
@@ -173,3 +181,862 @@ def determine_bucket_and_prefix(
     # once in total.
 
     return final_bucket, final_key_prefix
+
+
+# Part size used by boto3 managed transfers, which produce most multipart ETags.
+_DEFAULT_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+_MB = 1024 * 1024
+_HASH_READ_SIZE = 1024 * 1024
+
+
+def list_s3_objects(s3_client, bucket, prefix):
+    """Lazily list the objects under an S3 prefix, one page of results at a time.
+
+    Args:
+        s3_client (botocore.client.S3): The S3 client used to list the objects.
+        bucket (str): Name of the S3 bucket.
+        prefix (str): S3 object key name prefix.
+
+    Yields:
+        dict: The ``Contents`` entries returned by ``ListObjectsV2``, such as
+            ``{"Key": ..., "Size": ..., "ETag": ...}``.
+    """
+    request_parameters = {"Bucket": bucket, "Prefix": prefix}
+    while True:
+        response = s3_client.list_objects_v2(**request_parameters)
+        for s3_object in response.get("Contents", None) or []:
+            yield s3_object
+        next_token = response.get("NextContinuationToken")
+        if next_token is None:
+            return
+        request_parameters["ContinuationToken"] = next_token
+
+
+def _file_md5(local_path, start=0, length=None):
+    """Return the MD5 hash object of a file or of a byte range of a file."""
+    md5 = hashlib.md5()
+    with open(local_path, "rb") as f:
+        f.seek(start)
+        remaining = length
+        while remaining is None or remaining > 0:
+            read_size = _HASH_READ_SIZE if remaining is None else min(_HASH_READ_SIZE, remaining)
+            chunk = f.read(read_size)
+            if not chunk:
+                break
+            md5.update(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+    return md5
+
+
+def _multipart_etag(local_path, size, chunk_size):
+    """Return the ETag S3 computes for a multipart upload of a file with the given part size."""
+    digests = b"".join(
+        _file_md5(local_path, start, chunk_size).digest() for start in range(0, size, chunk_size)
+    )
+    return "{}-{}".format(hashlib.md5(digests).hexdigest(), math.ceil(size / chunk_size))
+
+
+def local_file_matches_s3_object(local_path, size, etag):
+    """Check whether a local file has the same size and ETag as an S3 object.
+
+    Single part ETags are compared with the MD5 of the file. For multipart ETags, the part
+    size is not known, so the boto3 default part size and the smallest whole-MiB part size
+    yielding the same number of parts are tried. Objects whose ETag is not derived from
+    MD5 (for example SSE-KMS encrypted objects) never match.
+
+    Args:
+        local_path (str): Path of the local file.
+        size (int): Size of the S3 object in bytes.
+        etag (str): ETag of the S3 object, with or without surrounding quotes.
+
+    Returns:
+        bool: True if the local file exists and matches the S3 object.
+    """
+    if not etag or not os.path.isfile(local_path):
+        return False
+    size = int(size)
+    if os.path.getsize(local_path) != size:
+        return False
+
+    etag = etag.strip('"')
+    if "-" not in etag:
+        return _file_md5(local_path).hexdigest() == etag
+
+    try:
+        num_parts = int(etag.rsplit("-", 1)[1])
+    except ValueError:
+        return False
+    if num_parts < 1:
+        return False
+    candidate_chunk_sizes = {
+        _DEFAULT_MULTIPART_CHUNKSIZE,
+        math.ceil(size / num_parts / _MB) * _MB,
+    }
+    for chunk_size in sorted(candidate_chunk_sizes):
+        if chunk_size > 0 and math.ceil(size / chunk_size) == num_parts:
+            if _multipart_etag(local_path, size, chunk_size) == etag:
+                return True
+    return False
+
+
+def download_s3_objects(
+    s3_client,
+    bucket,
+    s3_objects,
+    destination_for_key,
+    extra_args=None,
+    max_workers=None,
+    skip_existing=False,
+):
+    """Download S3 objects to local files, optionally with a pool of worker threads.
+
+    ``s3_objects`` is consumed lazily, so when it is the generator returned by
+    :func:`list_s3_objects` the listing of the next pages overlaps with the downloads of
+    the objects already listed. At most twice ``max_workers`` downloads are queued at a time.
+
+    Args:
+        s3_client (botocore.client.S3): The S3 client used for the downloads. It is shared
+            between the worker threads, so it must not be a boto3 resource.
+        bucket (str): Name of the S3 bucket.
+        s3_objects (Iterable[dict]): ``ListObjectsV2`` style entries with at least a ``Key``,
+            and a ``Size`` and ``ETag`` when ``skip_existing`` is used.
+        destination_for_key (callable[[str], str]): Returns the local path for an object key.
+            Parent directories are created as needed.
+        extra_args (dict): Optional extra arguments passed to the download operation.
+        max_workers (int): Optional number of threads downloading concurrently
+            (default: None). If not specified, objects are downloaded one after another.
+        skip_existing (bool): Skip objects whose local file already has the same size and
+            ETag (default: False). This makes interrupted downloads cheap to resume.
+
+    Returns:
+        list[str]: The local paths of the objects, in listing order, whether they were
+            downloaded or skipped.
+    """
+
+    def _download(s3_object, destination_path):
+        if skip_existing and local_file_matches_s3_object(
+            destination_path, s3_object.get("Size", -1), s3_object.get("ETag")
+        ):
+            logger.debug("Skipping up-to-date file %s", destination_path)
+            return
+        s3_client.download_file(
+            Bucket=bucket, Key=s3_object["Key"], Filename=destination_path, ExtraArgs=extra_args
+        )
+
+    def _destination(s3_object):
+        destination_path = destination_for_key(s3_object["Key"])
+        if not os.path.exists(os.path.dirname(destination_path)):
+            os.makedirs(os.path.dirname(destination_path), exist_ok=True)
+        return destination_path
+
+    downloaded_paths = []
+    if not max_workers or max_workers <= 1:
+        for s3_object in s3_objects:
+            destination_path = _destination(s3_object)
+            _download(s3_object, destination_path)
+            downloaded_paths.append(destination_path)
+        return downloaded_paths
+
+    slots = threading.BoundedSemaphore(2 * max_workers)
+    failed = threading.Event()
+    futures = []
+
+    def _on_done(future):
+        slots.release()
+        if future.cancelled() or future.exception() is not None:
+            failed.set()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for s3_object in s3_objects:
+                if failed.is_set():
+                    break
+                destination_path = _destination(s3_object)
+                slots.acquire()
+                future = executor.submit(_download, s3_object, destination_path)
+                future.add_done_callback(_on_done)
+                futures.append(future)
+                downloaded_paths.append(destination_path)
+            for future in futures:
+                future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return downloaded_paths
+
+
+SyncResult = collections.namedtuple("SyncResult", ["transferred", "unchanged", "deleted"])
+SyncResult.__doc__ = """The outcome of a sync between a local directory and an S3 prefix.
+
+Attributes:
+    transferred (list[str]): The S3 URIs uploaded, or the local paths downloaded.
+    unchanged (list[str]): The files or objects that were already up to date.
+    deleted (list[str]): The extra S3 URIs or local paths that were deleted.
+"""
+
+# Maximum number of keys accepted by a single DeleteObjects request.
+_DELETE_OBJECTS_BATCH_SIZE = 1000
+
+
+class _SyncManifest(object):
+    """Remembers the files found in sync with an S3 object, to avoid hashing them again.
+
+    An entry records the size and modification time of a local file together with the ETag
+    of the object it matched. As long as neither the file nor the object changed, the pair
+    is known to be in sync without reading the file. The manifest is a JSON file that is
+    discarded when it was written for another S3 location.
+    """
+
+    _VERSION = 1
+
+    def __init__(self, path, s3_uri):
+        """Load the manifest at ``path``, if any, for the given S3 location."""
+        self._path = path
+        self._s3_uri = s3_uri
+        self._entries = {}
+        self._lock = threading.Lock()
+        if path is None or not os.path.isfile(path):
+            return
+        try:
+            with open(path, "r") as f:
+                manifest = json.load(f)
+        except ValueError:
+            logger.warning("Ignoring the unreadable sync manifest %s", path)
+            return
+        if manifest.get("version") == self._VERSION and manifest.get("s3_uri") == s3_uri:
+            self._entries = manifest.get("files", {})
+
+    def matches(self, relative_path, local_path, etag):
+        """Return True if the file and the object did not change since they were recorded."""
+        entry = self._entries.get(relative_path)
+        if entry is None or entry["etag"] != etag:
+            return False
+        file_stat = os.stat(local_path)
+        return entry["size"] == file_stat.st_size and entry["mtime_ns"] == file_stat.st_mtime_ns
+
+    def record(self, relative_path, local_path, etag):
+        """Record that a local file is in sync with the object of the given ETag."""
+        file_stat = os.stat(local_path)
+        with self._lock:
+            self._entries[relative_path] = {
+                "size": file_stat.st_size,
+                "mtime_ns": file_stat.st_mtime_ns,
+                "etag": etag,
+            }
+
+    def remove(self, relative_path):
+        """Forget a file."""
+        with self._lock:
+            self._entries.pop(relative_path, None)
+
+    def retain(self, relative_paths):
+        """Forget the files that are not in ``relative_paths``."""
+        with self._lock:
+            self._entries = {
+                path: entry for path, entry in self._entries.items() if path in relative_paths
+            }
+
+    def save(self):
+        """Atomically write the manifest, if it has a path."""
+        if self._path is None:
+            return
+        directory = os.path.dirname(os.path.abspath(self._path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = "{}.tmp".format(self._path)
+        with open(tmp_path, "w") as f:
+            json.dump({"version": self._VERSION, "s3_uri": self._s3_uri, "files": self._entries}, f)
+        os.replace(tmp_path, self._path)
+
+
+def _list_local_files(local_dir, exclude=None):
+    """Return a dict of the files under ``local_dir`` keyed by their relative ``/`` path."""
+    exclude = os.path.abspath(exclude) if exclude else None
+    local_files = {}
+    for dirpath, _, filenames in os.walk(local_dir):
+        for name in filenames:
+            local_path = os.path.join(dirpath, name)
+            if exclude is not None and os.path.abspath(local_path) == exclude:
+                continue
+            relative_path = os.path.relpath(local_path, local_dir).replace(os.sep, "/")
+            local_files[relative_path] = local_path
+    return local_files
+
+
+def _list_remote_objects(s3_client, bucket, key_prefix):
+    """Return a dict of the objects under ``key_prefix`` keyed by their path relative to it."""
+    prefix = "{}/".format(key_prefix.rstrip("/")) if key_prefix else ""
+    remote_objects = {}
+    for s3_object in list_s3_objects(s3_client, bucket, prefix):
+        if s3_object["Key"].endswith("/"):
+            continue
+        remote_objects[s3_object["Key"][len(prefix) :]] = s3_object
+    return remote_objects
+
+
+def _is_in_sync(relative_path, local_path, s3_object, manifest, compare_hash, local_is_source):
+    """Decide whether a local file and an S3 object hold the same content.
+
+    Files of different sizes always differ. Then, a matching manifest entry means the pair is
+    in sync. Otherwise the MD5 of the file is compared with the ETag if ``compare_hash`` is
+    set, and if not, the pair is in sync unless the source is newer than the destination.
+    """
+    if not os.path.isfile(local_path) or os.path.getsize(local_path) != s3_object["Size"]:
+        return False
+    etag = s3_object.get("ETag")
+    if manifest.matches(relative_path, local_path, etag):
+        return True
+    if compare_hash:
+        if local_file_matches_s3_object(local_path, s3_object["Size"], etag):
+            manifest.record(relative_path, local_path, etag)
+            return True
+        return False
+    local_mtime = os.path.getmtime(local_path)
+    remote_mtime = s3_object["LastModified"].timestamp()
+    return local_mtime <= remote_mtime if local_is_source else remote_mtime <= local_mtime
+
+
+def _run_transfers(transfers, max_workers):
+    """Run transfer callables, on a pool of threads if ``max_workers`` is greater than one."""
+    if not max_workers or max_workers <= 1 or len(transfers) <= 1:
+        for transfer in transfers:
+            transfer()
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(transfer) for transfer in transfers]
+        try:
+            for future in futures:
+                future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def sync_local_to_s3(
+    s3_client,
+    local_dir,
+    bucket,
+    key_prefix,
+    extra_args=None,
+    delete=False,
+    compare_hash=False,
+    manifest_path=None,
+    max_workers=None,
+):
+    """Upload the files of a local directory that are missing or changed under an S3 prefix.
+
+    Args:
+        s3_client (botocore.client.S3): The S3 client used for the listing and the transfers.
+        local_dir (str): The local directory to upload.
+        bucket (str): Name of the S3 bucket.
+        key_prefix (str): S3 key prefix under which the relative paths of the files are added.
+        extra_args (dict): Optional extra arguments passed to the upload operation.
+        delete (bool): Delete the objects under the prefix that have no local file
+            (default: False).
+        compare_hash (bool): Compare the MD5 of files of the same size with the ETag of the
+            objects, instead of their modification times (default: False).
+        manifest_path (str): Optional path of a manifest file recording the files known to be
+            in sync, so that they are not hashed again by the next sync (default: None).
+        max_workers (int): Optional number of threads uploading concurrently (default: None).
+
+    Returns:
+        sagemaker.s3_utils.SyncResult: The S3 URIs uploaded, unchanged and deleted.
+    """
+    if not os.path.isdir(local_dir):
+        raise ValueError("{} is not a directory.".format(local_dir))
+    key_prefix = key_prefix.strip("/") if key_prefix else ""
+    s3_uri = s3_path_join("s3://", bucket, key_prefix)
+    manifest = _SyncManifest(manifest_path, s3_uri)
+    local_files = _list_local_files(local_dir, exclude=manifest_path)
+    remote_objects = _list_remote_objects(s3_client, bucket, key_prefix)
+
+    def _key(relative_path):
+        return "{}/{}".format(key_prefix, relative_path) if key_prefix else relative_path
+
+    def _upload(relative_path, local_path):
+        s3_client.upload_file(local_path, bucket, _key(relative_path), ExtraArgs=extra_args)
+        if manifest_path is not None:
+            etag = s3_client.head_object(Bucket=bucket, Key=_key(relative_path))["ETag"]
+            manifest.record(relative_path, local_path, etag)
+
+    result = SyncResult([], [], [])
+    transfers = []
+    for relative_path, local_path in sorted(local_files.items()):
+        s3_object = remote_objects.get(relative_path)
+        if s3_object is not None and _is_in_sync(
+            relative_path, local_path, s3_object, manifest, compare_hash, local_is_source=True
+        ):
+            result.unchanged.append(s3_path_join(s3_uri, relative_path))
+        else:
+            transfers.append(partial(_upload, relative_path, local_path))
+            result.transferred.append(s3_path_join(s3_uri, relative_path))
+
+    try:
+        _run_transfers(transfers, max_workers)
+    finally:
+        manifest.retain(local_files)
+        manifest.save()
+
+    if delete:
+        extra_keys = sorted(_key(path) for path in remote_objects if path not in local_files)
+        for start in range(0, len(extra_keys), _DELETE_OBJECTS_BATCH_SIZE):
+            batch = extra_keys[start : start + _DELETE_OBJECTS_BATCH_SIZE]
+            s3_client.delete_objects(
+                Bucket=bucket, Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True}
+            )
+            result.deleted.extend(s3_path_join("s3://", bucket, key) for key in batch)
+    return result
+
+
+def sync_s3_to_local(
+    s3_client,
+    bucket,
+    key_prefix,
+    local_dir,
+    extra_args=None,
+    delete=False,
+    compare_hash=False,
+    manifest_path=None,
+    max_workers=None,
+):
+    """Download the objects under an S3 prefix that are missing or changed in a local directory.
+
+    Args:
+        s3_client (botocore.client.S3): The S3 client used for the listing and the transfers.
+        bucket (str): Name of the S3 bucket.
+        key_prefix (str): S3 key prefix of the objects to download.
+        local_dir (str): The local directory the objects are downloaded to.
+        extra_args (dict): Optional extra arguments passed to the download operation.
+        delete (bool): Delete the local files that have no object under the prefix
+            (default: False).
+        compare_hash (bool): Compare the MD5 of files of the same size with the ETag of the
+            objects, instead of their modification times (default: False).
+        manifest_path (str): Optional path of a manifest file recording the files known to be
+            in sync, so that they are not hashed again by the next sync (default: None).
+        max_workers (int): Optional number of threads downloading concurrently (default: None).
+
+    Returns:
+        sagemaker.s3_utils.SyncResult: The local paths downloaded, unchanged and deleted.
+    """
+    key_prefix = key_prefix.strip("/") if key_prefix else ""
+    manifest = _SyncManifest(manifest_path, s3_path_join("s3://", bucket, key_prefix))
+    os.makedirs(local_dir, exist_ok=True)
+    local_files = _list_local_files(local_dir, exclude=manifest_path)
+    remote_objects = _list_remote_objects(s3_client, bucket, key_prefix)
+
+    def _download(relative_path, local_path, s3_object):
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        s3_client.download_file(
+            Bucket=bucket, Key=s3_object["Key"], Filename=local_path, ExtraArgs=extra_args
+        )
+        manifest.record(relative_path, local_path, s3_object.get("ETag"))
+
+    result = SyncResult([], [], [])
+    transfers = []
+    for relative_path, s3_object in sorted(remote_objects.items()):
+        local_path = os.path.join(local_dir, *relative_path.split("/"))
+        if relative_path in local_files and _is_in_sync(
+            relative_path, local_path, s3_object, manifest, compare_hash, local_is_source=False
+        ):
+            result.unchanged.append(local_path)
+        else:
+            transfers.append(partial(_download, relative_path, local_path, s3_object))
+            result.transferred.append(local_path)
+
+    try:
+        _run_transfers(transfers, max_workers)
+    finally:
+        manifest.save()
+
+    if delete:
+        for relative_path, local_path in sorted(local_files.items()):
+            if relative_path not in remote_objects:
+                os.remove(local_path)
+                manifest.remove(relative_path)
+                result.deleted.append(local_path)
+        manifest.save()
+    return result
+
+
+class S3MultipartUploadWriter(object):
+    """A write-only, non-seekable file object that streams its content to an S3 object.
+
+    Data is buffered into parts that are uploaded with an S3 multipart upload while more
+    data is being written, so that an archive can be produced straight into S3 without a
+    temporary file. At most ``max_concurrency`` parts are in flight, which bounds memory use
+    to roughly ``part_size * (max_concurrency + 1)``. Content smaller than a part is uploaded
+    with a single ``PutObject`` call when the writer is closed.
+
+    Closing the writer completes the upload. When used as a context manager, the upload is
+    aborted instead if the block raises, so that no partial object is left behind.
+    """
+
+    MIN_PART_SIZE = 5 * 1024 * 1024
+    # Arguments of CreateMultipartUpload that must be repeated on every UploadPart call.
+    _UPLOAD_PART_ARGS = (
+        "SSECustomerAlgorithm",
+        "SSECustomerKey",
+        "SSECustomerKeyMD5",
+        "RequestPayer",
+        "ExpectedBucketOwner",
+    )
+
+    def __init__(
+        self,
+        s3_client,
+        bucket,
+        key,
+        extra_args=None,
+        part_size=16 * 1024 * 1024,
+        max_concurrency=4,
+    ):
+        """Initialize an ``S3MultipartUploadWriter``.
+
+        Args:
+            s3_client (botocore.client.S3): The S3 client used for the upload.
+            bucket (str): Name of the S3 bucket.
+            key (str): Key of the S3 object to write.
+            extra_args (dict): Optional extra arguments of the upload, such as
+                ``ServerSideEncryption`` and ``SSEKMSKeyId`` (default: None).
+            part_size (int): Size in bytes of the uploaded parts. It must be at least 5 MiB
+                (default: 16 MiB).
+            max_concurrency (int): Maximum number of parts uploaded at the same time
+                (default: 4).
+        """
+        if part_size < self.MIN_PART_SIZE:
+            raise ValueError(
+                "part_size must be at least {} bytes, got {}.".format(self.MIN_PART_SIZE, part_size)
+            )
+        self._s3_client = s3_client
+        self._bucket = bucket
+        self._key = key
+        self._extra_args = extra_args or {}
+        self._part_size = part_size
+        self._max_concurrency = max_concurrency
+        self._buffer = bytearray()
+        self._upload_id = None
+        self._executor = None
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._futures = []
+        self._bytes_written = 0
+        self.closed = False
+
+    @property
+    def bytes_written(self):
+        """int: The number of bytes written so far."""
+        return self._bytes_written
+
+    def writable(self):
+        """Return True, the writer only supports writing."""
+        return True
+
+    def write(self, data):
+        """Buffer ``data`` and upload every complete part.
+
+        Args:
+            data (bytes): The bytes to write.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        self._buffer += data
+        while len(self._buffer) >= self._part_size:
+            part = bytes(self._buffer[: self._part_size])
+            del self._buffer[: self._part_size]
+            self._submit_part(part)
+        self._bytes_written += len(data)
+        return len(data)
+
+    def close(self):
+        """Upload the remaining data and complete the upload."""
+        if self.closed:
+            return
+        try:
+            if self._upload_id is None:
+                self._s3_client.put_object(
+                    Bucket=self._bucket, Key=self._key, Body=bytes(self._buffer), **self._extra_args
+                )
+            else:
+                if self._buffer:
+                    self._submit_part(bytes(self._buffer))
+                parts = [future.result() for future in self._futures]
+                self._s3_client.complete_multipart_upload(
+                    Bucket=self._bucket,
+                    Key=self._key,
+                    UploadId=self._upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+        except BaseException:
+            self.abort()
+            raise
+        finally:
+            self._buffer = bytearray()
+            self._shutdown_executor()
+            self.closed = True
+
+    def abort(self):
+        """Abort the upload and discard the parts uploaded so far."""
+        for future in self._futures:
+            future.cancel()
+        self._shutdown_executor()
+        if self._upload_id is not None:
+            try:
+                self._s3_client.abort_multipart_upload(
+                    Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+                )
+            except Exception:  # pylint: disable=broad-except
+                logger.warning(
+                    "Failed to abort multipart upload %s of s3://%s/%s",
+                    self._upload_id,
+                    self._bucket,
+                    self._key,
+                )
+            self._upload_id = None
+        self._buffer = bytearray()
+        self.closed = True
+
+    def flush(self):
+        """Do nothing, parts are uploaded as soon as they are complete."""
+
+    def __enter__(self):
+        """Return the writer itself."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Complete the upload, or abort it if the block raised."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _submit_part(self, body):
+        """Start the upload of the next part, waiting for a free slot if needed."""
+        if self._upload_id is None:
+            response = self._s3_client.create_multipart_upload(
+                Bucket=self._bucket, Key=self._key, **self._extra_args
+            )
+            self._upload_id = response["UploadId"]
+            self._executor = ThreadPoolExecutor(max_workers=self._max_concurrency)
+
+        for future in self._futures:
+            if future.done() and future.exception() is not None:
+                raise future.exception()
+
+        self._slots.acquire()
+        future = self._executor.submit(self._upload_part, len(self._futures) + 1, body)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+
+    def _upload_part(self, part_number, body):
+        """Upload a single part and return its entry for CompleteMultipartUpload."""
+        part_args = {
+            name: value
+            for name, value in self._extra_args.items()
+            if name in self._UPLOAD_PART_ARGS
+        }
+        response = self._s3_client.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body,
+            **part_args,
+        )
+        return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+    def _shutdown_executor(self):
+        """Wait for the part uploads in flight and release the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+class S3ObjectReader(io.RawIOBase):
+    """A read-only, seekable file object reading an S3 object with ranged ``GetObject`` calls.
+
+    The object is read in blocks of ``block_size`` bytes. The most recently used blocks are
+    kept in a small cache, and the blocks following the last one read are fetched ahead on
+    background threads, so sequential reads rarely wait for S3. Every request is made with
+    the ``ETag`` of the object at opening time, so a reader fails instead of mixing the
+    contents of two versions if the object is overwritten while it is read.
+
+    Wrap the reader in ``io.BufferedReader`` or ``io.TextIOWrapper`` for efficient small
+    reads or text decoding.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket,
+        key,
+        block_size=8 * 1024 * 1024,
+        read_ahead=2,
+        max_cached_blocks=8,
+    ):
+        """Initialize an ``S3ObjectReader``, fetching the size and ETag of the object.
+
+        Args:
+            s3_client (botocore.client.S3): The S3 client used for the requests. It is shared
+                with the read-ahead threads, so it must not be a boto3 resource.
+            bucket (str): Name of the S3 bucket.
+            key (str): Key of the S3 object.
+            block_size (int): The size in bytes of the ranges requested (default: 8 MiB).
+            read_ahead (int): The number of blocks fetched ahead of the last block read
+                (default: 2). With 0, blocks are only fetched when they are read.
+            max_cached_blocks (int): The number of blocks kept in memory (default: 8). It is
+                raised to ``read_ahead + 1`` if lower.
+        """
+        super(S3ObjectReader, self).__init__()
+        # set before anything can fail, as close() is called when the reader is collected
+        self._blocks = collections.OrderedDict()
+        self._pending = {}
+        self._executor = None
+        if block_size <= 0:
+            raise ValueError("block_size must be positive, got {}.".format(block_size))
+        self._s3_client = s3_client
+        self._bucket = bucket
+        self._key = key
+        self._block_size = block_size
+        self._read_ahead = max(read_ahead, 0)
+        self._max_cached_blocks = max(max_cached_blocks, self._read_ahead + 1)
+        self._position = 0
+
+        response = s3_client.head_object(Bucket=bucket, Key=key)
+        self._size = response["ContentLength"]
+        self._etag = response.get("ETag")
+        if self._read_ahead:
+            self._executor = ThreadPoolExecutor(max_workers=self._read_ahead)
+
+    @property
+    def size(self):
+        """int: The size of the S3 object in bytes."""
+        return self._size
+
+    @property
+    def name(self):
+        """str: The S3 URI of the object."""
+        return s3_path_join("s3://", self._bucket, self._key)
+
+    def readable(self):
+        """Return True, the reader supports reading."""
+        return True
+
+    def seekable(self):
+        """Return True, the reader supports random access."""
+        return True
+
+    def tell(self):
+        """Return the current position in the object."""
+        self._check_not_closed()
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """Change the position in the object, without making any request.
+
+        Args:
+            offset (int): The offset, relative to ``whence``.
+            whence (int): ``io.SEEK_SET``, ``io.SEEK_CUR`` or ``io.SEEK_END``
+                (default: ``io.SEEK_SET``).
+
+        Returns:
+            int: The new absolute position.
+        """
+        self._check_not_closed()
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError("Invalid whence ({}).".format(whence))
+        if position < 0:
+            raise ValueError("Negative seek position {}.".format(position))
+        self._position = position
+        return position
+
+    def readinto(self, b):
+        """Read bytes from the current position into a pre-allocated buffer.
+
+        Args:
+            b (bytearray or memoryview): The buffer to fill.
+
+        Returns:
+            int: The number of bytes read, 0 at the end of the object.
+        """
+        self._check_not_closed()
+        view = memoryview(b).cast("B")
+        copied = 0
+        while copied < len(view) and self._position < self._size:
+            index, offset = divmod(self._position, self._block_size)
+            block = self._get_block(index)
+            length = min(len(block) - offset, len(view) - copied)
+            if length <= 0:
+                raise IOError("{} is shorter than its announced size.".format(self.name))
+            view[copied : copied + length] = block[offset : offset + length]
+            copied += length
+            self._position += length
+        return copied
+
+    def readall(self):
+        """Read from the current position to the end of the object."""
+        self._check_not_closed()
+        buffer = bytearray(max(self._size - self._position, 0))
+        return bytes(buffer[: self.readinto(buffer)])
+
+    def close(self):
+        """Close the reader, cancel the pending read-ahead and release the cached blocks."""
+        if not self.closed:
+            if self._executor is not None:
+                for future in self._pending.values():
+                    future.cancel()
+                self._executor.shutdown(wait=False)
+            self._pending.clear()
+            self._blocks.clear()
+        super(S3ObjectReader, self).close()
+
+    def _check_not_closed(self):
+        """Raise a ``ValueError`` if the reader is closed."""
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+    def _get_block(self, index):
+        """Return a block from the cache, the read-ahead or S3, and schedule the next ones."""
+        block = self._blocks.pop(index, None)
+        if block is None:
+            future = self._pending.pop(index, None)
+            block = future.result() if future is not None else self._fetch_block(index)
+        self._blocks[index] = block
+        self._schedule_read_ahead(index)
+        while len(self._blocks) > self._max_cached_blocks:
+            self._blocks.popitem(last=False)
+        return block
+
+    def _schedule_read_ahead(self, index):
+        """Start fetching the blocks following ``index`` that are not cached or pending."""
+        if self._executor is None:
+            return
+        last_index = (self._size - 1) // self._block_size
+        for next_index in range(index + 1, min(index + self._read_ahead, last_index) + 1):
+            if next_index not in self._blocks and next_index not in self._pending:
+                self._pending[next_index] = self._executor.submit(self._fetch_block, next_index)
+        # Forget the read-ahead of blocks the reader moved away from.
+        for stale_index in [i for i in self._pending if not index < i <= index + self._read_ahead]:
+            self._pending.pop(stale_index).cancel()
+
+    def _fetch_block(self, index):
+        """Fetch a block of the object with a ranged ``GetObject`` request."""
+        start = index * self._block_size
+        end = min(start + self._block_size, self._size) - 1
+        request = {
+            "Bucket": self._bucket,
+            "Key": self._key,
+            "Range": "bytes={}-{}".format(start, end),
+        }
+        if self._etag:
+            request["IfMatch"] = self._etag
+        return self._s3_client.get_object(**request)["Body"].read()
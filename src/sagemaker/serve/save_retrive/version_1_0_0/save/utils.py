@@ -47,7 +47,7 @@ def upload_to_s3(s3_path: str, local_path: str, session: Session) -> str:
     files = [os.path.join(local_path, name) for name in os.listdir(local_path)]
     tmp = tempfile.mkdtemp(dir="/tmp")
 
-    tar_file = create_tar_file(files, os.path.join(tmp, "model.tar.gz"))
+    tar_file = create_tar_file(files, os.path.join(tmp, "model.tar.gz"), settings=session.settings)
     s3_model_url = session.upload_data(
         path=os.path.join(tmp, "model.tar.gz"), bucket=bucket, key_prefix=key_prefix
     )
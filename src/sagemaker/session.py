@@ -18,11 +18,14 @@ import logging
 import os
 import re
 import sys
+import threading
 import time
 import typing
 import warnings
 import uuid
 import datetime
+import functools
+import itertools
 
 from copy import deepcopy
 from typing import List, Dict, Any, Sequence, Optional
@@ -121,6 +124,8 @@ from sagemaker.config.config_utils import _log_sagemaker_config_merge
 from sagemaker.deprecations import deprecated_class
 from sagemaker.enums import EndpointType
 from sagemaker.inputs import ShuffleConfig, TrainingInput, BatchDataCaptureConfig
+from sagemaker.job_tracker import JobTracker
+from sagemaker.utilities import polling
 from sagemaker.user_agent import get_user_agent_extra_suffix
 from sagemaker.utils import (
     name_from_image,
@@ -128,6 +133,7 @@ from sagemaker.utils import (
     secondary_training_status_message,
     sts_regional_endpoint,
     retries,
+    run_concurrently,
     resolve_value_from_config,
     get_sagemaker_config_value,
     resolve_class_attribute_from_config,
@@ -158,6 +164,8 @@ _STATUS_CODE_TABLE = {
     "PENDING": "Pending",
 }
 EP_LOGGER_POLL = 10
+# Size of the connection pool of shared clients, matching the botocore default.
+_DEFAULT_MAX_POOL_CONNECTIONS = 10
 DEFAULT_EP_POLL = 30
 
 
@@ -171,6 +179,26 @@ class LogState(object):
     COMPLETE = 5
 
 
+class _SharedClients(object):
+    """The clients shared by the users of a ``Session``, keyed by service and configuration.
+
+    Copies of a session, such as deep copies or unpickled sessions, start with no clients.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self.clients = {}
+        self.lock = threading.Lock()
+
+    def __getstate__(self):
+        """Drop the clients and the lock, which cannot be copied."""
+        return {}
+
+    def __setstate__(self, state):
+        """Start a copy with no clients."""
+        self.__init__()
+
+
 class Session(object):  # pylint: disable=too-many-public-methods
     """Manage interactions with the Amazon SageMaker APIs and any other AWS services needed.
 
@@ -261,6 +289,7 @@ class Session(object):  # pylint: disable=too-many-public-methods
         self._config = None
         self.lambda_client = None
         self.settings = settings if settings else SessionSettings()
+        self._shared_clients = _SharedClients()
 
         self._initialize(
             boto_session=boto_session,
@@ -334,6 +363,7 @@ class Session(object):  # pylint: disable=too-many-public-methods
 
         self.s3_client = self.boto_session.client("s3", region_name=self.boto_region_name)
         self.s3_resource = self.boto_session.resource("s3", region_name=self.boto_region_name)
+        self._default_s3 = (self.s3_client, self.s3_resource)
 
         self.local_mode = False
 
@@ -373,7 +403,15 @@ class Session(object):  # pylint: disable=too-many-public-methods
         """Placeholder docstring"""
         return self._region_name
 
-    def upload_data(self, path, bucket=None, key_prefix="data", callback=None, extra_args=None):
+    def upload_data(
+        self,
+        path,
+        bucket=None,
+        key_prefix="data",
+        callback=None,
+        extra_args=None,
+        max_workers=None,
+    ):
         """Upload local file or directory to S3.
 
         If a single file is specified for upload, the resulting S3 object key is
@@ -382,6 +420,10 @@ class Session(object):  # pylint: disable=too-many-public-methods
         preserving relative structure of subdirectories. The resulting object key names are:
         ``{key_prefix}/{relative_subdirectory_path}/filename``.
 
+        When ``max_workers`` is greater than one, the files of a directory are uploaded
+        concurrently by a bounded pool of threads sharing a single S3 client whose connection
+        pool is sized to the number of workers.
+
         Args:
             path (str): Path (absolute or relative) of local file or directory to upload.
             bucket (str): Name of the S3 Bucket to upload to (default: None). If not specified, the
@@ -394,6 +436,11 @@ class Session(object):  # pylint: disable=too-many-public-methods
                 Similar to ExtraArgs parameter in S3 upload_file function. Please refer to the
                 ExtraArgs parameter documentation here:
                 https://boto3.amazonaws.com/v1/documentation/api/latest/guide/s3-uploading-files.html#the-extraargs-parameter
+            max_workers (int): Optional number of threads used to upload the files of a
+                directory concurrently (default: None). If not specified, the
+                ``s3_transfer_max_workers`` value of the session settings is used, and if
+                that is not set either, files are uploaded one after another. Note that
+                ``callback`` may be invoked from several threads when uploading concurrently.
 
         Returns:
             str: The S3 URI of the uploaded file(s). If a file is specified in the path argument,
@@ -423,15 +470,33 @@ class Session(object):  # pylint: disable=too-many-public-methods
             files.append((path, s3_key))
             key_suffix = name
 
-        if self.s3_resource is None:
-            s3 = self.boto_session.resource("s3", region_name=self.boto_region_name)
+        max_workers = max_workers or self.settings.s3_transfer_max_workers
+        if max_workers and max_workers > 1 and len(files) > 1:
+            s3_client = self.get_client("s3", max_pool_connections=max_workers)
+            run_concurrently(
+                [
+                    functools.partial(
+                        s3_client.upload_file,
+                        local_path,
+                        bucket,
+                        s3_key,
+                        Callback=callback,
+                        ExtraArgs=extra_args,
+                    )
+                    for local_path, s3_key in files
+                ],
+                max_workers=max_workers,
+            )
         else:
-            s3 = self.s3_resource
+            if self.s3_resource is None:
+                s3 = self.boto_session.resource("s3", region_name=self.boto_region_name)
+            else:
+                s3 = self.s3_resource
 
-        for local_path, s3_key in files:
-            s3.Object(bucket, s3_key).upload_file(
-                local_path, Callback=callback, ExtraArgs=extra_args
-            )
+            for local_path, s3_key in files:
+                s3.Object(bucket, s3_key).upload_file(
+                    local_path, Callback=callback, ExtraArgs=extra_args
+                )
 
         s3_uri = "s3://{}/{}".format(bucket, key_prefix)
         # If a specific file was used as input (instead of a directory), we return the full S3 key
@@ -441,6 +506,86 @@ class Session(object):  # pylint: disable=too-many-public-methods
             s3_uri = "{}/{}".format(s3_uri, key_suffix)
         return s3_uri
 
+    def get_client(self, service_name, max_pool_connections=None, **config_options):
+        """Return a client of an AWS service that is shared by the users of this session.
+
+        Clients are created lazily, once per service and configuration, and reused by every
+        later call, so their connections are kept alive between requests. Unlike boto3
+        resources, clients are thread-safe and can be shared by the threads of a concurrent
+        workload. A client is created again with a larger connection pool if more
+        connections than it has are requested.
+
+        If the ``s3_client`` or the ``s3_resource`` of the session was replaced, for example
+        to use other credentials or endpoint, the S3 client of the session is returned for
+        ``"s3"`` instead, whatever the pool size requested.
+
+        Args:
+            service_name (str): The name of the service, such as ``"s3"`` or ``"logs"``.
+            max_pool_connections (int): Optional number of connections needed in the pool
+                of the client (default: None). If not specified, or lower, the
+                ``client_max_pool_connections`` value of the session settings is used,
+                and if that is not set either, the botocore default of 10.
+            **config_options: Other ``botocore.config.Config`` options of the client, such
+                as ``retries``. Clients with different options are not shared.
+
+        Returns:
+            botocore.client.BaseClient: The client.
+        """
+        if service_name == "s3" and not config_options:
+            s3_client = self._replaced_s3_client()
+            if s3_client is not None:
+                return s3_client
+
+        max_pool_connections = max(
+            max_pool_connections or 0,
+            self.settings.client_max_pool_connections or _DEFAULT_MAX_POOL_CONNECTIONS,
+        )
+        key = (service_name, json.dumps(config_options, sort_keys=True, default=str))
+        with self._shared_clients.lock:
+            pool_size, client = self._shared_clients.clients.get(key, (0, None))
+            if client is None or pool_size < max_pool_connections:
+                config = botocore.config.Config(
+                    max_pool_connections=max_pool_connections,
+                    user_agent_extra=get_user_agent_extra_suffix(),
+                    **config_options,
+                )
+                endpoint_url = (
+                    getattr(self, "s3_endpoint_url", None) if service_name == "s3" else None
+                )
+                client = self.boto_session.client(
+                    service_name,
+                    region_name=self.boto_region_name,
+                    endpoint_url=endpoint_url,
+                    config=config,
+                )
+                self._shared_clients.clients[key] = (max_pool_connections, client)
+            return client
+
+    def _replaced_s3_client(self):
+        """Return the client of the S3 client or resource set on this session, if replaced."""
+        default_client, default_resource = getattr(self, "_default_s3", (None, None))
+        if self.s3_client is not None and self.s3_client is not default_client:
+            return self.s3_client
+        if self.s3_resource is not None and self.s3_resource is not default_resource:
+            return self.s3_resource.meta.client
+        return None
+
+    def _polling(self, poll):
+        """Return the polling strategy of the session settings, or ``poll`` if there is none."""
+        return self.settings.polling_strategy or poll
+
+    @property
+    def aio(self):
+        """sagemaker.async_session.AsyncSession: Awaitable versions of the session APIs.
+
+        The ``AsyncSession`` is created on first use, and shared by the later calls.
+        """
+        if getattr(self, "_aio", None) is None:
+            from sagemaker.async_session import AsyncSession
+
+            self._aio = AsyncSession(self)
+        return self._aio
+
     def upload_string_as_file_body(self, body, bucket, key, kms_key=None):
         """Upload a string as a file body.
 
@@ -471,9 +616,21 @@ class Session(object):  # pylint: disable=too-many-public-methods
         s3_uri = "s3://{}/{}".format(bucket, key)
         return s3_uri
 
-    def download_data(self, path, bucket, key_prefix="", extra_args=None):
+    def download_data(
+        self,
+        path,
+        bucket,
+        key_prefix="",
+        extra_args=None,
+        max_workers=None,
+        skip_existing=False,
+    ):
         """Download file or directory from S3.
 
+        Objects are downloaded while the prefix is still being listed. When ``max_workers`` is
+        greater than one, they are downloaded concurrently by a bounded pool of threads sharing
+        a single S3 client.
+
         Args:
             path (str): Local path where the file or directory should be downloaded to.
             bucket (str): Name of the S3 Bucket to download from.
@@ -482,62 +639,58 @@ class Session(object):  # pylint: disable=too-many-public-methods
                 download operation. Please refer to the ExtraArgs parameter in the boto3
                 documentation here:
                 https://boto3.amazonaws.com/v1/documentation/api/latest/guide/s3-example-download-file.html
+            max_workers (int): Optional number of threads used to download objects
+                concurrently (default: None). If not specified, the ``s3_transfer_max_workers``
+                value of the session settings is used, and if that is not set either, objects
+                are downloaded one after another.
+            skip_existing (bool): Skip objects whose local file already has the same size and
+                ETag, so that an interrupted download only fetches what is missing when it is
+                run again (default: False).
 
         Returns:
             list[str]: List of local paths of downloaded files
         """
         # Initialize the S3 client.
-        if self.s3_client is None:
+        max_workers = max_workers or self.settings.s3_transfer_max_workers
+        if max_workers and max_workers > 1:
+            s3 = self.get_client("s3", max_pool_connections=max_workers)
+        elif self.s3_client is None:
             s3 = self.boto_session.client("s3", region_name=self.boto_region_name)
         else:
             s3 = self.s3_client
 
-        # Initialize the variables used to loop through the contents of the S3 bucket.
-        keys = []
-        directories = []
-        next_token = ""
-        base_parameters = {"Bucket": bucket, "Prefix": key_prefix}
-
-        # Loop through the contents of the bucket, 1,000 objects at a time. Gathering all keys into
-        # a "keys" list.
-        while next_token is not None:
-            request_parameters = base_parameters.copy()
-            if next_token != "":
-                request_parameters.update({"ContinuationToken": next_token})
-            response = s3.list_objects_v2(**request_parameters)
-            contents = response.get("Contents", None)
-            if not contents:
-                logger.info(
-                    "Nothing to download from bucket: %s, key_prefix: %s.", bucket, key_prefix
-                )
-                return []
-            # For each object, save its key or directory.
-            for s3_object in contents:
+        # The listing is consumed lazily by the download loop, 1,000 objects at a time.
+        s3_objects = s3_utils.list_s3_objects(s3, bucket, key_prefix)
+        first_object = next(s3_objects, None)
+        if first_object is None:
+            logger.info("Nothing to download from bucket: %s, key_prefix: %s.", bucket, key_prefix)
+            return []
+
+        def _files():
+            """Create the local directories of directory objects and yield the other objects."""
+            for s3_object in itertools.chain([first_object], s3_objects):
                 key: str = s3_object.get("Key")
                 obj_size = s3_object.get("Size")
                 if key.endswith("/") and int(obj_size) == 0:
-                    directories.append(os.path.join(path, key))
+                    os.makedirs(os.path.dirname(os.path.join(path, key)), exist_ok=True)
                 else:
-                    keys.append(key)
-            next_token = response.get("NextContinuationToken")
-
-        # For each object key, create the directory on the local machine if needed, and then
-        # download the file.
-        downloaded_paths = []
-        for dir_path in directories:
-            os.makedirs(os.path.dirname(dir_path), exist_ok=True)
-        for key in keys:
+                    yield s3_object
+
+        def _destination_for_key(key):
             tail_s3_uri_path = os.path.basename(key)
             if not os.path.splitext(key_prefix)[1]:
                 tail_s3_uri_path = os.path.relpath(key, key_prefix)
-            destination_path = os.path.join(path, tail_s3_uri_path)
-            if not os.path.exists(os.path.dirname(destination_path)):
-                os.makedirs(os.path.dirname(destination_path), exist_ok=True)
-            s3.download_file(
-                Bucket=bucket, Key=key, Filename=destination_path, ExtraArgs=extra_args
-            )
-            downloaded_paths.append(destination_path)
-        return downloaded_paths
+            return os.path.join(path, tail_s3_uri_path)
+
+        return s3_utils.download_s3_objects(
+            s3,
+            bucket,
+            _files(),
+            _destination_for_key,
+            extra_args=extra_args,
+            max_workers=max_workers,
+            skip_existing=skip_existing,
+        )
 
     def read_s3_file(self, bucket, key_prefix):
         """Read a single file from S3.
@@ -2976,7 +3129,9 @@ class Session(object):  # pylint: disable=too-many-public-methods
             exceptions.CapacityError: If the auto ml job fails with CapacityError.
             exceptions.UnexpectedStatusException: If the auto ml job fails.
         """
-        desc = _wait_until(lambda: _auto_ml_job_status(self.sagemaker_client, job), poll)
+        desc = _wait_until(
+            lambda: _auto_ml_job_status(self.sagemaker_client, job), self._polling(poll)
+        )
         _check_job_status(job, desc, "AutoMLJobStatus")
         return desc
 
@@ -2994,7 +3149,9 @@ class Session(object):  # pylint: disable=too-many-public-methods
             exceptions.ResourceNotFound: If optimization job fails with CapacityError.
             exceptions.UnexpectedStatusException: If optimization job fails.
         """
-        desc = _wait_until(lambda: _optimization_job_status(self.sagemaker_client, job), poll)
+        desc = _wait_until(
+            lambda: _optimization_job_status(self.sagemaker_client, job), self._polling(poll)
+        )
         _check_job_status(job, desc, "OptimizationJobStatus")
         return desc
 
@@ -3021,7 +3178,7 @@ class Session(object):  # pylint: disable=too-many-public-methods
         description = _wait_until(lambda: self.describe_auto_ml_job_v2(job_name), poll)
 
         instance_count, stream_names, positions, client, log_group, dot, color_wrap = _logs_init(
-            self.boto_session, description, job="AutoML"
+            self, description, job="AutoML"
         )
 
         state = _get_initial_job_state(description, "AutoMLJobStatus", wait)
@@ -4669,7 +4826,8 @@ class Session(object):  # pylint: disable=too-many-public-methods
             exceptions.UnexpectedStatusException: If waiting and the Model Package job fails.
         """
         desc = _wait_until(
-            lambda: _create_model_package_status(self.sagemaker_client, model_package_name), poll
+            lambda: _create_model_package_status(self.sagemaker_client, model_package_name),
+            self._polling(poll),
         )
         status = desc["ModelPackageStatus"]
 
@@ -5299,7 +5457,7 @@ class Session(object):  # pylint: disable=too-many-public-methods
         """
         desc = _wait_until(
             lambda: self._inference_component_done(self.sagemaker_client, inference_component_name),
-            poll,
+            self._polling(poll),
         )
         status = desc["InferenceComponentStatus"]
 
@@ -5376,7 +5534,7 @@ class Session(object):  # pylint: disable=too-many-public-methods
             lambda: self._inference_component_deletion_done(
                 self.sagemaker_client, inference_component_name
             ),
-            poll,
+            self._polling(poll),
         )
 
     def _inference_component_deletion_done(self, sagemaker_client, inference_component_name: str):
@@ -5470,7 +5628,7 @@ class Session(object):  # pylint: disable=too-many-public-methods
                 lambda: self._inference_component_deletion_done(
                     self.sagemaker_client, inference_component_name
                 ),
-                poll=20,
+                poll=self._polling(20),
             )
 
     def list_and_paginate_inference_component_names_associated_with_endpoint(
@@ -5718,7 +5876,9 @@ class Session(object):  # pylint: disable=too-many-public-methods
             exceptions.UnexpectedStatusException: If the training job fails.
         """
         desc = _wait_until_training_done(
-            lambda last_desc: _train_done(self.sagemaker_client, job, last_desc), None, poll
+            lambda last_desc: _train_done(self.sagemaker_client, job, last_desc),
+            None,
+            self._polling(poll),
         )
         _check_job_status(job, desc, "TrainingJobStatus")
         return desc
@@ -5737,7 +5897,9 @@ class Session(object):  # pylint: disable=too-many-public-methods
             exceptions.CapacityError: If the processing job fails with CapacityError.
             exceptions.UnexpectedStatusException: If the processing job fails.
         """
-        desc = _wait_until(lambda: _processing_job_status(self.sagemaker_client, job), poll)
+        desc = _wait_until(
+            lambda: _processing_job_status(self.sagemaker_client, job), self._polling(poll)
+        )
         _check_job_status(job, desc, "ProcessingJobStatus")
         return desc
 
@@ -5755,7 +5917,9 @@ class Session(object):  # pylint: disable=too-many-public-methods
             exceptions.CapacityError: If the compilation job fails with CapacityError.
             exceptions.UnexpectedStatusException: If the compilation job fails.
         """
-        desc = _wait_until(lambda: _compilation_job_status(self.sagemaker_client, job), poll)
+        desc = _wait_until(
+            lambda: _compilation_job_status(self.sagemaker_client, job), self._polling(poll)
+        )
         _check_job_status(job, desc, "CompilationJobStatus")
         return desc
 
@@ -5773,7 +5937,9 @@ class Session(object):  # pylint: disable=too-many-public-methods
             exceptions.CapacityError: If the edge packaging job fails with CapacityError.
             exceptions.UnexpectedStatusException: If the edge packaging job fails.
         """
-        desc = _wait_until(lambda: _edge_packaging_job_status(self.sagemaker_client, job), poll)
+        desc = _wait_until(
+            lambda: _edge_packaging_job_status(self.sagemaker_client, job), self._polling(poll)
+        )
         _check_job_status(job, desc, "EdgePackagingJobStatus")
         return desc
 
@@ -5791,7 +5957,9 @@ class Session(object):  # pylint: disable=too-many-public-methods
             exceptions.CapacityError: If the hyperparameter tuning job fails with CapacityError.
             exceptions.UnexpectedStatusException: If the hyperparameter tuning job fails.
         """
-        desc = _wait_until(lambda: _tuning_job_status(self.sagemaker_client, job), poll)
+        desc = _wait_until(
+            lambda: _tuning_job_status(self.sagemaker_client, job), self._polling(poll)
+        )
         _check_job_status(job, desc, "HyperParameterTuningJobStatus")
         return desc
 
@@ -5820,10 +5988,63 @@ class Session(object):  # pylint: disable=too-many-public-methods
             exceptions.CapacityError: If the transform job fails with CapacityError.
             exceptions.UnexpectedStatusException: If the transform job fails.
         """
-        desc = _wait_until(lambda: _transform_job_status(self.sagemaker_client, job), poll)
+        desc = _wait_until(
+            lambda: _transform_job_status(self.sagemaker_client, job), self._polling(poll)
+        )
         _check_job_status(job, desc, "TransformJobStatus")
         return desc
 
+    def wait_for_jobs(
+        self,
+        training_jobs=None,
+        processing_jobs=None,
+        transform_jobs=None,
+        poll=30,
+        callback=None,
+        timeout=None,
+    ):
+        """Wait for many Amazon SageMaker training, processing and transform jobs to complete.
+
+        Unlike ``wait_for_job``, which describes its job on every poll, the jobs are refreshed
+        with a few ``List*Jobs`` calls per poll, filtered on their status, creation time and
+        last modification time (see :class:`~sagemaker.job_tracker.JobTracker`).
+
+        Args:
+            training_jobs (list[str]): Names of the training jobs to wait for (default: None).
+            processing_jobs (list[str]): Names of the processing jobs to wait for
+                (default: None).
+            transform_jobs (list[str]): Names of the transform jobs to wait for (default: None).
+            poll (int): Polling interval in seconds (default: 30).
+            callback (callable[[sagemaker.job_tracker.FinishedJob], None]): A function called
+                with each job as soon as it completes, fails or is stopped (default: None).
+            timeout (int): The maximum number of seconds to wait for all the jobs
+                (default: None). If not specified, wait until every job is finished.
+
+        Returns:
+            dict[str, dict]: The return value of the ``Describe*Job`` API of each job, by
+            job name.
+
+        Raises:
+            exceptions.CapacityError: If a job fails with CapacityError.
+            exceptions.UnexpectedStatusException: If a job fails. All the jobs are waited for
+                before raising. Like ``wait_for_job``, a stopped job only logs a warning.
+            TimeoutError: If some jobs are not finished after ``timeout`` seconds.
+        """
+        tracker = JobTracker(self, poll=poll)
+        tracker.add_jobs(training_jobs or [], job_type="training")
+        tracker.add_jobs(processing_jobs or [], job_type="processing")
+        tracker.add_jobs(transform_jobs or [], job_type="transform")
+        finished = tracker.wait(callback=callback, timeout=timeout)
+
+        status_keys = {
+            "training": "TrainingJobStatus",
+            "processing": "ProcessingJobStatus",
+            "transform": "TransformJobStatus",
+        }
+        for job in finished:
+            _check_job_status(job.job_name, job.description, status_keys[job.job_type])
+        return {job.job_name: job.description for job in finished}
+
     def stop_transform_job(self, name):
         """Stop the Amazon SageMaker hyperparameter tuning job with the specified name.
 
@@ -5861,7 +6082,9 @@ class Session(object):  # pylint: disable=too-many-public-methods
         """
 
         if not live_logging or not _has_permission_for_live_logging(self.boto_session, endpoint):
-            desc = _wait_until(lambda: _deploy_done(self.sagemaker_client, endpoint), poll)
+            desc = _wait_until(
+                lambda: _deploy_done(self.sagemaker_client, endpoint), self._polling(poll)
+            )
         else:
             cloudwatch_client = self.boto_session.client("logs")
             paginator = cloudwatch_client.get_paginator("filter_log_events")
@@ -5872,29 +6095,7 @@ class Session(object):  # pylint: disable=too-many-public-methods
                 ),
                 poll=EP_LOGGER_POLL,
             )
-        status = desc["EndpointStatus"]
-
-        if status != "InService":
-            reason = desc.get("FailureReason", None)
-            trouble_shooting = (
-                "Try changing the instance type or reference the troubleshooting page "
-                "https://docs.aws.amazon.com/sagemaker/latest/dg/async-inference-troubleshooting"
-                ".html"
-            )
-            message = "Error hosting endpoint {}: {}. Reason: {}. {}".format(
-                endpoint, status, reason, trouble_shooting
-            )
-            if "CapacityError" in str(reason):
-                raise exceptions.CapacityError(
-                    message=message,
-                    allowed_statuses=["InService"],
-                    actual_status=status,
-                )
-            raise exceptions.UnexpectedStatusException(
-                message=message,
-                allowed_statuses=["InService"],
-                actual_status=status,
-            )
+        _check_endpoint_status(endpoint, desc)
         return desc
 
     def endpoint_from_job(
@@ -6351,7 +6552,16 @@ class Session(object):  # pylint: disable=too-many-public-methods
 
         return role
 
-    def logs_for_job(self, job_name, wait=False, poll=10, log_type="All", timeout=None):
+    def logs_for_job(
+        self,
+        job_name,
+        wait=False,
+        poll=10,
+        log_type="All",
+        timeout=None,
+        export_dir=None,
+        export_format="jsonl",
+    ):
         """Display logs for a given training job, optionally tailing them until job is complete.
 
         If the output is a tty or a Jupyter cell, it will be color-coded
@@ -6368,11 +6578,18 @@ class Session(object):  # pylint: disable=too-many-public-methods
                 compatibility, boolean values are also accepted and converted to strings.
             timeout (int): Timeout in seconds to wait until the job is completed. ``None`` by
                 default.
+            export_dir (str): A local directory to also write the logs to (default: None).
+                The position of each log stream is checkpointed in this directory after
+                every poll, and a later call with the same directory resumes from the
+                checkpointed positions instead of reading the logs from the start.
+            export_format (str): How the logs are written to ``export_dir``: "jsonl" writes
+                every event to ``events.jsonl``, "per_host" writes the messages of each
+                instance to ``<host>.log`` (default: "jsonl").
         Raises:
             exceptions.CapacityError: If the training job fails with CapacityError.
             exceptions.UnexpectedStatusException: If waiting and the training job fails.
         """
-        _logs_for_job(self, job_name, wait, poll, log_type, timeout)
+        _logs_for_job(self, job_name, wait, poll, log_type, timeout, export_dir, export_format)
 
     def logs_for_processing_job(self, job_name, wait=False, poll=10):
         """Display logs for a given processing job, optionally tailing them until the is complete.
@@ -6391,7 +6608,7 @@ class Session(object):  # pylint: disable=too-many-public-methods
         description = _wait_until(lambda: self.describe_processing_job(job_name), poll)
 
         instance_count, stream_names, positions, client, log_group, dot, color_wrap = _logs_init(
-            self.boto_session, description, job="Processing"
+            self, description, job="Processing"
         )
 
         state = _get_initial_job_state(description, "ProcessingJobStatus", wait)
@@ -6472,7 +6689,7 @@ class Session(object):  # pylint: disable=too-many-public-methods
         description = _wait_until(lambda: self.describe_transform_job(job_name), poll)
 
         instance_count, stream_names, positions, client, log_group, dot, color_wrap = _logs_init(
-            self.boto_session, description, job="Transform"
+            self, description, job="Transform"
         )
 
         state = _get_initial_job_state(description, "TransformJobStatus", wait)
@@ -8763,21 +8980,30 @@ def _live_logging_deploy_done(sagemaker_client, endpoint_name, paginator, pagina
 
 
 def _wait_until_training_done(callable_fn, desc, poll=5):
-    """Placeholder docstring"""
-    elapsed_time = 0
+    """Call ``callable_fn`` with the last description until it reports the job as finished.
+
+    Args:
+        callable_fn (callable): A function taking the last job description and returning the
+            new description and whether the job is finished.
+        desc (dict): The initial job description.
+        poll (int or sagemaker.utilities.polling.PollingStrategy): The number of seconds to
+            sleep before each call, or the strategy deciding it (default: 5).
+    """
+    poller = polling.Poller(poll)
     finished = None
     job_desc = desc
     while not finished:
         try:
-            elapsed_time += poll
-            time.sleep(poll)
+            poller.sleep()
             job_desc, finished = callable_fn(job_desc)
         except botocore.exceptions.ClientError as err:
+            if poller.throttled(err):
+                continue
             # For initial 5 mins we accept/pass AccessDeniedException.
             # The reason is to await tag propagation to avoid false AccessDenied claims for an
             # access policy based on resource tags, The caveat here is for true AccessDenied
             # cases the routine will fail after 5 mins
-            if err.response["Error"]["Code"] == "AccessDeniedException" and elapsed_time <= 300:
+            if err.response["Error"]["Code"] == "AccessDeniedException" and poller.elapsed <= 300:
                 logger.warning(
                     "Received AccessDeniedException. This could mean the IAM role does not "
                     "have the resource permissions, in which case please add resource access "
@@ -8790,20 +9016,29 @@ def _wait_until_training_done(callable_fn, desc, poll=5):
 
 
 def _wait_until(callable_fn, poll=5):
-    """Placeholder docstring"""
-    elapsed_time = 0
+    """Call ``callable_fn`` until it returns something else than None, and return it.
+
+    Throttling errors are retried after backing off.
+
+    Args:
+        callable_fn (callable): The function to call.
+        poll (int or sagemaker.utilities.polling.PollingStrategy): The number of seconds to
+            sleep before each call, or the strategy deciding it (default: 5).
+    """
+    poller = polling.Poller(poll)
     result = None
     while result is None:
         try:
-            elapsed_time += poll
-            time.sleep(poll)
+            poller.sleep()
             result = callable_fn()
         except botocore.exceptions.ClientError as err:
+            if poller.throttled(err):
+                continue
             # For initial 5 mins we accept/pass AccessDeniedException.
             # The reason is to await tag propagation to avoid false AccessDenied claims for an
             # access policy based on resource tags, The caveat here is for true AccessDenied
             # cases the routine will fail after 5 mins
-            if err.response["Error"]["Code"] == "AccessDeniedException" and elapsed_time <= 300:
+            if err.response["Error"]["Code"] == "AccessDeniedException" and poller.elapsed <= 300:
                 logger.warning(
                     "Received AccessDeniedException. This could mean the IAM role does not "
                     "have the resource permissions, in which case please add resource access "
@@ -8853,7 +9088,14 @@ def _rule_statuses_changed(current_statuses, last_statuses):
 
 
 def _logs_for_job(  # noqa: C901 - suppress complexity warning for this method
-    sagemaker_session, job_name, wait=False, poll=10, log_type="All", timeout=None
+    sagemaker_session,
+    job_name,
+    wait=False,
+    poll=10,
+    log_type="All",
+    timeout=None,
+    export_dir=None,
+    export_format="jsonl",
 ):
     """Display logs for a given training job, optionally tailing them until job is complete.
 
@@ -8873,6 +9115,9 @@ def _logs_for_job(  # noqa: C901 - suppress complexity warning for this method
             compatibility, boolean values are also accepted and converted to strings.
         timeout (int): Timeout in seconds to wait until the job is completed. ``None`` by
             default.
+        export_dir (str): A local directory to also write the logs to, and to checkpoint the
+            position of each log stream in (default: None).
+        export_format (str): Either "jsonl" or "per_host" (default: "jsonl").
     Returns:
         Last call to sagemaker DescribeTrainingJob
     Raises:
@@ -8887,9 +9132,14 @@ def _logs_for_job(  # noqa: C901 - suppress complexity warning for this method
     print(secondary_training_status_message(description, None), end="")
 
     instance_count, stream_names, positions, client, log_group, dot, color_wrap = _logs_init(
-        sagemaker_session.boto_session, description, job="Training"
+        sagemaker_session, description, job="Training"
     )
 
+    exporter = None
+    if export_dir:
+        exporter = sagemaker.logs.LogExporter(export_dir, job_name, export_format)
+        positions.update(exporter.positions)
+
     state = _get_initial_job_state(description, "TrainingJobStatus", wait)
 
     # The loop below implements a state machine that alternates between checking the job status
@@ -8927,6 +9177,7 @@ def _logs_for_job(  # noqa: C901 - suppress complexity warning for this method
             positions,
             dot,
             color_wrap,
+            exporter,
         )
         if timeout and time.time() > request_end_time:
             print("Timeout Exceeded. {} seconds elapsed.".format(timeout))
@@ -9002,6 +9253,42 @@ def _logs_for_job(  # noqa: C901 - suppress complexity warning for this method
     return last_description
 
 
+def _check_endpoint_status(endpoint, desc):
+    """Raise an exception if an endpoint is not in service after a deployment.
+
+    Args:
+        endpoint (str): The name of the endpoint.
+        desc (dict): The response of the ``DescribeEndpoint`` API.
+
+    Raises:
+        exceptions.CapacityError: If the endpoint creation failed with CapacityError.
+        exceptions.UnexpectedStatusException: If the endpoint is not in service.
+    """
+    status = desc["EndpointStatus"]
+
+    if status != "InService":
+        reason = desc.get("FailureReason", None)
+        trouble_shooting = (
+            "Try changing the instance type or reference the troubleshooting page "
+            "https://docs.aws.amazon.com/sagemaker/latest/dg/async-inference-troubleshooting"
+            ".html"
+        )
+        message = "Error hosting endpoint {}: {}. Reason: {}. {}".format(
+            endpoint, status, reason, trouble_shooting
+        )
+        if "CapacityError" in str(reason):
+            raise exceptions.CapacityError(
+                message=message,
+                allowed_statuses=["InService"],
+                actual_status=status,
+            )
+        raise exceptions.UnexpectedStatusException(
+            message=message,
+            allowed_statuses=["InService"],
+            actual_status=status,
+        )
+
+
 def _check_job_status(job, desc, status_key_name):
     """Check to see if the job completed successfully.
 
@@ -9056,7 +9343,7 @@ def _check_job_status(job, desc, status_key_name):
         )
 
 
-def _logs_init(boto_session, description, job):
+def _logs_init(sagemaker_session, description, job):
     """Placeholder docstring"""
     if job == "Training":
         if "InstanceGroups" in description["ResourceConfig"]:
@@ -9077,8 +9364,11 @@ def _logs_init(boto_session, description, job):
 
     # Increase retries allowed (from default of 4), as we don't want waiting for a training job
     # to be interrupted by a transient exception.
-    config = botocore.config.Config(retries={"max_attempts": 15})
-    client = boto_session.client("logs", config=config)
+    client = sagemaker_session.get_client(
+        "logs",
+        max_pool_connections=min(instance_count, sagemaker.logs.MAX_CONCURRENT_STREAMS),
+        retries={"max_attempts": 15},
+    )
     log_group = "/aws/sagemaker/" + job + "Jobs"
 
     dot = False
@@ -9089,30 +9379,38 @@ def _logs_init(boto_session, description, job):
 
 
 def _flush_log_streams(
-    stream_names, instance_count, client, log_group, job_name, positions, dot, color_wrap
+    stream_names,
+    instance_count,
+    client,
+    log_group,
+    job_name,
+    positions,
+    dot,
+    color_wrap,
+    exporter=None,
 ):
-    """Placeholder docstring"""
+    """Print the new events of the log streams of a job, and export them if ``exporter`` is set."""
     if len(stream_names) < instance_count:
         # Log streams are created whenever a container starts writing to stdout/err, so this list
         # may be dynamic until we have a stream for every instance.
         try:
-            streams = client.describe_log_streams(
-                logGroupName=log_group,
-                logStreamNamePrefix=job_name + "/",
-                orderBy="LogStreamName",
-                limit=min(instance_count, 50),
-            )
-            stream_names = [s["logStreamName"] for s in streams["logStreams"]]
-
-            while "nextToken" in streams:
+            token_arg = {}
+            names = []
+            while True:
                 streams = client.describe_log_streams(
                     logGroupName=log_group,
                     logStreamNamePrefix=job_name + "/",
                     orderBy="LogStreamName",
                     limit=50,
+                    **token_arg,
                 )
-
-                stream_names.extend([s["logStreamName"] for s in streams["logStreams"]])
+                names.extend([s["logStreamName"] for s in streams["logStreams"]])
+                if not streams.get("nextToken"):
+                    break
+                token_arg = {"nextToken": streams["nextToken"]}
+            # Update the caller's list in place, so that the streams stop being listed once
+            # there is one for every instance.
+            stream_names[:] = names
 
             positions.update(
                 [
@@ -9136,6 +9434,8 @@ def _flush_log_streams(
             client, log_group, stream_names, positions
         ):
             color_wrap(idx, event["message"])
+            if exporter is not None:
+                exporter.write(stream_names[idx], event)
             ts, count = positions[stream_names[idx]]
             if event["timestamp"] == ts:
                 positions[stream_names[idx]] = sagemaker.logs.Position(timestamp=ts, skip=count + 1)
@@ -9143,6 +9443,8 @@ def _flush_log_streams(
                 positions[stream_names[idx]] = sagemaker.logs.Position(
                     timestamp=event["timestamp"], skip=1
                 )
+        if exporter is not None:
+            exporter.checkpoint(positions)
     else:
         dot = True
         print(".", end="")
@@ -23,6 +23,17 @@ class SessionSettings(object):
         encrypt_repacked_artifacts=True,
         local_download_dir=None,
         include_jumpstart_tags=True,
+        s3_transfer_max_workers=None,
+        source_code_cache_prefix=None,
+        stream_archive_uploads=False,
+        archive_compression_level=None,
+        archive_compression_threads=None,
+        incremental_model_repack=False,
+        client_max_pool_connections=None,
+        polling_strategy=None,
+        compress_remote_function_buffers=False,
+        runtime_environment_cache_uri=None,
+        runtime_environment_cache_secret_key=None,
     ) -> None:
         """Initialize the ``SessionSettings`` of a SageMaker ``Session``.
 
@@ -34,10 +45,70 @@ class SessionSettings(object):
                 for downloading artifacts. (Default: None).
             include_jumpstart_tags (bool): Optional. By default, if a JumpStart model is identified,
                 it will receive special tags describing its properties.
+            s3_transfer_max_workers (int): Optional. The default number of worker threads used
+                to transfer files concurrently when uploading or downloading a directory. If not
+                set, files are transferred one after another (Default: None).
+            source_code_cache_prefix (str): Optional. An S3 key prefix in the code bucket under
+                which source code archives are cached by content digest. When set, the
+                archives are built deterministically and an archive whose digest is already
+                cached is reused instead of being uploaded again. Remote functions also cache
+                their workspace and runtime scripts under this prefix of their S3 root URI,
+                and check that the files they reuse still exist (Default: None).
+            stream_archive_uploads (bool): Optional. Flag to indicate whether source code
+                archives and repacked models uploaded to S3 should be compressed straight into
+                an S3 multipart upload instead of a temporary local file (Default: False).
+            archive_compression_level (int): Optional. The gzip compression level, from 0 to 9,
+                of the model and source code archives created by the SDK. Level 0 stores the
+                files without compressing them, which suits already compressed model weights.
+                If not set, the maximum level 9 is used (Default: None).
+            archive_compression_threads (int): Optional. The number of threads compressing
+                model and source code archives. With more than one thread, blocks of the
+                archive are compressed in parallel into a standard gzip stream. If not set,
+                archives are compressed on a single thread (Default: None).
+            incremental_model_repack (bool): Optional. Flag to indicate whether models should
+                be repacked by streaming the existing archive and only rewriting its ``code/``
+                directory, instead of extracting the whole model to a local directory. The
+                other members are copied as they are (Default: False).
+            client_max_pool_connections (int): Optional. The default size of the connection
+                pool of the clients shared through ``Session.get_client``. If not set, the
+                botocore default of 10 connections is used (Default: None).
+            polling_strategy (sagemaker.utilities.polling.PollingStrategy): Optional. The
+                strategy deciding how long the ``Session.wait_for_*`` waiters sleep between
+                two polls, for example an ``AdaptivePolling`` that polls quickly at first and
+                backs off while the job runs. If set, it replaces the fixed ``poll`` interval
+                of the waiters (Default: None).
+            compress_remote_function_buffers (bool): Optional. Flag to indicate whether the
+                large buffers of remote function arguments and results, which are uploaded
+                as separate S3 objects, should be compressed with zlib. This helps with
+                sparse or repetitive data, at the cost of compressing and decompressing it
+                (Default: False).
+            runtime_environment_cache_uri (str): Optional. An S3 URI, or a directory in the
+                job container such as a warm pool persistent cache, where remote functions
+                and function steps cache the dependencies they install. The files installed
+                from a dependency file are snapshotted there, keyed by the content of the file,
+                the Python version and the image, and later jobs signing with the same
+                ``runtime_environment_cache_secret_key`` restore the snapshot instead of
+                installing the dependencies again. Without that key, only the function steps
+                of a pipeline cache their dependencies, for the steps and executions of the
+                same pipeline definition, which share a secret key (Default: None).
+            runtime_environment_cache_secret_key (str): Optional. The key signing the
+                snapshots of the ``runtime_environment_cache_uri``. A snapshot is only restored
+                by the jobs that sign with the same key (Default: None).
         """
         self._encrypt_repacked_artifacts = encrypt_repacked_artifacts
         self._local_download_dir = local_download_dir
         self._include_jumpstart_tags = include_jumpstart_tags
+        self._s3_transfer_max_workers = s3_transfer_max_workers
+        self._source_code_cache_prefix = source_code_cache_prefix
+        self._stream_archive_uploads = stream_archive_uploads
+        self._archive_compression_level = archive_compression_level
+        self._archive_compression_threads = archive_compression_threads
+        self._incremental_model_repack = incremental_model_repack
+        self._client_max_pool_connections = client_max_pool_connections
+        self._polling_strategy = polling_strategy
+        self._compress_remote_function_buffers = compress_remote_function_buffers
+        self._runtime_environment_cache_uri = runtime_environment_cache_uri
+        self._runtime_environment_cache_secret_key = runtime_environment_cache_secret_key
 
     @property
     def encrypt_repacked_artifacts(self) -> bool:
@@ -53,3 +124,58 @@ class SessionSettings(object):
     def include_jumpstart_tags(self) -> bool:
         """Return True if JumpStart tags should be attached to models with JumpStart artifacts."""
         return self._include_jumpstart_tags
+
+    @property
+    def s3_transfer_max_workers(self) -> int:
+        """Return the default number of worker threads used for concurrent S3 transfers."""
+        return self._s3_transfer_max_workers
+
+    @property
+    def source_code_cache_prefix(self) -> str:
+        """Return the S3 key prefix under which source code archives are cached by digest."""
+        return self._source_code_cache_prefix
+
+    @property
+    def stream_archive_uploads(self) -> bool:
+        """Return True if archives should be streamed to S3 without a temporary file."""
+        return self._stream_archive_uploads
+
+    @property
+    def archive_compression_level(self) -> int:
+        """Return the gzip compression level of the archives created by the SDK."""
+        return self._archive_compression_level
+
+    @property
+    def archive_compression_threads(self) -> int:
+        """Return the number of threads compressing the archives created by the SDK."""
+        return self._archive_compression_threads
+
+    @property
+    def incremental_model_repack(self) -> bool:
+        """Return True if only the code of a model archive should be rewritten when repacking."""
+        return self._incremental_model_repack
+
+    @property
+    def client_max_pool_connections(self) -> int:
+        """Return the default size of the connection pool of the clients shared by a session."""
+        return self._client_max_pool_connections
+
+    @property
+    def polling_strategy(self):
+        """Return the strategy deciding how long waiters sleep between two polls."""
+        return self._polling_strategy
+
+    @property
+    def compress_remote_function_buffers(self) -> bool:
+        """Return True if the buffers of remote function data should be compressed."""
+        return self._compress_remote_function_buffers
+
+    @property
+    def runtime_environment_cache_uri(self) -> str:
+        """Return the location where remote functions cache their installed dependencies."""
+        return self._runtime_environment_cache_uri
+
+    @property
+    def runtime_environment_cache_secret_key(self) -> str:
+        """Return the key signing the runtime environments cached by remote functions."""
+        return self._runtime_environment_cache_secret_key
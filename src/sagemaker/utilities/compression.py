@@ -0,0 +1,175 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""This module defines a gzip writer that compresses blocks on several threads."""
+from __future__ import absolute_import
+
+import collections
+import os
+import struct
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+# Size of the deflate window, and of the dictionary carried over between blocks.
+_WINDOW_SIZE = 32 * 1024
+_GZIP_MAGIC = b"\x1f\x8b"
+_GZIP_DEFLATE = 8
+_GZIP_OS_UNKNOWN = 255
+
+
+class ParallelGzipWriter(object):
+    """A write-only file object producing gzip data, compressing blocks on several threads.
+
+    The input is split into blocks that are deflated independently, each one primed with the
+    last 32 KiB of the previous block, and joined into a single gzip member, the same way
+    ``pigz`` does. The output can be read by any gzip decompressor, including ``gunzip``,
+    the ``gzip`` module and ``tarfile``. zlib releases the GIL while compressing, so the
+    blocks are compressed in parallel. At most ``2 * threads`` blocks are held in memory.
+
+    The underlying file object only needs a ``write`` method and is not closed.
+    """
+
+    def __init__(
+        self,
+        fileobj,
+        compresslevel=9,
+        threads=None,
+        block_size=1024 * 1024,
+        mtime=None,
+    ):
+        """Initialize a ``ParallelGzipWriter``.
+
+        Args:
+            fileobj: The binary file object the gzip data is written to.
+            compresslevel (int): The zlib compression level, from 0 (no compression) to
+                9 (default: 9).
+            threads (int): The number of compression threads (default: None). If not
+                specified, the number of CPUs is used.
+            block_size (int): The size in bytes of the blocks compressed independently
+                (default: 1 MiB).
+            mtime (int): The modification time recorded in the gzip header (default: None).
+                If not specified, the current time is used.
+        """
+        if not 0 <= compresslevel <= 9:
+            raise ValueError("compresslevel must be between 0 and 9, got {}.".format(compresslevel))
+        if block_size < _WINDOW_SIZE:
+            raise ValueError("block_size must be at least {} bytes.".format(_WINDOW_SIZE))
+        self._fileobj = fileobj
+        self._compresslevel = compresslevel
+        self._threads = threads or os.cpu_count() or 1
+        self._block_size = block_size
+        self._buffer = bytearray()
+        self._dictionary = b""
+        self._pending = collections.deque()
+        self._executor = ThreadPoolExecutor(max_workers=self._threads)
+        self._crc = zlib.crc32(b"")
+        self._size = 0
+        self.closed = False
+        self._write_header(int(time.time()) if mtime is None else mtime)
+
+    def writable(self):
+        """Return True, the writer only supports writing."""
+        return True
+
+    def write(self, data):
+        """Buffer ``data`` and start compressing every complete block.
+
+        Args:
+            data (bytes): The uncompressed bytes to write.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        data = memoryview(data).cast("B")
+        self._crc = zlib.crc32(data, self._crc)
+        self._size += len(data)
+        self._buffer += data
+        while len(self._buffer) >= self._block_size:
+            block = bytes(self._buffer[: self._block_size])
+            del self._buffer[: self._block_size]
+            self._submit(block, last=False)
+        return len(data)
+
+    def flush(self):
+        """Do nothing, blocks are written as soon as they are compressed."""
+
+    def close(self):
+        """Compress the remaining data and write the gzip trailer."""
+        if self.closed:
+            return
+        try:
+            self._submit(bytes(self._buffer), last=True)
+            self._drain(0)
+            self._fileobj.write(struct.pack("<II", self._crc, self._size & 0xFFFFFFFF))
+        finally:
+            self._buffer = bytearray()
+            self._executor.shutdown(wait=True)
+            self.closed = True
+
+    def __enter__(self):
+        """Return the writer itself."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the writer, or only release its threads if the block raised."""
+        if exc_type is None:
+            self.close()
+        else:
+            for future in self._pending:
+                future.cancel()
+            self._executor.shutdown(wait=True)
+            self.closed = True
+
+    def _write_header(self, mtime):
+        """Write a gzip member header without file name."""
+        if self._compresslevel == 9:
+            extra_flags = 2
+        elif self._compresslevel == 1:
+            extra_flags = 4
+        else:
+            extra_flags = 0
+        self._fileobj.write(
+            _GZIP_MAGIC
+            + struct.pack("<BBIBB", _GZIP_DEFLATE, 0, mtime, extra_flags, _GZIP_OS_UNKNOWN)
+        )
+
+    def _submit(self, block, last):
+        """Queue the compression of a block and write the blocks that are ready."""
+        future = self._executor.submit(
+            _deflate_block, block, self._dictionary, self._compresslevel, last
+        )
+        self._dictionary = block[-_WINDOW_SIZE:]
+        self._pending.append(future)
+        self._drain(2 * self._threads)
+
+    def _drain(self, max_pending):
+        """Write compressed blocks, in order, until at most ``max_pending`` are in flight."""
+        while len(self._pending) > max_pending or (self._pending and self._pending[0].done()):
+            self._fileobj.write(self._pending.popleft().result())
+
+
+def _deflate_block(block, dictionary, compresslevel, last):
+    """Deflate a block into raw deflate data that can be concatenated with the next block.
+
+    Every block but the last ends with a sync flush, which aligns the output on a byte
+    boundary without marking the end of the deflate stream.
+    """
+    if dictionary:
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15, zdict=dictionary)
+    else:
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+    return compressor.compress(block) + compressor.flush(
+        zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH
+    )
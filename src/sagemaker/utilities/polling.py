@@ -0,0 +1,229 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""This module defines the strategies deciding how long waiters sleep between two polls."""
+from __future__ import absolute_import
+
+import abc
+import logging
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+# Error codes returned by AWS services when the caller is throttled.
+_THROTTLING_ERROR_CODES = frozenset(
+    [
+        "Throttling",
+        "ThrottlingException",
+        "ThrottledException",
+        "RequestThrottledException",
+        "TooManyRequestsException",
+        "ProvisionedThroughputExceededException",
+        "RequestLimitExceeded",
+        "SlowDown",
+    ]
+)
+
+
+class PollingStrategy(abc.ABC):
+    """Decide how long a waiter sleeps before each poll.
+
+    Subclasses implement ``delay``. The strategy is stateless, so a single instance can be
+    shared by several waiters.
+    """
+
+    # The longest sleep after the caller was throttled, in seconds.
+    max_throttled_delay = 300
+
+    @abc.abstractmethod
+    def delay(self, attempt, elapsed):
+        """Return the number of seconds to sleep before a poll.
+
+        Args:
+            attempt (int): The number of polls made so far.
+            elapsed (float): The number of seconds spent waiting so far.
+
+        Returns:
+            float: The number of seconds to sleep.
+        """
+
+    def throttled_delay(self, delay, throttles, retry_after=None):
+        """Return the number of seconds to sleep after the caller was throttled.
+
+        The delay doubles with each consecutive throttling error, with full jitter, and is
+        never shorter than the ``Retry-After`` time sent by the service.
+
+        Args:
+            delay (float): The delay the strategy would have used without throttling.
+            throttles (int): The number of consecutive throttling errors, at least 1.
+            retry_after (float): The ``Retry-After`` time sent by the service, if any.
+
+        Returns:
+            float: The number of seconds to sleep.
+        """
+        backoff = min(delay * 2**throttles, self.max_throttled_delay)
+        backoff = random.uniform(backoff / 2, backoff)
+        return max(backoff, retry_after or 0)
+
+
+class FixedPolling(PollingStrategy):
+    """Sleep the same number of seconds before every poll."""
+
+    def __init__(self, poll):
+        """Initialize a ``FixedPolling`` strategy.
+
+        Args:
+            poll (float): The number of seconds to sleep before every poll.
+        """
+        self.poll = poll
+
+    def delay(self, attempt, elapsed):
+        """Return the fixed polling interval."""
+        return self.poll
+
+
+class AdaptivePolling(PollingStrategy):
+    """Poll quickly when a status change is likely, and back off while it is not.
+
+    The waiter polls every ``min_poll`` seconds during the first ``fast_period`` seconds, when
+    short jobs finish and endpoints fail fast. After that, each sleep is ``backoff_ratio``
+    times the time spent waiting beyond ``fast_period``, so the intervals grow exponentially
+    up to ``max_poll``, and a status change is detected after at most ``backoff_ratio`` of
+    the waiting time. If the ``expected_duration`` of the operation is known, the waiter
+    polls every ``min_poll`` seconds again once it gets close to it. A random ``jitter``
+    spreads the polls of waiters started at the same time.
+    """
+
+    def __init__(
+        self,
+        min_poll=2,
+        max_poll=60,
+        fast_period=60,
+        backoff_ratio=0.2,
+        jitter=0.2,
+        expected_duration=None,
+    ):
+        """Initialize an ``AdaptivePolling`` strategy.
+
+        Args:
+            min_poll (float): The shortest sleep between two polls, in seconds (default: 2).
+            max_poll (float): The longest sleep between two polls, in seconds (default: 60).
+            fast_period (float): How many seconds the waiter polls every ``min_poll``
+                seconds after it starts (default: 60).
+            backoff_ratio (float): The sleep after ``fast_period``, as a fraction of the
+                time spent waiting beyond it (default: 0.2).
+            jitter (float): The maximum random variation of each sleep, as a fraction of
+                it (default: 0.2).
+            expected_duration (float): The expected duration of the operation, in seconds
+                (default: None). From 90% of it onwards, the waiter polls every ``min_poll``
+                seconds.
+        """
+        if not 0 < min_poll <= max_poll:
+            raise ValueError("min_poll must be positive and at most max_poll.")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be between 0 and 1.")
+        self.min_poll = min_poll
+        self.max_poll = max_poll
+        self.fast_period = fast_period
+        self.backoff_ratio = backoff_ratio
+        self.jitter = jitter
+        self.expected_duration = expected_duration
+
+    def delay(self, attempt, elapsed):
+        """Return a short delay near expected status changes, and a growing one otherwise."""
+        if self.expected_duration is not None and elapsed >= 0.9 * self.expected_duration:
+            delay = self.min_poll
+        else:
+            delay = (elapsed - self.fast_period) * self.backoff_ratio
+            delay = min(max(delay, self.min_poll), self.max_poll)
+        delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return min(max(delay, self.min_poll), self.max_poll)
+
+
+def is_throttling_error(error):
+    """Return True if a ``botocore.exceptions.ClientError`` is a throttling error.
+
+    Args:
+        error (botocore.exceptions.ClientError): The error raised by a boto3 client.
+    """
+    response = getattr(error, "response", None) or {}
+    if response.get("Error", {}).get("Code") in _THROTTLING_ERROR_CODES:
+        return True
+    return response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 429
+
+
+def _retry_after(error):
+    """Return the ``Retry-After`` time of an error response in seconds, or None."""
+    response = getattr(error, "response", None) or {}
+    headers = response.get("ResponseMetadata", {}).get("HTTPHeaders", {})
+    try:
+        return float(headers["retry-after"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class Poller(object):
+    """Sleep between the polls of a waiter according to a ``PollingStrategy``."""
+
+    def __init__(self, strategy):
+        """Initialize a ``Poller``.
+
+        Args:
+            strategy (PollingStrategy or float): The polling strategy, or a number of
+                seconds to sleep before every poll.
+        """
+        if not isinstance(strategy, PollingStrategy):
+            strategy = FixedPolling(strategy)
+        self.strategy = strategy
+        self.attempts = 0
+        self.elapsed = 0
+        self._throttles = 0
+        self._retry_after = None
+        self._throttled = False
+
+    def sleep(self):
+        """Sleep until the next poll."""
+        time.sleep(self.next_delay())
+
+    def next_delay(self):
+        """Return the number of seconds to wait before the next poll, and count the poll.
+
+        Waiters that do not block, such as coroutines, wait for this delay themselves
+        instead of calling ``sleep``.
+        """
+        delay = self.strategy.delay(self.attempts, self.elapsed)
+        if self._throttled:
+            delay = self.strategy.throttled_delay(delay, self._throttles, self._retry_after)
+            self._throttled = False
+        else:
+            self._throttles = 0
+        self.attempts += 1
+        self.elapsed += delay
+        return delay
+
+    def throttled(self, error):
+        """Record a throttling error, so that the next sleep backs off.
+
+        Args:
+            error (botocore.exceptions.ClientError): The error raised by the poll.
+
+        Returns:
+            bool: True if ``error`` is a throttling error and the poll can be retried.
+        """
+        if not is_throttling_error(error):
+            return False
+        self._throttles += 1
+        self._retry_after = _retry_after(error)
+        self._throttled = True
+        logger.debug("Polling was throttled %d time(s), backing off.", self._throttles)
+        return True
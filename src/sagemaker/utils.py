@@ -16,7 +16,8 @@ from __future__ import absolute_import
 import abc
 import contextlib
 import copy
-import errno
+import gzip
+import hashlib
 import inspect
 import json
 import logging
@@ -24,10 +25,12 @@ import os
 import random
 import re
 import shutil
+import stat
 import tarfile
 import tempfile
 import time
 import uuid
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from datetime import datetime
 from functools import lru_cache
 from importlib import import_module
@@ -42,7 +45,7 @@ from botocore.utils import merge_dicts
 from six import viewitems
 from six.moves.urllib import parse
 
-from sagemaker import deprecations
+from sagemaker import deprecations, s3_utils
 from sagemaker.config import validate_sagemaker_config
 from sagemaker.config.config_utils import (
     _log_sagemaker_config_merge,
@@ -50,6 +53,7 @@ from sagemaker.config.config_utils import (
 )
 from sagemaker.enums import RoutingStrategy
 from sagemaker.session_settings import SessionSettings
+from sagemaker.utilities.compression import ParallelGzipWriter
 from sagemaker.workflow import is_pipeline_parameter_string, is_pipeline_variable
 from sagemaker.workflow.entities import PipelineVariable
 
@@ -387,7 +391,9 @@ def secondary_training_status_message(job_description, prev_description):
     return "\n".join(status_strs)
 
 
-def download_folder(bucket_name, prefix, target, sagemaker_session):
+def download_folder(
+    bucket_name, prefix, target, sagemaker_session, max_workers=None, skip_existing=False
+):
     """Download a folder from S3 to a local path
 
     Args:
@@ -397,6 +403,12 @@ def download_folder(bucket_name, prefix, target, sagemaker_session):
         target (str): destination path where the downloaded items will be placed
         sagemaker_session (sagemaker.session.Session): a sagemaker session to
             interact with S3.
+        max_workers (int): Optional number of threads used to download the files under
+            the prefix concurrently. If not specified, the ``s3_transfer_max_workers``
+            value of the session settings is used, and if that is not set either, files
+            are downloaded one after another.
+        skip_existing (bool): Skip files that already exist locally with the same size
+            and ETag as the S3 object (default: False).
     """
     s3 = sagemaker_session.s3_resource
 
@@ -418,43 +430,69 @@ def download_folder(bucket_name, prefix, target, sagemaker_session):
             else:
                 raise
 
-    _download_files_under_prefix(bucket_name, prefix, target, s3)
+    max_workers = max_workers or sagemaker_session.settings.s3_transfer_max_workers
+    if max_workers and max_workers > 1:
+        s3_client = sagemaker_session.get_client("s3", max_pool_connections=max_workers)
+    else:
+        s3_client = s3.meta.client
+
+    _download_files_under_prefix(
+        bucket_name,
+        prefix,
+        target,
+        s3_client,
+        max_workers=max_workers,
+        skip_existing=skip_existing,
+    )
 
 
-def _download_files_under_prefix(bucket_name, prefix, target, s3):
+def _download_files_under_prefix(
+    bucket_name, prefix, target, s3_client, max_workers=None, skip_existing=False
+):
     """Download all S3 files which match the given prefix
 
     Args:
         bucket_name (str): S3 bucket name
         prefix (str): S3 prefix within the bucket that will be downloaded
         target (str): destination path where the downloaded items will be placed
-        s3 (boto3.resources.base.ServiceResource): S3 resource
+        s3_client (botocore.client.S3): S3 client
+        max_workers (int): Optional number of threads downloading concurrently.
+        skip_existing (bool): Skip files that are already up to date locally.
     """
-    bucket = s3.Bucket(bucket_name)
-    for obj_sum in bucket.objects.filter(Prefix=prefix):
-        # if obj_sum is a folder object skip it.
-        if obj_sum.key.endswith("/"):
-            continue
-        obj = s3.Object(obj_sum.bucket_name, obj_sum.key)
-        s3_relative_path = obj_sum.key[len(prefix) :].lstrip("/")
-        file_path = os.path.join(target, s3_relative_path)
 
-        try:
-            os.makedirs(os.path.dirname(file_path))
-        except OSError as exc:
-            # EEXIST means the folder already exists, this is safe to skip
-            # anything else will be raised.
-            if exc.errno != errno.EEXIST:
-                raise
-        obj.download_file(file_path)
+    def _file_objects():
+        for s3_object in s3_utils.list_s3_objects(s3_client, bucket_name, prefix):
+            # if the object is a folder object skip it.
+            if not s3_object["Key"].endswith("/"):
+                yield s3_object
 
+    def _destination_for_key(key):
+        s3_relative_path = key[len(prefix) :].lstrip("/")
+        return os.path.join(target, s3_relative_path)
 
-def create_tar_file(source_files, target=None):
+    s3_utils.download_s3_objects(
+        s3_client,
+        bucket_name,
+        _file_objects(),
+        _destination_for_key,
+        max_workers=max_workers,
+        skip_existing=skip_existing,
+    )
+
+
+def create_tar_file(source_files, target=None, deterministic=False, settings=None):
     """Create a tar file containing all the source_files
 
     Args:
         source_files: (List[str]): List of file paths that will be contained in the tar file
         target:
+        deterministic (bool): If True, the entries are added in sorted order with normalized
+            modification times and owners, and the gzip header carries no timestamp or file
+            name, so that identical sources always produce a byte-identical archive
+            (default: False).
+        settings (sagemaker.session_settings.SessionSettings): Optional. Session settings
+            providing the compression level and number of compression threads to use
+            (default: None).
 
     Returns:
         (str): path to created tar file
@@ -464,13 +502,128 @@ def create_tar_file(source_files, target=None):
     else:
         _, filename = tempfile.mkstemp()
 
-    with tarfile.open(filename, mode="w:gz", dereference=True) as t:
-        for sf in source_files:
-            # Add all files from the directory into the root of the directory structure of the tar
-            t.add(sf, arcname=os.path.basename(sf))
+    if not deterministic and not _has_archive_compression_settings(settings):
+        with tarfile.open(filename, mode="w:gz", dereference=True) as t:
+            for sf in source_files:
+                # Add all files from the directory into the root of the directory structure of
+                # the tar
+                t.add(sf, arcname=os.path.basename(sf))
+        return filename
+
+    with open(filename, "wb") as f:
+        write_tar_file(source_files, f, deterministic=deterministic, settings=settings)
     return filename
 
 
+def write_tar_file(source_files, fileobj, deterministic=False, settings=None):
+    """Write a gzipped tar archive of ``source_files`` to a writable file object.
+
+    The archive is written sequentially, so ``fileobj`` does not need to be seekable. It can
+    for instance be a :class:`~sagemaker.s3_utils.S3MultipartUploadWriter` that streams the
+    archive to S3. ``fileobj`` is not closed.
+
+    Args:
+        source_files: (List[str]): List of file paths that will be contained in the tar file
+        fileobj: A binary file object with a ``write`` method.
+        deterministic (bool): If True, the archive is byte-identical for identical sources,
+            see :func:`create_tar_file` (default: False).
+        settings (sagemaker.session_settings.SessionSettings): Optional. Session settings
+            providing the compression level and number of compression threads to use
+            (default: None).
+    """
+    with _gzip_tar_stream(
+        fileobj, deterministic=deterministic, settings=settings, dereference=True
+    ) as t:
+        if deterministic:
+            # tarfile adds the contents of directories in sorted order already.
+            for sf in sorted(source_files, key=os.path.basename):
+                t.add(sf, arcname=os.path.basename(sf), filter=_normalize_tarinfo)
+        else:
+            for sf in source_files:
+                t.add(sf, arcname=os.path.basename(sf))
+
+
+def _has_archive_compression_settings(settings):
+    """Return True if the settings override how archives are compressed."""
+    return settings is not None and (
+        settings.archive_compression_level is not None
+        or settings.archive_compression_threads is not None
+    )
+
+
+def _gzip_writer(fileobj, deterministic=False, settings=None):
+    """Return a gzip file object writing to ``fileobj`` as configured by the settings.
+
+    With more than one compression thread, a
+    :class:`~sagemaker.utilities.compression.ParallelGzipWriter` is used, otherwise a
+    single-threaded ``gzip.GzipFile``. Both produce standard gzip data.
+    """
+    compresslevel = 9
+    threads = None
+    if settings is not None:
+        if settings.archive_compression_level is not None:
+            compresslevel = settings.archive_compression_level
+        threads = settings.archive_compression_threads
+    mtime = 0 if deterministic else None
+
+    if threads is not None and threads > 1:
+        return ParallelGzipWriter(
+            fileobj, compresslevel=compresslevel, threads=threads, mtime=mtime
+        )
+    return gzip.GzipFile(
+        filename="", mode="wb", fileobj=fileobj, mtime=mtime, compresslevel=compresslevel
+    )
+
+
+@contextlib.contextmanager
+def _gzip_tar_stream(fileobj, deterministic=False, settings=None, dereference=False):
+    """Open a streaming ``TarFile`` that writes gzip-compressed data to ``fileobj``."""
+    with _gzip_writer(fileobj, deterministic=deterministic, settings=settings) as gz:
+        with tarfile.open(mode="w|", fileobj=gz, dereference=dereference) as t:
+            yield t
+
+
+def _normalize_tarinfo(tarinfo):
+    """Strip the modification time and ownership of a tar entry."""
+    tarinfo.mtime = 0
+    tarinfo.uid = tarinfo.gid = 0
+    tarinfo.uname = tarinfo.gname = ""
+    return tarinfo
+
+
+def compute_tar_content_digest(source_files):
+    """Compute a SHA-256 digest of what ``create_tar_file`` would archive.
+
+    The digest covers the archive names, permission bits and contents of the files and
+    directories, in the order of a deterministic archive, but not their timestamps or owners.
+    It can therefore be used to identify an archive without building it.
+
+    Args:
+        source_files: (List[str]): List of file paths that would be contained in the tar file
+
+    Returns:
+        str: The hexadecimal digest.
+    """
+    digest = hashlib.sha256()
+
+    def _add(path, arcname):
+        file_stat = os.stat(path)
+        mode = stat.S_IMODE(file_stat.st_mode)
+        if os.path.isdir(path):
+            digest.update("D {} {:o}\0".format(arcname, mode).encode("utf-8"))
+            for name in sorted(os.listdir(path)):
+                _add(os.path.join(path, name), "{}/{}".format(arcname, name))
+            return
+        digest.update("F {} {:o} {}\0".format(arcname, mode, file_stat.st_size).encode("utf-8"))
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+
+    for sf in sorted(source_files, key=os.path.basename):
+        _add(sf, os.path.basename(sf))
+    return digest.hexdigest()
+
+
 @contextlib.contextmanager
 def _tmpdir(suffix="", prefix="tmp", directory=None):
     """Create a temporary directory with a context manager.
@@ -557,6 +710,21 @@ def repack_model(
         else sagemaker_session.settings.local_download_dir
     )
     with _tmpdir(directory=local_download_dir) as tmp:
+        if sagemaker_session.settings is not None and (
+            sagemaker_session.settings.incremental_model_repack
+        ):
+            _repack_code_dir(
+                model_uri,
+                repacked_model_uri,
+                inference_script,
+                source_directory,
+                dependencies,
+                sagemaker_session,
+                kms_key,
+                tmp,
+            )
+            return
+
         model_dir = _extract_model(model_uri, sagemaker_session, tmp)
 
         _create_or_update_code_dir(
@@ -568,38 +736,154 @@ def repack_model(
             tmp,
         )
 
-        tmp_model_path = os.path.join(tmp, "temp-model.tar.gz")
-        with tarfile.open(tmp_model_path, mode="w:gz") as t:
+        with _repacked_model_archive(repacked_model_uri, sagemaker_session, kms_key, tmp) as t:
             t.add(model_dir, arcname=os.path.sep)
 
+
+def _repack_code_dir(
+    model_uri,
+    repacked_model_uri,
+    inference_script,
+    source_directory,
+    dependencies,
+    sagemaker_session,
+    kms_key,
+    tmp,
+):
+    """Rewrite the ``code/`` directory of a model archive in a single streaming pass.
+
+    The members of the existing archive are read one by one. Those under ``code/`` are
+    extracted to ``tmp`` and updated the same way as by ``repack_model``, every other member
+    is copied straight into the new archive, and the new ``code/`` directory is appended at
+    the end. Only the code is written to the local disk.
+    """
+    model_dir = os.path.join(tmp, "model")
+    os.mkdir(model_dir)
+
+    with contextlib.ExitStack() as stack:
+        source = stack.enter_context(_open_model_archive(model_uri, sagemaker_session))
+        target = stack.enter_context(
+            _repacked_model_archive(repacked_model_uri, sagemaker_session, kms_key, tmp)
+        )
+        for member in source:
+            if _is_code_member(member):
+                _extract_member(source, member, model_dir)
+            elif member.isreg():
+                target.addfile(member, source.extractfile(member))
+            else:
+                target.addfile(member)
+
+        _create_or_update_code_dir(
+            model_dir,
+            inference_script,
+            source_directory,
+            dependencies,
+            sagemaker_session,
+            tmp,
+        )
+        target.add(os.path.join(model_dir, "code"), arcname="code")
+
+
+def _is_code_member(member):
+    """Return True if a model archive member belongs to its ``code/`` directory."""
+    name = member.name
+    while name.startswith(("./", "/")):
+        name = name[2:] if name.startswith("./") else name[1:]
+    return name == "code" or name.startswith("code/")
+
+
+def _extract_member(tar, member, extract_path):
+    """Extract one member of a tarfile with the checks of ``custom_extractall_tarfile``."""
+    if hasattr(tarfile, "data_filter"):
+        tar.extract(member, path=extract_path, filter="data")
+    else:
+        for safe_member in _get_safe_members([member]):
+            tar.extract(safe_member, path=extract_path)
+
+
+@contextlib.contextmanager
+def _open_model_archive(model_uri, sagemaker_session):
+    """Open a model archive from S3 or the local file system as a streaming ``TarFile``.
+
+    Archives in S3 are read from the response body of a single ``GetObject`` request, without
+    being downloaded first.
+    """
+    if model_uri.lower().startswith("s3://"):
+        url = parse.urlparse(model_uri)
+        body = sagemaker_session.get_client("s3").get_object(
+            Bucket=url.netloc, Key=url.path.lstrip("/")
+        )["Body"]
+        try:
+            with tarfile.open(mode="r|gz", fileobj=body) as t:
+                yield t
+        finally:
+            body.close()
+    else:
+        with open(model_uri.replace("file://", ""), "rb") as f:
+            with tarfile.open(mode="r|gz", fileobj=f) as t:
+                yield t
+
+
+@contextlib.contextmanager
+def _repacked_model_archive(repacked_model_uri, sagemaker_session, kms_key, tmp):
+    """Open a streaming ``TarFile`` for a repacked model and save it when the block exits.
+
+    The archive is compressed straight into an S3 multipart upload if the session settings
+    ask for it, otherwise into a temporary file in ``tmp`` which is then moved or uploaded
+    to ``repacked_model_uri``.
+    """
+    settings = sagemaker_session.settings
+    if (
+        settings is not None
+        and settings.stream_archive_uploads
+        and repacked_model_uri.lower().startswith("s3://")
+    ):
+        bucket, new_key, extra_args = _repacked_model_upload_args(
+            repacked_model_uri, sagemaker_session, kms_key
+        )
+        s3_client = sagemaker_session.get_client("s3")
+        with s3_utils.S3MultipartUploadWriter(s3_client, bucket, new_key, extra_args) as writer:
+            with _gzip_tar_stream(writer, settings=settings) as t:
+                yield t
+    else:
+        tmp_model_path = os.path.join(tmp, "temp-model.tar.gz")
+        with open(tmp_model_path, "wb") as f:
+            with _gzip_tar_stream(f, settings=settings) as t:
+                yield t
         _save_model(repacked_model_uri, tmp_model_path, sagemaker_session, kms_key=kms_key)
 
 
 def _save_model(repacked_model_uri, tmp_model_path, sagemaker_session, kms_key):
     """Placeholder docstring"""
     if repacked_model_uri.lower().startswith("s3://"):
-        url = parse.urlparse(repacked_model_uri)
-        bucket, key = url.netloc, url.path.lstrip("/")
-        new_key = key.replace(os.path.basename(key), os.path.basename(repacked_model_uri))
-
-        settings = (
-            sagemaker_session.settings if sagemaker_session is not None else SessionSettings()
+        bucket, new_key, extra_args = _repacked_model_upload_args(
+            repacked_model_uri, sagemaker_session, kms_key
+        )
+        sagemaker_session.get_client("s3").upload_file(
+            tmp_model_path, bucket, new_key, ExtraArgs=extra_args
         )
-        encrypt_artifact = settings.encrypt_repacked_artifacts
-
-        if kms_key:
-            extra_args = {"ServerSideEncryption": "aws:kms", "SSEKMSKeyId": kms_key}
-        elif encrypt_artifact:
-            extra_args = {"ServerSideEncryption": "aws:kms"}
-        else:
-            extra_args = None
-        sagemaker_session.boto_session.resource(
-            "s3", region_name=sagemaker_session.boto_region_name
-        ).Object(bucket, new_key).upload_file(tmp_model_path, ExtraArgs=extra_args)
     else:
         shutil.move(tmp_model_path, repacked_model_uri.replace("file://", ""))
 
 
+def _repacked_model_upload_args(repacked_model_uri, sagemaker_session, kms_key):
+    """Return the bucket, key and upload ``ExtraArgs`` of a repacked model S3 URI."""
+    url = parse.urlparse(repacked_model_uri)
+    bucket, key = url.netloc, url.path.lstrip("/")
+    new_key = key.replace(os.path.basename(key), os.path.basename(repacked_model_uri))
+
+    settings = sagemaker_session.settings if sagemaker_session is not None else SessionSettings()
+    encrypt_artifact = settings.encrypt_repacked_artifacts
+
+    if kms_key:
+        extra_args = {"ServerSideEncryption": "aws:kms", "SSEKMSKeyId": kms_key}
+    elif encrypt_artifact:
+        extra_args = {"ServerSideEncryption": "aws:kms"}
+    else:
+        extra_args = None
+    return bucket, new_key, extra_args
+
+
 def _create_or_update_code_dir(
     model_dir, inference_script, source_directory, dependencies, sagemaker_session, tmp
 ):
@@ -687,11 +971,31 @@ def download_file(bucket_name, path, target, sagemaker_session):
             interact with S3.
     """
     path = path.lstrip("/")
-    boto_session = sagemaker_session.boto_session
+    sagemaker_session.get_client("s3").download_file(bucket_name, path, target)
 
-    s3 = boto_session.resource("s3", region_name=sagemaker_session.boto_region_name)
-    bucket = s3.Bucket(bucket_name)
-    bucket.download_file(path, target)
+
+def run_concurrently(tasks, max_workers):
+    """Run callables on a bounded pool of threads and wait for all of them to finish.
+
+    If any task raises, the tasks that have not started yet are cancelled and the first
+    exception is re-raised once the running ones have finished.
+
+    Args:
+        tasks (list[callable]): Zero-argument callables to run.
+        max_workers (int): The maximum number of threads running tasks at the same time.
+
+    Returns:
+        list: The results of the tasks, in the order of ``tasks``.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(task) for task in tasks]
+        done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in done:
+            if not future.cancelled() and future.exception() is not None:
+                for pending in futures:
+                    pending.cancel()
+                raise future.exception()
+        return [future.result() for future in futures]
 
 
 def sts_regional_endpoint(region):
@@ -13,11 +13,14 @@
 # language governing permissions and limitations under the License.
 from __future__ import absolute_import
 
+import os
+
 import pandas as pd
 import numpy as np
 import pytest
 from mock import Mock, patch, MagicMock, call
-from botocore.exceptions import ProfileNotFound
+from botocore.config import Config
+from botocore.exceptions import ClientError, ProfileNotFound
 
 from sagemaker.feature_store.feature_definition import (
     FractionalFeatureDefinition,
@@ -35,6 +38,11 @@ from sagemaker.feature_store.feature_group import (
     AthenaQuery,
     IngestionError,
 )
+from sagemaker.feature_store.ingestion import (
+    AdaptiveConcurrency,
+    IngestionJournal,
+    _SharedDataFrame,
+)
 from sagemaker.feature_store.inputs import (
     FeatureParameter,
     DeletionModeEnum,
@@ -875,6 +883,9 @@ def test_ingest(
         max_workers=10,
         max_processes=1,
         profile_name=sagemaker_session_mock.boto_session.profile_name,
+        adaptive_concurrency=None,
+        shared_memory=False,
+        journal=None,
     )
     mock_ingestion_manager_instance.run.assert_called_once_with(
         data_frame=df, target_stores=None, wait=True, timeout=None
@@ -912,6 +923,9 @@ def test_ingest_default(
         max_workers=1,
         max_processes=1,
         profile_name=None,
+        adaptive_concurrency=None,
+        shared_memory=False,
+        journal=None,
     )
     mock_ingestion_manager_instance.run.assert_called_once_with(
         data_frame=df, target_stores=None, wait=True, timeout=None
@@ -960,6 +974,9 @@ def test_ingest_with_target_stores(
             max_workers=10,
             max_processes=1,
             profile_name=sagemaker_session_mock.boto_session.profile_name,
+            adaptive_concurrency=None,
+            shared_memory=False,
+            journal=None,
         ),
         call().run(
             data_frame=df, target_stores=[TargetStoreEnum.ONLINE_STORE], wait=True, timeout=None
@@ -972,6 +989,9 @@ def test_ingest_with_target_stores(
             max_workers=10,
             max_processes=1,
             profile_name=sagemaker_session_mock.boto_session.profile_name,
+            adaptive_concurrency=None,
+            shared_memory=False,
+            journal=None,
         ),
         call().run(
             data_frame=df, target_stores=[TargetStoreEnum.OFFLINE_STORE], wait=True, timeout=None
@@ -984,6 +1004,9 @@ def test_ingest_with_target_stores(
             max_workers=10,
             max_processes=1,
             profile_name=sagemaker_session_mock.boto_session.profile_name,
+            adaptive_concurrency=None,
+            shared_memory=False,
+            journal=None,
         ),
         call().run(
             data_frame=df,
@@ -1027,6 +1050,9 @@ def test_ingest_with_profile_name(
         max_workers=10,
         max_processes=1,
         profile_name="profile_name",
+        adaptive_concurrency=None,
+        shared_memory=False,
+        journal=None,
     )
     mock_ingestion_manager_instance.run.assert_called_once_with(
         data_frame=df, target_stores=None, wait=True, timeout=None
@@ -1123,6 +1149,73 @@ def test_ingestion_manager_run_multi_process_with_multi_thread_success(
     manager.run(df)
 
 
+def ingest_even_rows(data_frame, start_index, end_index, **kwargs):
+    rows = data_frame[start_index:end_index]
+    return [index for index, value in zip(rows.index, rows["int"]) if value % 2]
+
+
+@patch(
+    "sagemaker.feature_store.feature_group.IngestionManagerPandas._ingest_single_batch",
+    MagicMock(side_effect=ingest_even_rows),
+)
+def test_ingestion_manager_run_multi_process_with_shared_memory(fs_runtime_client_config_mock):
+    df = pd.DataFrame(
+        {"int": range(10), "string": [str(i) for i in range(10)]}, index=list("abcdefghij")
+    )
+    manager = IngestionManagerPandas(
+        feature_group_name="MyGroup",
+        feature_definitions=feature_group_dummy_definition_dict,
+        sagemaker_session=sagemaker_session_mock,
+        sagemaker_fs_runtime_client_config=fs_runtime_client_config_mock,
+        max_workers=2,
+        max_processes=2,
+        shared_memory=True,
+    )
+
+    with patch.object(
+        _SharedDataFrame, "close", autospec=True, side_effect=_SharedDataFrame.close
+    ) as close:
+        with pytest.raises(IngestionError) as error:
+            manager.run(df)
+
+    assert sorted(error.value.failed_rows) == ["b", "d", "f", "h", "j"]
+    shared_df = close.call_args[0][0]
+    assert shared_df.pickled_ranges.keys() == {(0, 5), (5, 10)}
+    assert not os.path.exists(shared_df.path)
+
+
+def test_ingestion_manager_wait_keeps_shared_memory_until_finished(
+    fs_runtime_client_config_mock,
+):
+    manager = IngestionManagerPandas(
+        feature_group_name="MyGroup",
+        feature_definitions=feature_group_dummy_definition_dict,
+        sagemaker_session=sagemaker_session_mock,
+        sagemaker_fs_runtime_client_config=fs_runtime_client_config_mock,
+        max_processes=2,
+        shared_memory=True,
+    )
+    shared_df = Mock()
+    manager._shared_data_frame = shared_df
+    manager._processing_pool = Mock()
+    manager._async_result = Mock()
+
+    # the processes still read the DataFrame after a timeout
+    manager._async_result.get.side_effect = TimeoutError()
+    manager._async_result.ready.return_value = False
+    with pytest.raises(TimeoutError):
+        manager.wait(timeout=1)
+    shared_df.close.assert_not_called()
+
+    # but not after they failed
+    manager._async_result.get.side_effect = ValueError("failed")
+    manager._async_result.ready.return_value = True
+    with pytest.raises(ValueError):
+        manager.wait()
+    shared_df.close.assert_called_once()
+    assert manager._shared_data_frame is None
+
+
 @patch(
     "sagemaker.feature_store.feature_group.IngestionManagerPandas._ingest_single_batch",
     MagicMock(return_value=[1]),
@@ -1146,8 +1239,8 @@ def test_ingestion_manager_run_failure():
 
 
 @patch(
-    "sagemaker.feature_store.feature_group.IngestionManagerPandas._ingest_row",
-    MagicMock(return_value=[1]),
+    "sagemaker.feature_store.feature_group.IngestionManagerPandas._ingest_records",
+    MagicMock(return_value=None),
 )
 def test_ingestion_manager_run_success(sagemaker_session_mock, fs_runtime_client_config_mock):
     sagemaker_session_mock.sagemaker_featurestore_runtime_client = fs_runtime_client_config_mock
@@ -1160,22 +1253,60 @@ def test_ingestion_manager_run_success(sagemaker_session_mock, fs_runtime_client
     )
 
     manager.run(df)
-    for row in df.itertuples():
-        manager._ingest_row.assert_called_with(
-            data_frame=df,
-            target_stores=None,
-            row=row,
-            feature_group_name="MyGroup",
-            feature_definitions=feature_group_dummy_definition_dict,
-            sagemaker_fs_runtime_client=fs_runtime_client_config_mock,
-            failed_rows=[],
-        )
+    manager._ingest_records.assert_called_once_with(
+        data_frame=df,
+        target_stores=None,
+        feature_group_name="MyGroup",
+        feature_definitions=feature_group_dummy_definition_dict,
+        sagemaker_fs_runtime_client=fs_runtime_client_config_mock,
+        failed_rows=[],
+    )
 
-    expected_invocation_count = 1  # Set your expected count
-    actual_invocation_count = len(manager._ingest_row.mock_calls)
-    assert (
-        actual_invocation_count == expected_invocation_count
-    ), f"Expected {expected_invocation_count} calls, but got {actual_invocation_count}"
+
+def test_ingestion_manager_iter_records():
+    df = pd.DataFrame(
+        {
+            "int": pd.Series([1, 2, 3], dtype="int64"),
+            "float": pd.Series([0.1, np.nan, 3.0], dtype="float64"),
+            "float32": pd.Series([0.1, 2.5, np.nan], dtype="float32"),
+            "string": pd.Series(["a", None, "c"], dtype="string"),
+            "object": pd.Series(["x", "y", np.nan], dtype="object"),
+            "mixed": pd.Series([[1, 2], 5, None], dtype="object"),
+            "timestamp": pd.to_datetime(["2024-01-01", None, "2024-01-03"]),
+            "list": pd.Series([[1, None], [], 4], dtype="object"),
+        }
+    ).set_index(pd.Index([10, 11, 12]))
+    feature_definitions = {"list": {"CollectionType": "List"}}
+
+    records = list(IngestionManagerPandas._iter_records(df, feature_definitions, chunk_size=2))
+
+    assert records[0] == (
+        10,
+        [
+            {"FeatureName": "int", "ValueAsString": "1"},
+            {"FeatureName": "float", "ValueAsString": "0.1"},
+            {"FeatureName": "float32", "ValueAsString": "0.10000000149011612"},
+            {"FeatureName": "string", "ValueAsString": "a"},
+            {"FeatureName": "object", "ValueAsString": "x"},
+            {"FeatureName": "mixed", "ValueAsString": "[1, 2]"},
+            {"FeatureName": "timestamp", "ValueAsString": "2024-01-01 00:00:00"},
+            {"FeatureName": "list", "ValueAsStringList": ["1", None]},
+        ],
+        None,
+    )
+    assert records[1] == (
+        11,
+        [
+            {"FeatureName": "int", "ValueAsString": "2"},
+            {"FeatureName": "float32", "ValueAsString": "2.5"},
+            {"FeatureName": "object", "ValueAsString": "y"},
+            {"FeatureName": "mixed", "ValueAsString": "5"},
+        ],
+        None,
+    )
+    # a scalar cannot be ingested as a collection
+    assert records[2][:2] == (12, None)
+    assert isinstance(records[2][2], ValueError)
 
 
 def test_ingestion_manager_run_standard(
@@ -1217,6 +1348,168 @@ def test_ingestion_manager_run_standard(
     ), f"Expected {expected_put_record_calls} calls, but got {actual_put_record_calls}"
 
 
+def test_ingest_stream_zero_chunk_size():
+    feature_group = FeatureGroup(name="MyGroup", sagemaker_session=sagemaker_session_mock)
+    with pytest.raises(RuntimeError) as error:
+        feature_group.ingest_stream(source=Mock(), chunk_size=0)
+
+    assert "chunk_size must be greater than 0." in str(error)
+
+
+@patch("sagemaker.feature_store.feature_group.IngestionManagerPandas._get_fs_runtime_client")
+def test_ingest_stream_from_csv_file(
+    get_fs_runtime_client,
+    tmp_path,
+    sagemaker_session_mock,
+    fs_runtime_client_config_mock,
+    feature_group_describe_dummy_definitions,
+):
+    sagemaker_session_mock.sagemaker_featurestore_runtime_client.meta.config = (
+        fs_runtime_client_config_mock
+    )
+    sagemaker_session_mock.describe_feature_group.return_value = {
+        "FeatureDefinitions": feature_group_describe_dummy_definitions
+    }
+    runtime_client = get_fs_runtime_client.return_value
+
+    def put_record(Record, **kwargs):
+        if Record[2]["ValueAsString"] == "c":
+            raise ValueError("failed")
+
+    runtime_client.put_record.side_effect = put_record
+    path = str(tmp_path / "rows.csv")
+    pd.DataFrame(
+        {"feature1": [0.5, 1.5, 2.5], "feature2": [1, 2, 3], "feature3": ["a", "b", "c"]}
+    ).to_csv(path, index=False)
+
+    feature_group = FeatureGroup(name="MyGroup", sagemaker_session=sagemaker_session_mock)
+    with pytest.raises(IngestionError) as error:
+        feature_group.ingest_stream(
+            source=path, max_workers=2, chunk_size=2, target_stores=[TargetStoreEnum.ONLINE_STORE]
+        )
+
+    assert error.value.failed_rows == [(path, 2)]
+    get_fs_runtime_client.assert_called_once_with(
+        fs_runtime_client_config_mock, sagemaker_session_mock.boto_session.profile_name, 2
+    )
+    assert sorted(
+        runtime_client.put_record.mock_calls, key=lambda c: c.kwargs["Record"][1]["ValueAsString"]
+    ) == [
+        call(
+            Record=[
+                {"FeatureName": "feature1", "ValueAsString": f"{value - 0.5}"},
+                {"FeatureName": "feature2", "ValueAsString": f"{value}"},
+                {"FeatureName": "feature3", "ValueAsString": "abc"[value - 1]},
+            ],
+            FeatureGroupName="MyGroup",
+            TargetStores=["OnlineStore"],
+        )
+        for value in (1, 2, 3)
+    ]
+
+
+def test_ingest_adaptive_concurrency_with_multiple_processes():
+    feature_group = FeatureGroup(name="MyGroup", sagemaker_session=sagemaker_session_mock)
+    with pytest.raises(RuntimeError) as error:
+        feature_group.ingest(
+            data_frame=Mock(), max_processes=2, adaptive_concurrency=AdaptiveConcurrency()
+        )
+
+    assert "max_processes must be 1 when adaptive_concurrency is specified." in str(error)
+
+
+def test_ingest_journal_with_multiple_processes():
+    feature_group = FeatureGroup(name="MyGroup", sagemaker_session=sagemaker_session_mock)
+    with pytest.raises(RuntimeError) as error:
+        feature_group.ingest(
+            data_frame=Mock(), max_processes=2, journal=IngestionJournal("journal.json")
+        )
+
+    assert "max_processes must be 1 when journal is specified." in str(error)
+
+
+def test_ingestion_manager_resumes_from_journal(
+    tmp_path, sagemaker_session_mock, feature_group_dummy_definition_dict
+):
+    runtime_client = sagemaker_session_mock.sagemaker_featurestore_runtime_client
+    df = pd.DataFrame(data={"feature1": [2.0, 3.0, 4.0, 5.0], "feature2": [3, 4, 5, 6]})
+    df.index = ["a", "b", "c", "d"]
+    journal_path = str(tmp_path / "journal.json")
+
+    def run(put_record):
+        runtime_client.put_record.reset_mock(side_effect=True)
+        runtime_client.put_record.side_effect = put_record
+        manager = IngestionManagerPandas(
+            feature_group_name="MyGroup",
+            feature_definitions=feature_group_dummy_definition_dict,
+            sagemaker_session=sagemaker_session_mock,
+            max_workers=2,
+            journal=IngestionJournal(journal_path),
+        )
+        manager.run(df, wait=False)
+        return manager
+
+    def throttle_third_row(Record, **kwargs):
+        if Record[0]["ValueAsString"] == "4.0":
+            raise ClientError({"Error": {"Code": "ThrottlingException"}}, "PutRecord")
+
+    with pytest.raises(IngestionError) as error:
+        run(throttle_third_row).wait()
+    assert error.value.failed_rows == [2]
+    # the throttled row is sent again 5 times
+    assert runtime_client.put_record.call_count == 4 + 5
+
+    journal = IngestionJournal(journal_path)
+    journal.load("MyGroup")
+    assert journal.completed_rows == 3
+    assert journal.failed_rows == [("", 2, "ThrottlingException")]
+
+    # only the row that failed is sent again
+    run(None).wait()
+    assert [
+        c.kwargs["Record"][0]["ValueAsString"] for c in runtime_client.put_record.mock_calls
+    ] == ["4.0"]
+
+    journal.load("MyGroup")
+    assert journal.completed_rows == 4
+    assert journal.failed_rows == []
+
+
+def test_ingestion_manager_run_adaptive_concurrency(
+    sagemaker_session_mock, feature_group_dummy_definition_dict
+):
+    runtime_client = sagemaker_session_mock.sagemaker_featurestore_runtime_client
+    runtime_client.put_record.side_effect = [None, None, ValueError("failed")]
+    df = pd.DataFrame(data={"feature1": [2.0, 3.0, 4.0], "feature2": [3, 4, 5]})
+
+    manager = IngestionManagerPandas(
+        feature_group_name="MyGroup",
+        feature_definitions=feature_group_dummy_definition_dict,
+        sagemaker_session=sagemaker_session_mock,
+        adaptive_concurrency=AdaptiveConcurrency(initial_concurrency=1, max_concurrency=1),
+    )
+    manager.run(df, target_stores=[TargetStoreEnum.ONLINE_STORE], wait=False)
+
+    with pytest.raises(IngestionError) as error:
+        manager.wait(timeout=10)
+
+    assert error.value.failed_rows == [2]
+    assert runtime_client.put_record.mock_calls == [
+        call(
+            Record=[
+                {"FeatureName": "feature1", "ValueAsString": str(value)},
+                {"FeatureName": "feature2", "ValueAsString": str(int(value) + 1)},
+            ],
+            FeatureGroupName="MyGroup",
+            TargetStores=["OnlineStore"],
+        )
+        for value in (2.0, 3.0, 4.0)
+    ]
+    assert manager.stats.ingested_rows == 2
+    assert manager.stats.failed_rows == 1
+    assert manager.stats.p99_latency is not None
+
+
 def test_ingestion_manager_run_non_collection_type(
     sagemaker_session_mock,
     fs_runtime_client_config_mock,
@@ -1628,3 +1921,30 @@ def test_athena_query_as_dataframe_query_running(sagemaker_session_mock, query):
     with pytest.raises(RuntimeError) as error:
         query.as_dataframe()
     assert "Current query query_id is still being executed" in str(error)
+
+
+@patch("sagemaker.feature_store.feature_group.boto3.Session")
+def test_ingest_single_batch_shares_runtime_client(
+    boto_session_cls, feature_group_dummy_definition_dict
+):
+    df = pd.DataFrame({"float": pd.Series([2.0, 3.0], dtype="float64")})
+    client_config = Config(retries={"max_attempts": 3})
+    runtime_client = boto_session_cls.return_value.client.return_value
+
+    for start_index in range(2):
+        IngestionManagerPandas._ingest_single_batch(
+            data_frame=df,
+            feature_group_name="MyGroup",
+            feature_definitions=feature_group_dummy_definition_dict,
+            client_config=client_config,
+            start_index=start_index,
+            end_index=start_index + 1,
+            profile_name="my-profile",
+            max_pool_connections=32,
+        )
+
+    boto_session_cls.assert_called_once_with(profile_name="my-profile")
+    _, kwargs = boto_session_cls.return_value.client.call_args
+    assert kwargs["config"].max_pool_connections == 32
+    assert kwargs["config"].retries == {"max_attempts": 3}
+    assert runtime_client.put_record.call_count == 2
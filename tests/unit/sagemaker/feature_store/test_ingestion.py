@@ -0,0 +1,455 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import errno
+import io
+import os
+import pickle
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from botocore.exceptions import ClientError
+from mock import Mock, patch
+
+from sagemaker.feature_store.ingestion import (
+    AdaptiveConcurrency,
+    IngestionJournal,
+    IngestionStats,
+    _ConcurrencyLimiter,
+    _add_to_ranges,
+    _SharedDataFrame,
+    _iter_data_frames,
+    _prefetch,
+    ingest_adaptively,
+)
+
+THROTTLING_ERROR = ClientError({"Error": {"Code": "ThrottlingException"}}, "PutRecord")
+
+
+def test_adaptive_concurrency_validation():
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(initial_concurrency=8, max_concurrency=4)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(min_concurrency=0)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(decrease_ratio=1)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(max_throttling_retries=-1)
+
+
+@patch("sagemaker.feature_store.ingestion.time.monotonic")
+def test_limiter_increases_additively_and_decreases_multiplicatively(mock_monotonic):
+    mock_monotonic.return_value = 0
+    stats = IngestionStats()
+    limiter = _ConcurrencyLimiter(
+        AdaptiveConcurrency(initial_concurrency=4, max_concurrency=6), stats
+    )
+
+    # about one more request in flight per round trip
+    for _ in range(4):
+        limiter.acquire()
+    for _ in range(4):
+        limiter.release(0.1)
+    assert limiter.limit == 4
+    assert limiter._limit == pytest.approx(4 + 1 / 4 + 1 / 4.25 + 1 / 4.485 + 1 / 4.708, 0.01)
+    for _ in range(100):
+        limiter.acquire()
+        limiter.release(0.1)
+    assert limiter.limit == 6
+
+    # throttling halves the limit, once per round trip
+    mock_monotonic.return_value = 10
+    for _ in range(3):
+        limiter.acquire()
+    for _ in range(3):
+        limiter.release(0.1, throttled=True)
+    assert limiter.limit == 3
+    assert stats.concurrency == 3
+
+    mock_monotonic.return_value = 10.2
+    limiter.acquire()
+    limiter.release(0.1, throttled=True)
+    assert limiter.limit == 1
+
+    # but never below min_concurrency
+    mock_monotonic.return_value = 11
+    limiter.acquire()
+    limiter.release(0.1, throttled=True)
+    assert limiter.limit == 1
+
+
+@patch("sagemaker.feature_store.ingestion.time.monotonic", return_value=0)
+def test_limiter_decreases_when_latency_rises(mock_monotonic):
+    limiter = _ConcurrencyLimiter(AdaptiveConcurrency(initial_concurrency=8), IngestionStats())
+
+    limiter.acquire()
+    limiter.release(0.1)
+    assert limiter.limit == 8
+
+    # the smoothed latency exceeds twice the lowest latency
+    for _ in range(20):
+        limiter.acquire()
+        limiter.release(1.0)
+    assert limiter.limit == 4
+
+    limiter = _ConcurrencyLimiter(
+        AdaptiveConcurrency(initial_concurrency=8, latency_target=0.05), IngestionStats()
+    )
+    limiter.acquire()
+    limiter.release(0.1)
+    assert limiter.limit == 4
+
+
+@patch("sagemaker.feature_store.ingestion._BASELINE_LATENCY_WINDOW", 50)
+@patch("sagemaker.feature_store.ingestion.time.monotonic")
+def test_limiter_recovers_after_latency_shift(mock_monotonic):
+    mock_monotonic.return_value = 0
+    limiter = _ConcurrencyLimiter(
+        AdaptiveConcurrency(initial_concurrency=8, max_concurrency=16), IngestionStats()
+    )
+    for _ in range(10):
+        limiter.acquire()
+        limiter.release(0.1)
+
+    # the latency of the online store rises for good: the limit decreases once per round
+    # trip, until the lowest latency of the window is the new latency
+    for i in range(50):
+        mock_monotonic.return_value = i
+        limiter.acquire()
+        limiter.release(1.0)
+    assert limiter._latency_target() == 2.0
+    limit = limiter.limit
+    assert limit < 8
+
+    # then the limit grows again
+    for _ in range(200):
+        limiter.acquire()
+        limiter.release(1.0)
+    assert limiter.limit > limit
+    assert limiter.limit == 16
+
+
+def test_ingestion_stats():
+    stats = IngestionStats()
+    assert stats.p99_latency is None
+
+    for latency in range(1, 201):
+        stats._record(latency / 1000, succeeded=latency != 200, throttled=latency == 200)
+    stats._record_failure()
+    stats._finish()
+
+    assert stats.ingested_rows == 199
+    assert stats.failed_rows == 2
+    assert stats.throttled_requests == 1
+    assert stats.p99_latency == 0.198
+    assert stats.latency_percentile(50) == 0.1
+    assert stats.rows_per_second == pytest.approx(199 / stats.elapsed)
+    assert "199 rows ingested" in str(stats)
+
+
+def test_ingest_adaptively_bounds_requests_in_flight():
+    lock = threading.Lock()
+    in_flight = [0]
+    max_in_flight = [0]
+    put_records = []
+
+    def put_record(record):
+        with lock:
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        time.sleep(0.001)
+        with lock:
+            in_flight[0] -= 1
+            put_records.append(record)
+        if record == ["throttled"] or (record == [30] and put_records.count(record) == 1):
+            raise THROTTLING_ERROR
+
+    records = [(i, [i], None) for i in range(200)]
+    records[10] = (10, None, ValueError("not a list"))
+    records[20] = (20, ["throttled"], None)
+    stats = IngestionStats()
+
+    failed_rows = ingest_adaptively(
+        iter(records),
+        put_record,
+        AdaptiveConcurrency(
+            initial_concurrency=2, max_concurrency=4, latency_target=10, max_throttling_retries=2
+        ),
+        stats,
+    )
+
+    # the throttled records are sent again, up to max_throttling_retries times
+    assert sorted(failed_rows) == [10, 20]
+    assert len(put_records) == 199 + 2 + 1
+    assert put_records.count(["throttled"]) == 3
+    assert put_records.count([30]) == 2
+    assert max_in_flight[0] <= 4
+    assert stats.ingested_rows == 198
+    assert stats.failed_rows == 2
+    assert stats.throttled_requests == 4
+    assert stats.p99_latency is not None
+
+
+@pytest.mark.parametrize(
+    "index",
+    [None, [10, 11, 12, 13, 14], ["a", "b", "c", "d", "e"]],
+    ids=["range", "array", "pickled"],
+)
+def test_shared_data_frame_reads_row_ranges(index):
+    df = pd.DataFrame(
+        {
+            "int": np.arange(5),
+            "float": np.arange(5.0),
+            "timestamp": pd.date_range("2024-01-01", periods=5),
+            "string": pd.Series(list("vwxyz"), dtype="string"),
+            "list": [[i] for i in range(5)],
+        }
+    )
+    if index is not None:
+        df.index = index
+    shared_df = _SharedDataFrame.create(df, [(0, 2), (2, 5)])
+    try:
+        for start, end in [(0, 2), (2, 5)]:
+            rows = pickle.loads(pickle.dumps(shared_df.slice(start, end))).read()
+
+            pd.testing.assert_frame_equal(rows, df.iloc[start:end], check_freq=False)
+            assert isinstance(rows["float"].to_numpy().base, np.memmap)
+    finally:
+        shared_df.close()
+
+    assert not os.path.exists(shared_df.path)
+
+
+def test_shared_data_frame_falls_back_to_temporary_directory(tmp_path):
+    df = pd.DataFrame({"int": np.arange(5), "string": list("vwxyz")})
+    write = _SharedDataFrame._write
+
+    def write_unless_shared_memory(data_frame, row_ranges, directory):
+        if directory == str(tmp_path):
+            raise OSError(errno.ENOSPC, "No space left on device")
+        return write(data_frame, row_ranges, directory)
+
+    with patch("sagemaker.feature_store.ingestion._SHARED_MEMORY_DIR", str(tmp_path)):
+        # not enough space available
+        with patch("sagemaker.feature_store.ingestion.os.statvfs") as statvfs:
+            statvfs.return_value = Mock(f_bavail=0, f_frsize=4096)
+            shared_df = _SharedDataFrame.create(df, [(0, 5)])
+        assert os.path.dirname(shared_df.path) == tempfile.gettempdir()
+        shared_df.close()
+
+        # the space runs out while writing
+        with patch.object(_SharedDataFrame, "_write", side_effect=write_unless_shared_memory):
+            shared_df = _SharedDataFrame.create(df, [(0, 5)])
+        assert os.path.dirname(shared_df.path) == tempfile.gettempdir()
+        pd.testing.assert_frame_equal(shared_df.read(), df)
+        shared_df.close()
+
+    assert os.listdir(str(tmp_path)) == []
+
+
+def test_prefetch_reads_ahead_a_bounded_number_of_items():
+    produced = []
+
+    def produce():
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    items = _prefetch(produce(), max_buffered=2)
+    assert next(items) == 0
+    time.sleep(0.3)
+    # one item consumed, two buffered and one waiting to be buffered
+    assert len(produced) == 4
+    assert list(items) == list(range(1, 10))
+
+
+def test_prefetch_raises_errors_of_the_iterable():
+    def produce():
+        yield 1
+        raise ValueError("cannot read")
+
+    items = _prefetch(produce(), max_buffered=1)
+    assert next(items) == 1
+    with pytest.raises(ValueError, match="cannot read"):
+        next(items)
+
+
+def test_iter_data_frames_from_local_files(tmp_path):
+    pd.DataFrame({"id": [1, 2, 3], "value": ["a", "b", "c"]}).to_csv(
+        tmp_path / "part-0.csv", index=False
+    )
+    (tmp_path / "nested").mkdir()
+    pd.DataFrame({"id": [4], "value": ["d"]}).to_csv(
+        tmp_path / "nested" / "part-1.csv.gz", index=False
+    )
+    (tmp_path / "_SUCCESS").write_text("")
+
+    data_frames = list(_iter_data_frames(str(tmp_path), chunk_size=2))
+
+    assert [df.shape[0] for df in data_frames] == [2, 1, 1]
+    df = pd.concat(data_frames)
+    assert df["id"].tolist() == [1, 2, 3, 4]
+    assert df.index.tolist() == [
+        (str(tmp_path / "part-0.csv"), 0),
+        (str(tmp_path / "part-0.csv"), 1),
+        (str(tmp_path / "part-0.csv"), 2),
+        (str(tmp_path / "nested" / "part-1.csv.gz"), 0),
+    ]
+
+    (tmp_path / "data.txt").write_text("id\n1\n")
+    with pytest.raises(ValueError, match="file_format must be 'csv' or 'parquet'"):
+        list(_iter_data_frames(str(tmp_path / "data.txt")))
+    assert list(_iter_data_frames(str(tmp_path / "data.txt"), file_format="csv"))[0].shape == (
+        1,
+        1,
+    )
+
+
+def test_iter_data_frames_from_s3():
+    s3_client = Mock()
+    s3_client.get_paginator.return_value.paginate.return_value = [
+        {"Contents": [{"Key": "prefix/"}, {"Key": "prefix/part-0.csv"}]},
+        {"Contents": [{"Key": "prefix/_SUCCESS"}, {"Key": "prefix/part-1.csv"}]},
+    ]
+    s3_client.get_object.side_effect = lambda Bucket, Key: {
+        "Body": io.BytesIO(b"id,value\n1,a\n2,b\n" if Key.endswith("0.csv") else b"id,value\n3,c\n")
+    }
+    sagemaker_session = Mock()
+    sagemaker_session.get_client.return_value = s3_client
+
+    df = pd.concat(_iter_data_frames("s3://bucket/prefix", sagemaker_session, chunk_size=10))
+
+    sagemaker_session.get_client.assert_called_once_with("s3")
+    s3_client.get_paginator.return_value.paginate.assert_called_once_with(
+        Bucket="bucket", Prefix="prefix"
+    )
+    assert df["value"].tolist() == ["a", "b", "c"]
+    assert df.index.tolist() == [
+        ("s3://bucket/prefix/part-0.csv", 0),
+        ("s3://bucket/prefix/part-0.csv", 1),
+        ("s3://bucket/prefix/part-1.csv", 0),
+    ]
+
+
+def test_iter_data_frames_from_data_frames():
+    df = pd.DataFrame({"id": range(5)})
+
+    assert [chunk.index.tolist() for chunk in _iter_data_frames(df, chunk_size=2)] == [
+        [0, 1],
+        [2, 3],
+        [4],
+    ]
+    assert list(_iter_data_frames(iter([df]))) == [df]
+
+
+def test_add_to_ranges_merges_adjacent_positions():
+    ranges = []
+    for position in [5, 7, 3, 6, 4, 5, 0, 10, 9]:
+        _add_to_ranges(ranges, position)
+
+    assert ranges == [[0, 1], [3, 8], [9, 11]]
+
+
+def test_journal_records_progress(tmp_path):
+    path = str(tmp_path / "journals" / "journal.json")
+    journal = IngestionJournal(path)
+    journal.load("MyGroup")
+    assert journal.completed_rows == 0
+
+    for position in [0, 1, 3, 4]:
+        journal._record_success(position)
+    journal._record_failure(2, THROTTLING_ERROR)
+    journal._record_failure(("s3://bucket/part-0.csv", 7), ValueError("not a number"))
+    journal._record_success(("s3://bucket/part-0.csv", 6))
+    journal.save()
+
+    journal = IngestionJournal(path)
+    journal.load("MyGroup")
+    assert journal.completed_rows == 5
+    assert journal.failed_rows == [
+        ("", 2, "ThrottlingException"),
+        ("s3://bucket/part-0.csv", 7, "ValueError"),
+    ]
+
+    df = pd.DataFrame({"id": range(6)})
+    assert journal._skip_completed(df).index.tolist() == [2, 5]
+    files_df = pd.DataFrame(
+        {"id": range(3)},
+        index=pd.MultiIndex.from_tuples(
+            [("s3://bucket/part-0.csv", 6), ("s3://bucket/part-0.csv", 7), ("other.csv", 6)]
+        ),
+    )
+    assert journal._skip_completed(files_df).index.tolist() == [
+        ("s3://bucket/part-0.csv", 7),
+        ("other.csv", 6),
+    ]
+
+    # a row ingested after failing is no longer recorded as failed
+    journal._record_success(2)
+    assert journal.failed_rows == [("s3://bucket/part-0.csv", 7, "ValueError")]
+
+    with pytest.raises(ValueError, match="records the ingestion of Feature Group MyGroup"):
+        IngestionJournal(path).load("OtherGroup")
+
+
+@patch("sagemaker.feature_store.ingestion.S3Uploader")
+@patch("sagemaker.feature_store.ingestion.S3Downloader")
+def test_journal_in_s3(mock_downloader, mock_uploader):
+    uri = "s3://bucket/journal.json"
+    sagemaker_session = Mock()
+    mock_downloader.read_file.side_effect = ClientError(
+        {"Error": {"Code": "NoSuchKey"}}, "GetObject"
+    )
+    journal = IngestionJournal(uri, kms_key="key")
+    journal.load("MyGroup", sagemaker_session)
+    journal._record_success(0)
+    journal.save()
+
+    mock_downloader.read_file.assert_called_once_with(uri, sagemaker_session)
+    content, *args = mock_uploader.upload_string_as_file_body.call_args[0]
+    assert args == [uri, "key", sagemaker_session]
+
+    mock_downloader.read_file.side_effect = None
+    mock_downloader.read_file.return_value = content
+    journal = IngestionJournal(uri)
+    journal.load("MyGroup", sagemaker_session)
+    assert journal.completed_rows == 1
+
+
+def test_ingest_adaptively_records_progress_in_journal(tmp_path):
+    def put_record(record):
+        if record == [3]:
+            raise THROTTLING_ERROR
+
+    journal = IngestionJournal(str(tmp_path / "journal.json"), checkpoint_interval=0)
+    journal.load("MyGroup")
+    records = [(i, [i], None) for i in range(6)]
+    records[1] = (1, None, ValueError("not a list"))
+
+    with patch.object(journal, "save", wraps=journal.save) as save:
+        failed_rows = ingest_adaptively(
+            iter(records), put_record, AdaptiveConcurrency(), None, journal
+        )
+
+    assert sorted(failed_rows) == [1, 3]
+    # a checkpoint after each request sent, including the 5 retries of the throttled
+    # record, and a save at the end
+    assert save.call_count == 11
+    journal.load("MyGroup")
+    assert journal.completed_rows == 4
+    assert journal.failed_rows == [("", 1, "ValueError"), ("", 3, "ThrottlingException")]
@@ -14,6 +14,8 @@ from __future__ import absolute_import
 
 import random
 import string
+
+import numpy
 import pytest
 
 from mock import patch, Mock
@@ -29,6 +31,7 @@ from sagemaker.remote_function.core.serialization import (
     deserialize_exception_from_s3,
 )
 from sagemaker.remote_function.errors import ServiceError, SerializationError, DeserializationError
+from sagemaker.session_settings import SessionSettings
 from tblib import pickling_support
 
 KMS_KEY = "kms-key"
@@ -44,7 +47,7 @@ def random_s3_uri():
 
 def upload(b, s3_uri, kms_key=None, sagemaker_session=None):
     assert kms_key == KMS_KEY
-    mock_s3[s3_uri] = b
+    mock_s3[s3_uri] = b.read() if hasattr(b, "read") else b
 
 
 def read(s3_uri, sagemaker_session=None):
@@ -527,3 +530,74 @@ def test_serialize_deserialize_remote_function_error_with_traceback():
             sagemaker_session=Mock(), s3_uri=s3_uri, hmac_key=HMAC_KEY
         )
     assert type(exc_info.value.__cause__) is TypeError
+
+
+def session_using_mock_s3(**settings):
+    def upload_fileobj(fileobj, bucket, key, ExtraArgs=None):
+        assert ExtraArgs == {"SSEKMSKeyId": KMS_KEY, "ServerSideEncryption": "aws:kms"}
+        mock_s3[f"s3://{bucket}/{key}"] = fileobj.read()
+
+    def download_fileobj(bucket, key, fileobj):
+        fileobj.write(mock_s3[f"s3://{bucket}/{key}"])
+
+    sagemaker_session = Mock(settings=SessionSettings(**settings))
+    s3_client = sagemaker_session.get_client.return_value
+    s3_client.upload_fileobj.side_effect = upload_fileobj
+    s3_client.download_fileobj.side_effect = download_fileobj
+    return sagemaker_session
+
+
+@pytest.mark.parametrize("compress", [False, True])
+@patch("sagemaker.s3.S3Uploader.upload_bytes", new=upload)
+@patch("sagemaker.s3.S3Downloader.read_bytes", new=read)
+def test_serialize_deserialize_large_buffers_out_of_band(compress):
+    s3_uri = f"s3://bucket/{random_s3_uri()}"
+    sagemaker_session = session_using_mock_s3(compress_remote_function_buffers=compress)
+    large = numpy.arange(1024 * 1024, dtype=numpy.float64)
+    small = numpy.arange(10)
+
+    serialize_obj_to_s3(
+        obj={"large": large, "small": small, "transposed": large.reshape(1024, 1024).T},
+        sagemaker_session=sagemaker_session,
+        s3_uri=s3_uri,
+        s3_kms_key=KMS_KEY,
+        hmac_key=HMAC_KEY,
+    )
+
+    assert len(mock_s3[f"{s3_uri}/payload.pkl"]) < 1024
+    assert f"{s3_uri}/buffers/1.bin" in mock_s3
+    assert f"{s3_uri}/buffers/2.bin" not in mock_s3
+    if compress:
+        assert len(mock_s3[f"{s3_uri}/buffers/0.bin"]) < large.nbytes
+
+    deserialized = deserialize_obj_from_s3(
+        sagemaker_session=sagemaker_session, s3_uri=s3_uri, hmac_key=HMAC_KEY
+    )
+
+    numpy.testing.assert_array_equal(deserialized["large"], large)
+    numpy.testing.assert_array_equal(deserialized["small"], small)
+    numpy.testing.assert_array_equal(deserialized["transposed"], large.reshape(1024, 1024).T)
+    deserialized["large"][0] = -1
+
+
+@patch("sagemaker.s3.S3Uploader.upload_bytes", new=upload)
+@patch("sagemaker.s3.S3Downloader.read_bytes", new=read)
+def test_deserialize_integrity_check_covers_buffers():
+    s3_uri = f"s3://bucket/{random_s3_uri()}"
+    sagemaker_session = session_using_mock_s3()
+
+    serialize_obj_to_s3(
+        obj=numpy.zeros(1024 * 1024),
+        sagemaker_session=sagemaker_session,
+        s3_uri=s3_uri,
+        s3_kms_key=KMS_KEY,
+        hmac_key=HMAC_KEY,
+    )
+    tampered = bytearray(mock_s3[f"{s3_uri}/buffers/0.bin"])
+    tampered[0] = 1
+    mock_s3[f"{s3_uri}/buffers/0.bin"] = bytes(tampered)
+
+    with pytest.raises(DeserializationError, match="Integrity check for the serialized"):
+        deserialize_obj_from_s3(
+            sagemaker_session=sagemaker_session, s3_uri=s3_uri, hmac_key=HMAC_KEY
+        )
@@ -12,6 +12,8 @@
 # language governing permissions and limitations under the License.
 from __future__ import absolute_import
 
+import os
+
 from mock import patch
 from mock.mock import MagicMock
 
@@ -526,7 +528,47 @@ def test_install_dependencies_filename_provided(bootstrap_runtime, list_dir):
         local_dependencies_file=dependency_file,
         conda_env=TEST_JOB_CONDA_ENV,
         client_python_version=TEST_PYTHON_VERSION,
+        cache=None,
+    )
+
+
+@patch(
+    "sagemaker.remote_function.runtime_environment.runtime_environment_manager"
+    ".RuntimeEnvironmentManager.bootstrap"
+)
+def test_install_dependencies_with_runtime_environment_cache(bootstrap_runtime):
+    def install_dependencies(environment):
+        with patch.dict(os.environ, environment):
+            bootstrap._install_dependencies(
+                TEST_DEPENDENCIES_PATH,
+                TEST_JOB_CONDA_ENV,
+                TEST_PYTHON_VERSION,
+                REMOTE_FUNCTION_CHANNEL,
+                _DependencySettings.from_string(
+                    _DependencySettings(
+                        TEST_DEPENDENCY_FILE_NAME,
+                        cache_uri="s3://bucket/cache",
+                        image_uri="image",
+                        region="us-west-2",
+                    ).to_string()
+                ),
+            )
+        return bootstrap_runtime.call_args[1]["cache"]
+
+    cache = install_dependencies({"REMOTE_FUNCTION_SECRET_KEY": "job-secret"})
+    assert cache.cache_uri == "s3://bucket/cache"
+    assert cache.image_uri == "image"
+    assert cache.s3_kms_key is None
+    assert cache.region == "us-west-2"
+    assert cache.secret_key == "job-secret"
+
+    cache = install_dependencies(
+        {
+            "REMOTE_FUNCTION_SECRET_KEY": "job-secret",
+            "REMOTE_FUNCTION_CACHE_SECRET_KEY": "cache-secret",
+        }
     )
+    assert cache.secret_key == "cache-secret"
 
 
 @patch("os.listdir", return_value=[TEST_DEPENDENCY_FILE_NAME])
@@ -12,7 +12,10 @@
 # language governing permissions and limitations under the License.
 from __future__ import absolute_import
 
+import io
+import json
 import subprocess
+import tarfile
 
 import pytest
 from mock import patch, Mock
@@ -25,6 +28,8 @@ from mock.mock import MagicMock
 from sagemaker.remote_function.runtime_environment.runtime_environment_manager import (
     RuntimeEnvironmentManager,
     RuntimeEnvironmentError,
+    _DependencySettings,
+    _RuntimeEnvironmentCache,
 )
 
 TEST_REQUIREMENTS_TXT = "usr/local/requirements.txt"
@@ -491,3 +496,207 @@ def test_change_dir_permission_and_dir_not_exist(mock_subprocess_run):
             dirs=["a", "b", "c"], new_permission="777"
         )
     assert "chmod: cannot access ...: No such file or directory" in str(error)
+
+
+def test_dependency_settings_only_serialize_cache_when_set():
+    assert _DependencySettings("req.txt").to_string() == '{"dependency_file": "req.txt"}'
+
+    settings = _DependencySettings("req.txt", cache_uri="s3://bucket/cache", image_uri="image")
+    assert _DependencySettings.from_string(settings.to_string()) == settings
+
+
+def test_runtime_environment_cache_key(tmp_path):
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text("numpy==1.26.4")
+    cache = _RuntimeEnvironmentCache("s3://bucket/cache", "secret", image_uri="image")
+    key = cache.key(str(requirements))
+
+    assert cache.key(str(requirements)) == key
+    assert cache.key(str(requirements), "conda_env") != key
+    assert (
+        _RuntimeEnvironmentCache("s3://bucket/cache", "secret", image_uri="other").key(
+            str(requirements)
+        )
+        != key
+    )
+    requirements.write_text("numpy==2.0.0")
+    assert cache.key(str(requirements)) != key
+
+
+def test_bootstrap_req_txt_restores_cached_runtime_environment(tmp_path):
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text("pkg==1.0")
+    site_packages = tmp_path / "site-packages"
+    (site_packages / "stale").mkdir(parents=True)
+    (site_packages / "kept.py").write_text("kept")
+    (site_packages / "stale" / "stale.py").write_text("stale")
+    cache = _RuntimeEnvironmentCache(str(tmp_path / "cache"), "secret")
+
+    def install(local_path, python_executable):
+        (site_packages / "pkg").mkdir()
+        (site_packages / "pkg" / "__init__.py").write_text("new")
+        os.symlink("pkg", str(site_packages / "pkg_link"))
+        os.remove(str(site_packages / "stale" / "stale.py"))
+
+    manager = RuntimeEnvironmentManager()
+    with (
+        patch.object(
+            RuntimeEnvironmentManager, "_environment_roots", return_value=[str(site_packages)]
+        ),
+        patch.object(RuntimeEnvironmentManager, "_install_requirements_txt") as install_txt,
+    ):
+        install_txt.side_effect = install
+        manager.bootstrap(str(requirements), CLIENT_PYTHON_VERSION, cache=cache)
+        install_txt.assert_called_once()
+        assert len(os.listdir(str(tmp_path / "cache"))) == 1
+
+        # a new job starts from the image again
+        (site_packages / "pkg" / "__init__.py").unlink()
+        (site_packages / "pkg").rmdir()
+        (site_packages / "pkg_link").unlink()
+        (site_packages / "stale" / "stale.py").write_text("stale")
+
+        install_txt.reset_mock()
+        manager.bootstrap(str(requirements), CLIENT_PYTHON_VERSION, cache=cache)
+        install_txt.assert_not_called()
+
+    assert (site_packages / "pkg" / "__init__.py").read_text() == "new"
+    assert os.readlink(str(site_packages / "pkg_link")) == "pkg"
+    assert (site_packages / "kept.py").read_text() == "kept"
+    assert not (site_packages / "stale" / "stale.py").exists()
+
+
+def test_bootstrap_installs_without_cache_when_the_environment_is_not_found(tmp_path):
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text("pkg==1.0")
+    cache = Mock(spec=_RuntimeEnvironmentCache)
+
+    with (
+        patch.object(RuntimeEnvironmentManager, "_get_conda_exe", return_value="conda"),
+        patch(
+            "sagemaker.remote_function.runtime_environment.runtime_environment_manager"
+            "._run_and_get_output_shell_cmd",
+            side_effect=subprocess.CalledProcessError(1, "conda info --json"),
+        ),
+        patch.object(RuntimeEnvironmentManager, "_install_req_txt_in_conda_env") as install_txt,
+        patch.object(RuntimeEnvironmentManager, "_write_conda_env_to_file"),
+    ):
+        RuntimeEnvironmentManager().bootstrap(
+            str(requirements), CLIENT_PYTHON_VERSION, "conda_env", cache=cache
+        )
+
+    install_txt.assert_called_once_with("conda_env", str(requirements))
+    cache.restore.assert_not_called()
+    cache.save.assert_not_called()
+
+
+@patch("boto3.session.Session")
+def test_runtime_environment_cache_s3_client_uses_region(boto_session, tmp_path):
+    cache = _RuntimeEnvironmentCache("s3://bucket/cache", "secret", region="us-west-2")
+
+    assert cache._fetch("key", str(tmp_path)) == str(tmp_path / "snapshot.tar.gz")
+    cache._store("key", str(tmp_path / "snapshot.tar.gz"))
+
+    boto_session.assert_called_once_with(region_name="us-west-2")
+    s3_client = boto_session.return_value.client.return_value
+    s3_client.download_file.assert_called_once_with(
+        "bucket", "cache/key.tar.gz", str(tmp_path / "snapshot.tar.gz")
+    )
+    s3_client.upload_file.assert_called_once_with(
+        str(tmp_path / "snapshot.tar.gz"), "bucket", "cache/key.tar.gz", ExtraArgs=None
+    )
+
+
+def _cache_snapshot(tmp_path, install):
+    """Install into an empty site-packages with a cache, and return the cache and snapshot."""
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text("pkg==1.0")
+    site_packages = tmp_path / "site-packages"
+    site_packages.mkdir()
+    cache = _RuntimeEnvironmentCache(str(tmp_path / "cache"), "secret")
+    with (
+        patch.object(
+            RuntimeEnvironmentManager, "_environment_roots", return_value=[str(site_packages)]
+        ),
+        patch.object(RuntimeEnvironmentManager, "_install_requirements_txt") as install_txt,
+    ):
+        install_txt.side_effect = lambda *args: install(site_packages)
+        RuntimeEnvironmentManager().bootstrap(str(requirements), CLIENT_PYTHON_VERSION, cache=cache)
+    key = cache.key(str(requirements))
+    return cache, key, site_packages, str(tmp_path / "cache" / f"{key}.tar.gz")
+
+
+def test_runtime_environment_cache_rejects_unsigned_snapshots(tmp_path):
+    def install(site_packages):
+        (site_packages / "pkg.py").write_text("new")
+
+    cache, key, site_packages, snapshot_path = _cache_snapshot(tmp_path, install)
+    (site_packages / "pkg.py").unlink()
+
+    assert not _RuntimeEnvironmentCache(str(tmp_path / "cache"), "other").restore(
+        key, [str(site_packages)]
+    )
+    with open(snapshot_path, "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        last_byte = f.read(1)
+        f.seek(-1, os.SEEK_END)
+        f.write(bytes([last_byte[0] ^ 1]))
+    assert not cache.restore(key, [str(site_packages)])
+    assert not (site_packages / "pkg.py").exists()
+
+
+def test_runtime_environment_cache_rejects_files_outside_of_the_environment(tmp_path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "victim.py").write_text("victim")
+
+    def install(site_packages):
+        (site_packages / "pkg.py").write_text("new")
+
+    cache, key, site_packages, _ = _cache_snapshot(tmp_path, install)
+    (site_packages / "pkg.py").unlink()
+
+    # a snapshot of the same files is not restored into another environment
+    other_site_packages = tmp_path / "other-site-packages"
+    other_site_packages.mkdir()
+    assert not cache.restore(key, [str(other_site_packages)])
+    assert cache.restore(key, [str(site_packages)])
+
+    def add_link(tar):
+        info = tarfile.TarInfo(str(site_packages / "out").lstrip(os.sep))
+        info.type = tarfile.SYMTYPE
+        info.linkname = str(outside)
+        tar.addfile(info)
+
+    def add_file_through_parent(tar):
+        info = tarfile.TarInfo(
+            os.path.join(str(site_packages).lstrip(os.sep), "..", "outside", "victim.py")
+        )
+        info.size = 4
+        tar.addfile(info, io.BytesIO(b"evil"))
+
+    for removed_files, add_members in [
+        ([str(outside / "victim.py")], lambda tar: None),
+        ([], add_link),
+        ([], add_file_through_parent),
+    ]:
+        _write_signed_snapshot(cache, key, removed_files, add_members)
+
+        assert not cache.restore(key, [str(site_packages)])
+        assert (outside / "victim.py").read_text() == "victim"
+        assert not (site_packages / "out").exists()
+
+
+def _write_signed_snapshot(cache, key, removed_files, add_members):
+    manifest = json.dumps({"removed_files": removed_files}).encode()
+    with open(os.path.join(cache.cache_uri, f"{key}.tar.gz"), "w+b") as f:
+        f.write(b"0" * 65)
+        with tarfile.open(fileobj=f, mode="w:gz") as tar:
+            info = tarfile.TarInfo(cache.MANIFEST_NAME)
+            info.size = len(manifest)
+            tar.addfile(info, io.BytesIO(manifest))
+            add_members(tar)
+        f.seek(65)
+        signature = cache._signature(key, f)
+        f.seek(0)
+        f.write(signature)
@@ -28,6 +28,7 @@ from sagemaker import Session
 from sagemaker.experiments.experiment import Experiment
 from sagemaker.experiments.run import Run
 from sagemaker.remote_function.client import (
+    _ChunkRunner,
     remote,
     RemoteExecutor,
     Future,
@@ -538,6 +539,83 @@ def test_decorator_with_spot_instances(mock_start, mock_job_settings, mock_deser
     assert mock_job_settings.call_args.kwargs["max_wait_time_in_seconds"] == 172800
 
 
+def _wait_for_running_jobs(executor, count):
+    deadline = time.time() + 5
+    while len(executor._running_jobs) < count and time.time() < deadline:
+        time.sleep(0.005)
+
+
+@patch("sagemaker.remote_function.client._API_CALL_LIMIT", new=API_CALL_LIMIT)
+@patch("sagemaker.remote_function.client._JobSettings")
+@patch("sagemaker.remote_function.client._Job.start")
+def test_executor_lists_running_jobs_in_bulk(mock_start, mock_job_settings):
+    job_names = ["job_1", "job_2", "job_3"]
+    mock_jobs = [create_mock_job(name, INPROGRESS_TRAINING_JOB) for name in job_names]
+    mock_start.side_effect = mock_jobs
+    listed_status = {"status": "InProgress"}
+
+    def paginate(**kwargs):
+        return [
+            {
+                "TrainingJobSummaries": [
+                    {"TrainingJobName": name, "TrainingJobStatus": listed_status["status"]}
+                    for name in job_names + ["job_10"]
+                ]
+            }
+        ]
+
+    sagemaker_client = mock_job_settings.return_value.sagemaker_session.sagemaker_client
+    paginator = sagemaker_client.get_paginator.return_value
+    paginator.paginate.side_effect = paginate
+
+    e = RemoteExecutor(max_parallel_jobs=3, s3_root_uri="s3://bucket/")
+    futures = [e.submit(job_function, i, 2, c=3, d=4) for i in range(3)]
+    _wait_for_running_jobs(e, 3)
+    time.sleep(0.05)
+
+    # while the jobs are listed in progress, they are not described
+    describe_counts = [job.describe.call_count for job in mock_jobs]
+    time.sleep(0.05)
+    assert [job.describe.call_count for job in mock_jobs] == describe_counts
+
+    for job in mock_jobs:
+        job.describe.return_value = COMPLETED_TRAINING_JOB
+    listed_status["status"] = "Completed"
+    e.shutdown()
+
+    assert all(future.done() for future in futures)
+    sagemaker_client.get_paginator.assert_called_with("list_training_jobs")
+    list_filters = paginator.paginate.call_args[1]
+    assert list_filters["NameContains"] == "job_"
+    assert list_filters["CreationTimeAfter"].timestamp() < time.time() - 300
+
+
+@patch("sagemaker.remote_function.client._API_CALL_LIMIT", new=API_CALL_LIMIT)
+@patch("sagemaker.remote_function.client._JobSettings")
+@patch("sagemaker.remote_function.client._Job.start")
+def test_executor_describes_jobs_when_listing_is_denied(mock_start, mock_job_settings):
+    mock_jobs = [create_mock_job(name, INPROGRESS_TRAINING_JOB) for name in ["job_1", "job_2"]]
+    mock_start.side_effect = mock_jobs
+    sagemaker_client = mock_job_settings.return_value.sagemaker_session.sagemaker_client
+    paginator = sagemaker_client.get_paginator.return_value
+    paginator.paginate.side_effect = ClientError(
+        error_response={"Error": {"Code": "AccessDeniedException"}},
+        operation_name="ListTrainingJobs",
+    )
+
+    e = RemoteExecutor(max_parallel_jobs=2, s3_root_uri="s3://bucket/")
+    futures = [e.submit(job_function, i, 2, c=3, d=4) for i in range(2)]
+    _wait_for_running_jobs(e, 2)
+    time.sleep(0.05)
+
+    for job in mock_jobs:
+        job.describe.return_value = COMPLETED_TRAINING_JOB
+    e.shutdown()
+
+    assert all(future.done() for future in futures)
+    paginator.paginate.assert_called_once()
+
+
 @pytest.mark.parametrize(
     "args, kwargs, error_message",
     [
@@ -1272,6 +1350,54 @@ def test_executor_map_happy_case(mock_deserialized, mock_start, mock_job_setting
     assert results[1] == 16
 
 
+@patch("sagemaker.remote_function.client._API_CALL_LIMIT", new=API_CALL_LIMIT)
+@patch("sagemaker.remote_function.client._JobSettings")
+@patch("sagemaker.remote_function.client._Job.start")
+@patch("sagemaker.remote_function.client.serialization.deserialize_obj_from_s3")
+def test_executor_map_with_chunksize(mock_deserialized, mock_start, mock_job_settings):
+    mock_job_1 = create_mock_job("job_1", COMPLETED_TRAINING_JOB)
+    mock_job_2 = create_mock_job("job_2", COMPLETED_TRAINING_JOB)
+    mock_start.side_effect = [mock_job_1, mock_job_2]
+    error = ValueError("item 3 failed")
+    mock_deserialized.side_effect = [[(True, 1), (True, 4)], [(False, error)]]
+
+    with RemoteExecutor(max_parallel_jobs=2, s3_root_uri="s3://bucket/") as executor:
+        with pytest.raises(ValueError, match="item 3 failed"):
+            executor.map(job_function2, [1, 2, 3], [1, 2, 3], chunksize=2, processes=4)
+
+    assert mock_start.call_count == 2
+    _, runner, args, kwargs, _ = mock_start.call_args_list[0][0]
+    assert (runner.func, runner.processes, runner.__name__) == (job_function2, 4, "job_function2")
+    assert (args, kwargs) == (((1, 1), (2, 2)), {})
+    assert mock_start.call_args_list[1][0][2] == ((3, 3),)
+
+
+@patch("sagemaker.remote_function.client._JobSettings")
+def test_executor_map_validates_chunked_args(mock_job_settings):
+    with RemoteExecutor(max_parallel_jobs=1, s3_root_uri="s3://bucket/") as executor:
+        with pytest.raises(ValueError, match="chunksize"):
+            executor.map(job_function2, [1], [2], chunksize=0)
+        with pytest.raises(TypeError, match="missing 1 required positional argument: 'b'"):
+            executor.map(job_function2, [1, 2], chunksize=2)
+
+
+def _fail_on_odd(value):
+    if value % 2:
+        raise ValueError(value)
+    return value * 10
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_chunk_runner_returns_an_outcome_per_item(processes):
+    runner = _ChunkRunner(_fail_on_odd, processes=processes)
+
+    outcomes = runner((0,), (1,), (2,))
+
+    assert [succeeded for succeeded, _ in outcomes] == [True, False, True]
+    assert outcomes[0][1] == 0 and outcomes[2][1] == 20
+    assert isinstance(outcomes[1][1], ValueError) and outcomes[1][1].args == (1,)
+
+
 @patch("sagemaker.remote_function.client._API_CALL_LIMIT", new=API_CALL_LIMIT)
 @patch("sagemaker.remote_function.client._JobSettings")
 @patch("sagemaker.remote_function.client._Job.start")
@@ -1508,6 +1634,7 @@ def test_consistency_between_remote_and_step_decorator():
         "use_torchrun",
         "use_mpirun",
         "nproc_per_node",
+        "cache",
     ]
 
     step_args_to_ignore = ["_step", "name", "display_name", "description", "retry_policies"]
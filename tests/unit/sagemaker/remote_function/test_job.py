@@ -12,6 +12,7 @@
 # language governing permissions and limitations under the License.
 from __future__ import absolute_import
 
+import json
 import os
 import sys
 
@@ -19,6 +20,7 @@ import tempfile
 import pytest
 from mock import patch, Mock, ANY, mock_open
 from mock.mock import MagicMock
+from botocore.exceptions import ClientError
 
 from sagemaker.config import load_sagemaker_config
 from sagemaker.remote_function.checkpoint_location import CheckpointLocation
@@ -592,6 +594,7 @@ def test_start(
         sagemaker_session=session(),
         use_torchrun=False,
         use_mpirun=False,
+        cache_s3_uri=None,
     )
 
     mock_dependency_upload.assert_called_once_with(
@@ -603,6 +606,7 @@ def test_start(
         s3_kms_key=None,
         sagemaker_session=session(),
         custom_file_filter=None,
+        cache_s3_uri=None,
     )
 
     session().sagemaker_client.create_training_job.assert_called_once_with(
@@ -875,6 +879,7 @@ def test_start_with_complete_job_settings(
         sagemaker_session=session(),
         use_torchrun=False,
         use_mpirun=False,
+        cache_s3_uri=None,
     )
 
     mock_user_workspace_upload.assert_called_once_with(
@@ -886,6 +891,7 @@ def test_start_with_complete_job_settings(
         s3_kms_key=job_settings.s3_kms_key,
         sagemaker_session=session(),
         custom_file_filter=None,
+        cache_s3_uri=None,
     )
 
     session().sagemaker_client.create_training_job.assert_called_once_with(
@@ -953,6 +959,151 @@ def test_start_with_complete_job_settings(
     )
 
 
+@patch("secrets.token_hex", return_value=HMAC_KEY)
+@patch("sagemaker.remote_function.job._prepare_and_upload_workspace", return_value="some_s3_uri")
+@patch(
+    "sagemaker.remote_function.job._prepare_and_upload_runtime_scripts", return_value="some_s3_uri"
+)
+@patch("sagemaker.remote_function.job.RuntimeEnvironmentManager")
+@patch("sagemaker.remote_function.job.StoredFunction")
+@patch("sagemaker.remote_function.job.Session", return_value=mock_session())
+def test_start_with_runtime_environment_cache(
+    session,
+    mock_stored_function,
+    mock_runtime_manager,
+    mock_bootstrap_script_upload,
+    mock_user_workspace_upload,
+    secret_token,
+):
+    session().settings = SessionSettings(
+        runtime_environment_cache_uri="s3://bucket/env-cache",
+        runtime_environment_cache_secret_key="cache-secret",
+    )
+    job_settings = _JobSettings(
+        dependencies="path/to/dependencies/req.txt",
+        image_uri=IMAGE,
+        s3_root_uri=S3_URI,
+        s3_kms_key=KMS_KEY_ARN,
+        role=ROLE_ARN,
+        instance_type="ml.m5.xlarge",
+    )
+
+    try:
+        _Job.start(job_settings, job_function, func_args=(1, 2), func_kwargs={})
+    finally:
+        session().settings = SessionSettings()
+
+    container_args = session().sagemaker_client.create_training_job.call_args[1][
+        "AlgorithmSpecification"
+    ]["ContainerArguments"]
+    dependency_settings = container_args[container_args.index("--dependency_settings") + 1]
+    assert json.loads(dependency_settings) == {
+        "dependency_file": "req.txt",
+        "cache_uri": "s3://bucket/env-cache",
+        "image_uri": IMAGE,
+        "s3_kms_key": KMS_KEY_ARN,
+        "region": TEST_REGION,
+    }
+    environment = session().sagemaker_client.create_training_job.call_args[1]["Environment"]
+    assert environment["REMOTE_FUNCTION_SECRET_KEY"] == HMAC_KEY
+    assert environment["REMOTE_FUNCTION_CACHE_SECRET_KEY"] == "cache-secret"
+
+
+@patch("sagemaker.remote_function.job._UNSIGNED_RUNTIME_ENVIRONMENT_CACHE_URIS", set())
+@patch("sagemaker.remote_function.job.logger")
+@patch("secrets.token_hex", return_value=HMAC_KEY)
+@patch("sagemaker.remote_function.job._prepare_and_upload_workspace", return_value="some_s3_uri")
+@patch(
+    "sagemaker.remote_function.job._prepare_and_upload_runtime_scripts", return_value="some_s3_uri"
+)
+@patch("sagemaker.remote_function.job.RuntimeEnvironmentManager")
+@patch("sagemaker.remote_function.job.StoredFunction")
+@patch("sagemaker.remote_function.job.Session", return_value=mock_session())
+def test_start_without_runtime_environment_cache_secret_key(
+    session,
+    mock_stored_function,
+    mock_runtime_manager,
+    mock_bootstrap_script_upload,
+    mock_user_workspace_upload,
+    secret_token,
+    mock_logger,
+):
+    session().settings = SessionSettings(runtime_environment_cache_uri="s3://bucket/env-cache")
+    job_settings = _JobSettings(
+        dependencies="path/to/dependencies/req.txt",
+        image_uri=IMAGE,
+        s3_root_uri=S3_URI,
+        role=ROLE_ARN,
+        instance_type="ml.m5.xlarge",
+    )
+
+    try:
+        for _ in range(2):
+            _Job.start(job_settings, job_function, func_args=(1, 2), func_kwargs={})
+    finally:
+        session().settings = SessionSettings()
+
+    # no other job could restore a snapshot signed with the secret key of the job
+    container_args = session().sagemaker_client.create_training_job.call_args[1][
+        "AlgorithmSpecification"
+    ]["ContainerArguments"]
+    dependency_settings = container_args[container_args.index("--dependency_settings") + 1]
+    assert json.loads(dependency_settings) == {"dependency_file": "req.txt"}
+    environment = session().sagemaker_client.create_training_job.call_args[1]["Environment"]
+    assert "REMOTE_FUNCTION_CACHE_SECRET_KEY" not in environment
+    mock_logger.warning.assert_called_once()
+
+
+@patch("sagemaker.workflow.utilities._pipeline_config", MOCKED_PIPELINE_CONFIG)
+@patch(
+    "sagemaker.remote_function.job._prepare_dependencies_and_pre_execution_scripts",
+    return_value="some_s3_uri",
+)
+@patch("sagemaker.remote_function.job._prepare_and_upload_workspace", return_value="some_s3_uri")
+@patch(
+    "sagemaker.remote_function.job._prepare_and_upload_runtime_scripts", return_value="some_s3_uri"
+)
+@patch("sagemaker.remote_function.job.RuntimeEnvironmentManager")
+@patch("sagemaker.remote_function.job.StoredFunction")
+@patch("sagemaker.remote_function.job.Session", return_value=mock_session())
+def test_compile_with_runtime_environment_cache_under_pipeline_context(
+    session,
+    mock_stored_function,
+    mock_runtime_manager,
+    mock_bootstrap_scripts_upload,
+    mock_user_workspace_upload,
+    mock_user_dependencies_upload,
+):
+    session().settings = SessionSettings(runtime_environment_cache_uri="s3://bucket/env-cache")
+    job_settings = _JobSettings(
+        dependencies="path/to/dependencies/req.txt",
+        image_uri=IMAGE,
+        s3_root_uri=S3_URI,
+        role=ROLE_ARN,
+        instance_type="ml.m5.xlarge",
+    )
+
+    try:
+        train_args = _Job.compile(
+            job_settings=job_settings,
+            job_name=TEST_JOB_NAME,
+            s3_base_uri=f"{S3_URI}/{TEST_PIPELINE_NAME}",
+            func=job_function,
+            func_args=(1, 2),
+            func_kwargs={},
+            serialized_data=serialized_data(),
+        )
+    finally:
+        session().settings = SessionSettings()
+
+    # the function steps of the pipeline share their secret key
+    container_args = train_args["AlgorithmSpecification"]["ContainerArguments"]
+    dependency_settings = container_args[container_args.index("--dependency_settings") + 1]
+    assert json.loads(dependency_settings)["cache_uri"] == "s3://bucket/env-cache"
+    assert train_args["Environment"]["REMOTE_FUNCTION_SECRET_KEY"] == "token-from-pipeline"
+    assert "REMOTE_FUNCTION_CACHE_SECRET_KEY" not in train_args["Environment"]
+
+
 @patch("sagemaker.workflow.utilities._pipeline_config", MOCKED_PIPELINE_CONFIG)
 @patch("secrets.token_hex", MagicMock(return_value=HMAC_KEY))
 @patch(
@@ -1047,6 +1198,7 @@ def test_get_train_args_under_pipeline_context(
         sagemaker_session=session(),
         use_torchrun=False,
         use_mpirun=False,
+        cache_s3_uri=None,
     )
 
     mock_user_workspace_upload.assert_called_once_with(
@@ -1058,6 +1210,7 @@ def test_get_train_args_under_pipeline_context(
         s3_kms_key=job_settings.s3_kms_key,
         sagemaker_session=session(),
         custom_file_filter=None,
+        cache_s3_uri=None,
     )
 
     mock_user_dependencies_upload.assert_called_once()
@@ -1223,6 +1376,7 @@ def test_start_with_spark(
         sagemaker_session=session(),
         use_torchrun=False,
         use_mpirun=False,
+        cache_s3_uri=None,
     )
 
     session().sagemaker_client.create_training_job.assert_called_once_with(
@@ -1544,6 +1698,89 @@ def test_prepare_and_upload_workspace_under_pipeline_context(
     mock_s3_upload.assert_not_called()
 
 
+@patch("sagemaker.remote_function.job._CACHED_UPLOAD_URIS", new_callable=set)
+@patch("sagemaker.s3.S3Uploader.upload", return_value="some_uri")
+def test_prepare_and_upload_workspace_with_cache(mock_s3_upload, mock_cached_uris):
+    session = mock_session()
+    session.list_s3_files.return_value = []
+    cache_s3_uri = S3_URI + "/cache"
+
+    def prepare(commands):
+        return _prepare_and_upload_workspace(
+            local_dependencies_path=None,
+            include_local_workdir=False,
+            pre_execution_commands=commands,
+            pre_execution_script_local_path=None,
+            s3_base_uri=S3_URI + "/job-name",
+            s3_kms_key=KMS_KEY_ARN,
+            sagemaker_session=session,
+            cache_s3_uri=cache_s3_uri,
+        )
+
+    assert prepare(["cmd_1"]) == "some_uri"
+    upload_uri = mock_s3_upload.call_args[0][1]
+    assert upload_uri.startswith(cache_s3_uri + "/")
+    session.list_s3_files.assert_called_once_with(BUCKET, upload_uri[len(f"s3://{BUCKET}/") :])
+
+    # the same workspace is reused without being archived, listed or uploaded again
+    with patch("shutil.make_archive") as mock_make_archive:
+        assert prepare(["cmd_1"]) == upload_uri + "/workspace.zip"
+    mock_make_archive.assert_not_called()
+    mock_s3_upload.assert_called_once()
+    session.list_s3_files.assert_called_once()
+    session.get_client("s3").head_object.assert_called_once_with(
+        Bucket=BUCKET, Key=upload_uri[len(f"s3://{BUCKET}/") :] + "/workspace.zip"
+    )
+
+    # a workspace that was deleted since is uploaded again
+    session.get_client("s3").head_object.side_effect = ClientError(
+        {"Error": {"Code": "404"}}, "HeadObject"
+    )
+    assert prepare(["cmd_1"]) == "some_uri"
+    assert mock_s3_upload.call_count == 2
+    session.get_client("s3").head_object.side_effect = None
+
+    # a workspace uploaded by another process is found by listing it
+    mock_cached_uris.clear()
+    session.list_s3_files.return_value = [upload_uri[len(f"s3://{BUCKET}/") :] + "/workspace.zip"]
+    assert prepare(["cmd_1"]) == upload_uri + "/workspace.zip"
+    assert mock_s3_upload.call_count == 2
+
+    # a different workspace is uploaded under another digest
+    prepare(["cmd_2"])
+    assert mock_s3_upload.call_count == 3
+    assert mock_s3_upload.call_args[0][1] != upload_uri
+
+
+@patch("sagemaker.remote_function.job._CACHED_UPLOAD_URIS", new_callable=set)
+@patch("sagemaker.s3.S3Uploader.upload", return_value="some_uri")
+def test_prepare_and_upload_runtime_scripts_with_cache(mock_s3_upload, mock_cached_uris):
+    session = mock_session()
+    cache_s3_uri = S3_URI + "/cache"
+    session.list_s3_files.return_value = []
+
+    _prepare_and_upload_runtime_scripts(
+        spark_config=None,
+        s3_base_uri=S3_URI + "/job-name",
+        s3_kms_key=KMS_KEY_ARN,
+        sagemaker_session=session,
+        cache_s3_uri=cache_s3_uri,
+    )
+    upload_uri = mock_s3_upload.call_args[0][1]
+
+    s3_path = _prepare_and_upload_runtime_scripts(
+        spark_config=None,
+        s3_base_uri=S3_URI + "/other-job-name",
+        s3_kms_key=KMS_KEY_ARN,
+        sagemaker_session=session,
+        cache_s3_uri=cache_s3_uri,
+    )
+
+    assert upload_uri.startswith(cache_s3_uri + "/")
+    assert s3_path == upload_uri
+    mock_s3_upload.assert_called_once()
+
+
 @patch("sagemaker.s3.S3Uploader.upload", return_value="some_uri")
 @patch("sagemaker.remote_function.job.copy_workdir")
 @patch("shutil.copy2")
@@ -1886,6 +2123,7 @@ def test_start_with_torchrun_single_node(
         sagemaker_session=session(),
         use_torchrun=True,
         use_mpirun=False,
+        cache_s3_uri=None,
     )
 
     mock_dependency_upload.assert_called_once_with(
@@ -1897,6 +2135,7 @@ def test_start_with_torchrun_single_node(
         s3_kms_key=None,
         sagemaker_session=session(),
         custom_file_filter=None,
+        cache_s3_uri=None,
     )
 
     session().sagemaker_client.create_training_job.assert_called_once_with(
@@ -2016,6 +2255,7 @@ def test_start_with_torchrun_multi_node(
         sagemaker_session=session(),
         use_torchrun=True,
         use_mpirun=False,
+        cache_s3_uri=None,
     )
 
     mock_dependency_upload.assert_called_once_with(
@@ -2027,6 +2267,7 @@ def test_start_with_torchrun_multi_node(
         s3_kms_key=None,
         sagemaker_session=session(),
         custom_file_filter=None,
+        cache_s3_uri=None,
     )
 
     session().sagemaker_client.create_training_job.assert_called_once_with(
@@ -2408,6 +2649,7 @@ def test_start_with_torchrun_single_node_with_nproc_per_node(
         sagemaker_session=session(),
         use_torchrun=True,
         use_mpirun=False,
+        cache_s3_uri=None,
     )
 
     mock_dependency_upload.assert_called_once_with(
@@ -2419,6 +2661,7 @@ def test_start_with_torchrun_single_node_with_nproc_per_node(
         s3_kms_key=None,
         sagemaker_session=session(),
         custom_file_filter=None,
+        cache_s3_uri=None,
     )
 
     session().sagemaker_client.create_training_job.assert_called_once_with(
@@ -2540,6 +2783,7 @@ def test_start_with_mpirun_single_node_with_nproc_per_node(
         sagemaker_session=session(),
         use_torchrun=False,
         use_mpirun=True,
+        cache_s3_uri=None,
     )
 
     mock_dependency_upload.assert_called_once_with(
@@ -2551,6 +2795,7 @@ def test_start_with_mpirun_single_node_with_nproc_per_node(
         s3_kms_key=None,
         sagemaker_session=session(),
         custom_file_filter=None,
+        cache_s3_uri=None,
     )
 
     session().sagemaker_client.create_training_job.assert_called_once_with(
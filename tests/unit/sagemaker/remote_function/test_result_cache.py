@@ -0,0 +1,286 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import json
+
+import pytest
+from botocore.exceptions import ClientError
+from mock import Mock, patch
+
+from sagemaker.remote_function import RemoteExecutor, ResultCache, remote
+from sagemaker.session_settings import SessionSettings
+
+S3_ROOT_URI = "s3://my-bucket/root"
+JOB_NAME = "square-2024-01-01-00-00-00-000"
+COMPLETED_TRAINING_JOB = {
+    "TrainingJobName": JOB_NAME,
+    "TrainingJobArn": "training-job-arn",
+    "TrainingJobStatus": "Completed",
+    "OutputDataConfig": {"S3OutputPath": f"{S3_ROOT_URI}/{JOB_NAME}"},
+    "Environment": {"REMOTE_FUNCTION_SECRET_KEY": "secret"},
+}
+
+
+def square(x):
+    return x * x
+
+
+class FakeS3(object):
+    """Keep the cache entries in memory."""
+
+    def __init__(self):
+        self.objects = {}
+
+    def read_file(self, s3_uri, sagemaker_session=None):
+        if s3_uri not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        return self.objects[s3_uri]
+
+    def upload_string_as_file_body(self, body, desired_s3_uri, kms_key=None, session=None):
+        self.objects[desired_s3_uri] = body
+
+    def delete_object(self, Bucket, Key):
+        del self.objects[f"s3://{Bucket}/{Key}"]
+
+
+@pytest.fixture()
+def s3():
+    fake_s3 = FakeS3()
+    with (
+        patch("sagemaker.remote_function.result_cache.S3Downloader", fake_s3),
+        patch("sagemaker.remote_function.result_cache.S3Uploader", fake_s3),
+    ):
+        yield fake_s3
+
+
+def job_settings(**kwargs):
+    settings = Mock(
+        s3_root_uri=S3_ROOT_URI,
+        s3_kms_key=None,
+        image_uri="image",
+        dependencies=None,
+        pre_execution_commands=None,
+        pre_execution_script=None,
+        environment_variables={},
+        job_conda_env=None,
+    )
+    for name, value in kwargs.items():
+        setattr(settings, name, value)
+    return settings
+
+
+def test_key_depends_on_function_arguments_and_environment(tmp_path):
+    cache = ResultCache()
+    key = cache._key(job_settings(), square, (2,), {})
+
+    assert cache._key(job_settings(), square, (2,), {}) == key
+    assert cache._key(job_settings(), square, (3,), {}) != key
+    assert cache._key(job_settings(), len, (2,), {}) != key
+    assert cache._key(job_settings(image_uri="other"), square, (2,), {}) != key
+    assert ResultCache(namespace="v2")._key(job_settings(), square, (2,), {}) != key
+    # the secret keys given to each job are not part of the key
+    settings = job_settings(
+        environment_variables={
+            "REMOTE_FUNCTION_SECRET_KEY": "other",
+            "REMOTE_FUNCTION_CACHE_SECRET_KEY": "cache-secret",
+        }
+    )
+    assert cache._key(settings, square, (2,), {}) == key
+
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text("numpy")
+    key = cache._key(job_settings(dependencies=str(requirements)), square, (2,), {})
+    requirements.write_text("pandas")
+    assert cache._key(job_settings(dependencies=str(requirements)), square, (2,), {}) != key
+
+
+@patch("sagemaker.remote_function.result_cache.serialization.deserialize_obj_from_s3")
+def test_load_saved_result_until_it_expires(mock_deserialize, s3):
+    mock_deserialize.return_value = 4
+    settings = job_settings()
+    settings.sagemaker_session.sagemaker_client.describe_training_job.return_value = (
+        COMPLETED_TRAINING_JOB
+    )
+    cache = ResultCache(ttl_in_seconds=60)
+
+    assert cache._load(settings, "key") is None
+
+    with patch("time.time", return_value=1000):
+        cache._save(settings, "key", JOB_NAME)
+    assert json.loads(s3.objects[f"{S3_ROOT_URI}/result_cache/key.json"])["job_name"] == JOB_NAME
+
+    with patch("time.time", return_value=1030):
+        assert cache._load(settings, "key") == (COMPLETED_TRAINING_JOB, 4)
+    mock_deserialize.assert_called_once_with(
+        sagemaker_session=settings.sagemaker_session,
+        s3_uri=f"{S3_ROOT_URI}/{JOB_NAME}/results",
+        hmac_key="secret",
+    )
+    with patch("time.time", return_value=1061):
+        assert cache._load(settings, "key") is None
+
+
+def test_load_treats_unreadable_entries_as_missing(s3):
+    settings = job_settings()
+    cache = ResultCache(ttl_in_seconds=60)
+    entry_uri = f"{S3_ROOT_URI}/result_cache/key.json"
+
+    for entry in ["{", '{"job_name": "job"}', '{"job_name": "job", "created_time": "x"}', "[]"]:
+        s3.objects[entry_uri] = entry
+        assert cache._load(settings, "key") is None
+
+    # a missing entry is denied without the permission to list the bucket
+    with patch.object(
+        s3, "read_file", side_effect=ClientError({"Error": {"Code": "AccessDenied"}}, "GetObject")
+    ):
+        assert cache._load(settings, "key") is None
+
+    with patch.object(
+        s3, "read_file", side_effect=ClientError({"Error": {"Code": "NoSuchBucket"}}, "GetObject")
+    ):
+        with pytest.raises(ClientError):
+            cache._load(settings, "key")
+
+
+@patch("sagemaker.remote_function.client.serialization.deserialize_obj_from_s3", return_value=4)
+@patch("sagemaker.remote_function.result_cache.serialization.deserialize_obj_from_s3")
+@patch("sagemaker.remote_function.client._Job.start")
+@patch("sagemaker.remote_function.client._JobSettings")
+def test_decorator_reuses_cached_result(
+    mock_job_settings, mock_start, mock_cached_deserialize, mock_deserialize, s3
+):
+    settings = job_settings()
+    mock_job_settings.return_value = settings
+    settings.sagemaker_session.sagemaker_client.describe_training_job.return_value = (
+        COMPLETED_TRAINING_JOB
+    )
+    settings.sagemaker_session.get_client.return_value = s3
+    mock_start.return_value = Mock(job_name=JOB_NAME)
+    mock_start.return_value.describe.return_value = COMPLETED_TRAINING_JOB
+    mock_cached_deserialize.return_value = 4
+
+    cached_square = remote(square, s3_root_uri=S3_ROOT_URI, cache=True)
+
+    assert cached_square(2) == 4
+    assert cached_square(2) == 4
+    mock_start.assert_called_once()
+
+    cached_square.invalidate_cache(2)
+    assert cached_square(2) == 4
+    assert mock_start.call_count == 2
+
+    with pytest.raises(ValueError):
+        remote(square, s3_root_uri=S3_ROOT_URI).invalidate_cache(2)
+
+
+@patch("sagemaker.remote_function.client.serialization.deserialize_obj_from_s3", return_value=4)
+@patch("sagemaker.remote_function.client._Job.start")
+@patch("sagemaker.remote_function.client._JobSettings")
+def test_decorator_returns_result_that_could_not_be_cached(
+    mock_job_settings, mock_start, mock_deserialize, s3
+):
+    mock_job_settings.return_value = job_settings()
+    mock_start.return_value = Mock(job_name=JOB_NAME)
+    mock_start.return_value.describe.return_value = COMPLETED_TRAINING_JOB
+
+    with patch.object(
+        s3,
+        "upload_string_as_file_body",
+        side_effect=ClientError({"Error": {"Code": "AccessDenied"}}, "PutObject"),
+    ):
+        assert remote(square, s3_root_uri=S3_ROOT_URI, cache=True)(2) == 4
+
+
+@patch("sagemaker.remote_function.client.serialization.deserialize_obj_from_s3", return_value=4)
+@patch("sagemaker.remote_function.result_cache.serialization.deserialize_obj_from_s3")
+@patch("sagemaker.remote_function.client._Job.start")
+@patch("sagemaker.remote_function.client._JobSettings")
+def test_executor_reuses_cached_result(
+    mock_job_settings, mock_start, mock_cached_deserialize, mock_deserialize, s3
+):
+    settings = job_settings()
+    mock_job_settings.return_value = settings
+    settings.sagemaker_session.sagemaker_client.describe_training_job.return_value = (
+        COMPLETED_TRAINING_JOB
+    )
+    mock_start.return_value = Mock(job_name=JOB_NAME, s3_uri=f"{S3_ROOT_URI}/{JOB_NAME}")
+    mock_start.return_value.describe.return_value = COMPLETED_TRAINING_JOB
+    mock_cached_deserialize.return_value = 4
+
+    with patch.dict(
+        "sagemaker.remote_function.client._API_CALL_LIMIT",
+        {"SubmittingIntervalInSecs": 0, "MinBatchPollingIntervalInSecs": 0.01},
+    ):
+        with RemoteExecutor(s3_root_uri=S3_ROOT_URI, cache=ResultCache()) as executor:
+            assert executor.submit(square, 2).result() == 4
+            future = executor.submit(square, 2)
+
+    assert future.done()
+    assert future.result() == 4
+    mock_start.assert_called_once()
+
+
+@patch("sagemaker.remote_function.client.serialization.deserialize_obj_from_s3", return_value=4)
+@patch("sagemaker.remote_function.result_cache.serialization.deserialize_obj_from_s3")
+@patch("sagemaker.remote_function.job._Job.wait")
+@patch("sagemaker.remote_function.job._prepare_and_upload_workspace", return_value="some_s3_uri")
+@patch(
+    "sagemaker.remote_function.job._prepare_and_upload_runtime_scripts", return_value="some_s3_uri"
+)
+@patch("sagemaker.remote_function.job.RuntimeEnvironmentManager")
+@patch("sagemaker.remote_function.job.StoredFunction")
+def test_decorator_reuses_cached_result_of_job_with_runtime_environment_cache(
+    mock_stored_function,
+    mock_runtime_manager,
+    mock_bootstrap_script_upload,
+    mock_user_workspace_upload,
+    mock_wait,
+    mock_cached_deserialize,
+    mock_deserialize,
+    s3,
+):
+    session = Mock(
+        boto_region_name="us-west-2",
+        sagemaker_config=None,
+        default_bucket_prefix=None,
+        settings=SessionSettings(
+            runtime_environment_cache_uri="s3://my-bucket/env-cache",
+            runtime_environment_cache_secret_key="cache-secret",
+        ),
+    )
+    session.default_bucket.return_value = "my-bucket"
+    session.expand_role.return_value = "role-arn"
+    session._append_sagemaker_config_tags.return_value = []
+    session.sagemaker_client.describe_training_job.return_value = COMPLETED_TRAINING_JOB
+    mock_cached_deserialize.return_value = 4
+
+    cached_square = remote(
+        square,
+        s3_root_uri=S3_ROOT_URI,
+        dependencies="path/to/requirements.txt",
+        image_uri="image",
+        role="role-arn",
+        instance_type="ml.m5.xlarge",
+        sagemaker_session=session,
+        cache=True,
+    )
+
+    assert cached_square(2) == 4
+    assert cached_square(2) == 4
+    session.sagemaker_client.create_training_job.assert_called_once()
+    environment = session.sagemaker_client.create_training_job.call_args[1]["Environment"]
+    assert environment["REMOTE_FUNCTION_CACHE_SECRET_KEY"] == "cache-secret"
+    assert (
+        "REMOTE_FUNCTION_CACHE_SECRET_KEY" not in cached_square.job_settings.environment_variables
+    )
@@ -0,0 +1,83 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import gzip
+import io
+import os
+import tarfile
+import zlib
+
+import pytest
+
+from sagemaker.utilities.compression import ParallelGzipWriter
+
+DATA = os.urandom(300 * 1024) + b"sagemaker" * 100000 + bytes(200 * 1024)
+
+
+def _compress(data, chunk_size=7919, **kwargs):
+    buffer = io.BytesIO()
+    with ParallelGzipWriter(buffer, block_size=64 * 1024, **kwargs) as writer:
+        for start in range(0, len(data), chunk_size):
+            writer.write(data[start : start + chunk_size])
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("compresslevel", [0, 1, 6, 9])
+@pytest.mark.parametrize("threads", [1, 4])
+def test_parallel_gzip_writer_round_trip(compresslevel, threads):
+    compressed = _compress(DATA, compresslevel=compresslevel, threads=threads)
+
+    assert gzip.decompress(compressed) == DATA
+    # A single gzip member, readable by a plain zlib stream decoder.
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    assert decompressor.decompress(compressed) == DATA
+    assert decompressor.eof and not decompressor.unused_data
+
+
+def test_parallel_gzip_writer_compresses():
+    assert len(_compress(DATA, compresslevel=6)) < len(DATA) / 2
+    assert len(_compress(DATA, compresslevel=0)) > len(DATA)
+
+
+def test_parallel_gzip_writer_is_deterministic():
+    assert _compress(DATA, mtime=0, threads=2) == _compress(DATA, mtime=0, threads=3)
+
+
+def test_parallel_gzip_writer_empty_input():
+    assert gzip.decompress(_compress(b"")) == b""
+
+
+def test_parallel_gzip_writer_with_tarfile(tmpdir):
+    tmpdir.join("weights.bin").write_binary(DATA)
+    buffer = io.BytesIO()
+    with ParallelGzipWriter(buffer, threads=2) as writer:
+        with tarfile.open(mode="w|", fileobj=writer) as t:
+            t.add(str(tmpdir.join("weights.bin")), arcname="weights.bin")
+
+    with tarfile.open(fileobj=io.BytesIO(buffer.getvalue()), mode="r:gz") as t:
+        assert t.extractfile("weights.bin").read() == DATA
+
+
+def test_parallel_gzip_writer_rejects_invalid_arguments():
+    with pytest.raises(ValueError):
+        ParallelGzipWriter(io.BytesIO(), compresslevel=10)
+    with pytest.raises(ValueError):
+        ParallelGzipWriter(io.BytesIO(), block_size=1024)
+
+
+def test_parallel_gzip_writer_closed():
+    writer = ParallelGzipWriter(io.BytesIO())
+    writer.close()
+    with pytest.raises(ValueError):
+        writer.write(b"data")
@@ -0,0 +1,116 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import pytest
+from botocore.exceptions import ClientError
+from mock import patch
+
+from sagemaker.utilities.polling import (
+    AdaptivePolling,
+    FixedPolling,
+    Poller,
+    PollingStrategy,
+    is_throttling_error,
+)
+
+
+def _client_error(code, status=400, headers=None):
+    return ClientError(
+        {
+            "Error": {"Code": code, "Message": "message"},
+            "ResponseMetadata": {"HTTPStatusCode": status, "HTTPHeaders": headers or {}},
+        },
+        "DescribeTrainingJob",
+    )
+
+
+def test_polling_strategy_requires_delay():
+    with pytest.raises(TypeError):
+        PollingStrategy()
+
+
+def test_fixed_polling():
+    assert [FixedPolling(5).delay(attempt, attempt * 5) for attempt in range(3)] == [5, 5, 5]
+
+
+def test_adaptive_polling_backs_off_after_fast_period():
+    strategy = AdaptivePolling(min_poll=2, max_poll=60, fast_period=60, backoff_ratio=0.2, jitter=0)
+
+    assert strategy.delay(0, 0) == 2
+    assert strategy.delay(10, 59) == 2
+    assert strategy.delay(20, 160) == 20
+    assert strategy.delay(30, 3600) == 60
+
+
+def test_adaptive_polling_polls_quickly_near_expected_duration():
+    strategy = AdaptivePolling(min_poll=2, max_poll=60, jitter=0, expected_duration=1000)
+
+    assert strategy.delay(10, 800) > 2
+    assert strategy.delay(11, 900) == 2
+    assert strategy.delay(12, 1500) == 2
+
+
+def test_adaptive_polling_jitter_stays_within_bounds():
+    strategy = AdaptivePolling(min_poll=2, max_poll=60, jitter=0.5)
+
+    delays = [strategy.delay(0, 260) for _ in range(200)]
+
+    assert all(20 <= delay <= 60 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_adaptive_polling_invalid_arguments():
+    with pytest.raises(ValueError):
+        AdaptivePolling(min_poll=0)
+    with pytest.raises(ValueError):
+        AdaptivePolling(min_poll=10, max_poll=5)
+    with pytest.raises(ValueError):
+        AdaptivePolling(jitter=1)
+
+
+def test_is_throttling_error():
+    assert is_throttling_error(_client_error("ThrottlingException"))
+    assert is_throttling_error(_client_error("SomethingElse", status=429))
+    assert not is_throttling_error(_client_error("ValidationException"))
+
+
+@patch("time.sleep")
+def test_poller_backs_off_on_throttling_and_resets(sleep):
+    poller = Poller(4)
+
+    poller.sleep()
+    assert poller.throttled(_client_error("ThrottlingException"))
+    poller.sleep()
+    assert poller.throttled(_client_error("ThrottlingException"))
+    poller.sleep()
+    poller.sleep()
+    assert not poller.throttled(_client_error("ValidationException"))
+
+    delays = [c[0][0] for c in sleep.call_args_list]
+    assert delays[0] == 4
+    assert 4 <= delays[1] <= 8
+    assert 8 <= delays[2] <= 16
+    assert delays[3] == 4
+    assert poller.attempts == 4
+    assert poller.elapsed == sum(delays)
+
+
+@patch("time.sleep")
+def test_poller_respects_retry_after(sleep):
+    poller = Poller(AdaptivePolling(min_poll=1, jitter=0))
+
+    poller.throttled(_client_error("ThrottlingException", headers={"retry-after": "30"}))
+    poller.sleep()
+
+    assert sleep.call_args[0][0] >= 30
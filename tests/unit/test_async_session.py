@@ -0,0 +1,142 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import asyncio
+import copy
+import threading
+
+import pytest
+from botocore.exceptions import ClientError
+from mock import Mock, patch
+
+from sagemaker import exceptions
+from sagemaker.async_session import AsyncSession
+from sagemaker.session import Session
+
+REGION = "us-west-2"
+
+
+@pytest.fixture()
+def sagemaker_session():
+    return Session(boto_session=Mock(region_name=REGION), sagemaker_client=Mock())
+
+
+def _no_sleep():
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay):
+        await real_sleep(0)
+
+    return patch("asyncio.sleep", new=sleep)
+
+
+def test_wait_for_many_jobs_with_few_threads(sagemaker_session):
+    polls = {}
+    threads = set()
+
+    def describe_training_job(TrainingJobName):
+        threads.add(threading.current_thread().name)
+        polls[TrainingJobName] = polls.get(TrainingJobName, 0) + 1
+        status = "Completed" if polls[TrainingJobName] == 3 else "InProgress"
+        return {"TrainingJobName": TrainingJobName, "TrainingJobStatus": status}
+
+    sagemaker_session.sagemaker_client.describe_training_job.side_effect = describe_training_job
+    job_names = ["job-{}".format(i) for i in range(500)]
+
+    async def wait_for_all():
+        async with AsyncSession(sagemaker_session, max_workers=4) as aio:
+            return await asyncio.gather(*[aio.wait_for_job(job, poll=0) for job in job_names])
+
+    descriptions = asyncio.run(wait_for_all())
+
+    assert [desc["TrainingJobName"] for desc in descriptions] == job_names
+    assert set(polls.values()) == {3}
+    assert len(threads) <= 4
+    assert all(name.startswith("sagemaker-aio") for name in threads)
+
+
+def test_wait_for_job_raises_on_failure(sagemaker_session):
+    sagemaker_session.sagemaker_client.describe_training_job.return_value = {
+        "TrainingJobStatus": "Failed",
+        "FailureReason": "CapacityError: no capacity",
+    }
+
+    with pytest.raises(exceptions.CapacityError):
+        asyncio.run(sagemaker_session.aio.wait_for_job("job", poll=0))
+
+
+def test_wait_for_endpoint_retries_throttling(sagemaker_session):
+    throttled = ClientError({"Error": {"Code": "ThrottlingException"}}, "DescribeEndpoint")
+    sagemaker_session.sagemaker_client.describe_endpoint.side_effect = [
+        throttled,
+        {"EndpointStatus": "Creating"},
+        throttled,
+        {"EndpointStatus": "InService"},
+    ]
+
+    with _no_sleep():
+        desc = asyncio.run(sagemaker_session.aio.wait_for_endpoint("endpoint", poll=1))
+
+    assert desc == {"EndpointStatus": "InService"}
+
+
+def test_wait_for_endpoint_raises_when_not_in_service(sagemaker_session):
+    sagemaker_session.sagemaker_client.describe_endpoint.return_value = {
+        "EndpointStatus": "Failed",
+        "FailureReason": "bad image",
+    }
+
+    with pytest.raises(exceptions.UnexpectedStatusException, match="bad image"):
+        asyncio.run(sagemaker_session.aio.wait_for_endpoint("endpoint", poll=0))
+
+
+def test_create_endpoint_waits_on_event_loop(sagemaker_session):
+    client = sagemaker_session.sagemaker_client
+    client.create_endpoint.return_value = {"EndpointArn": "arn"}
+    client.describe_endpoint.side_effect = [
+        {"EndpointStatus": "Creating"},
+        {"EndpointStatus": "InService"},
+    ]
+
+    with _no_sleep():
+        name = asyncio.run(sagemaker_session.aio.create_endpoint("endpoint", "config", poll=1))
+
+    assert name == "endpoint"
+    assert client.create_endpoint.call_args[1]["EndpointName"] == "endpoint"
+    assert client.describe_endpoint.call_count == 2
+
+
+def test_run_and_s3_helpers_use_session(sagemaker_session):
+    sagemaker_session.upload_data = Mock(return_value="s3://bucket/prefix")
+
+    async def upload():
+        aio = sagemaker_session.aio
+        uri = await aio.upload_data("data", bucket="bucket", key_prefix="prefix")
+        length = await aio.run(len, "abc")
+        return uri, length
+
+    assert asyncio.run(upload()) == ("s3://bucket/prefix", 3)
+    sagemaker_session.upload_data.assert_called_once_with(
+        "data", bucket="bucket", key_prefix="prefix"
+    )
+    assert sagemaker_session.aio is sagemaker_session.aio
+
+
+def test_session_with_aio_can_be_copied(sagemaker_session):
+    asyncio.run(sagemaker_session.aio.run(len, "abc"))
+
+    copied = copy.deepcopy(sagemaker_session)
+
+    assert asyncio.run(copied.aio.run(len, "abcd")) == 4
+    sagemaker_session.aio.close()
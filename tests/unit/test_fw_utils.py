@@ -19,10 +19,12 @@ import tarfile
 from contextlib import contextmanager
 from itertools import product
 
+import botocore
 import pytest
 
 from mock import Mock, patch
 
+import sagemaker
 from sagemaker import fw_utils
 from sagemaker.utils import name_from_image, custom_extractall_tarfile
 from sagemaker.session_settings import SessionSettings
@@ -413,6 +415,105 @@ def test_test_tar_and_upload_dir_with_subfolders(sagemaker_session, tmpdir):
     )
 
 
+def test_tar_and_upload_dir_with_source_code_cache_miss(sagemaker_session, tmpdir):
+    source_dir = file_tree(tmpdir, ["src-dir/train.py"])
+    source_dir = os.path.join(source_dir, "src-dir")
+    settings = SessionSettings(source_code_cache_prefix="code-cache")
+    s3_object = sagemaker_session.resource("s3").Object()
+    s3_object.load.side_effect = botocore.exceptions.ClientError(
+        error_response={"Error": {"Code": "404", "Message": "Not Found"}},
+        operation_name="HeadObject",
+    )
+    digest = sagemaker.utils.compute_tar_content_digest([os.path.join(source_dir, "train.py")])
+
+    with patch("shutil.rmtree"):
+        result = fw_utils.tar_and_upload_dir(
+            sagemaker_session, "bucket", "prefix", "train.py", source_dir, settings=settings
+        )
+
+    assert result == fw_utils.UploadedCode(
+        s3_prefix="s3://bucket/code-cache/{}/sourcedir.tar.gz".format(digest),
+        script_name="train.py",
+    )
+    sagemaker_session.resource("s3").Object.assert_called_with(
+        "bucket", "code-cache/{}/sourcedir.tar.gz".format(digest)
+    )
+    s3_object.upload_file.assert_called_once()
+    assert {"/train.py"} == list_source_dir_files(sagemaker_session, tmpdir)
+
+
+def test_tar_and_upload_dir_with_source_code_cache_hit(sagemaker_session, tmpdir):
+    source_dir = file_tree(tmpdir, ["src-dir/train.py"])
+    source_dir = os.path.join(source_dir, "src-dir")
+    settings = SessionSettings(source_code_cache_prefix="code-cache")
+    s3_object = sagemaker_session.resource("s3").Object()
+    digest = sagemaker.utils.compute_tar_content_digest([os.path.join(source_dir, "train.py")])
+
+    with patch("sagemaker.utils.create_tar_file") as create_tar_file:
+        result = fw_utils.tar_and_upload_dir(
+            sagemaker_session, "bucket", "prefix", "train.py", source_dir, settings=settings
+        )
+
+    assert result == fw_utils.UploadedCode(
+        s3_prefix="s3://bucket/code-cache/{}/sourcedir.tar.gz".format(digest),
+        script_name="train.py",
+    )
+    s3_object.load.assert_called_once()
+    s3_object.upload_file.assert_not_called()
+    create_tar_file.assert_not_called()
+
+
+def test_tar_and_upload_dir_with_source_code_cache_kms_key_changes_key(sagemaker_session, tmpdir):
+    source_dir = file_tree(tmpdir, ["src-dir/train.py"])
+    source_dir = os.path.join(source_dir, "src-dir")
+    settings = SessionSettings(source_code_cache_prefix="code-cache")
+
+    plain = fw_utils.tar_and_upload_dir(
+        sagemaker_session, "bucket", "prefix", "train.py", source_dir, settings=settings
+    )
+    encrypted = fw_utils.tar_and_upload_dir(
+        sagemaker_session,
+        "bucket",
+        "prefix",
+        "train.py",
+        source_dir,
+        kms_key="kms-key",
+        settings=settings,
+    )
+
+    assert plain.s3_prefix != encrypted.s3_prefix
+
+
+def test_tar_and_upload_dir_streams_archive(sagemaker_session, tmpdir):
+    file_tree(tmpdir, ["src-dir/train.py", "src-dir/module/__init__.py"])
+    source_dir = os.path.join(str(tmpdir), "src-dir")
+    settings = SessionSettings(stream_archive_uploads=True)
+    s3_client = sagemaker_session.resource("s3").meta.client
+    streamed_path = os.path.join(str(tmpdir), "streamed.tar.gz")
+
+    def put_object(Bucket, Key, Body, **kwargs):
+        with open(streamed_path, "wb") as f:
+            f.write(Body)
+
+    s3_client.put_object.side_effect = put_object
+
+    result = fw_utils.tar_and_upload_dir(
+        sagemaker_session, "bucket", "prefix", "train.py", source_dir, settings=settings
+    )
+
+    assert result == fw_utils.UploadedCode(
+        s3_prefix="s3://bucket/prefix/sourcedir.tar.gz", script_name="train.py"
+    )
+    s3_client.put_object.assert_called_once()
+    _, kwargs = s3_client.put_object.call_args
+    assert kwargs["Key"] == "prefix/sourcedir.tar.gz"
+    assert kwargs["ServerSideEncryption"] == "aws:kms"
+    sagemaker_session.resource("s3").Object().upload_file.assert_not_called()
+    assert {"/train.py", "/module/__init__.py"} == list_tar_files(
+        "/opt/ml/code/", streamed_path, tmpdir
+    )
+
+
 def list_source_dir_files(sagemaker_session, tmpdir):
     source_dir_tar = sagemaker_session.resource("s3").Object().upload_file.call_args[0][0]
 
@@ -0,0 +1,184 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import datetime
+
+import pytest
+from mock import Mock, patch
+
+from sagemaker import exceptions
+from sagemaker.job_tracker import FinishedJob, JobTracker
+from sagemaker.session import Session
+
+NOW = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class FakeSageMakerClient(object):
+    """Keep training and processing jobs in memory and serve the list and describe calls."""
+
+    def __init__(self):
+        self.jobs = {"TrainingJob": {}, "ProcessingJob": {}}
+        self.calls = []
+
+    def add(self, resource, name, status="InProgress", minutes=0):
+        self.jobs[resource][name] = {
+            resource + "Name": name,
+            resource + "Status": status,
+            "CreationTime": NOW + datetime.timedelta(minutes=minutes),
+            "LastModifiedTime": NOW + datetime.timedelta(minutes=minutes),
+        }
+
+    def update(self, resource, name, status):
+        self.jobs[resource][name][resource + "Status"] = status
+        self.jobs[resource][name]["LastModifiedTime"] = datetime.datetime.now(datetime.timezone.utc)
+
+    def _list(self, resource, MaxResults, NextToken=None, **filters):
+        self.calls.append(("list", resource, filters))
+        jobs = [
+            job
+            for job in self.jobs[resource].values()
+            if filters.get("StatusEquals", job[resource + "Status"]) == job[resource + "Status"]
+            and filters.get("NameContains", "") in job[resource + "Name"]
+            and (
+                "CreationTimeAfter" not in filters
+                or job["CreationTime"] > filters["CreationTimeAfter"]
+            )
+            and (
+                "LastModifiedTimeAfter" not in filters
+                or job["LastModifiedTime"] > filters["LastModifiedTimeAfter"]
+            )
+        ]
+        start = int(NextToken or 0)
+        response = {resource + "Summaries": [dict(job) for job in jobs[start : start + MaxResults]]}
+        if start + MaxResults < len(jobs):
+            response["NextToken"] = str(start + MaxResults)
+        return response
+
+    def list_training_jobs(self, **kwargs):
+        return self._list("TrainingJob", **kwargs)
+
+    def list_processing_jobs(self, **kwargs):
+        return self._list("ProcessingJob", **kwargs)
+
+    def describe_training_job(self, TrainingJobName):
+        self.calls.append(("describe", "TrainingJob", TrainingJobName))
+        return dict(self.jobs["TrainingJob"][TrainingJobName], FailureReason="none")
+
+    def describe_processing_job(self, ProcessingJobName):
+        self.calls.append(("describe", "ProcessingJob", ProcessingJobName))
+        return dict(self.jobs["ProcessingJob"][ProcessingJobName])
+
+
+@pytest.fixture()
+def client():
+    return FakeSageMakerClient()
+
+
+@pytest.fixture()
+def sagemaker_session(client):
+    return Mock(sagemaker_client=client)
+
+
+@patch("sagemaker.job_tracker._MAX_RESULTS", 2)
+def test_job_tracker_refreshes_jobs_with_list_calls(sagemaker_session, client):
+    for i in range(5):
+        client.add("TrainingJob", "train-{}".format(i), minutes=i)
+    client.add("TrainingJob", "other-job", minutes=-60)
+    client.add("ProcessingJob", "process-0", status="Completed")
+    tracker = JobTracker(sagemaker_session, poll=0)
+    tracker.add_jobs(["train-{}".format(i) for i in range(5)])
+    tracker.add_job("process-0", job_type="processing")
+
+    finished = tracker.refresh()
+
+    assert finished == [
+        FinishedJob(
+            "processing", "process-0", "Completed", client.jobs["ProcessingJob"]["process-0"]
+        )
+    ]
+    assert len(tracker.pending) == 5
+    # The first refresh lists the jobs in progress, and describes the ones that are not.
+    assert [c for c in client.calls if c[1] == "TrainingJob"] == [
+        ("list", "TrainingJob", {"StatusEquals": "InProgress", "NameContains": "train-"})
+    ] * 3
+
+    client.calls = []
+    client.update("TrainingJob", "train-1", "Completed")
+    client.update("TrainingJob", "train-3", "Failed")
+
+    finished = tracker.refresh()
+
+    assert [(job.job_name, job.status) for job in finished] == [
+        ("train-1", "Completed"),
+        ("train-3", "Failed"),
+    ]
+    assert finished[1].description["FailureReason"] == "none"
+    # The other jobs are refreshed with a single list call, and are not described.
+    assert [c[0] for c in client.calls] == ["list", "describe", "describe"]
+    assert client.calls[0][2]["CreationTimeAfter"] < NOW
+    assert client.calls[0][2]["NameContains"] == "train-"
+    assert "StatusEquals" not in client.calls[0][2]
+    assert sorted(name for _, name in tracker.pending) == ["train-0", "train-2", "train-4"]
+
+
+def test_job_tracker_as_completed(sagemaker_session, client):
+    client.add("TrainingJob", "train-0")
+    client.add("TrainingJob", "train-1")
+    tracker = JobTracker(sagemaker_session, poll=0)
+    tracker.add_jobs(["train-0", "train-1"])
+    completed = tracker.as_completed()
+
+    assert list(tracker.refresh()) == []
+    client.update("TrainingJob", "train-1", "Stopped")
+    assert next(completed).job_name == "train-1"
+    client.update("TrainingJob", "train-0", "Completed")
+    assert next(completed).job_name == "train-0"
+    with pytest.raises(StopIteration):
+        next(completed)
+    assert [job.job_name for job in tracker.finished] == ["train-1", "train-0"]
+
+
+def test_job_tracker_wait_calls_callback_and_times_out(sagemaker_session, client):
+    client.add("TrainingJob", "train-0", status="Completed")
+    client.add("TrainingJob", "train-1")
+    tracker = JobTracker(sagemaker_session, poll=0)
+    tracker.add_jobs(["train-0", "train-1"])
+    callback = Mock()
+
+    with pytest.raises(TimeoutError, match="train-1"):
+        tracker.wait(callback=callback, timeout=0)
+
+    callback.assert_called_once_with(tracker.finished[0])
+
+
+def test_job_tracker_invalid_job_type(sagemaker_session):
+    with pytest.raises(ValueError):
+        JobTracker(sagemaker_session).add_job("job", job_type="tuning")
+
+
+def test_session_wait_for_jobs(client):
+    client.add("TrainingJob", "train-0", status="Completed")
+    client.add("ProcessingJob", "process-0", status="Completed")
+    session = Session(boto_session=Mock(region_name="us-west-2"), sagemaker_client=client)
+
+    descriptions = session.wait_for_jobs(
+        training_jobs=["train-0"], processing_jobs=["process-0"], poll=0
+    )
+
+    assert sorted(descriptions) == ["process-0", "train-0"]
+    assert descriptions["train-0"]["TrainingJobStatus"] == "Completed"
+
+    client.add("TrainingJob", "train-1", status="Failed")
+    with pytest.raises(exceptions.UnexpectedStatusException):
+        session.wait_for_jobs(training_jobs=["train-0", "train-1"], poll=0)
@@ -0,0 +1,177 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+from __future__ import absolute_import
+
+import json
+import os
+import threading
+
+import pytest
+
+from sagemaker.logs import LogExporter, Position, log_stream, multi_stream_iter
+
+LOG_GROUP = "/aws/sagemaker/TrainingJobs"
+
+
+class FakeLogsClient(object):
+    """Serve the events of each stream in pages of ``page_size`` events."""
+
+    def __init__(self, streams, page_size=2):
+        self.streams = streams
+        self.page_size = page_size
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get_log_events(self, logGroupName, logStreamName, startTime, startFromHead, nextToken=None):
+        assert logGroupName == LOG_GROUP
+        assert startFromHead
+        with self.lock:
+            self.calls.append((logStreamName, nextToken))
+        events = [e for e in self.streams[logStreamName] if e["timestamp"] >= startTime]
+        start = int(nextToken or 0)
+        page = events[start : start + self.page_size]
+        return {"events": page, "nextForwardToken": str(start + len(page))}
+
+
+def _events(*timestamps):
+    return [{"timestamp": ts, "message": "message {}".format(ts)} for ts in timestamps]
+
+
+STREAMS = {
+    "job/algo-1": _events(1, 4, 4, 7, 9),
+    "job/algo-2": _events(2, 3, 4, 8),
+    "job/algo-3": [],
+    "job/algo-4": _events(4, 5, 6, 10, 11, 12),
+}
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 2])
+def test_multi_stream_iter_merges_streams_in_timestamp_order(max_workers):
+    client = FakeLogsClient(STREAMS)
+    names = sorted(STREAMS)
+
+    result = list(multi_stream_iter(client, LOG_GROUP, names, max_workers=max_workers))
+
+    assert [event["timestamp"] for _, event in result] == [
+        1, 2, 3, 4, 4, 4, 4, 5, 6, 7, 8, 9, 10, 11, 12
+    ]  # fmt: skip
+    # Events with the same timestamp come in stream order.
+    assert [i for i, event in result if event["timestamp"] == 4] == [0, 0, 1, 3]
+    for i, name in enumerate(names):
+        assert [event for j, event in result if j == i] == STREAMS[name]
+
+
+def test_multi_stream_iter_matches_log_stream():
+    client = FakeLogsClient(STREAMS)
+    positions = {
+        "job/algo-1": Position(timestamp=4, skip=1),
+        "job/algo-2": Position(timestamp=0, skip=0),
+        "job/algo-4": Position(timestamp=5, skip=3),
+    }
+    names = sorted(positions)
+
+    result = list(multi_stream_iter(client, LOG_GROUP, names, positions))
+
+    for i, name in enumerate(names):
+        expected = list(log_stream(client, LOG_GROUP, name, *positions[name]))
+        assert [event for j, event in result if j == i] == expected
+    assert [event["timestamp"] for _, event in result] == [2, 3, 4, 4, 7, 8, 9, 11, 12]
+
+
+def test_multi_stream_iter_paginates_until_empty_page():
+    client = FakeLogsClient({"job/algo-1": _events(1, 2, 3, 4, 5)}, page_size=2)
+
+    result = list(multi_stream_iter(client, LOG_GROUP, ["job/algo-1"]))
+
+    assert len(result) == 5
+    assert client.calls == [
+        ("job/algo-1", None),
+        ("job/algo-1", "2"),
+        ("job/algo-1", "4"),
+        ("job/algo-1", "5"),
+    ]
+
+
+def test_multi_stream_iter_fetches_streams_concurrently():
+    streams = {"job/algo-{}".format(i): _events(i) for i in range(4)}
+    barrier = threading.Barrier(len(streams), timeout=5)
+
+    class BlockingClient(FakeLogsClient):
+        def get_log_events(self, **kwargs):
+            if kwargs.get("nextToken") is None:
+                # Only returns if the first page of every stream is requested at once.
+                barrier.wait()
+            return super(BlockingClient, self).get_log_events(**kwargs)
+
+    client = BlockingClient(streams)
+
+    result = list(multi_stream_iter(client, LOG_GROUP, sorted(streams), max_workers=4))
+
+    assert [i for i, _ in result] == [0, 1, 2, 3]
+
+
+def test_multi_stream_iter_no_streams():
+    assert list(multi_stream_iter(FakeLogsClient({}), LOG_GROUP, [])) == []
+
+
+def test_log_exporter_writes_jsonl_and_resumes(tmpdir):
+    output_dir = str(tmpdir.join("export"))
+    exporter = LogExporter(output_dir, "job")
+    assert exporter.positions == {}
+
+    exporter.write("job/algo-1", {"timestamp": 1, "message": "one", "ingestionTime": 5})
+    exporter.write("job/algo-2", {"timestamp": 2, "message": "two"})
+    positions = {"job/algo-1": Position(1, 1), "job/algo-2": Position(2, 1)}
+    exporter.checkpoint(positions)
+
+    # Events written after the last checkpoint are dropped when the export resumes.
+    exporter.write("job/algo-1", {"timestamp": 3, "message": "lost"})
+    with open(os.path.join(output_dir, LogExporter.JSONL_FILE), "a") as f:
+        f.write('{"partial": ')
+
+    resumed = LogExporter(output_dir, "job")
+    assert resumed.positions == positions
+    resumed.write("job/algo-1", {"timestamp": 3, "message": "three"})
+    resumed.checkpoint(dict(positions, **{"job/algo-1": Position(3, 1)}))
+
+    with open(os.path.join(output_dir, LogExporter.JSONL_FILE)) as f:
+        records = [json.loads(line) for line in f]
+    assert records == [
+        {"stream": "job/algo-1", "timestamp": 1, "message": "one", "ingestionTime": 5},
+        {"stream": "job/algo-2", "timestamp": 2, "message": "two"},
+        {"stream": "job/algo-1", "timestamp": 3, "message": "three"},
+    ]
+    assert LogExporter(output_dir, "job").positions["job/algo-1"] == Position(3, 1)
+
+
+def test_log_exporter_writes_per_host_files(tmpdir):
+    exporter = LogExporter(str(tmpdir), "job", export_format="per_host")
+
+    exporter.write("job/algo-1-1700000000", {"timestamp": 1, "message": "one"})
+    exporter.write("job/algo-2-1700000000", {"timestamp": 1, "message": "two"})
+    exporter.write("job/algo-1-1700000000", {"timestamp": 2, "message": "three"})
+    exporter.checkpoint({})
+
+    assert tmpdir.join("algo-1-1700000000.log").read() == "one\nthree\n"
+    assert tmpdir.join("algo-2-1700000000.log").read() == "two\n"
+
+
+def test_log_exporter_rejects_other_exports(tmpdir):
+    with pytest.raises(ValueError):
+        LogExporter(str(tmpdir), "job", export_format="csv")
+
+    LogExporter(str(tmpdir), "job").checkpoint({})
+    with pytest.raises(ValueError):
+        LogExporter(str(tmpdir), "other-job")
+    with pytest.raises(ValueError):
+        LogExporter(str(tmpdir), "job", export_format="per_host")
@@ -12,12 +12,27 @@
 # language governing permissions and limitations under the License.
 from __future__ import absolute_import
 
+import datetime
+import hashlib
+import io
 import os
+import threading
+import time
+
 import pytest
-from mock import Mock
+from mock import Mock, call, patch
 
 from sagemaker import s3
-from sagemaker.s3_utils import is_s3_url
+from sagemaker.s3_utils import (
+    S3MultipartUploadWriter,
+    S3ObjectReader,
+    download_s3_objects,
+    is_s3_url,
+    list_s3_objects,
+    local_file_matches_s3_object,
+    sync_local_to_s3,
+    sync_s3_to_local,
+)
 
 BUCKET_NAME = "mybucket"
 REGION = "us-west-2"
@@ -305,3 +320,605 @@ def test_determine_bucket_and_prefix(
     )
 
     assert (actual_bucket == expected_bucket) and (actual_prefix == expected_prefix)
+
+
+def test_list_s3_objects_follows_continuation_tokens():
+    s3_client = Mock()
+    s3_client.list_objects_v2.side_effect = [
+        {"Contents": [{"Key": "prefix/a"}], "NextContinuationToken": "token"},
+        {"Contents": [{"Key": "prefix/b"}]},
+    ]
+
+    keys = [s3_object["Key"] for s3_object in list_s3_objects(s3_client, BUCKET_NAME, "prefix")]
+
+    assert keys == ["prefix/a", "prefix/b"]
+    assert s3_client.list_objects_v2.call_args_list == [
+        call(Bucket=BUCKET_NAME, Prefix="prefix"),
+        call(Bucket=BUCKET_NAME, Prefix="prefix", ContinuationToken="token"),
+    ]
+
+
+def test_local_file_matches_s3_object_single_part(tmpdir):
+    local_file = tmpdir.join("data.csv")
+    local_file.write_binary(b"some data")
+    etag = '"{}"'.format(hashlib.md5(b"some data").hexdigest())
+
+    assert local_file_matches_s3_object(str(local_file), 9, etag)
+    assert not local_file_matches_s3_object(str(local_file), 10, etag)
+    assert not local_file_matches_s3_object(str(local_file), 9, '"0123"')
+    assert not local_file_matches_s3_object(str(tmpdir.join("missing.csv")), 9, etag)
+
+
+def test_local_file_matches_s3_object_multipart(tmpdir):
+    mib = 1024 * 1024
+    data = os.urandom(3 * mib)
+    local_file = tmpdir.join("model.bin")
+    local_file.write_binary(data)
+    part_digests = hashlib.md5(data[: 2 * mib]).digest() + hashlib.md5(data[2 * mib :]).digest()
+    etag = '"{}-2"'.format(hashlib.md5(part_digests).hexdigest())
+
+    assert local_file_matches_s3_object(str(local_file), len(data), etag)
+    assert not local_file_matches_s3_object(str(local_file), len(data), '"{}-3"'.format("a" * 32))
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_download_s3_objects(tmpdir, max_workers):
+    s3_client = Mock()
+    s3_objects = [{"Key": "prefix/sub/{}".format(i)} for i in range(10)]
+
+    paths = download_s3_objects(
+        s3_client,
+        BUCKET_NAME,
+        iter(s3_objects),
+        lambda key: os.path.join(str(tmpdir), key),
+        extra_args={"SSECustomerKey": "key"},
+        max_workers=max_workers,
+    )
+
+    assert paths == [os.path.join(str(tmpdir), s3_object["Key"]) for s3_object in s3_objects]
+    assert os.path.isdir(os.path.join(str(tmpdir), "prefix", "sub"))
+    assert s3_client.download_file.call_count == 10
+    s3_client.download_file.assert_any_call(
+        Bucket=BUCKET_NAME,
+        Key="prefix/sub/3",
+        Filename=os.path.join(str(tmpdir), "prefix/sub/3"),
+        ExtraArgs={"SSECustomerKey": "key"},
+    )
+
+
+def test_download_s3_objects_skip_existing(tmpdir):
+    s3_client = Mock()
+    tmpdir.join("done").write_binary(b"some data")
+    s3_objects = [
+        {"Key": "done", "Size": 9, "ETag": hashlib.md5(b"some data").hexdigest()},
+        {"Key": "missing", "Size": 9, "ETag": hashlib.md5(b"some data").hexdigest()},
+    ]
+
+    download_s3_objects(
+        s3_client,
+        BUCKET_NAME,
+        s3_objects,
+        lambda key: os.path.join(str(tmpdir), key),
+        max_workers=2,
+        skip_existing=True,
+    )
+
+    s3_client.download_file.assert_called_once_with(
+        Bucket=BUCKET_NAME,
+        Key="missing",
+        Filename=os.path.join(str(tmpdir), "missing"),
+        ExtraArgs=None,
+    )
+
+
+def test_download_s3_objects_stops_on_error(tmpdir):
+    s3_client = Mock()
+    s3_client.download_file.side_effect = RuntimeError("download failed")
+    listed = []
+
+    def s3_objects():
+        for i in range(100):
+            listed.append(i)
+            yield {"Key": str(i)}
+
+    with pytest.raises(RuntimeError, match="download failed"):
+        download_s3_objects(
+            s3_client,
+            BUCKET_NAME,
+            s3_objects(),
+            lambda key: os.path.join(str(tmpdir), key),
+            max_workers=2,
+        )
+    assert len(listed) < 100
+
+
+def test_s3_multipart_upload_writer_small_object_uses_put_object():
+    s3_client = Mock()
+
+    with S3MultipartUploadWriter(
+        s3_client, BUCKET_NAME, "key", extra_args={"ServerSideEncryption": "aws:kms"}
+    ) as writer:
+        writer.write(b"some ")
+        writer.write(b"data")
+
+    assert writer.bytes_written == 9
+    s3_client.put_object.assert_called_once_with(
+        Bucket=BUCKET_NAME, Key="key", Body=b"some data", ServerSideEncryption="aws:kms"
+    )
+    s3_client.create_multipart_upload.assert_not_called()
+
+
+def test_s3_multipart_upload_writer_uploads_parts():
+    part_size = S3MultipartUploadWriter.MIN_PART_SIZE
+    s3_client = Mock()
+    s3_client.create_multipart_upload.return_value = {"UploadId": "upload-id"}
+    s3_client.upload_part.side_effect = lambda **kwargs: {
+        "ETag": "etag-{}".format(kwargs["PartNumber"])
+    }
+    extra_args = {"ServerSideEncryption": "aws:kms", "SSECustomerKey": "customer-key"}
+    data = os.urandom(2 * part_size + 10)
+
+    with S3MultipartUploadWriter(
+        s3_client, BUCKET_NAME, "key", extra_args=extra_args, part_size=part_size
+    ) as writer:
+        for start in range(0, len(data), 1024 * 1024):
+            writer.write(data[start : start + 1024 * 1024])
+
+    s3_client.create_multipart_upload.assert_called_once_with(
+        Bucket=BUCKET_NAME, Key="key", **extra_args
+    )
+    uploaded = sorted(
+        (kwargs["PartNumber"], kwargs["Body"]) for _, kwargs in s3_client.upload_part.call_args_list
+    )
+    assert b"".join(body for _, body in uploaded) == data
+    assert [len(body) for _, body in uploaded] == [part_size, part_size, 10]
+    for _, kwargs in s3_client.upload_part.call_args_list:
+        assert kwargs["SSECustomerKey"] == "customer-key"
+        assert "ServerSideEncryption" not in kwargs
+    s3_client.complete_multipart_upload.assert_called_once_with(
+        Bucket=BUCKET_NAME,
+        Key="key",
+        UploadId="upload-id",
+        MultipartUpload={
+            "Parts": [
+                {"PartNumber": 1, "ETag": "etag-1"},
+                {"PartNumber": 2, "ETag": "etag-2"},
+                {"PartNumber": 3, "ETag": "etag-3"},
+            ]
+        },
+    )
+    s3_client.put_object.assert_not_called()
+
+
+def test_s3_multipart_upload_writer_aborts_on_error():
+    part_size = S3MultipartUploadWriter.MIN_PART_SIZE
+    s3_client = Mock()
+    s3_client.create_multipart_upload.return_value = {"UploadId": "upload-id"}
+    s3_client.upload_part.return_value = {"ETag": "etag"}
+
+    with pytest.raises(RuntimeError, match="archive failed"):
+        with S3MultipartUploadWriter(s3_client, BUCKET_NAME, "key", part_size=part_size) as writer:
+            writer.write(b"0" * part_size)
+            raise RuntimeError("archive failed")
+
+    s3_client.abort_multipart_upload.assert_called_once_with(
+        Bucket=BUCKET_NAME, Key="key", UploadId="upload-id"
+    )
+    s3_client.complete_multipart_upload.assert_not_called()
+    with pytest.raises(ValueError):
+        writer.write(b"more")
+
+
+def test_s3_multipart_upload_writer_part_failure_aborts_upload():
+    part_size = S3MultipartUploadWriter.MIN_PART_SIZE
+    s3_client = Mock()
+    s3_client.create_multipart_upload.return_value = {"UploadId": "upload-id"}
+    s3_client.upload_part.side_effect = RuntimeError("part failed")
+
+    with pytest.raises(RuntimeError, match="part failed"):
+        with S3MultipartUploadWriter(s3_client, BUCKET_NAME, "key", part_size=part_size) as writer:
+            writer.write(b"0" * (part_size + 1))
+
+    s3_client.abort_multipart_upload.assert_called_once()
+    s3_client.complete_multipart_upload.assert_not_called()
+
+
+def test_s3_multipart_upload_writer_rejects_small_part_size():
+    with pytest.raises(ValueError):
+        S3MultipartUploadWriter(Mock(), BUCKET_NAME, "key", part_size=1024)
+
+
+class FakeS3Client(object):
+    """A thread-safe in-memory S3 client supporting the calls made by a sync."""
+
+    def __init__(self):
+        self.objects = {}
+        self.uploaded = []
+        self.downloaded = []
+        self._lock = threading.Lock()
+
+    def put(self, key, body, last_modified=None):
+        self.objects[key] = {
+            "Body": body,
+            "ETag": '"{}"'.format(hashlib.md5(body).hexdigest()),
+            "LastModified": last_modified
+            or datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=5),
+        }
+
+    def list_objects_v2(self, Bucket, Prefix, **kwargs):
+        contents = [
+            {
+                "Key": key,
+                "Size": len(o["Body"]),
+                "ETag": o["ETag"],
+                "LastModified": o["LastModified"],
+            }
+            for key, o in sorted(self.objects.items())
+            if key.startswith(Prefix)
+        ]
+        return {"Contents": contents}
+
+    def upload_file(self, Filename, Bucket, Key, ExtraArgs=None):
+        with open(Filename, "rb") as f:
+            body = f.read()
+        with self._lock:
+            self.put(Key, body)
+            self.uploaded.append(Key)
+
+    def head_object(self, Bucket, Key):
+        return {"ETag": self.objects[Key]["ETag"]}
+
+    def download_file(self, Bucket, Key, Filename, ExtraArgs=None):
+        with open(Filename, "wb") as f:
+            f.write(self.objects[Key]["Body"])
+        with self._lock:
+            self.downloaded.append(Key)
+
+    def delete_objects(self, Bucket, Delete):
+        for entry in Delete["Objects"]:
+            del self.objects[entry["Key"]]
+
+
+def _past(seconds=3600):
+    return datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=seconds)
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_sync_local_to_s3(tmpdir, max_workers):
+    local_dir = tmpdir.mkdir("data")
+    local_dir.join("same.csv").write_binary(b"same")
+    local_dir.join("changed.csv").write_binary(b"new content")
+    local_dir.mkdir("sub").join("missing.csv").write_binary(b"missing")
+    s3_client = FakeS3Client()
+    s3_client.put("prefix/same.csv", b"same")
+    s3_client.put("prefix/changed.csv", b"old")
+    s3_client.put("prefix/extra.csv", b"extra")
+    s3_client.put("prefix-other/file.csv", b"other")
+
+    result = sync_local_to_s3(
+        s3_client, str(local_dir), BUCKET_NAME, "prefix", max_workers=max_workers
+    )
+
+    assert sorted(s3_client.uploaded) == ["prefix/changed.csv", "prefix/sub/missing.csv"]
+    assert sorted(result.transferred) == [
+        "s3://mybucket/prefix/changed.csv",
+        "s3://mybucket/prefix/sub/missing.csv",
+    ]
+    assert result.unchanged == ["s3://mybucket/prefix/same.csv"]
+    assert result.deleted == []
+    assert "prefix/extra.csv" in s3_client.objects
+
+
+def test_sync_local_to_s3_uploads_newer_files_of_same_size(tmpdir):
+    local_dir = tmpdir.mkdir("data")
+    local_dir.join("file.csv").write_binary(b"new")
+    s3_client = FakeS3Client()
+    s3_client.put("prefix/file.csv", b"old", last_modified=_past())
+
+    result = sync_local_to_s3(s3_client, str(local_dir), BUCKET_NAME, "prefix")
+
+    assert result.transferred == ["s3://mybucket/prefix/file.csv"]
+    assert s3_client.objects["prefix/file.csv"]["Body"] == b"new"
+
+
+def test_sync_local_to_s3_compare_hash(tmpdir):
+    local_dir = tmpdir.mkdir("data")
+    local_dir.join("same.csv").write_binary(b"same")
+    local_dir.join("changed.csv").write_binary(b"new")
+    s3_client = FakeS3Client()
+    s3_client.put("prefix/same.csv", b"same", last_modified=_past())
+    s3_client.put("prefix/changed.csv", b"old")
+
+    result = sync_local_to_s3(s3_client, str(local_dir), BUCKET_NAME, "prefix", compare_hash=True)
+
+    assert s3_client.uploaded == ["prefix/changed.csv"]
+    assert result.unchanged == ["s3://mybucket/prefix/same.csv"]
+
+
+def test_sync_local_to_s3_delete(tmpdir):
+    local_dir = tmpdir.mkdir("data")
+    local_dir.join("file.csv").write_binary(b"file")
+    s3_client = FakeS3Client()
+    s3_client.put("prefix/extra.csv", b"extra")
+    s3_client.put("prefix/dir/extra.csv", b"extra")
+
+    result = sync_local_to_s3(s3_client, str(local_dir), BUCKET_NAME, "prefix", delete=True)
+
+    assert sorted(s3_client.objects) == ["prefix/file.csv"]
+    assert result.deleted == [
+        "s3://mybucket/prefix/dir/extra.csv",
+        "s3://mybucket/prefix/extra.csv",
+    ]
+
+
+def test_sync_local_to_s3_manifest_avoids_hashing(tmpdir):
+    local_dir = tmpdir.mkdir("data")
+    local_dir.join("file.csv").write_binary(b"file")
+    manifest_path = str(local_dir.join(".manifest.json"))
+    s3_client = FakeS3Client()
+
+    sync_local_to_s3(
+        s3_client,
+        str(local_dir),
+        BUCKET_NAME,
+        "prefix",
+        compare_hash=True,
+        manifest_path=manifest_path,
+    )
+    assert s3_client.uploaded == ["prefix/file.csv"]
+    assert os.path.isfile(manifest_path)
+
+    with patch("sagemaker.s3_utils.local_file_matches_s3_object") as matches:
+        result = sync_local_to_s3(
+            s3_client,
+            str(local_dir),
+            BUCKET_NAME,
+            "prefix",
+            compare_hash=True,
+            manifest_path=manifest_path,
+        )
+    matches.assert_not_called()
+    assert result.unchanged == ["s3://mybucket/prefix/file.csv"]
+    assert s3_client.uploaded == ["prefix/file.csv"]
+
+    # A modified file is not trusted from the manifest anymore.
+    time.sleep(0.01)
+    local_dir.join("file.csv").write_binary(b"FILE")
+    result = sync_local_to_s3(
+        s3_client,
+        str(local_dir),
+        BUCKET_NAME,
+        "prefix",
+        compare_hash=True,
+        manifest_path=manifest_path,
+    )
+    assert result.transferred == ["s3://mybucket/prefix/file.csv"]
+
+
+def test_sync_local_to_s3_rejects_files(tmpdir):
+    tmpdir.join("file.csv").write("file")
+    with pytest.raises(ValueError):
+        sync_local_to_s3(FakeS3Client(), str(tmpdir.join("file.csv")), BUCKET_NAME, "prefix")
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_sync_s3_to_local(tmpdir, max_workers):
+    local_dir = tmpdir.mkdir("data")
+    local_dir.join("same.csv").write_binary(b"same")
+    local_dir.join("changed.csv").write_binary(b"old")
+    local_dir.join("extra.csv").write_binary(b"extra")
+    s3_client = FakeS3Client()
+    s3_client.put("prefix/same.csv", b"same", last_modified=_past())
+    s3_client.put("prefix/changed.csv", b"new content")
+    s3_client.put("prefix/sub/missing.csv", b"missing")
+    s3_client.put("prefix/sub/", b"")
+
+    result = sync_s3_to_local(
+        s3_client, BUCKET_NAME, "prefix", str(local_dir), delete=True, max_workers=max_workers
+    )
+
+    assert sorted(s3_client.downloaded) == ["prefix/changed.csv", "prefix/sub/missing.csv"]
+    assert result.unchanged == [str(local_dir.join("same.csv"))]
+    assert result.deleted == [str(local_dir.join("extra.csv"))]
+    assert local_dir.join("changed.csv").read_binary() == b"new content"
+    assert local_dir.join("sub", "missing.csv").read_binary() == b"missing"
+    assert not local_dir.join("extra.csv").exists()
+
+
+def test_sync_s3_to_local_manifest(tmpdir):
+    local_dir = tmpdir.mkdir("data")
+    manifest_path = str(tmpdir.join("manifest.json"))
+    s3_client = FakeS3Client()
+    s3_client.put("prefix/file.csv", b"file")
+
+    sync_s3_to_local(
+        s3_client,
+        BUCKET_NAME,
+        "prefix",
+        str(local_dir),
+        compare_hash=True,
+        manifest_path=manifest_path,
+    )
+    with patch("sagemaker.s3_utils.local_file_matches_s3_object") as matches:
+        result = sync_s3_to_local(
+            s3_client,
+            BUCKET_NAME,
+            "prefix",
+            str(local_dir),
+            compare_hash=True,
+            manifest_path=manifest_path,
+        )
+
+    matches.assert_not_called()
+    assert s3_client.downloaded == ["prefix/file.csv"]
+    assert result.unchanged == [str(local_dir.join("file.csv"))]
+
+    # The manifest is ignored when syncing another location.
+    s3_client.put("other/file.csv", b"file")
+    with patch("sagemaker.s3_utils.local_file_matches_s3_object", return_value=True) as matches:
+        sync_s3_to_local(
+            s3_client,
+            BUCKET_NAME,
+            "other",
+            str(local_dir),
+            compare_hash=True,
+            manifest_path=manifest_path,
+        )
+    matches.assert_called_once()
+
+
+def test_s3_uploader_sync(sagemaker_session, tmpdir):
+    sagemaker_session.settings.s3_transfer_max_workers = None
+    s3_client = FakeS3Client()
+    sagemaker_session.get_client.return_value = s3_client
+    tmpdir.join("file.csv").write_binary(b"file")
+
+    result = s3.S3Uploader.sync(
+        local_path=str(tmpdir),
+        desired_s3_uri="s3://{}/prefix".format(BUCKET_NAME),
+        kms_key=KMS_KEY,
+        sagemaker_session=sagemaker_session,
+        max_workers=16,
+    )
+
+    sagemaker_session.get_client.assert_called_with("s3", max_pool_connections=16)
+    assert result.transferred == ["s3://mybucket/prefix/file.csv"]
+
+
+def test_s3_downloader_sync(sagemaker_session, tmpdir):
+    sagemaker_session.settings.s3_transfer_max_workers = None
+    s3_client = FakeS3Client()
+    s3_client.put("prefix/file.csv", b"file")
+    sagemaker_session.get_client.return_value = s3_client
+
+    result = s3.S3Downloader.sync(
+        s3_uri="s3://{}/prefix".format(BUCKET_NAME),
+        local_path=str(tmpdir),
+        sagemaker_session=sagemaker_session,
+    )
+
+    sagemaker_session.get_client.assert_called_with("s3", max_pool_connections=None)
+    assert result.transferred == [str(tmpdir.join("file.csv"))]
+    assert tmpdir.join("file.csv").read_binary() == b"file"
+
+
+class RangedS3Client(object):
+    """An S3 client serving ranged reads of a single object."""
+
+    def __init__(self, body, etag='"etag"'):
+        self.body = body
+        self.etag = etag
+        self.ranges = []
+        self._lock = threading.Lock()
+
+    def head_object(self, Bucket, Key):
+        return {"ContentLength": len(self.body), "ETag": self.etag}
+
+    def get_object(self, Bucket, Key, Range, IfMatch=None):
+        assert IfMatch == self.etag
+        start, end = (int(value) for value in Range[len("bytes=") :].split("-"))
+        with self._lock:
+            self.ranges.append((start, end))
+        return {"Body": io.BytesIO(self.body[start : end + 1])}
+
+
+OBJECT_BODY = bytes(range(256)) * 40
+
+
+@pytest.mark.parametrize("read_ahead", [0, 2])
+def test_s3_object_reader_reads_sequentially(read_ahead):
+    s3_client = RangedS3Client(OBJECT_BODY)
+
+    with S3ObjectReader(
+        s3_client, BUCKET_NAME, "key", block_size=1000, read_ahead=read_ahead
+    ) as reader:
+        chunks = iter(lambda: reader.read(300), b"")
+        assert b"".join(chunks) == OBJECT_BODY
+        assert reader.read() == b""
+
+    # Every block is requested once, whether read ahead or not.
+    assert sorted(s3_client.ranges) == [
+        (start, min(start + 1000, len(OBJECT_BODY)) - 1)
+        for start in range(0, len(OBJECT_BODY), 1000)
+    ]
+
+
+def test_s3_object_reader_seek():
+    s3_client = RangedS3Client(OBJECT_BODY)
+
+    with S3ObjectReader(s3_client, BUCKET_NAME, "key", block_size=1000, read_ahead=0) as reader:
+        assert reader.size == len(OBJECT_BODY)
+        assert reader.seekable()
+        assert reader.seek(-100, io.SEEK_END) == len(OBJECT_BODY) - 100
+        assert reader.read() == OBJECT_BODY[-100:]
+        reader.seek(1990)
+        assert reader.read(20) == OBJECT_BODY[1990:2010]
+        assert reader.tell() == 2010
+        reader.seek(-10, io.SEEK_CUR)
+        assert reader.read(5) == OBJECT_BODY[2000:2005]
+        reader.seek(len(OBJECT_BODY) + 10)
+        assert reader.read(10) == b""
+        with pytest.raises(ValueError):
+            reader.seek(-1)
+
+    # Blocks 1 and 2 were read twice but requested once, and block 0 was never read.
+    assert sorted(s3_client.ranges) == [(1000, 1999), (2000, 2999), (10000, 10239)]
+
+
+def test_s3_object_reader_evicts_least_recently_used_blocks():
+    s3_client = RangedS3Client(OBJECT_BODY)
+
+    with S3ObjectReader(
+        s3_client, BUCKET_NAME, "key", block_size=1000, read_ahead=0, max_cached_blocks=2
+    ) as reader:
+        for position in [0, 1000, 0, 2000, 0, 1000]:
+            reader.seek(position)
+            reader.read(1)
+
+    assert s3_client.ranges == [(0, 999), (1000, 1999), (2000, 2999), (1000, 1999)]
+
+
+def test_s3_object_reader_supports_buffered_and_text_io():
+    s3_client = RangedS3Client(b"first line\nsecond line\n")
+
+    with io.TextIOWrapper(
+        io.BufferedReader(S3ObjectReader(s3_client, BUCKET_NAME, "key", block_size=4))
+    ) as f:
+        assert f.readlines() == ["first line\n", "second line\n"]
+
+
+def test_s3_object_reader_closed():
+    reader = S3ObjectReader(RangedS3Client(b"data"), BUCKET_NAME, "key")
+    reader.close()
+
+    assert reader.closed
+    with pytest.raises(ValueError):
+        reader.read()
+
+
+def test_s3_object_reader_invalid_block_size():
+    with pytest.raises(ValueError, match="block_size must be positive"):
+        S3ObjectReader(RangedS3Client(b"data"), BUCKET_NAME, "key", block_size=0)
+
+    # a reader that failed to initialize can still be closed
+    reader = S3ObjectReader.__new__(S3ObjectReader)
+    with pytest.raises(ValueError):
+        reader.__init__(RangedS3Client(b"data"), BUCKET_NAME, "key", block_size=0)
+    reader.close()
+    assert reader.closed
+
+
+def test_s3_downloader_open(sagemaker_session):
+    s3_client = RangedS3Client(OBJECT_BODY)
+    sagemaker_session.get_client.return_value = s3_client
+
+    with s3.S3Downloader.open(
+        "s3://{}/path/to/object".format(BUCKET_NAME),
+        sagemaker_session=sagemaker_session,
+        block_size=4096,
+        read_ahead=4,
+    ) as reader:
+        assert reader.name == "s3://mybucket/path/to/object"
+        assert reader.read() == OBJECT_BODY
+
+    sagemaker_session.get_client.assert_called_with("s3", max_pool_connections=5)
@@ -18,6 +18,8 @@ import io
 import json
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 import six
@@ -32,6 +34,7 @@ from sagemaker import TrainingInput, Session, get_execution_role, exceptions
 from sagemaker.async_inference import AsyncInferenceConfig
 from sagemaker.explainer import ExplainerConfig
 from sagemaker.session import (
+    _flush_log_streams,
     _tuning_job_status,
     _transform_job_status,
     _train_done,
@@ -41,6 +44,8 @@ from sagemaker.session import (
 )
 from sagemaker.tuner import WarmStartConfig, WarmStartTypes
 from sagemaker.inputs import BatchDataCaptureConfig
+from sagemaker.session_settings import SessionSettings
+from sagemaker.utilities.polling import PollingStrategy
 from sagemaker.config import MODEL_CONTAINERS_PATH
 from sagemaker.utils import update_list_of_dicts_with_values_from_config
 from sagemaker.user_agent import (
@@ -1105,6 +1110,84 @@ def sagemaker_session():
     return ims
 
 
+def test_get_client_is_shared(sagemaker_session):
+    boto_session = sagemaker_session.boto_session
+    boto_session.client.reset_mock()
+    boto_session.client.side_effect = lambda *args, **kwargs: Mock()
+
+    s3_client = sagemaker_session.get_client("s3")
+
+    assert sagemaker_session.get_client("s3") is s3_client
+    assert sagemaker_session.get_client("s3", max_pool_connections=5) is s3_client
+    assert sagemaker_session.get_client("logs") is not s3_client
+    boto_session.client.assert_any_call(
+        "s3", region_name=sagemaker_session.boto_region_name, endpoint_url=None, config=ANY
+    )
+    _, kwargs = boto_session.client.call_args_list[0]
+    assert kwargs["config"].max_pool_connections == 10
+    assert boto_session.client.call_count == 2
+
+
+def test_get_client_grows_connection_pool(sagemaker_session):
+    boto_session = sagemaker_session.boto_session
+    boto_session.client.reset_mock()
+    boto_session.client.side_effect = lambda *args, **kwargs: Mock()
+
+    small_client = sagemaker_session.get_client("s3")
+    large_client = sagemaker_session.get_client("s3", max_pool_connections=32)
+
+    assert large_client is not small_client
+    assert sagemaker_session.get_client("s3", max_pool_connections=16) is large_client
+    _, kwargs = boto_session.client.call_args
+    assert kwargs["config"].max_pool_connections == 32
+
+
+def test_get_client_with_config_options_and_settings(sagemaker_session):
+    sagemaker_session.settings = SessionSettings(client_max_pool_connections=50)
+    boto_session = sagemaker_session.boto_session
+    boto_session.client.reset_mock()
+    boto_session.client.side_effect = lambda *args, **kwargs: Mock()
+
+    logs_client = sagemaker_session.get_client("logs", retries={"max_attempts": 15})
+
+    assert sagemaker_session.get_client("logs") is not logs_client
+    assert sagemaker_session.get_client("logs", retries={"max_attempts": 15}) is logs_client
+    _, kwargs = boto_session.client.call_args_list[0]
+    assert kwargs["config"].max_pool_connections == 50
+    assert kwargs["config"].retries == {"max_attempts": 15}
+
+
+def test_get_client_is_thread_safe(sagemaker_session):
+    boto_session = sagemaker_session.boto_session
+    boto_session.client.reset_mock()
+
+    def create_client(*args, **kwargs):
+        time.sleep(0.01)
+        return Mock()
+
+    boto_session.client.side_effect = create_client
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = list(executor.map(lambda _: sagemaker_session.get_client("s3"), range(16)))
+
+    assert all(client is clients[0] for client in clients)
+    assert boto_session.client.call_count == 1
+
+
+def test_get_client_returns_replaced_s3_client(sagemaker_session):
+    boto_session = sagemaker_session.boto_session
+    boto_session.client.reset_mock()
+
+    sagemaker_session.s3_resource = Mock()
+    assert sagemaker_session.get_client("s3") is sagemaker_session.s3_resource.meta.client
+
+    sagemaker_session.s3_client = Mock()
+    assert sagemaker_session.get_client("s3", max_pool_connections=32) is (
+        sagemaker_session.s3_client
+    )
+    boto_session.client.assert_not_called()
+
+
 def test_train_pack_to_request(sagemaker_session):
     in_config = [
         {
@@ -2557,6 +2640,27 @@ def test_logs_for_job_no_wait(cw, sagemaker_session_complete):
     cw().assert_called_with(0, "hi there #1")
 
 
+@patch("sagemaker.logs.ColorWrap")
+def test_logs_for_job_export_resumes_from_checkpoint(cw, sagemaker_session_complete, tmpdir):
+    ims = sagemaker_session_complete
+    export_dir = str(tmpdir)
+    ims.logs_for_job(JOB_NAME, export_dir=export_dir)
+
+    logs_client = ims.boto_session.client("logs")
+    logs_client.get_log_events.side_effect = None
+    logs_client.get_log_events.return_value = {"nextForwardToken": None, "events": []}
+    ims.logs_for_job(JOB_NAME, export_dir=export_dir)
+
+    _, kwargs = logs_client.get_log_events.call_args
+    assert kwargs["startTime"] == 1
+    with open(os.path.join(export_dir, "events.jsonl")) as f:
+        records = [json.loads(line) for line in f]
+    assert records == [
+        {"stream": JOB_NAME + "/xxxxxxxxx", "timestamp": 1, "message": "hi there #1"}
+    ]
+    cw().assert_called_once_with(0, "hi there #1")
+
+
 @patch("sagemaker.logs.ColorWrap")
 def test_logs_for_job_no_wait_stopped_job(cw, sagemaker_session_stopped):
     ims = sagemaker_session_stopped
@@ -2675,6 +2779,34 @@ def test_logs_for_transform_job_full_lifecycle(time, cw, sagemaker_session_full_
     ]
 
 
+def test_flush_log_streams_paginates_describe_log_streams():
+    client = Mock()
+    names = [JOB_NAME + "/algo-{}".format(i) for i in range(120)]
+    client.describe_log_streams.side_effect = [
+        {"logStreams": [{"logStreamName": n} for n in names[:50]], "nextToken": "token-1"},
+        {"logStreams": [{"logStreamName": n} for n in names[50:100]], "nextToken": "token-2"},
+        {"logStreams": [{"logStreamName": n} for n in names[100:]]},
+    ]
+    client.get_log_events.return_value = {"nextForwardToken": None, "events": []}
+    stream_names, positions = [], {}
+
+    _flush_log_streams(
+        stream_names, 120, client, "/aws/sagemaker/TrainingJobs", JOB_NAME, positions, False, Mock()
+    )
+
+    assert stream_names == names
+    assert set(positions) == set(names)
+    tokens = [c[1].get("nextToken") for c in client.describe_log_streams.call_args_list]
+    assert tokens == [None, "token-1", "token-2"]
+    assert client.get_log_events.call_count == 120
+
+    # Once there is a stream for every instance, they are not listed again.
+    _flush_log_streams(
+        stream_names, 120, client, "/aws/sagemaker/TrainingJobs", JOB_NAME, positions, False, Mock()
+    )
+    assert client.describe_log_streams.call_count == 3
+
+
 MODEL_NAME = "some-model"
 CONTAINERS = [
     {
@@ -4333,6 +4465,56 @@ def test_wait_until_fail_access_denied_after_5_mins(patched_sleep):
     assert "AccessDeniedException" in str(error)
 
 
+@patch("time.sleep", return_value=None)
+def test_wait_until_backs_off_when_throttled(patched_sleep):
+    response = {
+        "Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"},
+        "ResponseMetadata": {"HTTPHeaders": {"retry-after": "42"}},
+    }
+    side_effect_iter = [ClientError(error_response=response, operation_name="foo")] * 100
+    side_effect_iter.append("result")
+    mock_func = Mock(name="describe_training_job", side_effect=side_effect_iter)
+
+    assert _wait_until(mock_func) == "result"
+
+    assert mock_func.call_count == 101
+    delays = [c[0][0] for c in patched_sleep.call_args_list]
+    assert delays[0] == 5
+    assert all(delay >= 42 for delay in delays[1:])
+    assert max(delays) <= 300
+
+
+@patch("time.sleep", return_value=None)
+def test_wait_until_training_done_backs_off_when_throttled(patched_sleep):
+    response = {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}}
+    side_effect_iter = [ClientError(error_response=response, operation_name="foo")] * 2
+    side_effect_iter.append(("result", True))
+    mock_func = Mock(name="describe_training_job", side_effect=side_effect_iter)
+
+    assert _wait_until_training_done(mock_func, "dummy") == "result"
+    assert mock_func.call_count == 3
+
+
+@patch("time.sleep", return_value=None)
+def test_wait_for_job_uses_polling_strategy_of_settings(patched_sleep, boto_session):
+    strategy = Mock(spec=PollingStrategy)
+    strategy.delay.return_value = 1
+    session = Session(
+        boto_session=boto_session,
+        sagemaker_client=Mock(),
+        settings=SessionSettings(polling_strategy=strategy),
+    )
+    session.sagemaker_client.describe_training_job.side_effect = [
+        IN_PROGRESS_DESCRIBE_JOB_RESULT,
+        COMPLETED_DESCRIBE_JOB_RESULT,
+    ]
+
+    session.wait_for_job(JOB_NAME, poll=30)
+
+    assert strategy.delay.call_args_list == [call(0, 0), call(1, 1)]
+    assert patched_sleep.call_args_list == [call(1), call(1)]
+
+
 DEFAULT_EXPECTED_AUTO_ML_JOB_ARGS = {
     "AutoMLJobName": JOB_NAME,
     "InputDataConfig": [
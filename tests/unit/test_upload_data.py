@@ -135,3 +135,62 @@ def test_upload_data_aes_encrypted_absolute_file(sagemaker_session):
     (file, kwargs) = uploaded_files_with_args[0]
     assert os.path.exists(file)
     assert kwargs["ExtraArgs"] == AES_ENCRYPTION_ENABLED
+
+
+def test_upload_data_absolute_dir_concurrently(sagemaker_session):
+    result_s3_uri = sagemaker_session.upload_data(
+        UPLOAD_DATA_TESTS_FILES_DIR, extra_args=AES_ENCRYPTION_ENABLED, max_workers=4
+    )
+
+    uploaded_files_with_args = [
+        (args, kwargs)
+        for name, args, kwargs in sagemaker_session.boto_session.mock_calls
+        if name == "client().upload_file"
+    ]
+    assert result_s3_uri == "s3://{}/data".format(BUCKET_NAME)
+    assert len(uploaded_files_with_args) == 4
+    for (file, bucket, key), kwargs in uploaded_files_with_args:
+        assert os.path.exists(file)
+        assert bucket == BUCKET_NAME
+        assert key.startswith("data/")
+        assert kwargs["ExtraArgs"] == AES_ENCRYPTION_ENABLED
+
+    _, client_kwargs = sagemaker_session.boto_session.client.call_args
+    # Smaller pools than the botocore default are never requested.
+    assert client_kwargs["config"].max_pool_connections == 10
+
+
+def test_upload_data_concurrency_from_session_settings(sagemaker_session):
+    sagemaker_session.settings = sagemaker.session_settings.SessionSettings(
+        s3_transfer_max_workers=2
+    )
+
+    sagemaker_session.upload_data(UPLOAD_DATA_TESTS_FILES_DIR)
+
+    uploaded_files = [
+        name
+        for name, _, _ in sagemaker_session.boto_session.mock_calls
+        if name.endswith("upload_file")
+    ]
+    assert uploaded_files == ["client().upload_file"] * 4
+
+
+def test_upload_data_single_file_ignores_concurrency(sagemaker_session):
+    result_s3_uri = sagemaker_session.upload_data(UPLOAD_DATA_TESTS_SINGLE_FILE, max_workers=4)
+
+    uploaded_files = [
+        name
+        for name, _, _ in sagemaker_session.boto_session.mock_calls
+        if name.endswith("upload_file")
+    ]
+    assert result_s3_uri == "s3://{}/data/{}".format(BUCKET_NAME, SINGLE_FILE_NAME)
+    assert uploaded_files == ["resource().Object().upload_file"]
+
+
+def test_upload_data_concurrently_raises_upload_error(sagemaker_session):
+    sagemaker_session.boto_session.client.return_value.upload_file.side_effect = RuntimeError(
+        "upload failed"
+    )
+
+    with pytest.raises(RuntimeError, match="upload failed"):
+        sagemaker_session.upload_data(UPLOAD_DATA_TESTS_FILES_DIR, max_workers=2)
@@ -41,6 +41,7 @@ from sagemaker.utils import (
     get_domain_for_region,
     get_instance_type_family,
     retry_with_backoff,
+    run_concurrently,
     check_and_get_run_experiment_config,
     get_sagemaker_config_value,
     resolve_value_from_config,
@@ -652,6 +653,7 @@ def test_download_folder(makedirs):
     boto_mock = MagicMock(name="boto_session")
     session = sagemaker.Session(boto_session=boto_mock, sagemaker_client=MagicMock())
     s3_mock = boto_mock.resource("s3")
+    s3_client_mock = s3_mock.meta.client
 
     obj_mock = Mock()
     s3_mock.Object.return_value = obj_mock
@@ -669,36 +671,75 @@ def test_download_folder(makedirs):
 
     obj_mock.download_file.side_effect = obj_mock_download
 
-    train_data = Mock()
-    validation_data = Mock()
-
-    train_data.bucket_name.return_value = BUCKET_NAME
-    train_data.key = "prefix/train/train_data.csv"
-    validation_data.bucket_name.return_value = BUCKET_NAME
-    validation_data.key = "prefix/train/validation_data.csv"
-
-    s3_files = [train_data, validation_data]
-    s3_mock.Bucket(BUCKET_NAME).objects.filter.return_value = s3_files
+    s3_client_mock.list_objects_v2.return_value = {
+        "Contents": [
+            {"Key": "prefix/train/", "Size": 0},
+            {"Key": "prefix/train/train_data.csv", "Size": 10},
+            {"Key": "prefix/train/validation_data.csv", "Size": 10},
+        ]
+    }
 
     # all the S3 mocks are set, the test itself begins now.
     sagemaker.utils.download_folder(BUCKET_NAME, "/prefix", "/tmp", session)
 
-    obj_mock.download_file.assert_called()
+    s3_client_mock.list_objects_v2.assert_called_with(Bucket=BUCKET_NAME, Prefix="prefix")
     calls = [
-        call(os.path.join("/tmp", "train", "train_data.csv")),
-        call(os.path.join("/tmp", "train", "validation_data.csv")),
+        call(
+            Bucket=BUCKET_NAME,
+            Key="prefix/train/train_data.csv",
+            Filename=os.path.join("/tmp", "train", "train_data.csv"),
+            ExtraArgs=None,
+        ),
+        call(
+            Bucket=BUCKET_NAME,
+            Key="prefix/train/validation_data.csv",
+            Filename=os.path.join("/tmp", "train", "validation_data.csv"),
+            ExtraArgs=None,
+        ),
     ]
-    obj_mock.download_file.assert_has_calls(calls)
-    assert s3_mock.Object.call_count == 3
+    assert s3_client_mock.download_file.call_args_list == calls
+    assert s3_mock.Object.call_count == 1
 
     s3_mock.reset_mock()
+    s3_client_mock.reset_mock()
     obj_mock.reset_mock()
 
     # Test with a trailing slash for the prefix.
     sagemaker.utils.download_folder(BUCKET_NAME, "/prefix/", "/tmp", session)
-    obj_mock.download_file.assert_called()
-    obj_mock.download_file.assert_has_calls(calls)
-    assert s3_mock.Object.call_count == 2
+    assert s3_client_mock.download_file.call_args_list == calls
+    s3_mock.Object.assert_not_called()
+
+
+def test_download_folder_concurrently_skips_existing_files(tmpdir):
+    boto_mock = MagicMock(name="boto_session")
+    session = sagemaker.Session(boto_session=boto_mock, sagemaker_client=MagicMock())
+    pooled_client = Mock()
+    session.get_client = Mock(return_value=pooled_client)
+
+    existing_file = tmpdir.join("train", "train_data.csv")
+    existing_file.write_binary(b"some data", ensure=True)
+    pooled_client.list_objects_v2.return_value = {
+        "Contents": [
+            {
+                "Key": "prefix/train/train_data.csv",
+                "Size": 9,
+                "ETag": '"1e50210a0202497fb79bc38b6ade6c34"',
+            },
+            {"Key": "prefix/train/validation_data.csv", "Size": 10, "ETag": '"abc"'},
+        ]
+    }
+
+    sagemaker.utils.download_folder(
+        BUCKET_NAME, "prefix/", str(tmpdir), session, max_workers=4, skip_existing=True
+    )
+
+    session.get_client.assert_called_once_with("s3", max_pool_connections=4)
+    pooled_client.download_file.assert_called_once_with(
+        Bucket=BUCKET_NAME,
+        Key="prefix/train/validation_data.csv",
+        Filename=os.path.join(str(tmpdir), "train", "validation_data.csv"),
+        ExtraArgs=None,
+    )
 
 
 @patch("os.makedirs")
@@ -729,18 +770,38 @@ def test_download_folder_points_to_single_file(makedirs):
     obj_mock.reset_mock()
 
 
+def test_run_concurrently_returns_results_in_order():
+    results = run_concurrently([lambda i=i: i * 2 for i in range(10)], max_workers=3)
+    assert results == [i * 2 for i in range(10)]
+
+
+def test_run_concurrently_raises_first_error():
+    executed = []
+
+    def fail():
+        raise ValueError("task failed")
+
+    tasks = [fail] + [lambda i=i: executed.append(i) for i in range(5)]
+    with pytest.raises(ValueError, match="task failed"):
+        run_concurrently(tasks, max_workers=1)
+    assert len(executed) < 5
+
+
 def test_download_file():
     boto_mock = MagicMock(name="boto_session")
     boto_mock.client("sts").get_caller_identity.return_value = {"Account": "123"}
-    bucket_mock = Mock()
-    boto_mock.resource("s3").Bucket.return_value = bucket_mock
     session = sagemaker.Session(boto_session=boto_mock, sagemaker_client=MagicMock())
+    s3_client = Mock()
+    session.get_client = Mock(return_value=s3_client)
 
     sagemaker.utils.download_file(
         BUCKET_NAME, "/prefix/path/file.tar.gz", "/tmp/file.tar.gz", session
     )
 
-    bucket_mock.download_file.assert_called_with("prefix/path/file.tar.gz", "/tmp/file.tar.gz")
+    session.get_client.assert_called_with("s3")
+    s3_client.download_file.assert_called_with(
+        BUCKET_NAME, "prefix/path/file.tar.gz", "/tmp/file.tar.gz"
+    )
 
 
 @patch("tarfile.open")
@@ -777,6 +838,88 @@ def test_create_tar_file_with_auto_generated_path(open):
     assert files == [["/tmp/a", "a"], ["/tmp/b", "b"]]
 
 
+def test_create_tar_file_deterministic(tmpdir):
+    source_dir = tmpdir.mkdir("src")
+    source_dir.join("train.py").write("print('train')")
+    source_dir.mkdir("lib").join("util.py").write("x = 1")
+    first = sagemaker.utils.create_tar_file(
+        [str(source_dir.join("train.py")), str(source_dir.join("lib"))],
+        target=str(tmpdir.join("first.tar.gz")),
+        deterministic=True,
+    )
+
+    os.utime(str(source_dir.join("train.py")), (0, 1234567))
+    time.sleep(0.01)
+    second = sagemaker.utils.create_tar_file(
+        [str(source_dir.join("lib")), str(source_dir.join("train.py"))],
+        target=str(tmpdir.join("second.tar.gz")),
+        deterministic=True,
+    )
+
+    with open(first, "rb") as f1, open(second, "rb") as f2:
+        assert f1.read() == f2.read()
+    with tarfile.open(first) as t:
+        assert t.getnames() == ["lib", "lib/util.py", "train.py"]
+        assert {member.mtime for member in t.getmembers()} == {0}
+        assert {member.uname for member in t.getmembers()} == {""}
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        SessionSettings(archive_compression_level=0),
+        SessionSettings(archive_compression_level=1, archive_compression_threads=4),
+    ],
+)
+def test_create_tar_file_with_compression_settings(tmpdir, settings):
+    source_dir = tmpdir.mkdir("src")
+    source_dir.join("model.bin").write_binary(b"weights" * 100000)
+
+    path = sagemaker.utils.create_tar_file(
+        [str(source_dir.join("model.bin"))],
+        target=str(tmpdir.join("model.tar.gz")),
+        settings=settings,
+    )
+
+    with tarfile.open(path, mode="r:gz") as t:
+        assert t.extractfile("model.bin").read() == b"weights" * 100000
+    if settings.archive_compression_level == 0:
+        assert os.path.getsize(path) > 700000
+
+
+@patch("sagemaker.utils.ParallelGzipWriter", wraps=sagemaker.utils.ParallelGzipWriter)
+def test_repack_model_with_parallel_compression(parallel_gzip_writer, tmp, fake_s3):
+    create_file_tree(tmp, ["model-dir/model", "source-dir/inference.py"])
+    fake_s3.tar_and_upload("model-dir", "s3://fake/location")
+    fake_s3.sagemaker_session.settings = SessionSettings(archive_compression_threads=2)
+
+    sagemaker.utils.repack_model(
+        inference_script="inference.py",
+        source_directory=os.path.join(tmp, "source-dir"),
+        dependencies=[],
+        model_uri="s3://fake/location",
+        repacked_model_uri="s3://destination-bucket/model.tar.gz",
+        sagemaker_session=fake_s3.sagemaker_session,
+    )
+
+    parallel_gzip_writer.assert_called_once()
+    assert parallel_gzip_writer.call_args[1]["threads"] == 2
+    assert list_tar_files(fake_s3.fake_upload_path, tmp) == {"/code/inference.py", "/model"}
+
+
+def test_compute_tar_content_digest(tmpdir):
+    source_dir = tmpdir.mkdir("src")
+    source_dir.join("train.py").write("print('train')")
+    source_files = [str(source_dir.join("train.py"))]
+    digest = sagemaker.utils.compute_tar_content_digest(source_files)
+
+    os.utime(source_files[0], (0, 1234567))
+    assert sagemaker.utils.compute_tar_content_digest(source_files) == digest
+
+    source_dir.join("train.py").write("print('changed')")
+    assert sagemaker.utils.compute_tar_content_digest(source_files) != digest
+
+
 def create_file_tree(root, tree):
     for file in tree:
         try:
@@ -1035,28 +1178,160 @@ def test_repack_model_with_same_inference_file_name(tmp, fake_s3):
     }
 
 
+def test_repack_model_streams_to_s3(tmp, fake_s3):
+    create_file_tree(tmp, ["model-dir/model", "source-dir/inference.py"])
+    fake_s3.tar_and_upload("model-dir", "s3://fake/location")
+    fake_s3.sagemaker_session.settings = SessionSettings(stream_archive_uploads=True)
+    s3_client = fake_s3.sagemaker_session.get_client.return_value
+    streamed_path = os.path.join(tmp, "streamed.tar.gz")
+
+    def put_object(Bucket, Key, Body, **kwargs):
+        with open(streamed_path, "wb") as f:
+            f.write(Body)
+
+    s3_client.put_object.side_effect = put_object
+
+    sagemaker.utils.repack_model(
+        inference_script="inference.py",
+        source_directory=os.path.join(tmp, "source-dir"),
+        dependencies=[],
+        model_uri="s3://fake/location",
+        repacked_model_uri="s3://destination-bucket/model.tar.gz",
+        sagemaker_session=fake_s3.sagemaker_session,
+        kms_key="kms_key",
+    )
+
+    fake_s3.object_mock.upload_file.assert_not_called()
+    _, kwargs = s3_client.put_object.call_args
+    assert kwargs["Bucket"] == "destination-bucket"
+    assert kwargs["Key"] == "model.tar.gz"
+    assert kwargs["ServerSideEncryption"] == "aws:kms"
+    assert kwargs["SSEKMSKeyId"] == "kms_key"
+    assert list_tar_files(streamed_path, tmp) == {"/code/inference.py", "/model"}
+
+
+@patch("sagemaker.utils._extract_model")
+def test_repack_model_incrementally(extract_model, tmp, fake_s3):
+    create_file_tree(
+        tmp,
+        [
+            "model-dir/model",
+            "model-dir/weights/part-0",
+            "model-dir/code/old.py",
+            "source-dir/inference.py",
+            "dependencies/a",
+        ],
+    )
+    tar_location = fake_s3.tar_and_upload("model-dir", "s3://fake/location")
+    fake_s3.sagemaker_session.settings = SessionSettings(incremental_model_repack=True)
+    s3_client = fake_s3.sagemaker_session.get_client.return_value
+    s3_client.get_object.return_value = {"Body": open(tar_location, "rb")}
+
+    sagemaker.utils.repack_model(
+        inference_script="inference.py",
+        source_directory=os.path.join(tmp, "source-dir"),
+        dependencies=[os.path.join(tmp, "dependencies/a")],
+        model_uri="s3://fake/location",
+        repacked_model_uri="s3://destination-bucket/model.tar.gz",
+        sagemaker_session=fake_s3.sagemaker_session,
+    )
+
+    extract_model.assert_not_called()
+    s3_client.get_object.assert_called_with(Bucket="fake", Key="location")
+    assert list_tar_files(fake_s3.fake_upload_path, tmp) == {
+        "/code/inference.py",
+        "/code/lib/a",
+        "/model",
+        "/weights/part-0",
+    }
+    with tarfile.open(fake_s3.fake_upload_path, mode="r:gz") as t:
+        names = t.getnames()
+        assert t.extractfile("weights/part-0").read() == b"model-dir/weights/part-0"
+    assert names.index("code") > names.index("weights/part-0")
+
+
+def test_repack_model_incrementally_keeps_existing_code(tmp, fake_s3):
+    create_file_tree(tmp, ["model-dir/model", "model-dir/code/utils.py", "inference.py"])
+    tar_location = fake_s3.tar_and_upload("model-dir", "s3://fake/location")
+    fake_s3.sagemaker_session.settings = SessionSettings(incremental_model_repack=True)
+
+    sagemaker.utils.repack_model(
+        inference_script=os.path.join(tmp, "inference.py"),
+        source_directory=None,
+        dependencies=[],
+        model_uri="file://" + tar_location,
+        repacked_model_uri="file://" + os.path.join(tmp, "model.tar.gz"),
+        sagemaker_session=fake_s3.sagemaker_session,
+    )
+
+    assert list_tar_files(os.path.join(tmp, "model.tar.gz"), tmp) == {
+        "/code/inference.py",
+        "/code/utils.py",
+        "/model",
+    }
+
+
+def test_repack_model_incrementally_missing_inference_script(tmp, fake_s3):
+    create_file_tree(tmp, ["model-dir/model"])
+    tar_location = fake_s3.tar_and_upload("model-dir", "s3://fake/location")
+    fake_s3.sagemaker_session.settings = SessionSettings(incremental_model_repack=True)
+
+    with pytest.raises(FileNotFoundError):
+        sagemaker.utils.repack_model(
+            inference_script="inference.py",
+            source_directory=None,
+            dependencies=[],
+            model_uri="file://" + tar_location,
+            repacked_model_uri="file://" + os.path.join(tmp, "model.tar.gz"),
+            sagemaker_session=fake_s3.sagemaker_session,
+        )
+
+    assert not os.path.exists(os.path.join(tmp, "model.tar.gz"))
+
+
+def test_write_tar_file_to_non_seekable_fileobj(tmpdir):
+    source_dir = tmpdir.mkdir("src")
+    source_dir.join("train.py").write("print('train')")
+
+    class NonSeekable(object):
+        def __init__(self):
+            self.chunks = []
+
+        def write(self, data):
+            self.chunks.append(bytes(data))
+            return len(data)
+
+    fileobj = NonSeekable()
+    sagemaker.utils.write_tar_file([str(source_dir.join("train.py"))], fileobj)
+
+    archive = tmpdir.join("archive.tar.gz")
+    archive.write_binary(b"".join(fileobj.chunks))
+    with tarfile.open(str(archive)) as t:
+        assert t.getnames() == ["train.py"]
+
+
 class FakeS3(object):
     def __init__(self, tmp):
         self.tmp = tmp
         self.sagemaker_session = MagicMock(settings=SessionSettings())
         self.location_map = {}
-        self.current_bucket = None
         self.object_mock = MagicMock()
+        self.fake_upload_path = os.path.join(self.tmp, "dst")
 
-        self.sagemaker_session.boto_session.resource().Bucket().download_file.side_effect = (
-            self.download_file
-        )
-        self.sagemaker_session.boto_session.resource().Bucket.side_effect = self.bucket
-        self.fake_upload_path = self.mock_s3_upload()
-
-    def bucket(self, name):
-        self.current_bucket = name
-        return self
+        s3_client = self.sagemaker_session.get_client.return_value
+        s3_client.download_file.side_effect = self.download_file
+        s3_client.upload_file.side_effect = self.upload_file
 
-    def download_file(self, path, target):
-        key = "%s/%s" % (self.current_bucket, path)
+    def download_file(self, bucket, path, target):
+        key = "%s/%s" % (bucket, path)
         shutil.copy2(self.location_map[key], target)
 
+    def upload_file(self, target, bucket, key, **kwargs):
+        if bucket in BUCKET_WITHOUT_WRITING_PERMISSION:
+            raise exceptions.S3UploadFailedError()
+        shutil.copy2(target, self.fake_upload_path)
+        self.object_mock.upload_file(target, **kwargs)
+
     def tar_and_upload(self, path, fake_location):
         tar_location = os.path.join(self.tmp, "model-%s.tar.gz" % time.time())
         with tarfile.open(tar_location, mode="w:gz") as t:
@@ -1065,24 +1340,6 @@ class FakeS3(object):
         self.location_map[fake_location.replace("s3://", "")] = tar_location
         return tar_location
 
-    def mock_s3_upload(self):
-        dst = os.path.join(self.tmp, "dst")
-        object_mock = self.object_mock
-
-        class MockS3Object(object):
-            def __init__(self, bucket, key):
-                self.bucket = bucket
-                self.key = key
-
-            def upload_file(self, target, **kwargs):
-                if self.bucket in BUCKET_WITHOUT_WRITING_PERMISSION:
-                    raise exceptions.S3UploadFailedError()
-                shutil.copy2(target, dst)
-                object_mock.upload_file(target, **kwargs)
-
-        self.sagemaker_session.boto_session.resource().Object = MockS3Object
-        return dst
-
 
 @pytest.fixture()
 def fake_s3(tmp):